@@ -0,0 +1,30 @@
+"""
+シーンで共有する manim の部品
+manim helpers shared by the scenes
+
+physics/ の計算結果を mobject やアニメーションにつなぐ。
+Connects the results of physics/ to mobjects and animations.
+"""
+
+from .grids import WarpedGrid, mollweide_grid, mollweide_grid_points
+from .infall import InfallBody
+from .labels import backplate_label, backplate_labels
+from .text import cached_text
+from .tides import OceanSurface
+from .trajectories import follow_trajectory
+from .updaters import ArrowPose, Pose, reshape_from_points
+
+__all__ = [
+    "WarpedGrid",
+    "mollweide_grid",
+    "mollweide_grid_points",
+    "InfallBody",
+    "backplate_label",
+    "backplate_labels",
+    "cached_text",
+    "OceanSurface",
+    "follow_trajectory",
+    "ArrowPose",
+    "Pose",
+    "reshape_from_points",
+]
@@ -0,0 +1,180 @@
+"""
+格子線をまとめて作る部品
+Grid builders
+
+WarpedGrid: 縦線と横線の標本点を (線, 標本, 2) の配列で一度に作り、変形も
+1回のベクトル化された呼び出しで行う。ベジェの制御点も配列計算で求めるので、
+100×100 本・1本あたり 300 標本の格子でも構築の時間は目立たない。
+すべての線は1つの VMobject の別々のサブパスになる。
+
+mollweide_grid: モルワイデ図法風の格子の経線と緯線を配列から作り、プロセス内と
+ディスクにキャッシュして、使うシーンにはコピーを渡す。
+
+WarpedGrid: the sample points of all vertical and horizontal lines form one
+(lines, samples, 2) array that is warped in a single vectorized call, and the
+Bézier handles are computed with array arithmetic as well, so even a 100×100
+grid with 300 samples per line builds without a noticeable delay. Every line
+is a separate subpath of one VMobject.
+
+mollweide_grid: the meridians and parallels of a Mollweide-style grid come from
+arrays cached in process and on disk, and every scene gets its own copy.
+"""
+
+import numpy as np
+from manim import Ellipse, VGroup, VMobject
+
+from physics.cache import cached_arrays
+
+# モルワイデ格子の点の作り方を変えたら上げる / Bump when the Mollweide grid points change
+MOLLWEIDE_GRID_VERSION = 1
+
+# プロセス内のメモ（同じ引数の2回目以降はコピーを返すだけ） / In-process memo; repeat calls only copy
+_mollweide_grid_points: dict = {}
+_mollweide_grids: dict = {}
+
+
+def _lattice(size: float, num_lines: int, samples: int) -> np.ndarray:
+    """縦線、横線の順の格子の標本点 (2 num_lines, samples, 2) / Vertical then horizontal lines"""
+    across = np.linspace(-size, size, num_lines)
+    along = np.linspace(-size, size, samples)
+    a, b = np.meshgrid(across, along, indexing="ij")
+    vertical = np.stack([a, b], axis=-1)
+    horizontal = np.stack([b, a], axis=-1)
+    return np.concatenate([vertical, horizontal])
+
+
+def _smooth_curves(paths: np.ndarray) -> np.ndarray:
+    """
+    各経路の標本点を通る滑らかな3次ベジェ曲線の点 (L, 4 (S - 1), 3)
+    Points of smooth cubic Béziers through the samples of every path
+
+    制御点は隣の標本点の差から取る（Catmull-Rom、両端は片側差分）。
+    Handles come from neighbouring differences (Catmull-Rom, one-sided at the ends).
+    """
+    tangents = np.empty_like(paths)
+    tangents[:, 1:-1] = (paths[:, 2:] - paths[:, :-2]) / 2
+    tangents[:, 0] = paths[:, 1] - paths[:, 0]
+    tangents[:, -1] = paths[:, -1] - paths[:, -2]
+    curves = np.stack(
+        [paths[:, :-1], paths[:, :-1] + tangents[:, :-1] / 3, paths[:, 1:] - tangents[:, 1:] / 3, paths[:, 1:]],
+        axis=2,
+    )
+    return curves.reshape(len(paths), 4 * (paths.shape[1] - 1), 3)
+
+
+class WarpedGrid(VMobject):
+    """
+    変形した正方形の格子（全ての線を1つの VMobject に）
+    A warped square grid, all lines in one VMobject
+
+    同じ size, num_lines, samples の2つの格子は点の並びが同じなので、
+    Transform で平坦な格子を変形した格子へ点ごとに滑らかに移せる。
+    Two grids with the same size, num_lines and samples have matching point
+    layouts, so Transform morphs a flat grid into a warped one point by point.
+    """
+
+    def __init__(self, size: float, num_lines: int, warp=None, samples: int = 31, **kwargs):
+        """
+        Args:
+            size: 格子の半幅（格子座標）
+            num_lines: 各方向の線の数
+            warp: 格子座標 (..., 2) → 画面座標 (..., 2) の写像（省略時は原点中心の平坦な格子）
+            samples: 1本あたりの標本点の数
+            **kwargs: 色や線幅など VMobject への引数
+        """
+        super().__init__(**kwargs)
+        lattice = _lattice(size, num_lines, samples)
+        screen = lattice if warp is None else np.asarray(warp(lattice), dtype=float)
+        paths = np.concatenate([screen, np.zeros(screen.shape[:-1] + (1,))], axis=-1)
+        self.set_points(_smooth_curves(paths).reshape(-1, 3))
+
+
+def mollweide_grid_points(a: float, b: float, meridians, parallels=(), resolution: int = 49):
+    """
+    モルワイデ図法風の格子の経線と緯線のベジェ曲線の点
+    Bézier points of the meridians and parallels of a Mollweide-style grid
+
+    経線 t は (a t cos θ, b sin θ)（θ: -π/2 → π/2、南から北へ）、
+    緯線 v は高さ b v で楕円の内側を横切る線分。全ての線を配列で一度に作り、
+    プロセス内と media/physics_cache/mollweide_grid/ にキャッシュする。
+    Meridian t is (a t cos θ, b sin θ) from south to north and parallel v the
+    chord at height b v. All lines come from one array computation, cached in
+    process and under media/physics_cache/mollweide_grid/.
+
+    Args:
+        a, b: 外枠の楕円の横と縦の半径
+        meridians: 経線の横方向の割合 t（-1 ≤ t ≤ 1）の列
+        parallels: 緯線の高さの割合 v（-1 < v < 1）の列
+        resolution: 経線1本あたりの標本点の数
+
+    Returns:
+        (経線の点 (M, 4 (resolution - 1), 3), 緯線の点 (P, 4, 3))（書き換えないこと）
+    """
+    key = (float(a), float(b), tuple(map(float, meridians)), tuple(map(float, parallels)), int(resolution))
+    if key not in _mollweide_grid_points:
+        a, b, meridians, parallels, resolution = key
+        params = {
+            "version": MOLLWEIDE_GRID_VERSION,
+            "a": a,
+            "b": b,
+            "meridians": meridians,
+            "parallels": parallels,
+            "resolution": resolution,
+        }
+
+        def compute():
+            theta = np.linspace(-np.pi / 2, np.pi / 2, resolution)
+            t = np.asarray(meridians, dtype=float).reshape(-1, 1)
+            meridian_paths = np.stack(
+                np.broadcast_arrays(a * t * np.cos(theta), b * np.sin(theta), 0.0), axis=-1
+            )
+            v = np.asarray(parallels, dtype=float).reshape(-1, 1)
+            half_width = a * np.sqrt(1 - v**2)
+            parallel_paths = np.stack(
+                np.broadcast_arrays(half_width * [-1.0, 1.0], b * v, 0.0), axis=-1
+            )
+            return {"meridians": _smooth_curves(meridian_paths), "parallels": _smooth_curves(parallel_paths)}
+
+        arrays = cached_arrays("mollweide_grid", params, compute)
+        _mollweide_grid_points[key] = (arrays["meridians"], arrays["parallels"])
+    return _mollweide_grid_points[key]
+
+
+def mollweide_grid(
+    a: float,
+    b: float,
+    meridians,
+    parallels=(),
+    resolution: int = 49,
+    stroke_width: float = 1.5,
+    outline_width: float = 2,
+    emphasis_width: float | None = None,
+    **kwargs,
+) -> VGroup:
+    """
+    モルワイデ図法風の格子（外枠の楕円、経線、緯線の VGroup）
+    Mollweide-style grid: a VGroup of the outline ellipse, meridians and parallels
+
+    同じ引数の格子は一度だけ作り、2回目以降はそのコピーを返す。
+    A grid is built once per set of arguments; later calls return a copy.
+
+    Args:
+        a, b, meridians, parallels, resolution: mollweide_grid_points と同じ
+        stroke_width: 経線と緯線の太さ
+        outline_width: 外枠の楕円の太さ
+        emphasis_width: 中央の経線と赤道の太さ（省略時は stroke_width）
+        **kwargs: color や stroke_opacity など全ての線への引数
+
+    Returns:
+        VGroup（位置は楕円の中心が原点）
+    """
+    key = (a, b, tuple(meridians), tuple(parallels), resolution, stroke_width, outline_width, emphasis_width,
+           repr(sorted(kwargs.items())))
+    if key not in _mollweide_grids:
+        meridian_points, parallel_points = mollweide_grid_points(a, b, meridians, parallels, resolution)
+        grid = VGroup(Ellipse(width=2 * a, height=2 * b, stroke_width=outline_width, **kwargs))
+        for value, points in zip([*meridians, *parallels], [*meridian_points, *parallel_points]):
+            width = emphasis_width if emphasis_width is not None and abs(value) < 1e-9 else stroke_width
+            grid.add(VMobject(stroke_width=width, **kwargs).set_points(points))
+        _mollweide_grids[key] = grid
+    return _mollweide_grids[key].copy()
@@ -0,0 +1,66 @@
+"""
+引き伸ばしの表に沿って落ちていく mobject
+Mobjects that fall and deform along a stretch table
+"""
+
+import numpy as np
+from manim import UpdateFromAlphaFunc, linear
+
+from .updaters import reshape_from_points
+
+
+class InfallBody:
+    """
+    physics.StretchTable に沿って落下し変形する mobject
+    A mobject falling and deforming along a physics.StretchTable
+
+    変形前の点を一度だけ覚えておき、毎フレーム「変形前の点 × 表の比」を点に
+    書き込む。表の比は落下開始からの累積なので、何回に分けて再生しても
+    変形は積み重ならない。
+
+    The undeformed points are stored once and every frame writes the
+    undeformed points times the table ratios. The ratios are totals since the
+    start of the fall, so splitting the fall over several plays never
+    compounds the deformation.
+    """
+
+    def __init__(self, mobject, table, center, axis=None):
+        """
+        Args:
+            mobject: 落下させる mobject（現在の位置が落下の始点）
+            table: physics.StretchTable
+            center: 引きつける質量の位置
+            axis: 動径方向として引き伸ばす mobject の向き（省略時は質量への向き）
+        """
+        self.mobject = mobject
+        self.table = table
+        self.center = np.asarray(center, dtype=float)
+        self.origin = mobject.get_center()
+        offset = self.origin - self.center
+        self.direction = offset / np.linalg.norm(offset)
+        axis = self.direction if axis is None else np.asarray(axis, dtype=float)
+        self.axis = axis / np.linalg.norm(axis)
+        self.alpha = 0.0
+        self._points = [(member, member.points.copy()) for member in mobject.get_family()]
+
+    def set_alpha(self, alpha: float):
+        """落下時間の割合 alpha の位置と形にする / Move and reshape to fraction alpha of the fall"""
+        radius, radial, transverse = self.table.at(alpha)
+        position = self.center + self.direction * radius
+        for member, points in self._points:
+            offsets = points - self.origin
+            along = np.outer(offsets @ self.axis, self.axis)
+            reshape_from_points(member, position + radial * along + transverse * (offsets - along))
+        return self.mobject
+
+    def fall(self, to_radius: float, **kwargs) -> UpdateFromAlphaFunc:
+        """
+        前回の終わりから距離 to_radius まで落ちるアニメーション（固有時に比例）
+        Animation of the fall from where the previous one ended down to to_radius
+        """
+        start, end = self.alpha, self.table.alpha_at_radius(to_radius)
+        self.alpha = end
+        kwargs.setdefault("rate_func", linear)
+        return UpdateFromAlphaFunc(
+            self.mobject, lambda mobject, alpha: self.set_alpha(start + (end - start) * alpha), **kwargs
+        )
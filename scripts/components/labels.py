@@ -0,0 +1,80 @@
+"""
+バックプレート付きのラベル
+Labels on a background plate
+
+文字の後ろに半透明の矩形を敷いたラベル。組み立て済みの VGroup を引数ごとに
+覚えておき、2回目以降はコピーを返す（文字は cached_text 経由なので、初回も
+ディスクのキャッシュから読み込める）。
+
+Text with a translucent rectangle behind it. The assembled VGroup is kept per
+set of arguments and later calls return a copy (the text goes through
+cached_text, so even the first build can load from the disk cache).
+"""
+
+from manim import ManimColor, Rectangle, VGroup
+
+from .text import cached_text
+
+# 引数 → 組み立て済みのラベル / Assembled labels by arguments
+_labels: dict = {}
+
+
+def backplate_label(
+    text_content: str,
+    font_size: float,
+    text_color,
+    bg_color="#000000",
+    bg_opacity: float = 0.7,
+    padding: float = 0.15,
+) -> VGroup:
+    """
+    バックプレート付きテキスト（VGroup(背景, 文字)）
+    Text with a background plate, as VGroup(plate, text)
+
+    Args:
+        text_content: 文字列
+        font_size: 文字の大きさ
+        text_color: 文字の色
+        bg_color: 背景の色
+        bg_opacity: 背景の不透明度
+        padding: 文字と背景の縁の間隔
+
+    Returns:
+        VGroup（呼び出しごとに新しいコピー）
+    """
+    key = (
+        text_content,
+        float(font_size),
+        ManimColor(text_color).to_hex(),
+        ManimColor(bg_color).to_hex(),
+        float(bg_opacity),
+        float(padding),
+    )
+    if key not in _labels:
+        text = cached_text(text_content, font_size=font_size, color=text_color)
+        backplate = Rectangle(
+            width=text.width + padding * 2,
+            height=text.height + padding * 2,
+            color=bg_color,
+            fill_color=bg_color,
+            fill_opacity=bg_opacity,
+            stroke_width=0,
+        )
+        backplate.move_to(text.get_center())
+        _labels[key] = VGroup(backplate, text)
+    return _labels[key].copy()
+
+
+def backplate_labels(specs, **kwargs) -> list[VGroup]:
+    """
+    複数のラベルをまとめて作る（日本語と英語の組や凡例など）
+    Create several labels at once (Japanese/English pairs, legends and so on)
+
+    Args:
+        specs: (文字列, 大きさ, 色) の組の列
+        **kwargs: 全てのラベルに共通の bg_color, bg_opacity, padding
+
+    Returns:
+        ラベルのリスト（specs と同じ順番）
+    """
+    return [backplate_label(text_content, font_size, text_color, **kwargs) for text_content, font_size, text_color in specs]
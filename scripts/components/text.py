@@ -0,0 +1,84 @@
+"""
+Text のキャッシュ
+Cache for Text mobjects
+
+シーンは数百個の Text を作り、同じ文字列（「地球」/"Earth"、派生シーンで
+共通のタイトルなど）が何度も現れる。Text は毎回 Pango のレイアウトと SVG の
+解析を通るので、字形の点の配列を文字列・フォント・大きさ・太さをキーに
+media/physics_cache/text/ に保存し、プロセス内でも組み立て済みの mobject を
+覚えておく。2回目以降はそのコピーを返すだけになる。
+
+The scenes create hundreds of Text mobjects and many strings repeat ("地球" /
+"Earth", titles shared by variant scenes). Every Text goes through Pango
+layout and SVG parsing, so the glyph points are stored under
+media/physics_cache/text/ keyed by string, font, size and weight, and the
+assembled mobject is remembered in process. Repeat calls only copy it.
+"""
+
+import manim
+import numpy as np
+from manim import DEFAULT_FONT_SIZE, NORMAL, WHITE, ManimColor, Text, VGroup, VMobject
+
+from physics.cache import cached_arrays
+
+# 字形の保存方法を変えたら上げる / Bump when the stored glyph layout changes
+TEXT_CACHE_VERSION = 1
+
+# (文字列, フォント, 大きさ, 色, 太さ) → 組み立て済みの mobject / Assembled mobjects by key
+_prototypes: dict = {}
+
+
+def _glyph_arrays(text: str, font: str, font_size: float, weight: str) -> dict[str, np.ndarray]:
+    """字形の点をまとめた配列と字形ごとの点の数 / Concatenated glyph points and per-glyph counts"""
+    params = {
+        "version": TEXT_CACHE_VERSION,
+        "manim": manim.__version__,
+        "text": text,
+        "font": font,
+        "font_size": font_size,
+        "weight": weight,
+    }
+
+    def compute():
+        glyphs = Text(text, font=font, font_size=font_size, weight=weight).family_members_with_points()
+        return {
+            "points": np.concatenate([glyph.points for glyph in glyphs]) if glyphs else np.zeros((0, 3)),
+            "counts": np.array([len(glyph.points) for glyph in glyphs], dtype=int),
+        }
+
+    return cached_arrays("text", params, compute)
+
+
+def cached_text(
+    text: str,
+    font_size: float = DEFAULT_FONT_SIZE,
+    color=WHITE,
+    font: str = "",
+    weight: str = NORMAL,
+) -> VGroup:
+    """
+    Text と同じ見た目の mobject（キャッシュから）
+    A mobject that looks like Text(...), served from the cache
+
+    字形は Text と同じく塗りのみ（線幅 0）で、原点を中心に置かれる。
+    Glyphs are filled with zero stroke width and centered on the origin, as in Text.
+
+    Args:
+        text: 文字列
+        font_size: 文字の大きさ
+        color: 色
+        font: フォント名（空なら既定のフォント）
+        weight: 太さ（NORMAL, BOLD など）
+
+    Returns:
+        字形ごとの VMobject の VGroup（呼び出しごとに新しいコピー）
+    """
+    key = (text, font, float(font_size), ManimColor(color).to_hex(), weight)
+    if key not in _prototypes:
+        arrays = _glyph_arrays(text, font, float(font_size), weight)
+        counts = arrays["counts"]
+        pieces = np.split(arrays["points"], np.cumsum(counts)[:-1]) if len(counts) else []
+        _prototypes[key] = VGroup(
+            *(VMobject(color=color, fill_opacity=1.0, stroke_width=0).set_points(points) for points in pieces)
+        )
+    return _prototypes[key].copy()
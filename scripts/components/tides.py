@@ -0,0 +1,72 @@
+"""
+平衡潮汐の海面の mobject
+Mobject for the equilibrium-tide sea surface
+"""
+
+import numpy as np
+from manim import TAU, VMobject
+
+from physics.tides import SOLAR_TO_LUNAR, tide_weights
+
+from .updaters import reshape_from_points
+
+
+class OceanSurface(VMobject):
+    """
+    月（と太陽）の方向に合わせて形が変わる海面
+    Sea surface shaped by the directions of the Moon (and the Sun)
+
+    半径 r(θ) = radius + h(θ) の閉曲線。h は定数・cos 2θ・sin 2θ の重ね合わせ
+    なので、それぞれの形の点の配列を一度だけ作り、set_tide では重み付きの和を
+    点にそのまま書き込む（新しい mobject も become() も使わない）。
+
+    The closed curve r(θ) = radius + h(θ). Since h mixes a constant, cos 2θ and
+    sin 2θ, the point arrays of those three shapes are built once and set_tide
+    writes their weighted sum into the points in place (no new mobject, no
+    become()).
+    """
+
+    def __init__(
+        self,
+        radius: float,
+        tide: float,
+        moon_angle: float = 0.0,
+        sun_angle: float | None = None,
+        solar_ratio: float = SOLAR_TO_LUNAR,
+        samples: int = 180,
+        **kwargs,
+    ):
+        """
+        Args:
+            radius: 平均の海面の半径
+            tide: 月による潮汐の振幅（画面上の長さ、誇張してよい）
+            moon_angle: 月の方向（ラジアン）
+            sun_angle: 太陽の方向（省略時は月だけ）
+            solar_ratio: 太陽の振幅 / 月の振幅
+            samples: 曲線の点の数
+        """
+        super().__init__(**kwargs)
+        self.tide = tide
+        self.solar_ratio = solar_ratio
+
+        theta = np.linspace(0, TAU, samples + 1)
+        directions = np.stack([np.cos(theta), np.sin(theta), np.zeros_like(theta)], axis=1)
+        # 点は角の位置について線形なので、形ごとの点を足し合わせられる
+        # Corner points are linear in the anchors, so per-shape points can be summed
+        shapes = []
+        for profile in (np.ones_like(theta), np.cos(2 * theta), np.sin(2 * theta)):
+            self.set_points_as_corners(directions * profile[:, np.newaxis])
+            shapes.append(self.points.copy())
+        self._mean, self._cos, self._sin = shapes
+        self._radius = radius
+        self.set_points(radius * self._mean)
+        self.set_tide(moon_angle, sun_angle)
+
+    def set_tide(self, moon_angle: float, sun_angle: float | None = None):
+        """
+        天体の方向に合わせて海面の形を更新する（中心は保つ）
+        Reshape the surface for the given directions, keeping its center
+        """
+        w0, wc, ws = tide_weights(moon_angle, sun_angle, self.tide, self.solar_ratio)
+        center = self.get_center()
+        return reshape_from_points(self, center + (self._radius + w0) * self._mean + wc * self._cos + ws * self._sin)
@@ -0,0 +1,33 @@
+"""
+計算済みの軌道に沿って mobject を動かすアニメーション
+Animations that move mobjects along precomputed trajectories
+"""
+
+from manim import Group, UpdateFromAlphaFunc, linear
+
+
+def follow_trajectory(mobjects, trajectory, start: float = 0.0, end: float = 1.0, **kwargs) -> UpdateFromAlphaFunc:
+    """
+    i 番目の mobject を軌道の i 番目の粒子の位置に置くアニメーション
+    Animation placing the i-th mobject at the i-th particle of the trajectory
+
+    加速は軌道に含まれているので rate_func は linear（時間に比例）にする。
+    The acceleration is already in the trajectory, so rate_func is linear in time.
+
+    Args:
+        mobjects: 動かす mobject のリスト（粒子と同じ順番）
+        trajectory: physics.Trajectory
+        start, end: 再生する区間（軌道全体の時間の割合）
+        **kwargs: run_time などアニメーションへの引数
+
+    Returns:
+        UpdateFromAlphaFunc
+    """
+    group = Group(*mobjects)
+
+    def update(group, alpha):
+        for mobject, point in zip(group.submobjects, trajectory.at(start + (end - start) * alpha)):
+            mobject.move_to(point)
+
+    kwargs.setdefault("rate_func", linear)
+    return UpdateFromAlphaFunc(group, update, **kwargs)
@@ -0,0 +1,141 @@
+"""
+mobject をその場で書き換える更新処理
+Updaters that rewrite mobjects in place
+
+毎フレーム新しい mobject を作って become() する代わりに、基準の姿勢の点を
+一度だけ覚えておき、回転・移動・伸縮した点を既存の点の配列にそのまま
+書き込む。基準から毎回計算し直すので誤差も積み重ならない。
+
+Instead of building a new mobject every frame and calling become(), the
+points of a reference pose are stored once and every frame writes rotated,
+moved or stretched points straight into the existing point arrays. Each
+frame is computed from the reference, so errors never accumulate.
+"""
+
+import numpy as np
+from manim import ORIGIN, OUT, rotation_matrix
+
+
+def reshape_from_points(mobject, points):
+    """
+    点の配列を mobject の既存の配列に書き込む（形が違うときだけ置き換える）
+    Write points into the mobject's existing array (replace it only if the shape differs)
+    """
+    points = np.asarray(points, dtype=float)
+    if mobject.points.shape == points.shape:
+        np.copyto(mobject.points, points)
+    else:
+        mobject.set_points(points)
+    return mobject
+
+
+def _rotation_between(u, v) -> np.ndarray:
+    """単位ベクトル u を v に移す最小の回転 / Smallest rotation taking unit u to unit v"""
+    axis = np.cross(u, v)
+    sin, cos = np.linalg.norm(axis), np.dot(u, v)
+    if sin < 1e-12:
+        if cos > 0:
+            return np.eye(3)
+        # 逆向きなら u に垂直な軸の回りに半回転 / Half turn about an axis perpendicular to u
+        other = [1.0, 0.0, 0.0] if abs(u[0]) < 0.9 else [0.0, 1.0, 0.0]
+        axis = np.cross(u, other)
+        axis /= np.linalg.norm(axis)
+        return 2 * np.outer(axis, axis) - np.eye(3)
+    k = np.array([[0, -axis[2], axis[1]], [axis[2], 0, -axis[0]], [-axis[1], axis[0], 0]])
+    return np.eye(3) + k + k @ k * ((1 - cos) / sin**2)
+
+
+class Pose:
+    """
+    mobject の基準の姿勢を覚えておき、変換した点をその場で書き込む
+    Remembers a mobject's reference pose and writes transformed points in place
+    """
+
+    def __init__(self, mobject):
+        """
+        Args:
+            mobject: 現在の形と位置を基準にする mobject（子孫も含む）
+        """
+        self.mobject = mobject
+        self._members = [(member, member.points.copy()) for member in mobject.family_members_with_points()]
+
+    def _write(self, transform):
+        for member, reference in self._members:
+            reshape_from_points(member, transform(reference))
+        return self.mobject
+
+    def rotate_to(self, angle: float, about_point=ORIGIN, axis=OUT):
+        """
+        基準の姿勢から about_point の回りに angle だけ回した姿勢にする
+        Set the pose rotated by angle about about_point from the reference
+        """
+        about_point = np.asarray(about_point, dtype=float)
+        rotation = rotation_matrix(angle, axis)
+        return self._write(lambda points: (points - about_point) @ rotation.T + about_point)
+
+
+class ArrowPose(Pose):
+    """
+    矢印を始点と終点の間に置き直す（先端の形は保ち、軸だけ伸縮する）
+    Places an arrow between two points, stretching only the shaft
+
+    Arrow、DoubleArrow、Arrow3D のどれでもよい。先端（tip, start_tip, cone）
+    の部分は回転と移動だけで、軸の部分だけが長さに合わせて伸び縮みする。
+    Works for Arrow, DoubleArrow and Arrow3D. The tips (tip, start_tip, cone)
+    are only rotated and moved; the shaft alone stretches to the new length.
+    """
+
+    def __init__(self, arrow, start=None, end=None):
+        """
+        Args:
+            arrow: 矢印
+            start, end: 基準の姿勢での始点と終点（省略時は arrow.get_start(), get_end()）
+        """
+        super().__init__(arrow)
+        self.start = np.asarray(arrow.get_start() if start is None else start, dtype=float)
+        end = np.asarray(arrow.get_end() if end is None else end, dtype=float)
+        self.length = np.linalg.norm(end - self.start)
+        self.direction = (end - self.start) / self.length
+
+        # 先端が軸方向に占める長さ / Axial extent of the tips at each end
+        self.start_tip = self.end_tip = 0.0
+        for name in ("tip", "start_tip", "cone"):
+            tip = getattr(arrow, name, None)
+            if tip is None:
+                continue
+            along = np.concatenate([m.points for m in tip.family_members_with_points()]) - self.start
+            along = along @ self.direction
+            if along.mean() > self.length / 2:
+                self.end_tip = max(self.end_tip, self.length - along.min())
+            else:
+                self.start_tip = max(self.start_tip, along.max())
+
+    def place(self, start, end):
+        """
+        start から end への矢印にする
+        Make the arrow point from start to end
+        """
+        start, end = np.asarray(start, dtype=float), np.asarray(end, dtype=float)
+        length = np.linalg.norm(end - start)
+        rotation = _rotation_between(self.direction, (end - start) / length)
+        shaft = self.length - self.start_tip - self.end_tip
+        scale = max(length - self.start_tip - self.end_tip, 0.0) / shaft if shaft > 0 else 1.0
+
+        def transform(points):
+            offsets = points - self.start
+            along = offsets @ self.direction
+            # 軸方向の座標だけを区間ごとに写す: 始点側の先端はそのまま、軸は伸縮、終点側の先端は平行移動
+            # Only the axial coordinate changes: start tip fixed, shaft scaled, end tip shifted
+            stretched = np.where(
+                along <= self.start_tip,
+                along,
+                np.where(
+                    along >= self.length - self.end_tip,
+                    along + length - self.length,
+                    self.start_tip + (along - self.start_tip) * scale,
+                ),
+            )
+            offsets = offsets + np.outer(stretched - along, self.direction)
+            return start + offsets @ rotation.T
+
+        return self._write(transform)
@@ -12,7 +12,9 @@ gradually converging and eventually colliding at the center.
 """
 
 from manim import *
-import numpy as np
+
+from components import cached_text, follow_trajectory
+from physics import gravity_direction_and_strength, simulate, within
 
 
 class ConvergingBalls(Scene):
@@ -32,13 +34,13 @@ class ConvergingBalls(Scene):
 
         # 地球のラベル
         # Earth label
-        earth_label = Text("地球 / Earth", font_size=20, color=BLUE_B)
+        earth_label = cached_text("地球 / Earth", font_size=20, color=BLUE_B)
         earth_label.next_to(earth, DOWN, buff=0.3)
 
         # 地球の中心点
         # Earth's center point
         center_dot = Dot(earth_center, radius=0.08, color=WHITE)
-        center_label = Text("中心 / Center", font_size=16, color=WHITE)
+        center_label = cached_text("中心 / Center", font_size=16, color=WHITE)
         center_label.next_to(center_dot, DOWN, buff=0.15)
 
         # シーンを表示
@@ -80,8 +82,7 @@ class ConvergingBalls(Scene):
 
         # 矢印の方向を計算（中心に向かう）
         # Calculate arrow directions (toward center)
-        left_direction = (earth_center - left_pos) / np.linalg.norm(earth_center - left_pos)
-        right_direction = (earth_center - right_pos) / np.linalg.norm(earth_center - right_pos)
+        (left_direction, right_direction), _ = gravity_direction_and_strength([left_pos, right_pos], earth_center)
 
         arrow_length = 1.0
         gravity_left = Arrow(
@@ -101,11 +102,11 @@ class ConvergingBalls(Scene):
 
         # 説明テキスト
         # Explanation text
-        text1 = Text(
+        text1 = cached_text(
             "重力は地球の「中心」に向かって働く",
             font_size=24,
         )
-        text1_en = Text(
+        text1_en = cached_text(
             "Gravity points toward Earth's center",
             font_size=18,
             color=GRAY,
@@ -153,11 +154,11 @@ class ConvergingBalls(Scene):
 
         # 説明テキストを更新
         # Update explanation text
-        text2 = Text(
+        text2 = cached_text(
             "2つのボールは中心に向かって落ちていく",
             font_size=24,
         )
-        text2_en = Text(
+        text2_en = cached_text(
             "Both balls fall toward the center",
             font_size=18,
             color=GRAY,
@@ -170,13 +171,17 @@ class ConvergingBalls(Scene):
 
         # 落下アニメーション（中心に向かって加速）
         # Fall animation (accelerating toward center)
+        # 中心の近く（ボールの半径以内）に着くまでの軌道を計算
+        # Simulate the fall until both balls reach the center (within a ball radius)
         fall_duration = 2.5
+        fall = simulate(
+            [ball_left.get_center(), ball_right.get_center()],
+            earth_center,
+            stop=within(earth_center, ball_radius),
+        )
 
         self.play(
-            ball_left.animate.move_to(earth_center),
-            ball_right.animate.move_to(earth_center),
-            run_time=fall_duration,
-            rate_func=rate_functions.ease_in_quad,
+            follow_trajectory([ball_left, ball_right], fall, run_time=fall_duration),
         )
 
         # 衝突エフェクト
@@ -196,12 +201,12 @@ class ConvergingBalls(Scene):
 
         # 結論テキスト
         # Conclusion text
-        conclusion = Text(
+        conclusion = cached_text(
             "地球の中心でぶつかる！",
             font_size=28,
             color=YELLOW,
         )
-        conclusion_en = Text(
+        conclusion_en = cached_text(
             "They collide at Earth's center!",
             font_size=20,
             color=YELLOW_A,
@@ -283,11 +288,13 @@ class ConvergingBallsSimple(Scene):
 
         # 落下アニメーション
         # Fall animation
+        fall = simulate(
+            [ball_left.get_center(), ball_right.get_center()],
+            earth_center,
+            stop=within(earth_center, ball_radius),
+        )
         self.play(
-            ball_left.animate.move_to(earth_center),
-            ball_right.animate.move_to(earth_center),
-            run_time=2.0,
-            rate_func=rate_functions.ease_in_quad,
+            follow_trajectory([ball_left, ball_right], fall, run_time=2.0),
         )
 
         # 衝突フラッシュ
@@ -313,8 +320,8 @@ class ConvergingBallsWithLabels(Scene):
     def construct(self):
         # タイトル
         # Title
-        title = Text("地球は丸い → 重力は中心に向かう", font_size=26)
-        title_en = Text(
+        title = cached_text("地球は丸い → 重力は中心に向かう", font_size=26)
+        title_en = cached_text(
             "Earth is spherical → Gravity points to center",
             font_size=18,
             color=GRAY,
@@ -336,7 +343,7 @@ class ConvergingBallsWithLabels(Scene):
         # 地球の中心点とラベル
         # Earth's center and label
         center_dot = Dot(center_pos, radius=0.08, color=WHITE)
-        center_label = Text("中心", font_size=14, color=WHITE)
+        center_label = cached_text("中心", font_size=14, color=WHITE)
         center_label.next_to(center_dot, DOWN, buff=0.1)
 
         self.play(
@@ -375,7 +382,7 @@ class ConvergingBallsWithLabels(Scene):
             buff=0,
             max_tip_length_to_length_ratio=0.08,
         )
-        distance_label = Text("間隔 / Distance", font_size=14, color=YELLOW)
+        distance_label = cached_text("間隔 / Distance", font_size=14, color=YELLOW)
         distance_label.next_to(distance_arrow, DOWN, buff=0.1)
 
         self.play(
@@ -390,8 +397,7 @@ class ConvergingBallsWithLabels(Scene):
 
         # 重力の方向を示す矢印
         # Gravity arrows
-        left_dir = (center_pos - left_start) / np.linalg.norm(center_pos - left_start)
-        right_dir = (center_pos - right_start) / np.linalg.norm(center_pos - right_start)
+        (left_dir, right_dir), _ = gravity_direction_and_strength([left_start, right_start], center_pos)
 
         gravity_left = Arrow(
             left_start,
@@ -454,17 +460,17 @@ class ConvergingBallsWithLabels(Scene):
 
         # 中間地点での距離を示すテキスト
         # Text showing decreasing distance
-        shrinking_text = Text("間隔が縮まる...", font_size=20, color=YELLOW)
-        shrinking_text_en = Text("Distance shrinking...", font_size=14, color=YELLOW_A)
+        shrinking_text = cached_text("間隔が縮まる...", font_size=20, color=YELLOW)
+        shrinking_text_en = cached_text("Distance shrinking...", font_size=14, color=YELLOW_A)
         shrinking_group = VGroup(shrinking_text, shrinking_text_en).arrange(DOWN, buff=0.05)
         shrinking_group.to_edge(DOWN)
 
+        fall = simulate([left_start, right_start], center_pos, stop=within(center_pos, ball_radius))
+
         self.play(
-            ball_left.animate.move_to(center_pos),
-            ball_right.animate.move_to(center_pos),
+            follow_trajectory([ball_left, ball_right], fall),
             FadeIn(shrinking_group),
             run_time=fall_duration,
-            rate_func=rate_functions.ease_in_quad,
         )
 
         # 衝突エフェクト
@@ -482,8 +488,8 @@ class ConvergingBallsWithLabels(Scene):
 
         # 結論
         # Conclusion
-        conclusion = Text("中心でぶつかる！", font_size=24, color=YELLOW)
-        conclusion_en = Text("Collide at center!", font_size=16, color=YELLOW_A)
+        conclusion = cached_text("中心でぶつかる！", font_size=24, color=YELLOW)
+        conclusion_en = cached_text("Collide at center!", font_size=16, color=YELLOW_A)
         conclusion_group = VGroup(conclusion, conclusion_en).arrange(DOWN, buff=0.1)
         conclusion_group.to_edge(DOWN)
 
@@ -12,6 +12,9 @@ Balls falling while converging
 
 from manim import *
 
+from components import cached_text, follow_trajectory
+from physics import below, simulate
+
 
 class ConvergingFall(Scene):
     """収束しながら落下するボール（軌跡付き） / Balls converging while falling with trails"""
@@ -32,7 +35,7 @@ class ConvergingFall(Scene):
         # Create balls
         ball_radius = 0.45
         initial_spacing = 2.5  # 初期間隔
-        final_spacing = 2.1  # 着地時の間隔（少し狭くなる）
+        earth_center = DOWN * 26.0  # 画面の外の地球の中心（近さを誇張） / Earth's center off screen (exaggeratedly close)
         start_height = 2.5
 
         ball_left = Circle(radius=ball_radius, color="#e74c3c", fill_opacity=0.85)
@@ -94,25 +97,30 @@ class ConvergingFall(Scene):
 
         # 落下アニメーション（少し近づきながら）
         # Fall animation (converging slightly)
+        # 地球の中心に向かって落ちるので、着地するまでに少し近づく
+        # Both fall toward Earth's center, so they draw slightly closer before landing
+        fall = simulate(
+            [ball_left.get_center(), ball_right.get_center()],
+            earth_center,
+            stop=below(landing_y),
+        )
+        left_final, right_final = fall.final
         self.play(
-            ball_left.animate.move_to(LEFT * (final_spacing / 2) + UP * landing_y),
-            ball_right.animate.move_to(RIGHT * (final_spacing / 2) + UP * landing_y),
-            run_time=1.2,
-            rate_func=rate_functions.ease_in_quad,
+            follow_trajectory([ball_left, ball_right], fall, run_time=1.2),
         )
 
         # 軌跡を破線に変換して強調
         # Convert trails to dashed lines for emphasis
         trail_left_dashed = DashedLine(
             LEFT * (initial_spacing / 2) + UP * start_height,
-            LEFT * (final_spacing / 2) + UP * landing_y,
+            left_final,
             color="#e74c3c",
             stroke_width=3,
             dash_length=0.15,
         )
         trail_right_dashed = DashedLine(
             RIGHT * (initial_spacing / 2) + UP * start_height,
-            RIGHT * (final_spacing / 2) + UP * landing_y,
+            right_final,
             color="#3498db",
             stroke_width=3,
             dash_length=0.15,
@@ -142,7 +150,7 @@ class ConvergingFall(Scene):
 
         # はてなマークを表示（視聴者の疑問をくすぐる）
         # Show question mark to spark curiosity
-        question_mark = Text("？", font_size=120, color=YELLOW)
+        question_mark = cached_text("？", font_size=120, color=YELLOW)
         question_mark.move_to(UP * 1.0)
 
         self.play(
@@ -185,7 +193,7 @@ class ConvergingFallWithArrows(Scene):
         # ボールを作成
         ball_radius = 0.45
         initial_spacing = 2.5
-        final_spacing = 2.1
+        earth_center = DOWN * 26.0
         start_height = 2.5
 
         ball_left = Circle(radius=ball_radius, color="#e74c3c", fill_opacity=0.85)
@@ -242,25 +250,30 @@ class ConvergingFallWithArrows(Scene):
         self.add(trail_left, trail_right)
 
         # 落下アニメーション
+        # 地球の中心に向かって落ちるので、着地するまでに少し近づく
+        # Both fall toward Earth's center, so they draw slightly closer before landing
+        fall = simulate(
+            [ball_left.get_center(), ball_right.get_center()],
+            earth_center,
+            stop=below(landing_y),
+        )
+        left_final, right_final = fall.final
         self.play(
-            ball_left.animate.move_to(LEFT * (final_spacing / 2) + UP * landing_y),
-            ball_right.animate.move_to(RIGHT * (final_spacing / 2) + UP * landing_y),
-            run_time=1.2,
-            rate_func=rate_functions.ease_in_quad,
+            follow_trajectory([ball_left, ball_right], fall, run_time=1.2),
         )
 
         # 軌跡を破線に変換して強調
         # Convert trails to dashed lines for emphasis
         trail_left_dashed = DashedLine(
             LEFT * (initial_spacing / 2) + UP * start_height,
-            LEFT * (final_spacing / 2) + UP * landing_y,
+            left_final,
             color="#e74c3c",
             stroke_width=3,
             dash_length=0.15,
         )
         trail_right_dashed = DashedLine(
             RIGHT * (initial_spacing / 2) + UP * start_height,
-            RIGHT * (final_spacing / 2) + UP * landing_y,
+            right_final,
             color="#3498db",
             stroke_width=3,
             dash_length=0.15,
@@ -312,7 +325,7 @@ class ConvergingFallWithArrows(Scene):
         self.wait(0.3)
 
         # はてなマーク
-        question_mark = Text("？", font_size=120, color=YELLOW)
+        question_mark = cached_text("？", font_size=120, color=YELLOW)
         question_mark.move_to(UP * 1.0)
 
         self.play(
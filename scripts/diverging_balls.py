@@ -12,6 +12,9 @@ so it falls faster and the distance from the upper ball keeps increasing.
 from manim import *
 import numpy as np
 
+from components import ArrowPose, cached_text, follow_trajectory
+from physics import simulate, within
+
 
 class DivergingBalls(Scene):
     """
@@ -30,13 +33,13 @@ class DivergingBalls(Scene):
 
         # 地球のラベル
         # Earth label
-        earth_label = Text("地球 / Earth", font_size=20, color=BLUE_B)
+        earth_label = cached_text("地球 / Earth", font_size=20, color=BLUE_B)
         earth_label.next_to(earth, DOWN, buff=0.3)
 
         # 地球の中心点
         # Earth's center point
         center_dot = Dot(earth_center, radius=0.08, color=WHITE)
-        center_label = Text("中心 / Center", font_size=16, color=WHITE)
+        center_label = cached_text("中心 / Center", font_size=16, color=WHITE)
         center_label.next_to(center_dot, DOWN, buff=0.15)
 
         # シーンを表示
@@ -85,8 +88,8 @@ class DivergingBalls(Scene):
             stroke_width=4,
             max_tip_length_to_length_ratio=0.2,
         )
-        gravity_lower_label = Text("強い重力", font_size=14, color=YELLOW)
-        gravity_lower_label_en = Text("Strong gravity", font_size=10, color=YELLOW_A)
+        gravity_lower_label = cached_text("強い重力", font_size=14, color=YELLOW)
+        gravity_lower_label_en = cached_text("Strong gravity", font_size=10, color=YELLOW_A)
         gravity_lower_group = VGroup(gravity_lower_label, gravity_lower_label_en).arrange(DOWN, buff=0.05)
         gravity_lower_group.next_to(gravity_lower, RIGHT, buff=0.1)
 
@@ -99,18 +102,18 @@ class DivergingBalls(Scene):
             stroke_width=3,
             max_tip_length_to_length_ratio=0.25,
         )
-        gravity_upper_label = Text("弱い重力", font_size=14, color=ORANGE)
-        gravity_upper_label_en = Text("Weak gravity", font_size=10, color=ORANGE)
+        gravity_upper_label = cached_text("弱い重力", font_size=14, color=ORANGE)
+        gravity_upper_label_en = cached_text("Weak gravity", font_size=10, color=ORANGE)
         gravity_upper_group = VGroup(gravity_upper_label, gravity_upper_label_en).arrange(DOWN, buff=0.05)
         gravity_upper_group.next_to(gravity_upper, RIGHT, buff=0.1)
 
         # 説明テキスト
         # Explanation text
-        text1 = Text(
+        text1 = cached_text(
             "地球に近い方が重力が強い",
             font_size=24,
         )
-        text1_en = Text(
+        text1_en = cached_text(
             "Closer to Earth = Stronger gravity",
             font_size=18,
             color=GRAY,
@@ -138,11 +141,11 @@ class DivergingBalls(Scene):
 
         # 説明テキストを更新
         # Update explanation text
-        text2 = Text(
+        text2 = cached_text(
             "下のボールの方が速く落ちる",
             font_size=24,
         )
-        text2_en = Text(
+        text2_en = cached_text(
             "The lower ball falls faster",
             font_size=18,
             color=GRAY,
@@ -171,32 +174,36 @@ class DivergingBalls(Scene):
         # Fall animation (lower ball falls faster)
         fall_duration = 2.5
 
-        # 最終位置を計算（下のボールはより多く落下）
-        # Calculate final positions (lower ball falls more)
-        lower_final = earth_center + UP * 0.5  # 地球中心近くまで落下
-        upper_final = earth_center + UP * 1.8  # 上のボールはそこまで落ちない
+        # 下のボールが地球中心の近くに着くまでの軌道を計算（下のボールはより多く落下）
+        # Simulate until the lower ball nears Earth's center (it falls further than the upper one)
+        fall = simulate(
+            [ball_lower.get_center(), ball_upper.get_center()],
+            earth_center,
+            stop=within(earth_center, 0.5),
+            end="any",
+        )
 
-        # 距離矢印も更新しながら落下
-        # Fall while updating distance arrow
+        # 距離矢印も更新しながら落下（先端の大きさは保ち、軸だけ伸ばす）
+        # Fall while updating distance arrow (tips keep their size, only the shaft stretches)
+        distance_pose = ArrowPose(distance_arrow)
         self.play(
-            ball_lower.animate.move_to(lower_final),
-            ball_upper.animate.move_to(upper_final),
-            distance_arrow.animate.put_start_and_end_on(
-                lower_final + RIGHT * 0.3,
-                upper_final + RIGHT * 0.3,
+            follow_trajectory([ball_lower, ball_upper], fall),
+            UpdateFromAlphaFunc(
+                distance_arrow,
+                lambda arrow, alpha: distance_pose.place(*(fall.at(alpha) + RIGHT * 0.3)),
             ),
             run_time=fall_duration,
-            rate_func=rate_functions.ease_in_quad,
+            rate_func=linear,
         )
 
         # 結論テキスト
         # Conclusion text
-        conclusion = Text(
+        conclusion = cached_text(
             "2つのボールは離れていく！",
             font_size=28,
             color=GREEN,
         )
-        conclusion_en = Text(
+        conclusion_en = cached_text(
             "The two balls move apart!",
             font_size=20,
             color=GREEN_A,
@@ -257,14 +264,15 @@ class DivergingBallsSimple(Scene):
 
         # 落下アニメーション
         # Fall animation
-        lower_final = earth_center + UP * 0.5
-        upper_final = earth_center + UP * 1.6
+        fall = simulate(
+            [ball_lower.get_center(), ball_upper.get_center()],
+            earth_center,
+            stop=within(earth_center, 0.5),
+            end="any",
+        )
 
         self.play(
-            ball_lower.animate.move_to(lower_final),
-            ball_upper.animate.move_to(upper_final),
-            run_time=2.0,
-            rate_func=rate_functions.ease_in_quad,
+            follow_trajectory([ball_lower, ball_upper], fall, run_time=2.0),
         )
 
         self.wait(1.5)
@@ -279,8 +287,8 @@ class DivergingBallsWithLabels(Scene):
     def construct(self):
         # タイトル
         # Title
-        title = Text("縦に並べたボールを落とすと？", font_size=26)
-        title_en = Text(
+        title = cached_text("縦に並べたボールを落とすと？", font_size=26)
+        title_en = cached_text(
             "What happens when we drop vertically aligned balls?",
             font_size=16,
             color=GRAY,
@@ -302,7 +310,7 @@ class DivergingBallsWithLabels(Scene):
         # 地球の中心点とラベル
         # Earth's center and label
         center_dot = Dot(center_pos, radius=0.08, color=WHITE)
-        center_label = Text("中心", font_size=14, color=WHITE)
+        center_label = cached_text("中心", font_size=14, color=WHITE)
         center_label.next_to(center_dot, DOWN, buff=0.1)
 
         self.play(
@@ -341,7 +349,7 @@ class DivergingBallsWithLabels(Scene):
             buff=0,
             max_tip_length_to_length_ratio=0.15,
         )
-        initial_distance_label = Text("初期間隔", font_size=12, color=YELLOW)
+        initial_distance_label = cached_text("初期間隔", font_size=12, color=YELLOW)
         initial_distance_label.next_to(initial_distance_arrow, LEFT, buff=0.1)
 
         self.play(
@@ -389,22 +397,20 @@ class DivergingBallsWithLabels(Scene):
         # 落下アニメーション
         # Fall animation
         fall_duration = 2.5
-        lower_final = center_pos + UP * 0.5
-        upper_final = center_pos + UP * 1.7
+        fall = simulate([lower_start, upper_start], center_pos, stop=within(center_pos, 0.5), end="any")
+        lower_final, upper_final = fall.final
 
         # 距離が広がる様子を示すテキスト
         # Text showing increasing distance
-        expanding_text = Text("間隔が広がる...", font_size=20, color=GREEN)
-        expanding_text_en = Text("Distance increasing...", font_size=14, color=GREEN_A)
+        expanding_text = cached_text("間隔が広がる...", font_size=20, color=GREEN)
+        expanding_text_en = cached_text("Distance increasing...", font_size=14, color=GREEN_A)
         expanding_group = VGroup(expanding_text, expanding_text_en).arrange(DOWN, buff=0.05)
         expanding_group.to_edge(RIGHT).shift(UP * 0.5)
 
         self.play(
-            ball_lower.animate.move_to(lower_final),
-            ball_upper.animate.move_to(upper_final),
+            follow_trajectory([ball_lower, ball_upper], fall),
             FadeIn(expanding_group),
             run_time=fall_duration,
-            rate_func=rate_functions.ease_in_quad,
         )
 
         # 最終距離を示す矢印
@@ -417,7 +423,7 @@ class DivergingBallsWithLabels(Scene):
             buff=0,
             max_tip_length_to_length_ratio=0.1,
         )
-        final_distance_label = Text("広がった！", font_size=14, color=GREEN)
+        final_distance_label = cached_text("広がった！", font_size=14, color=GREEN)
         final_distance_label.next_to(final_distance_arrow, LEFT, buff=0.1)
 
         self.play(
@@ -428,8 +434,8 @@ class DivergingBallsWithLabels(Scene):
 
         # 結論
         # Conclusion
-        conclusion = Text("離れていく！", font_size=24, color=GREEN)
-        conclusion_en = Text("They move apart!", font_size=16, color=GREEN_A)
+        conclusion = cached_text("離れていく！", font_size=24, color=GREEN)
+        conclusion_en = cached_text("They move apart!", font_size=16, color=GREEN_A)
         conclusion_group = VGroup(conclusion, conclusion_en).arrange(DOWN, buff=0.1)
         conclusion_group.to_edge(DOWN)
 
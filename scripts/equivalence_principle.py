@@ -11,6 +11,8 @@ making the person inside feel as if gravity has "disappeared".
 
 from manim import *
 
+from components import cached_text
+
 
 class EquivalencePrinciple(Scene):
     """
@@ -20,7 +22,7 @@ class EquivalencePrinciple(Scene):
 
     def construct(self):
         # タイトル / Title
-        title = Text(
+        title = cached_text(
             "等価原理 / Equivalence Principle",
             font_size=32,
         )
@@ -41,7 +43,7 @@ class EquivalencePrinciple(Scene):
         elevator.move_to(ORIGIN)
 
         # 窓のない箱であることを示す / Indicate windowless box
-        no_window_text = Text(
+        no_window_text = cached_text(
             "窓のない箱 / Windowless box",
             font_size=18,
             color=GRAY,
@@ -59,7 +61,7 @@ class EquivalencePrinciple(Scene):
         self.wait(0.5)
 
         # フェーズ1：静止している状態 / Phase 1: At rest
-        phase1_text = Text(
+        phase1_text = cached_text(
             "静止状態 / At rest",
             font_size=24,
             color=BLUE,
@@ -75,8 +77,8 @@ class EquivalencePrinciple(Scene):
             stroke_width=5,
             max_tip_length_to_length_ratio=0.2,
         )
-        gravity_label = Text("重力 g", font_size=16, color=RED)
-        gravity_label_en = Text("Gravity", font_size=12, color=RED)
+        gravity_label = cached_text("重力 g", font_size=16, color=RED)
+        gravity_label_en = cached_text("Gravity", font_size=12, color=RED)
         gravity_label.next_to(gravity_arrow, RIGHT, buff=0.1)
         gravity_label_en.next_to(gravity_label, DOWN, buff=0.05)
         gravity_group = VGroup(gravity_label, gravity_label_en)
@@ -89,8 +91,8 @@ class EquivalencePrinciple(Scene):
             stroke_width=5,
             max_tip_length_to_length_ratio=0.2,
         )
-        normal_label = Text("床からの力", font_size=16, color=GREEN)
-        normal_label_en = Text("Normal force", font_size=12, color=GREEN)
+        normal_label = cached_text("床からの力", font_size=16, color=GREEN)
+        normal_label_en = cached_text("Normal force", font_size=12, color=GREEN)
         normal_label.next_to(normal_arrow, LEFT, buff=0.1)
         normal_label_en.next_to(normal_label, DOWN, buff=0.05)
         normal_group = VGroup(normal_label, normal_label_en)
@@ -106,7 +108,7 @@ class EquivalencePrinciple(Scene):
         self.wait(1)
 
         # フェーズ2：自由落下開始 / Phase 2: Free fall begins
-        phase2_text = Text(
+        phase2_text = cached_text(
             "自由落下！ / Free fall!",
             font_size=24,
             color=ORANGE,
@@ -128,7 +130,7 @@ class EquivalencePrinciple(Scene):
         fall_group = VGroup(elevator, person, gravity_arrow, gravity_group)
 
         # 落下中、エレベーター内の人の視点では... / From the person's perspective inside...
-        perspective_text = Text(
+        perspective_text = cached_text(
             "エレベーター内の視点 / Inside view",
             font_size=20,
             color=YELLOW,
@@ -145,7 +147,7 @@ class EquivalencePrinciple(Scene):
         self.wait(0.5)
 
         # フェーズ3：エレベーター基準で見ると / Phase 3: In the elevator's reference frame
-        phase3_text = Text(
+        phase3_text = cached_text(
             "エレベーター基準では... / In the elevator's frame...",
             font_size=24,
             color=YELLOW,
@@ -161,8 +163,8 @@ class EquivalencePrinciple(Scene):
             stroke_width=5,
             max_tip_length_to_length_ratio=0.2,
         )
-        inertial_label = Text("慣性力 -ma", font_size=16, color=BLUE)
-        inertial_label_en = Text("Inertial force", font_size=12, color=BLUE)
+        inertial_label = cached_text("慣性力 -ma", font_size=16, color=BLUE)
+        inertial_label_en = cached_text("Inertial force", font_size=12, color=BLUE)
         inertial_label.next_to(inertial_arrow, LEFT, buff=0.1)
         inertial_label_en.next_to(inertial_label, DOWN, buff=0.05)
         inertial_group = VGroup(inertial_label, inertial_label_en)
@@ -174,12 +176,12 @@ class EquivalencePrinciple(Scene):
         self.wait(0.5)
 
         # 力の打ち消し合いを強調 / Emphasize force cancellation
-        cancel_text = Text(
+        cancel_text = cached_text(
             "重力 + 慣性力 = 0",
             font_size=28,
             color=GREEN,
         )
-        cancel_text_en = Text(
+        cancel_text_en = cached_text(
             "Gravity + Inertial force = 0",
             font_size=20,
             color=GREEN,
@@ -219,12 +221,12 @@ class EquivalencePrinciple(Scene):
             run_time=0.8,
         )
 
-        conclusion_text = Text(
+        conclusion_text = cached_text(
             "重力が「消えた」ように感じる",
             font_size=26,
             color=GREEN,
         )
-        conclusion_text_en = Text(
+        conclusion_text_en = cached_text(
             "Gravity seems to have 'disappeared'",
             font_size=20,
             color=GREEN,
@@ -235,12 +237,12 @@ class EquivalencePrinciple(Scene):
         self.wait(1)
 
         # 等価原理のテキスト / Equivalence principle text
-        principle_text = Text(
+        principle_text = cached_text(
             "重力と加速度は局所的に区別できない",
             font_size=24,
             color=YELLOW,
         )
-        principle_text_en = Text(
+        principle_text_en = cached_text(
             "Gravity and acceleration are locally indistinguishable",
             font_size=18,
             color=YELLOW,
@@ -262,12 +264,12 @@ class EquivalencePrinciple(Scene):
         self.wait(2)
 
         # 最終メッセージ / Final message
-        final_text = Text(
+        final_text = cached_text(
             "これが「等価原理」",
             font_size=32,
             color=WHITE,
         )
-        final_text_en = Text(
+        final_text_en = cached_text(
             "This is the 'Equivalence Principle'",
             font_size=24,
             color=WHITE,
@@ -320,7 +322,7 @@ class EquivalencePrincipleSimple(Scene):
         # 右：自由落下中 / Right: In free fall
 
         # タイトル / Title
-        title = Text(
+        title = cached_text(
             "どちらも同じに見える / Both look the same",
             font_size=28,
         )
@@ -332,8 +334,8 @@ class EquivalencePrincipleSimple(Scene):
         left_box.set_stroke(width=3)
         left_box.move_to(LEFT * 3)
 
-        left_label = Text("宇宙空間で静止", font_size=16)
-        left_label_en = Text("At rest in space", font_size=12)
+        left_label = cached_text("宇宙空間で静止", font_size=16)
+        left_label_en = cached_text("At rest in space", font_size=12)
         left_labels = VGroup(left_label, left_label_en).arrange(DOWN, buff=0.05)
         left_labels.next_to(left_box, UP, buff=0.2)
 
@@ -346,8 +348,8 @@ class EquivalencePrincipleSimple(Scene):
         right_box.set_stroke(width=3)
         right_box.move_to(RIGHT * 3)
 
-        right_label = Text("自由落下中", font_size=16)
-        right_label_en = Text("In free fall", font_size=12)
+        right_label = cached_text("自由落下中", font_size=16)
+        right_label_en = cached_text("In free fall", font_size=12)
         right_labels = VGroup(right_label, right_label_en).arrange(DOWN, buff=0.05)
         right_labels.next_to(right_box, UP, buff=0.2)
 
@@ -369,12 +371,12 @@ class EquivalencePrincipleSimple(Scene):
         self.wait(0.5)
 
         # 両方で人が浮いている / Person floating in both
-        floating_text = Text(
+        floating_text = cached_text(
             "どちらも無重力に感じる",
             font_size=22,
             color=GREEN,
         )
-        floating_text_en = Text(
+        floating_text_en = cached_text(
             "Both feel weightless",
             font_size=16,
             color=GREEN,
@@ -386,12 +388,12 @@ class EquivalencePrincipleSimple(Scene):
         self.wait(1)
 
         # 区別できないことを強調 / Emphasize indistinguishability
-        question = Text(
+        question = cached_text(
             "窓がなければ、区別できない！",
             font_size=24,
             color=YELLOW,
         )
-        question_en = Text(
+        question_en = cached_text(
             "Without windows, they cannot be distinguished!",
             font_size=18,
             color=YELLOW,
@@ -15,6 +15,9 @@ yt_script.md L112-118 の解説用
 from manim import *
 import numpy as np
 
+from components import WarpedGrid, cached_text, mollweide_grid, mollweide_grid_points
+from physics import WarpMetric, geodesic_between
+
 
 class FlatVsCurvedGrid(Scene):
     """
@@ -24,8 +27,8 @@ class FlatVsCurvedGrid(Scene):
 
     def construct(self):
         # ===== タイトル =====
-        title = Text("平坦な空間 vs 曲がった空間", font_size=28)
-        title_en = Text("Flat Space vs Curved Space", font_size=18, color=GRAY)
+        title = cached_text("平坦な空間 vs 曲がった空間", font_size=28)
+        title_en = cached_text("Flat Space vs Curved Space", font_size=18, color=GRAY)
         title_group = VGroup(title, title_en).arrange(DOWN, buff=0.1)
         title_group.to_edge(UP, buff=0.3)
 
@@ -38,7 +41,7 @@ class FlatVsCurvedGrid(Scene):
         flat_grid = self.create_flat_grid()
         flat_grid.move_to(left_center)
 
-        flat_label = Text("平坦 / Flat", font_size=18, color=YELLOW)
+        flat_label = cached_text("平坦 / Flat", font_size=18, color=YELLOW)
         flat_label.next_to(flat_grid, DOWN, buff=0.3)
 
         # ===== 右側：モルワイデ図法風の格子 =====
@@ -47,7 +50,7 @@ class FlatVsCurvedGrid(Scene):
         curved_grid = self.create_mollweide_grid()
         curved_grid.move_to(right_center)
 
-        curved_label = Text("曲がった / Curved", font_size=18, color=GREEN)
+        curved_label = cached_text("曲がった / Curved", font_size=18, color=GREEN)
         curved_label.next_to(curved_grid, DOWN, buff=0.3)
 
         # 区切り線
@@ -115,8 +118,8 @@ class FlatVsCurvedGrid(Scene):
         self.wait(0.3)
 
         # ===== 「まっすぐ進む」テキスト =====
-        straight_text = Text("まっすぐ進む", font_size=16, color=WHITE)
-        straight_text_en = Text("Moving straight", font_size=12, color=GRAY)
+        straight_text = cached_text("まっすぐ進む", font_size=16, color=WHITE)
+        straight_text_en = cached_text("Moving straight", font_size=12, color=GRAY)
         straight_group = VGroup(straight_text, straight_text_en).arrange(DOWN, buff=0.05)
         straight_group.next_to(title_group, DOWN, buff=0.2)
 
@@ -153,8 +156,8 @@ class FlatVsCurvedGrid(Scene):
         )
 
         # 左側の結果表示
-        result_flat = Text("平行のまま", font_size=16, color=YELLOW)
-        result_flat_en = Text("Still parallel", font_size=12, color=YELLOW_A)
+        result_flat = cached_text("平行のまま", font_size=16, color=YELLOW)
+        result_flat_en = cached_text("Still parallel", font_size=12, color=YELLOW_A)
         result_flat_group = VGroup(result_flat, result_flat_en).arrange(DOWN, buff=0.05)
         result_flat_group.next_to(flat_grid, UP, buff=0.1)
 
@@ -170,8 +173,8 @@ class FlatVsCurvedGrid(Scene):
         )
 
         # 右側の結果表示
-        result_curved = Text("交わった！", font_size=16, color=GREEN)
-        result_curved_en = Text("They met!", font_size=12, color=GREEN_A)
+        result_curved = cached_text("交わった！", font_size=16, color=GREEN)
+        result_curved_en = cached_text("They met!", font_size=12, color=GREEN_A)
         result_curved_group = VGroup(result_curved, result_curved_en).arrange(DOWN, buff=0.05)
         result_curved_group.next_to(curved_grid, UP, buff=0.1)
 
@@ -194,8 +197,8 @@ class FlatVsCurvedGrid(Scene):
         self.wait(0.5)
 
         # ===== 結論 =====
-        conclusion = Text("曲がった空間では「まっすぐ」が交わる", font_size=22, color=WHITE)
-        conclusion_en = Text(
+        conclusion = cached_text("曲がった空間では「まっすぐ」が交わる", font_size=22, color=WHITE)
+        conclusion_en = cached_text(
             '"Straight" lines meet in curved space', font_size=14, color=GRAY
         )
         conclusion_group = VGroup(conclusion, conclusion_en).arrange(DOWN, buff=0.1)
@@ -235,56 +238,21 @@ class FlatVsCurvedGrid(Scene):
         return grid
 
     def create_mollweide_grid(self):
-        """モルワイデ図法風の格子を作成"""
-        grid = VGroup()
-
+        """モルワイデ図法風の格子を作成（格子線はキャッシュ済みの配列から）"""
         # 楕円のパラメータ
         a = 2.0  # 横幅
         b = 1.7  # 縦幅
 
-        # 外枠（楕円）
-        ellipse = Ellipse(width=2 * a, height=2 * b, color=BLUE_B, stroke_width=2)
-        grid.add(ellipse)
-
-        # 経線（縦の曲線）- 北極から南極へ
-        num_meridians = 7
-        for i in range(num_meridians):
-            # -1 から 1 までの値
-            t = -1 + (2 / (num_meridians - 1)) * i
-
-            # 経線をパラメトリックに描画
-            meridian = ParametricFunction(
-                lambda theta, t=t: np.array(
-                    [
-                        a * t * np.cos(theta),  # x: 楕円の形状に合わせる
-                        b * np.sin(theta),  # y: 縦方向
-                        0,
-                    ]
-                ),
-                t_range=[-PI / 2, PI / 2],
-                color=BLUE_B,
-                stroke_width=1.5 if i != num_meridians // 2 else 2,
-            )
-            grid.add(meridian)
-
-        # 緯線（横の曲線）
-        num_parallels = 5
-        for i in range(num_parallels):
-            # -1 から 1 までの値（極を除く）
-            v = -0.8 + (1.6 / (num_parallels - 1)) * i
-
-            # 緯線を楕円の一部として描画
-            y_pos = b * v
-            # この緯度での楕円の幅を計算
-            x_width = a * np.sqrt(1 - v**2)
-
-            parallel = Line(
-                LEFT * x_width + UP * y_pos,
-                RIGHT * x_width + UP * y_pos,
-                color=BLUE_B,
-                stroke_width=1.5 if abs(v) > 0.01 else 2,  # 赤道は太く
-            )
-            grid.add(parallel)
+        # 外枠（楕円）、経線7本（北極から南極へ）、緯線5本（極を除く）
+        # 中央の経線と赤道は太く
+        grid = mollweide_grid(
+            a,
+            b,
+            meridians=np.linspace(-1, 1, 7),
+            parallels=np.linspace(-0.8, 0.8, 5),
+            color=BLUE_B,
+            emphasis_width=2,
+        )
 
         # 北極と南極の点
         north_pole = Dot(UP * b, radius=0.08, color=WHITE)
@@ -292,9 +260,9 @@ class FlatVsCurvedGrid(Scene):
         grid.add(north_pole, south_pole)
 
         # 極のラベル
-        north_label = Text("N", font_size=12, color=WHITE)
+        north_label = cached_text("N", font_size=12, color=WHITE)
         north_label.next_to(north_pole, UP, buff=0.1)
-        south_label = Text("S", font_size=12, color=WHITE)
+        south_label = cached_text("S", font_size=12, color=WHITE)
         south_label.next_to(south_pole, DOWN, buff=0.1)
         grid.add(north_label, south_label)
 
@@ -327,20 +295,8 @@ class FlatVsCurvedGridSimple(Scene):
         flat_grid.move_to(left_center)
 
         # モルワイデ風格子（シンプル）
-        curved_grid = VGroup()
         a, b = 1.8, 1.5
-        ellipse = Ellipse(width=2 * a, height=2 * b, color=BLUE_B, stroke_width=2)
-        curved_grid.add(ellipse)
-
-        # 経線
-        for t in [-0.6, -0.3, 0, 0.3, 0.6]:
-            meridian = ParametricFunction(
-                lambda theta, t=t: np.array([a * t * np.cos(theta), b * np.sin(theta), 0]),
-                t_range=[-PI / 2, PI / 2],
-                color=BLUE_B,
-                stroke_width=1.5,
-            )
-            curved_grid.add(meridian)
+        curved_grid = mollweide_grid(a, b, meridians=[-0.6, -0.3, 0, 0.3, 0.6], color=BLUE_B)
 
         # 極の点
         curved_grid.add(Dot(UP * b, radius=0.06, color=WHITE))
@@ -348,9 +304,9 @@ class FlatVsCurvedGridSimple(Scene):
         curved_grid.move_to(right_center)
 
         # ラベル
-        flat_label = Text("平坦 / Flat", font_size=14, color=YELLOW)
+        flat_label = cached_text("平坦 / Flat", font_size=14, color=YELLOW)
         flat_label.next_to(flat_grid, DOWN, buff=0.2)
-        curved_label = Text("曲がった / Curved", font_size=14, color=GREEN)
+        curved_label = cached_text("曲がった / Curved", font_size=14, color=GREEN)
         curved_label.next_to(curved_grid, DOWN, buff=0.2)
 
         self.add(flat_grid, curved_grid, flat_label, curved_label)
@@ -427,8 +383,8 @@ class FlatVsCurvedGridWithTrajectory(Scene):
 
     def construct(self):
         # ===== タイトル =====
-        title = Text("「まっすぐ」なのに交わる？", font_size=28)
-        title_en = Text('"Straight" yet they meet?', font_size=18, color=GRAY)
+        title = cached_text("「まっすぐ」なのに交わる？", font_size=28)
+        title_en = cached_text('"Straight" yet they meet?', font_size=18, color=GRAY)
         title_group = VGroup(title, title_en).arrange(DOWN, buff=0.1)
         title_group.to_edge(UP, buff=0.3)
 
@@ -468,33 +424,15 @@ class FlatVsCurvedGridWithTrajectory(Scene):
         flat_grid.move_to(left_center)
 
         # モルワイデ風格子
-        curved_grid = VGroup()
         a, b = 2.0, 1.7
-        ellipse = Ellipse(width=2 * a, height=2 * b, color=BLUE_B, stroke_width=2, stroke_opacity=0.6)
-        curved_grid.add(ellipse)
-
-        for t in [-0.7, -0.35, 0, 0.35, 0.7]:
-            meridian = ParametricFunction(
-                lambda theta, t=t: np.array([a * t * np.cos(theta), b * np.sin(theta), 0]),
-                t_range=[-PI / 2, PI / 2],
-                color=BLUE_B,
-                stroke_width=1.5,
-                stroke_opacity=0.6,
-            )
-            curved_grid.add(meridian)
-
-        for v in [-0.6, -0.3, 0, 0.3, 0.6]:
-            y_pos = b * v
-            x_width = a * np.sqrt(1 - v**2)
-            curved_grid.add(
-                Line(
-                    LEFT * x_width + UP * y_pos,
-                    RIGHT * x_width + UP * y_pos,
-                    color=BLUE_B,
-                    stroke_width=1.5,
-                    stroke_opacity=0.6,
-                )
-            )
+        curved_grid = mollweide_grid(
+            a,
+            b,
+            meridians=[-0.7, -0.35, 0, 0.35, 0.7],
+            parallels=[-0.6, -0.3, 0, 0.3, 0.6],
+            color=BLUE_B,
+            stroke_opacity=0.6,
+        )
 
         north_pole = Dot(UP * b, radius=0.08, color=WHITE)
         south_pole_dot = Dot(DOWN * b, radius=0.08, color=WHITE)
@@ -502,9 +440,9 @@ class FlatVsCurvedGridWithTrajectory(Scene):
         curved_grid.move_to(right_center)
 
         # ラベル
-        flat_label = Text("平坦 / Flat", font_size=16, color=YELLOW)
+        flat_label = cached_text("平坦 / Flat", font_size=16, color=YELLOW)
         flat_label.next_to(flat_grid, DOWN, buff=0.25)
-        curved_label = Text("曲がった / Curved", font_size=16, color=GREEN)
+        curved_label = cached_text("曲がった / Curved", font_size=16, color=GREEN)
         curved_label.next_to(curved_grid, DOWN, buff=0.25)
 
         divider = DashedLine(UP * 2.5, DOWN * 2.5, color=GRAY, stroke_width=1)
@@ -539,19 +477,9 @@ class FlatVsCurvedGridWithTrajectory(Scene):
         south_pole = right_center + DOWN * b
         t1, t2 = -0.25, 0.25
 
-        trajectory_curved1 = ParametricFunction(
-            lambda theta: right_center
-            + np.array([a * t1 * np.cos(theta), b * np.sin(theta), 0]),
-            t_range=[-PI / 2, PI / 2],
-            color=GREEN_A,
-            stroke_width=2,
-        )
-        trajectory_curved2 = ParametricFunction(
-            lambda theta: right_center
-            + np.array([a * t2 * np.cos(theta), b * np.sin(theta), 0]),
-            t_range=[-PI / 2, PI / 2],
-            color=GREEN_A,
-            stroke_width=2,
+        trajectory_curved1, trajectory_curved2 = (
+            VMobject(color=GREEN_A, stroke_width=2).set_points(points).shift(right_center)
+            for points in mollweide_grid_points(a, b, meridians=[t1, t2])[0]
         )
 
         self.play(
@@ -626,18 +554,18 @@ class FlatVsCurvedGridWithTrajectory(Scene):
         self.remove(flash)
 
         # ===== 結果 =====
-        result_flat = Text("平行のまま", font_size=16, color=YELLOW)
+        result_flat = cached_text("平行のまま", font_size=16, color=YELLOW)
         result_flat.next_to(flat_grid, UP, buff=0.1)
 
-        result_curved = Text("交わった！", font_size=16, color=GREEN)
+        result_curved = cached_text("交わった！", font_size=16, color=GREEN)
         result_curved.next_to(curved_grid, UP, buff=0.1)
 
         self.play(Write(result_flat), Write(result_curved))
         self.wait(0.5)
 
         # ===== 結論 =====
-        conclusion = Text("これが「時空の曲がり」", font_size=24, color=WHITE)
-        conclusion_en = Text("This is spacetime curvature", font_size=16, color=GRAY)
+        conclusion = cached_text("これが「時空の曲がり」", font_size=24, color=WHITE)
+        conclusion_en = cached_text("This is spacetime curvature", font_size=16, color=GRAY)
         conclusion_group = VGroup(conclusion, conclusion_en).arrange(DOWN, buff=0.1)
         conclusion_group.to_edge(DOWN, buff=0.3)
 
@@ -658,8 +586,8 @@ class GravityWellMetric(Scene):
 
     def construct(self):
         # ===== タイトル =====
-        title = Text("時空が曲がると「まっすぐ」も変わる", font_size=26)
-        title_en = Text("When spacetime curves, 'straight' changes too", font_size=16, color=GRAY)
+        title = cached_text("時空が曲がると「まっすぐ」も変わる", font_size=26)
+        title_en = cached_text("When spacetime curves, 'straight' changes too", font_size=16, color=GRAY)
         title_group = VGroup(title, title_en).arrange(DOWN, buff=0.1)
         title_group.to_edge(UP, buff=0.3)
 
@@ -673,90 +601,30 @@ class GravityWellMetric(Scene):
         well_strength = 0.8   # 歪みの強さ
         well_radius = 1.2     # 歪みの影響範囲
 
-        # ===== 変形関数 =====
-        def warp_point(point, strength=well_strength, radius=well_radius):
-            """
-            重力井戸による点の変形
-            中心に近いほど格子が密になる（放射方向に縮む）
-            """
-            x, y = point[0], point[1]
-            r = np.sqrt(x**2 + y**2)
-            if r < 0.01:
-                return point
-
-            # 中心に近いほど放射方向に「引き寄せられる」
-            # これにより格子が中心付近で密になる
-            factor = 1 - strength * np.exp(-(r / radius) ** 2)
-            new_r = r * factor
-            return np.array([x * new_r / r, y * new_r / r, 0])
-
-        # ===== 平坦な格子を作成 =====
-        flat_grid = VGroup()
-        spacing = 2 * grid_size / (num_lines - 1)
-
-        # 縦線
-        for i in range(num_lines):
-            x = -grid_size + spacing * i
-            line = Line(
-                np.array([x, -grid_size, 0]),
-                np.array([x, grid_size, 0]),
-                color=BLUE_B,
-                stroke_width=1.5,
-                stroke_opacity=0.7,
-            )
-            flat_grid.add(line)
-
-        # 横線
-        for i in range(num_lines):
-            y = -grid_size + spacing * i
-            line = Line(
-                np.array([-grid_size, y, 0]),
-                np.array([grid_size, y, 0]),
-                color=BLUE_B,
-                stroke_width=1.5,
-                stroke_opacity=0.7,
-            )
-            flat_grid.add(line)
-
-        # ===== 歪んだ格子を作成 =====
-        warped_grid = VGroup()
+        # ===== 変形（重力井戸の計量が誘導する写像） =====
+        # 中心に近いほど格子が密になる（放射方向に縮む）
+        # Grid coordinates are pulled toward the well; the map is vectorized
+        metric = WarpMetric(well_strength, well_radius, center=well_center)
+
+        # ===== 平坦な格子と歪んだ格子 =====
+        # 全ての格子線を1つの VMobject にまとめ、格子全体を1回で変形する。
+        # 点の並びが同じなので Transform で点ごとに滑らかに移る。
+        # All lines in one VMobject, the whole lattice warped in one call;
+        # both grids share a point layout, so Transform morphs point by point.
+        grid_style = dict(color=BLUE_B, stroke_width=1.5, stroke_opacity=0.7)
         num_segments = 30  # 各線を滑らかにするためのセグメント数
-
-        # 縦線（歪み適用）
-        for i in range(num_lines):
-            x = -grid_size + spacing * i
-            points = []
-            for j in range(num_segments + 1):
-                y = -grid_size + (2 * grid_size / num_segments) * j
-                warped = warp_point(np.array([x, y, 0]))
-                points.append(warped)
-
-            warped_line = VMobject(color=BLUE_B, stroke_width=1.5, stroke_opacity=0.7)
-            warped_line.set_points_smoothly(points)
-            warped_grid.add(warped_line)
-
-        # 横線（歪み適用）
-        for i in range(num_lines):
-            y = -grid_size + spacing * i
-            points = []
-            for j in range(num_segments + 1):
-                x = -grid_size + (2 * grid_size / num_segments) * j
-                warped = warp_point(np.array([x, y, 0]))
-                points.append(warped)
-
-            warped_line = VMobject(color=BLUE_B, stroke_width=1.5, stroke_opacity=0.7)
-            warped_line.set_points_smoothly(points)
-            warped_grid.add(warped_line)
+        flat_grid = WarpedGrid(grid_size, num_lines, samples=num_segments + 1, **grid_style)
+        warped_grid = WarpedGrid(grid_size, num_lines, warp=metric.warp, samples=num_segments + 1, **grid_style)
 
         # ===== 重力源の表示 =====
         gravity_source = Dot(well_center, radius=0.15, color=YELLOW)
-        gravity_label = Text("M", font_size=16, color=YELLOW)
+        gravity_label = cached_text("M", font_size=16, color=YELLOW)
         gravity_label.next_to(gravity_source, DOWN, buff=0.15)
         gravity_group = VGroup(gravity_source, gravity_label)
 
         # ===== まず平坦な格子を表示 =====
-        flat_text = Text("平坦な空間", font_size=20, color=WHITE)
-        flat_text_en = Text("Flat space", font_size=14, color=GRAY)
+        flat_text = cached_text("平坦な空間", font_size=20, color=WHITE)
+        flat_text_en = cached_text("Flat space", font_size=14, color=GRAY)
         flat_text_group = VGroup(flat_text, flat_text_en).arrange(DOWN, buff=0.05)
         flat_text_group.to_edge(DOWN, buff=0.5)
 
@@ -765,8 +633,8 @@ class GravityWellMetric(Scene):
         self.wait(0.5)
 
         # ===== 重力源を配置して格子を歪める =====
-        warp_text = Text("質量があると空間が歪む", font_size=20, color=YELLOW)
-        warp_text_en = Text("Mass warps space", font_size=14, color=YELLOW_A)
+        warp_text = cached_text("質量があると空間が歪む", font_size=20, color=YELLOW)
+        warp_text_en = cached_text("Mass warps space", font_size=14, color=YELLOW_A)
         warp_text_group = VGroup(warp_text, warp_text_en).arrange(DOWN, buff=0.05)
         warp_text_group.to_edge(DOWN, buff=0.5)
 
@@ -786,8 +654,8 @@ class GravityWellMetric(Scene):
         self.wait(0.5)
 
         # ===== 格子の説明 =====
-        metric_text = Text("格子の目盛りが場所によって違う", font_size=18, color=WHITE)
-        metric_text_en = Text("Grid spacing varies by location", font_size=12, color=GRAY)
+        metric_text = cached_text("格子の目盛りが場所によって違う", font_size=18, color=WHITE)
+        metric_text_en = cached_text("Grid spacing varies by location", font_size=12, color=GRAY)
         metric_text_group = VGroup(metric_text, metric_text_en).arrange(DOWN, buff=0.05)
         metric_text_group.to_edge(DOWN, buff=0.5)
 
@@ -800,34 +668,18 @@ class GravityWellMetric(Scene):
         start_point = np.array([-grid_size, 1.0, 0])  # A: 左端、上から4番目
         end_point = np.array([grid_size, 1.0, 0])     # B: 右端、上から4番目
 
-        # 測地線の計算：変形前の直線を warp_point で変形
-        # これにより「格子の目盛りではまっすぐ」な経路が得られる
-        def compute_geodesic_on_grid(start, end, num_points=50):
-            """
-            格子に沿った測地線を計算
-            変形前の直線を同じ変形関数で歪める
-            → 格子の目盛りでは「まっすぐ」だが、ユークリッド的には曲がって見える
-            """
-            geodesic_points = []
-            for i in range(num_points):
-                t = i / (num_points - 1)
-                # 変形前の直線上の点
-                p = start + (end - start) * t
-                # 格子と同じ変形を適用
-                warped_p = warp_point(p)
-                geodesic_points.append(warped_p)
-            return geodesic_points
-
-        geodesic_points = compute_geodesic_on_grid(start_point, end_point)
+        # 変形後の始点・終点
+        warped_start, warped_end = np.pad(metric.warp([start_point[:2], end_point[:2]]), ((0, 0), (0, 1)))
+
+        # 測地線の計算：格子の目盛りを物差しとする計量で測地線方程式を積分
+        # 格子の目盛りでは「まっすぐ」だが、ユークリッド的には曲がって見える
+        # Geodesic of the metric in which the grid steps measure length
+        geodesic_points = geodesic_between(metric, warped_start, warped_end, num_points=50)
 
         # 測地線の描画
         geodesic_line = VMobject(color=ORANGE, stroke_width=4)
         geodesic_line.set_points_smoothly(geodesic_points)
 
-        # 変形後の始点・終点
-        warped_start = warp_point(start_point)
-        warped_end = warp_point(end_point)
-
         # 直線（ユークリッド的最短）も表示して比較
         # 変形後の始点・終点を結ぶ直線
         euclidean_line = DashedLine(
@@ -845,9 +697,9 @@ class GravityWellMetric(Scene):
         # 開始点と終了点のマーカー（変形後の位置）
         start_marker = Dot(warped_start, radius=0.08, color=GREEN_C)
         end_marker = Dot(warped_end, radius=0.08, color=GREEN_C)
-        start_label = Text("A", font_size=14, color=GREEN_C)
+        start_label = cached_text("A", font_size=14, color=GREEN_C)
         start_label.next_to(start_marker, UP + LEFT, buff=0.1)
-        end_label = Text("B", font_size=14, color=GREEN_C)
+        end_label = cached_text("B", font_size=14, color=GREEN_C)
         end_label.next_to(end_marker, UP + RIGHT, buff=0.1)
 
         self.play(
@@ -859,8 +711,8 @@ class GravityWellMetric(Scene):
         )
 
         # 直線を表示（これは最短ではない！）
-        euclidean_text = Text("ユークリッド的な直線", font_size=16, color=RED_A)
-        euclidean_text_en = Text("Euclidean straight line", font_size=12, color=RED_A)
+        euclidean_text = cached_text("ユークリッド的な直線", font_size=16, color=RED_A)
+        euclidean_text_en = cached_text("Euclidean straight line", font_size=12, color=RED_A)
         euclidean_text_group = VGroup(euclidean_text, euclidean_text_en).arrange(DOWN, buff=0.05)
         euclidean_text_group.to_edge(DOWN, buff=0.5)
 
@@ -872,8 +724,8 @@ class GravityWellMetric(Scene):
         self.wait(0.5)
 
         # ===== 測地線を表示 =====
-        geodesic_text = Text("格子に沿って「まっすぐ」進んだ経路", font_size=16, color=ORANGE)
-        geodesic_text_en = Text("Path going 'straight' along the grid", font_size=12, color=ORANGE)
+        geodesic_text = cached_text("格子に沿って「まっすぐ」進んだ経路", font_size=16, color=ORANGE)
+        geodesic_text_en = cached_text("Path going 'straight' along the grid", font_size=12, color=ORANGE)
         geodesic_text_group = VGroup(geodesic_text, geodesic_text_en).arrange(DOWN, buff=0.05)
         geodesic_text_group.to_edge(DOWN, buff=0.5)
 
@@ -895,8 +747,8 @@ class GravityWellMetric(Scene):
         self.wait(0.5)
 
         # ===== 結論 =====
-        conclusion = Text("曲がって見えるけど、これが「まっすぐ」", font_size=22, color=WHITE)
-        conclusion_en = Text('Looks curved, but this IS "straight"', font_size=14, color=GRAY)
+        conclusion = cached_text("曲がって見えるけど、これが「まっすぐ」", font_size=22, color=WHITE)
+        conclusion_en = cached_text('Looks curved, but this IS "straight"', font_size=14, color=GRAY)
         conclusion_group = VGroup(conclusion, conclusion_en).arrange(DOWN, buff=0.1)
         conclusion_group.to_edge(DOWN, buff=0.4)
 
@@ -912,8 +764,8 @@ class GravityWellMetricComparison(Scene):
 
     def construct(self):
         # ===== タイトル =====
-        title = Text("平坦な空間 vs 歪んだ空間", font_size=26)
-        title_en = Text("Flat Space vs Warped Space", font_size=16, color=GRAY)
+        title = cached_text("平坦な空間 vs 歪んだ空間", font_size=26)
+        title_en = cached_text("Flat Space vs Warped Space", font_size=16, color=GRAY)
         title_group = VGroup(title, title_en).arrange(DOWN, buff=0.1)
         title_group.to_edge(UP, buff=0.3)
 
@@ -929,73 +781,25 @@ class GravityWellMetricComparison(Scene):
         left_center = LEFT * 3.3
         right_center = RIGHT * 3.3
 
-        # ===== 変形関数 =====
-        def warp_point(point, center, strength=well_strength, radius=well_radius):
-            rel = point - center
-            x, y = rel[0], rel[1]
-            r = np.sqrt(x**2 + y**2)
-            if r < 0.01:
-                return point
-            factor = 1 - strength * np.exp(-(r / radius) ** 2)
-            new_r = r * factor
-            return center + np.array([x * new_r / r, y * new_r / r, 0])
-
         # ===== 左側：平坦な格子 =====
-        flat_grid = VGroup()
-        spacing = 2 * grid_size / (num_lines - 1)
+        grid_style = dict(color=BLUE_B, stroke_width=1.5, stroke_opacity=0.7)
+        flat_grid = WarpedGrid(grid_size, num_lines, samples=2, **grid_style).shift(left_center)
 
-        for i in range(num_lines):
-            x = -grid_size + spacing * i
-            flat_grid.add(Line(
-                left_center + np.array([x, -grid_size, 0]),
-                left_center + np.array([x, grid_size, 0]),
-                color=BLUE_B, stroke_width=1.5, stroke_opacity=0.7,
-            ))
-        for i in range(num_lines):
-            y = -grid_size + spacing * i
-            flat_grid.add(Line(
-                left_center + np.array([-grid_size, y, 0]),
-                left_center + np.array([grid_size, y, 0]),
-                color=BLUE_B, stroke_width=1.5, stroke_opacity=0.7,
-            ))
-
-        flat_label = Text("平坦 / Flat", font_size=16, color=YELLOW)
+        flat_label = cached_text("平坦 / Flat", font_size=16, color=YELLOW)
         flat_label.next_to(flat_grid, DOWN, buff=0.25)
 
         # ===== 右側：歪んだ格子 =====
-        warped_grid = VGroup()
+        # 格子全体を重力井戸の写像で1回で変形 / The whole lattice warped in one call
+        right_metric = WarpMetric(well_strength, well_radius, center=right_center)
         num_segments = 25
-
-        for i in range(num_lines):
-            x = -grid_size + spacing * i
-            points = []
-            for j in range(num_segments + 1):
-                y = -grid_size + (2 * grid_size / num_segments) * j
-                p = right_center + np.array([x, y, 0])
-                warped = warp_point(p, right_center)
-                points.append(warped)
-            warped_line = VMobject(color=BLUE_B, stroke_width=1.5, stroke_opacity=0.7)
-            warped_line.set_points_smoothly(points)
-            warped_grid.add(warped_line)
-
-        for i in range(num_lines):
-            y = -grid_size + spacing * i
-            points = []
-            for j in range(num_segments + 1):
-                x = -grid_size + (2 * grid_size / num_segments) * j
-                p = right_center + np.array([x, y, 0])
-                warped = warp_point(p, right_center)
-                points.append(warped)
-            warped_line = VMobject(color=BLUE_B, stroke_width=1.5, stroke_opacity=0.7)
-            warped_line.set_points_smoothly(points)
-            warped_grid.add(warped_line)
+        warped_grid = WarpedGrid(grid_size, num_lines, warp=right_metric.warp, samples=num_segments + 1, **grid_style)
 
         # 重力源
         gravity_source = Dot(right_center, radius=0.12, color=YELLOW)
-        gravity_label_m = Text("M", font_size=14, color=YELLOW)
+        gravity_label_m = cached_text("M", font_size=14, color=YELLOW)
         gravity_label_m.next_to(gravity_source, DOWN, buff=0.1)
 
-        warped_label = Text("歪んだ / Warped", font_size=16, color=GREEN)
+        warped_label = cached_text("歪んだ / Warped", font_size=16, color=GREEN)
         warped_label.next_to(warped_grid, DOWN, buff=0.25)
 
         # 区切り線
@@ -1024,28 +828,13 @@ class GravityWellMetricComparison(Scene):
         flat_ball.set_stroke(color=WHITE, width=2)
         flat_ball.move_to(left_start)
 
-        # 右側：測地線（迂回経路）
+        # 右側：測地線（重力井戸の側へ曲がる経路）
         right_start = right_center + np.array([-1.3, 1.0, 0])
         right_end = right_center + np.array([1.3, -0.8, 0])
 
-        def compute_geodesic_right(start, end, center, num_points=40):
-            geodesic_points = []
-            for i in range(num_points):
-                t = i / (num_points - 1)
-                p = start + (end - start) * t
-                deflection = np.sin(t * PI) ** 2
-                rel = p - center
-                r = np.sqrt(rel[0]**2 + rel[1]**2)
-                if r > 0.1:
-                    push_strength = 0.5 * deflection * np.exp(-(r / 1.0)**2)
-                    push_dir = rel / r
-                    new_p = p + push_dir * push_strength
-                else:
-                    new_p = p
-                geodesic_points.append(new_p)
-            return geodesic_points
-
-        geodesic_points = compute_geodesic_right(right_start, right_end, right_center)
+        # 重力井戸の計量で測地線方程式を積分（井戸の側へ曲がる）
+        # Integrate the geodesic equation of the well's metric (bends toward the well)
+        geodesic_points = geodesic_between(right_metric, right_start, right_end, num_points=40)
         warped_path = VMobject(color=ORANGE, stroke_width=3)
         warped_path.set_points_smoothly(geodesic_points)
 
@@ -1064,8 +853,8 @@ class GravityWellMetricComparison(Scene):
         self.play(FadeIn(markers), run_time=0.3)
 
         # 経路を表示
-        path_text = Text("どちらも「最短経路」", font_size=20, color=ORANGE)
-        path_text_en = Text("Both are 'shortest paths'", font_size=14, color=ORANGE)
+        path_text = cached_text("どちらも「最短経路」", font_size=20, color=ORANGE)
+        path_text_en = cached_text("Both are 'shortest paths'", font_size=14, color=ORANGE)
         path_text_group = VGroup(path_text, path_text_en).arrange(DOWN, buff=0.05)
         path_text_group.to_edge(DOWN, buff=0.4)
 
@@ -1093,8 +882,8 @@ class GravityWellMetricComparison(Scene):
         self.wait(0.5)
 
         # 結論
-        conclusion = Text("計量が違えば「まっすぐ」も違う", font_size=22, color=WHITE)
-        conclusion_en = Text("Different metrics mean different 'straight'", font_size=14, color=GRAY)
+        conclusion = cached_text("計量が違えば「まっすぐ」も違う", font_size=22, color=WHITE)
+        conclusion_en = cached_text("Different metrics mean different 'straight'", font_size=14, color=GRAY)
         conclusion_group = VGroup(conclusion, conclusion_en).arrange(DOWN, buff=0.1)
         conclusion_group.to_edge(DOWN, buff=0.4)
 
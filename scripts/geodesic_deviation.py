@@ -14,6 +14,9 @@ yt_script.md L126-131 の解説用
 from manim import *
 import numpy as np
 
+from components import cached_text
+from physics import jacobi_fields
+
 
 class GeodesicDeviation(Scene):
     """
@@ -28,8 +31,8 @@ class GeodesicDeviation(Scene):
 
     def construct(self):
         # ===== タイトル =====
-        title = Text("測地線偏差", font_size=32)
-        title_en = Text("Geodesic Deviation", font_size=20, color=GRAY)
+        title = cached_text("測地線偏差", font_size=32)
+        title_en = cached_text("Geodesic Deviation", font_size=20, color=GRAY)
         title_group = VGroup(title, title_en).arrange(DOWN, buff=0.1)
         title_group.to_edge(UP, buff=0.4)
 
@@ -43,95 +46,91 @@ class GeodesicDeviation(Scene):
         end_y = 2.5
 
         # 間隔のパラメータ
-        # t=0: 広い, t=0.5: 最も狭い, t=1: 再び広い
+        # 曲率 K(t) は前半で正（収束）、後半で負（発散）。描いた間隔（S字カーブ込み）は
+        # 2.5 から t≈0.7 で約 1.5 まで狭まり、終点で約 2.8 に戻る
+        # Curvature K(t) is positive early on (converging) and negative later
+        # (diverging); the drawn gap, S-curve included, narrows from 2.5 to about
+        # 1.5 near t≈0.7 and widens back to about 2.8 at the end
         initial_separation = 2.5   # 開始時の間隔
-        min_separation = 0.4       # 最小間隔（中間点）
-        final_separation = 3.0     # 終了時の間隔
-
-        def separation_at(t):
-            """
-            tに応じた間隔を計算（滑らかなcosine補間）
-            t=0: initial, t=0.5: min, t=1: final
-            """
-            if t <= 0.5:
-                # 0 -> 0.5: 収束（間隔が狭まる）
-                # cosine補間で滑らかに
-                ratio = (1 - np.cos(t * 2 * PI)) / 2  # 0->1 滑らかに
-                return initial_separation + (min_separation - initial_separation) * ratio
-            else:
-                # 0.5 -> 1: 発散（間隔が広がる）
-                # cosine補間で滑らかに
-                local_t = (t - 0.5) * 2  # 0->1に正規化
-                ratio = (1 - np.cos(local_t * PI)) / 2  # 0->1 滑らかに
-                return min_separation + (final_separation - min_separation) * ratio
-
-        def geodesic1_path(t):
-            """左側の測地線（滑らかな曲線）"""
-            y = start_y + t * (end_y - start_y)
-            sep = separation_at(t)
-            # 滑らかなS字カーブを追加
-            curve = 0.5 * np.sin(t * PI)
-            x = center_x - sep / 2 - curve
-            return np.array([x, y, 0])
-
-        def geodesic2_path(t):
-            """右側の測地線（滑らかな曲線）"""
-            y = start_y + t * (end_y - start_y)
-            sep = separation_at(t)
-            # 滑らかなS字カーブを追加
-            curve = 0.5 * np.sin(t * PI)
-            x = center_x + sep / 2 + curve
-            return np.array([x, y, 0])
+        converging_curvature = 10.0
+        diverging_curvature = 36.0
+        flip_t = 0.4               # 曲率の符号が変わる位置
+
+        def curvature(t):
+            return converging_curvature - (converging_curvature + diverging_curvature) * 0.5 * (
+                1 + np.tanh((t - flip_t) / 0.15)
+            )
+
+        # ヤコビ方程式で2本の測地線の偏差を一度に求める（初めは平行）
+        # Solve the Jacobi equation for both geodesics at once (initially parallel)
+        t = np.linspace(0, 1, 201)
+        offsets = jacobi_fields(curvature, t, [-initial_separation / 2, initial_separation / 2])
+
+        # 滑らかなS字カーブを加えて平面に配置
+        # Lay them out on the plane with a smooth S-curve added
+        y = start_y + t * (end_y - start_y)
+        curve = 0.5 * np.sin(t * PI)
+        geodesic1_points = np.stack([center_x + offsets[0] - curve, y, np.zeros_like(t)], axis=1)
+        geodesic2_points = np.stack([center_x + offsets[1] + curve, y, np.zeros_like(t)], axis=1)
+
+        # 描いた2本の間隔が最も狭い点で前半と後半に分ける
+        # Split into the converging and diverging halves where the drawn gap is narrowest
+        narrowest = int(np.argmin(np.linalg.norm(geodesic2_points - geodesic1_points, axis=1)))
+
+        def path_between(points, first, last, color):
+            path = VMobject(color=color, stroke_width=4)
+            path.set_points_smoothly(points[first : last + 1])
+            return path
 
         # ===== 測地線ラベル =====
-        geodesic_label1 = Text("測地線", font_size=16, color=RED_A)
-        geodesic_label1_en = Text("Geodesic", font_size=12, color=RED_A)
+        geodesic_label1 = cached_text("測地線", font_size=16, color=RED_A)
+        geodesic_label1_en = cached_text("Geodesic", font_size=12, color=RED_A)
         geodesic_group1 = VGroup(geodesic_label1, geodesic_label1_en).arrange(DOWN, buff=0.03)
 
-        geodesic_label2 = Text("測地線", font_size=16, color=BLUE_A)
-        geodesic_label2_en = Text("Geodesic", font_size=12, color=BLUE_A)
+        geodesic_label2 = cached_text("測地線", font_size=16, color=BLUE_A)
+        geodesic_label2_en = cached_text("Geodesic", font_size=12, color=BLUE_A)
         geodesic_group2 = VGroup(geodesic_label2, geodesic_label2_en).arrange(DOWN, buff=0.03)
 
         # ===== 間隔を示す矢印（3箇所：開始、中間、終了） =====
         # 開始時の間隔（t=0）
         start_arrow = DoubleArrow(
-            geodesic1_path(0),
-            geodesic2_path(0),
+            geodesic1_points[0],
+            geodesic2_points[0],
             color=GREEN_C,
             stroke_width=2,
             max_tip_length_to_length_ratio=0.08,
             buff=0.1,
         )
-        start_label = Text("広い / Wide", font_size=12, color=GREEN_C)
+        start_label = cached_text("広い / Wide", font_size=12, color=GREEN_C)
         start_label.next_to(start_arrow, DOWN, buff=0.15)
 
-        # 中間点の間隔（t=0.5、最小）
+        # 最も狭い点の間隔
         mid_arrow = DoubleArrow(
-            geodesic1_path(0.5),
-            geodesic2_path(0.5),
+            geodesic1_points[narrowest],
+            geodesic2_points[narrowest],
             color=ORANGE,
             stroke_width=2,
             max_tip_length_to_length_ratio=0.2,
             buff=0.1,
         )
-        mid_label = Text("狭い / Narrow", font_size=12, color=ORANGE)
+        mid_label = cached_text("狭い / Narrow", font_size=12, color=ORANGE)
         mid_label.next_to(mid_arrow, LEFT, buff=0.15)
 
         # 終了時の間隔（t=1）
         end_arrow = DoubleArrow(
-            geodesic1_path(1),
-            geodesic2_path(1),
+            geodesic1_points[-1],
+            geodesic2_points[-1],
             color=GREEN_C,
             stroke_width=2,
             max_tip_length_to_length_ratio=0.08,
             buff=0.1,
         )
-        end_label = Text("広い / Wide", font_size=12, color=GREEN_C)
+        end_label = cached_text("広い / Wide", font_size=12, color=GREEN_C)
         end_label.next_to(end_arrow, UP, buff=0.15)
 
         # ===== 開始点を表示 =====
-        start_dot1 = Dot(geodesic1_path(0), radius=0.08, color=RED_C)
-        start_dot2 = Dot(geodesic2_path(0), radius=0.08, color=BLUE_C)
+        start_dot1 = Dot(geodesic1_points[0], radius=0.08, color=RED_C)
+        start_dot2 = Dot(geodesic2_points[0], radius=0.08, color=BLUE_C)
 
         self.play(
             FadeIn(start_dot1, scale=0.5),
@@ -148,20 +147,16 @@ class GeodesicDeviation(Scene):
         self.wait(0.3)
 
         # ===== 測地線を伸ばすアニメーション（前半：収束） =====
-        explain_text = Text("収束：間隔が狭まる", font_size=20, color=YELLOW)
-        explain_text_en = Text("Converging: Separation decreases", font_size=14, color=YELLOW_A)
+        explain_text = cached_text("収束：間隔が狭まる", font_size=20, color=YELLOW)
+        explain_text_en = cached_text("Converging: Separation decreases", font_size=14, color=YELLOW_A)
         explain_group = VGroup(explain_text, explain_text_en).arrange(DOWN, buff=0.05)
         explain_group.to_edge(DOWN, buff=0.5)
 
         self.play(Write(explain_group), run_time=0.5)
 
-        # 前半の測地線（t=0 to 0.5）
-        geodesic1_first = ParametricFunction(
-            geodesic1_path, t_range=[0, 0.5], color=RED_C, stroke_width=4
-        )
-        geodesic2_first = ParametricFunction(
-            geodesic2_path, t_range=[0, 0.5], color=BLUE_C, stroke_width=4
-        )
+        # 前半の測地線（最も狭い点まで）
+        geodesic1_first = path_between(geodesic1_points, 0, narrowest, RED_C)
+        geodesic2_first = path_between(geodesic2_points, 0, narrowest, BLUE_C)
 
         self.play(
             Create(geodesic1_first),
@@ -171,8 +166,8 @@ class GeodesicDeviation(Scene):
         )
 
         # 中間点にドットを追加
-        mid_dot1 = Dot(geodesic1_path(0.5), radius=0.08, color=RED_C)
-        mid_dot2 = Dot(geodesic2_path(0.5), radius=0.08, color=BLUE_C)
+        mid_dot1 = Dot(geodesic1_points[narrowest], radius=0.08, color=RED_C)
+        mid_dot2 = Dot(geodesic2_points[narrowest], radius=0.08, color=BLUE_C)
 
         self.play(
             FadeIn(mid_dot1, scale=0.5),
@@ -189,20 +184,16 @@ class GeodesicDeviation(Scene):
         self.wait(0.5)
 
         # ===== 測地線を伸ばすアニメーション（後半：発散） =====
-        explain_text2 = Text("発散：間隔が広がる", font_size=20, color=YELLOW)
-        explain_text2_en = Text("Diverging: Separation increases", font_size=14, color=YELLOW_A)
+        explain_text2 = cached_text("発散：間隔が広がる", font_size=20, color=YELLOW)
+        explain_text2_en = cached_text("Diverging: Separation increases", font_size=14, color=YELLOW_A)
         explain_group2 = VGroup(explain_text2, explain_text2_en).arrange(DOWN, buff=0.05)
         explain_group2.to_edge(DOWN, buff=0.5)
 
         self.play(Transform(explain_group, explain_group2), run_time=0.5)
 
-        # 後半の測地線（t=0.5 to 1）
-        geodesic1_second = ParametricFunction(
-            geodesic1_path, t_range=[0.5, 1], color=RED_C, stroke_width=4
-        )
-        geodesic2_second = ParametricFunction(
-            geodesic2_path, t_range=[0.5, 1], color=BLUE_C, stroke_width=4
-        )
+        # 後半の測地線（最も狭い点から）
+        geodesic1_second = path_between(geodesic1_points, narrowest, len(t) - 1, RED_C)
+        geodesic2_second = path_between(geodesic2_points, narrowest, len(t) - 1, BLUE_C)
 
         self.play(
             Create(geodesic1_second),
@@ -212,8 +203,8 @@ class GeodesicDeviation(Scene):
         )
 
         # 終了点にドットを追加
-        end_dot1 = Dot(geodesic1_path(1), radius=0.08, color=RED_C)
-        end_dot2 = Dot(geodesic2_path(1), radius=0.08, color=BLUE_C)
+        end_dot1 = Dot(geodesic1_points[-1], radius=0.08, color=RED_C)
+        end_dot2 = Dot(geodesic2_points[-1], radius=0.08, color=BLUE_C)
 
         self.play(
             FadeIn(end_dot1, scale=0.5),
@@ -222,8 +213,8 @@ class GeodesicDeviation(Scene):
         )
 
         # ラベルを配置
-        geodesic_group1.next_to(geodesic1_path(0.25), LEFT, buff=0.2)
-        geodesic_group2.next_to(geodesic2_path(0.25), RIGHT, buff=0.2)
+        geodesic_group1.next_to(geodesic1_points[narrowest // 2], LEFT, buff=0.2)
+        geodesic_group2.next_to(geodesic2_points[narrowest // 2], RIGHT, buff=0.2)
 
         self.play(
             Write(geodesic_group1),
@@ -240,8 +231,8 @@ class GeodesicDeviation(Scene):
         self.wait(0.5)
 
         # ===== 結論 =====
-        conclusion = Text("これが「測地線偏差」", font_size=24, color=WHITE)
-        conclusion_en = Text('This is "Geodesic Deviation"', font_size=16, color=GRAY)
+        conclusion = cached_text("これが「測地線偏差」", font_size=24, color=WHITE)
+        conclusion_en = cached_text('This is "Geodesic Deviation"', font_size=16, color=GRAY)
         conclusion_group = VGroup(conclusion, conclusion_en).arrange(DOWN, buff=0.08)
         conclusion_group.to_edge(DOWN, buff=0.5)
 
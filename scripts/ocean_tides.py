@@ -10,7 +10,8 @@ This difference pulls the ocean water, causing tides.
 """
 
 from manim import *
-import numpy as np
+
+from components import OceanSurface, Pose, cached_text
 
 
 class OceanTides(Scene):
@@ -44,14 +45,14 @@ class OceanTides(Scene):
         moon.move_to(RIGHT * moon_distance)
 
         # 月のラベル
-        moon_label = Text("月", font_size=18, color=WHITE)
-        moon_label_en = Text("Moon", font_size=12, color=GRAY)
+        moon_label = cached_text("月", font_size=18, color=WHITE)
+        moon_label_en = cached_text("Moon", font_size=12, color=GRAY)
         moon_labels = VGroup(moon_label, moon_label_en).arrange(DOWN, buff=0.05)
         moon_labels.next_to(moon, UP, buff=0.15)
 
         # 地球のラベル
-        earth_label = Text("地球", font_size=18, color=BLUE_B)
-        earth_label_en = Text("Earth", font_size=12, color=BLUE_A)
+        earth_label = cached_text("地球", font_size=18, color=BLUE_B)
+        earth_label_en = cached_text("Earth", font_size=12, color=BLUE_A)
         earth_labels = VGroup(earth_label, earth_label_en).arrange(DOWN, buff=0.05)
         earth_labels.next_to(earth, DOWN, buff=0.3)
 
@@ -79,8 +80,8 @@ class OceanTides(Scene):
             stroke_width=4,
             max_tip_length_to_length_ratio=0.2,
         )
-        label_near = Text("強い", font_size=14, color=YELLOW)
-        label_near_en = Text("Strong", font_size=10, color=YELLOW_A)
+        label_near = cached_text("強い", font_size=14, color=YELLOW)
+        label_near_en = cached_text("Strong", font_size=10, color=YELLOW_A)
         label_near_group = VGroup(label_near, label_near_en).arrange(DOWN, buff=0.03)
         label_near_group.next_to(arrow_near, UP, buff=0.1)
 
@@ -92,14 +93,14 @@ class OceanTides(Scene):
             stroke_width=3,
             max_tip_length_to_length_ratio=0.35,
         )
-        label_far = Text("弱い", font_size=14, color=ORANGE)
-        label_far_en = Text("Weak", font_size=10, color=ORANGE)
+        label_far = cached_text("弱い", font_size=14, color=ORANGE)
+        label_far_en = cached_text("Weak", font_size=10, color=ORANGE)
         label_far_group = VGroup(label_far, label_far_en).arrange(DOWN, buff=0.03)
         label_far_group.next_to(arrow_far, UP, buff=0.1)
 
         # 説明テキスト
-        text1 = Text("月の重力は場所によって違う", font_size=22)
-        text1_en = Text("Moon's gravity varies by location", font_size=16, color=GRAY)
+        text1 = cached_text("月の重力は場所によって違う", font_size=22)
+        text1_en = cached_text("Moon's gravity varies by location", font_size=16, color=GRAY)
         text1_group = VGroup(text1, text1_en).arrange(DOWN, buff=0.1)
         text1_group.to_edge(UP, buff=0.4)
 
@@ -124,8 +125,8 @@ class OceanTides(Scene):
 
         # 海水が楕円形に変形
         # Ocean deforms into ellipse
-        text2 = Text("その差が海水を引っ張る", font_size=22, color=YELLOW)
-        text2_en = Text("This difference pulls the ocean", font_size=16, color=YELLOW_A)
+        text2 = cached_text("その差が海水を引っ張る", font_size=22, color=YELLOW)
+        text2_en = cached_text("This difference pulls the ocean", font_size=16, color=YELLOW_A)
         text2_group = VGroup(text2, text2_en).arrange(DOWN, buff=0.1)
         text2_group.to_edge(UP, buff=0.4)
 
@@ -172,16 +173,16 @@ class OceanTides(Scene):
 
         # 満潮・干潮のラベル
         # High tide / Low tide labels
-        high_tide_right = Text("満潮", font_size=14, color=BLUE_B)
+        high_tide_right = cached_text("満潮", font_size=14, color=BLUE_B)
         high_tide_right.next_to(ocean, RIGHT, buff=0.1)
 
-        high_tide_left = Text("満潮", font_size=14, color=BLUE_B)
+        high_tide_left = cached_text("満潮", font_size=14, color=BLUE_B)
         high_tide_left.next_to(ocean, LEFT, buff=0.1)
 
-        low_tide_top = Text("干潮", font_size=14, color=BLUE_D)
+        low_tide_top = cached_text("干潮", font_size=14, color=BLUE_D)
         low_tide_top.next_to(ocean, UP, buff=0.1).shift(DOWN * 0.3)
 
-        low_tide_bottom = Text("干潮", font_size=14, color=BLUE_D)
+        low_tide_bottom = cached_text("干潮", font_size=14, color=BLUE_D)
         low_tide_bottom.next_to(ocean, DOWN, buff=0.1).shift(UP * 0.3)
 
         self.play(
@@ -194,8 +195,8 @@ class OceanTides(Scene):
         self.wait(0.5)
 
         # 結論テキスト
-        text3 = Text("これが潮の満ち引き", font_size=26, color=YELLOW)
-        text3_en = Text("This is the ocean tides", font_size=18, color=YELLOW_A)
+        text3 = cached_text("これが潮の満ち引き", font_size=26, color=YELLOW)
+        text3_en = cached_text("This is the ocean tides", font_size=18, color=YELLOW_A)
         text3_group = VGroup(text3, text3_en).arrange(DOWN, buff=0.1)
         text3_group.to_edge(UP, buff=0.4)
 
@@ -203,8 +204,8 @@ class OceanTides(Scene):
         self.wait(0.5)
 
         # テロップ
-        caption = Text("だから「潮汐」力", font_size=28, color=YELLOW)
-        caption_en = Text("That's why 'Tidal' Force", font_size=20, color=YELLOW_A)
+        caption = cached_text("だから「潮汐」力", font_size=28, color=YELLOW)
+        caption_en = cached_text("That's why 'Tidal' Force", font_size=20, color=YELLOW_A)
         caption_group = VGroup(caption, caption_en).arrange(DOWN, buff=0.1)
         caption_group.to_edge(DOWN, buff=0.5)
 
@@ -232,18 +233,16 @@ class OceanTidesRotating(Scene):
         earth.set_stroke(color=BLUE_B, width=3)
 
         # 地球のラベル
-        earth_label = Text("地球", font_size=16, color=BLUE_B)
-        earth_label_en = Text("Earth", font_size=11, color=BLUE_A)
+        earth_label = cached_text("地球", font_size=16, color=BLUE_B)
+        earth_label_en = cached_text("Earth", font_size=11, color=BLUE_A)
         earth_labels = VGroup(earth_label, earth_label_en).arrange(DOWN, buff=0.03)
         earth_labels.move_to(earth.get_center())
 
-        # 海水（楕円形 - 潮汐変形）
-        # Ocean (elliptical - tidal deformation)
-        ocean_width = (earth_radius + 0.12) * 2 + 0.5
-        ocean_height = (earth_radius + 0.12) * 2 - 0.15
-        ocean = Ellipse(
-            width=ocean_width,
-            height=ocean_height,
+        # 海水（平衡潮汐 - 月の方向とその反対側が膨らむ）
+        # Ocean (equilibrium tide - bulges toward and away from the Moon)
+        ocean = OceanSurface(
+            radius=earth_radius + 0.12,
+            tide=0.22,  # 誇張した振幅 / Exaggerated amplitude
             color=BLUE_A,
             fill_opacity=0.3,
         )
@@ -263,12 +262,12 @@ class OceanTidesRotating(Scene):
         moon.move_to(RIGHT * orbit_radius)
 
         # 月のラベル
-        moon_label = Text("月", font_size=14, color=WHITE)
+        moon_label = cached_text("月", font_size=14, color=WHITE)
         moon_label.next_to(moon, UP, buff=0.1)
 
         # タイトル
-        title = Text("月の公転と潮汐", font_size=24)
-        title_en = Text("Lunar Orbit and Tides", font_size=16, color=GRAY)
+        title = cached_text("月の公転と潮汐", font_size=24)
+        title_en = cached_text("Lunar Orbit and Tides", font_size=16, color=GRAY)
         title_group = VGroup(title, title_en).arrange(DOWN, buff=0.1)
         title_group.to_edge(UP, buff=0.3)
 
@@ -290,48 +289,33 @@ class OceanTidesRotating(Scene):
 
         # 月と海水の回転アニメーション
         # Rotation animation for Moon and ocean
-        # 月は軌道上を回り、海水（楕円）は月の方向に合わせて回転
+        # 月は軌道上を回り、海水の膨らみは月の方向に合わせて回る
 
         # 回転のトラッカー
         angle_tracker = ValueTracker(0)
 
-        # 月の位置を更新する関数
+        # 月の位置を更新する関数（基準の位置から地球の回りに回した点をその場で書き込む）
+        # Rotate the Moon about Earth from its reference pose, in place
+        moon_pose = Pose(moon)
+
         def update_moon(m):
-            angle = angle_tracker.get_value()
-            m.move_to(
-                np.array(
-                    [
-                        orbit_radius * np.cos(angle),
-                        orbit_radius * np.sin(angle),
-                        0,
-                    ]
-                )
-            )
+            moon_pose.rotate_to(angle_tracker.get_value())
 
         # 月のラベル位置を更新
         def update_moon_label(label):
             label.next_to(moon, UP, buff=0.1)
 
-        # 海水の回転を更新
+        # 海水の形を月の方向に合わせて更新
         def update_ocean(o):
-            angle = angle_tracker.get_value()
-            new_ocean = Ellipse(
-                width=ocean_width,
-                height=ocean_height,
-                color=BLUE_A,
-                fill_opacity=0.3,
-            )
-            new_ocean.set_stroke(color=BLUE_A, width=2)
-            new_ocean.rotate(angle)
-            o.become(new_ocean)
+            o.set_tide(angle_tracker.get_value())
 
         moon.add_updater(update_moon)
         moon_label.add_updater(update_moon_label)
         ocean.add_updater(update_ocean)
 
         # 説明テキスト
-        explain = Text("海面は常に月の方向に膨らむ", font_size=20, color=YELLOW)
-        explain_en = Text(
+        explain = cached_text("海面は常に月の方向に膨らむ", font_size=20, color=YELLOW)
+        explain_en = cached_text(
             "Ocean always bulges toward the Moon", font_size=14, color=YELLOW_A
         )
         explain_group = VGroup(explain, explain_en).arrange(DOWN, buff=0.1)
@@ -352,8 +336,8 @@ class OceanTidesRotating(Scene):
         ocean.remove_updater(update_ocean)
 
         # 結論
-        conclusion = Text("だから「潮汐」力", font_size=26, color=YELLOW)
-        conclusion_en = Text("That's why 'Tidal' Force", font_size=18, color=YELLOW_A)
+        conclusion = cached_text("だから「潮汐」力", font_size=26, color=YELLOW)
+        conclusion_en = cached_text("That's why 'Tidal' Force", font_size=18, color=YELLOW_A)
         conclusion_group = VGroup(conclusion, conclusion_en).arrange(DOWN, buff=0.1)
         conclusion_group.to_edge(DOWN, buff=0.4)
 
@@ -388,10 +372,10 @@ class OceanTidesCombined(Scene):
         moon.move_to(RIGHT * moon_distance)
 
         # ラベル
-        moon_label = Text("月", font_size=14, color=WHITE)
+        moon_label = cached_text("月", font_size=14, color=WHITE)
         moon_label.next_to(moon, UP, buff=0.1)
 
-        earth_label = Text("地球", font_size=14, color=BLUE_B)
+        earth_label = cached_text("地球", font_size=14, color=BLUE_B)
         earth_label.move_to(earth.get_center())
 
         # 表示
@@ -418,8 +402,8 @@ class OceanTidesCombined(Scene):
             stroke_width=2,
         )
 
-        text1 = Text("月の重力は場所によって違う", font_size=20)
-        text1_en = Text("Moon's gravity varies by location", font_size=14, color=GRAY)
+        text1 = cached_text("月の重力は場所によって違う", font_size=20)
+        text1_en = cached_text("Moon's gravity varies by location", font_size=14, color=GRAY)
         text1_group = VGroup(text1, text1_en).arrange(DOWN, buff=0.1)
         text1_group.to_edge(UP, buff=0.3)
 
@@ -431,29 +415,28 @@ class OceanTidesCombined(Scene):
         )
         self.wait(1)
 
-        # 海水が楕円に変形
+        # 海水が潮汐の形に変形
         self.play(FadeOut(arrow_near), FadeOut(arrow_far), run_time=0.3)
 
-        ocean_width = (earth_radius + 0.12) * 2 + 0.5
-        ocean_height = (earth_radius + 0.12) * 2 - 0.15
-        ocean_deformed = Ellipse(
-            width=ocean_width,
-            height=ocean_height,
+        ocean_deformed = OceanSurface(
+            radius=earth_radius + 0.12,
+            tide=0.22,
             color=BLUE_A,
             fill_opacity=0.3,
         )
         ocean_deformed.set_stroke(color=BLUE_A, width=2)
 
-        text2 = Text("海水が引っ張られる", font_size=20, color=YELLOW)
-        text2_en = Text("Ocean water is pulled", font_size=14, color=YELLOW_A)
+        text2 = cached_text("海水が引っ張られる", font_size=20, color=YELLOW)
+        text2_en = cached_text("Ocean water is pulled", font_size=14, color=YELLOW_A)
         text2_group = VGroup(text2, text2_en).arrange(DOWN, buff=0.1)
         text2_group.to_edge(UP, buff=0.3)
 
         self.play(
             Transform(text1_group, text2_group),
-            Transform(ocean, ocean_deformed),
+            ReplacementTransform(ocean, ocean_deformed),
             run_time=1.0,
         )
+        ocean = ocean_deformed
         self.wait(0.5)
 
         # パート2: 月の公転
@@ -464,8 +447,8 @@ class OceanTidesCombined(Scene):
         orbit = Circle(radius=orbit_radius, color=GRAY, stroke_width=1)
         orbit.set_stroke(opacity=0.3)
 
-        text3 = Text("月が回ると潮汐も回る", font_size=20, color=YELLOW)
-        text3_en = Text("As Moon orbits, tides follow", font_size=14, color=YELLOW_A)
+        text3 = cached_text("月が回ると潮汐も回る", font_size=20, color=YELLOW)
+        text3_en = cached_text("As Moon orbits, tides follow", font_size=14, color=YELLOW_A)
         text3_group = VGroup(text3, text3_en).arrange(DOWN, buff=0.1)
         text3_group.to_edge(UP, buff=0.3)
 
@@ -478,32 +461,16 @@ class OceanTidesCombined(Scene):
         # 回転アニメーション
         angle_tracker = ValueTracker(0)
 
+        moon_pose = Pose(moon)
+
         def update_moon(m):
-            angle = angle_tracker.get_value()
-            m.move_to(
-                np.array(
-                    [
-                        orbit_radius * np.cos(angle),
-                        orbit_radius * np.sin(angle),
-                        0,
-                    ]
-                )
-            )
+            moon_pose.rotate_to(angle_tracker.get_value())
 
         def update_moon_label(label):
             label.next_to(moon, UP, buff=0.1)
 
         def update_ocean(o):
-            angle = angle_tracker.get_value()
-            new_ocean = Ellipse(
-                width=ocean_width,
-                height=ocean_height,
-                color=BLUE_A,
-                fill_opacity=0.3,
-            )
-            new_ocean.set_stroke(color=BLUE_A, width=2)
-            new_ocean.rotate(angle)
-            o.become(new_ocean)
+            o.set_tide(angle_tracker.get_value())
 
         moon.add_updater(update_moon)
         moon_label.add_updater(update_moon_label)
@@ -521,8 +488,8 @@ class OceanTidesCombined(Scene):
         ocean.remove_updater(update_ocean)
 
         # 結論
-        conclusion = Text("だから「潮汐」力", font_size=24, color=YELLOW)
-        conclusion_en = Text("That's why 'Tidal' Force", font_size=16, color=YELLOW_A)
+        conclusion = cached_text("だから「潮汐」力", font_size=24, color=YELLOW)
+        conclusion_en = cached_text("That's why 'Tidal' Force", font_size=16, color=YELLOW_A)
         conclusion_group = VGroup(conclusion, conclusion_en).arrange(DOWN, buff=0.1)
         conclusion_group.to_edge(DOWN, buff=0.4)
 
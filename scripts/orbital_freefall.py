@@ -12,6 +12,9 @@ by showing the difference between straight-line and actual orbital paths.
 from manim import *
 import numpy as np
 
+from components import ArrowPose, cached_text, follow_trajectory
+from physics import kepler_orbits
+
 
 class OrbitalFreefall(Scene):
     """
@@ -24,7 +27,7 @@ class OrbitalFreefall(Scene):
         # Create Earth (at center)
         earth = Circle(radius=1.5, color=BLUE, fill_opacity=0.7)
         earth.set_stroke(color=GREEN, width=3)
-        earth_label = Text("地球", font_size=20)  # "Earth"
+        earth_label = cached_text("地球", font_size=20)  # "Earth"
         earth_label.next_to(earth, DOWN, buff=0.2)
 
         self.play(GrowFromCenter(earth), Write(earth_label))
@@ -40,11 +43,11 @@ class OrbitalFreefall(Scene):
         # 宇宙ステーション（ボール）を作成
         # Create space station (dot)
         station = Dot(radius=0.15, color=YELLOW)
-        station_label = Text("宇宙ステーション", font_size=16, color=YELLOW)  # "Space station"
+        station_label = cached_text("宇宙ステーション", font_size=16, color=YELLOW)  # "Space station"
 
-        # 初期位置（右側）
-        # Initial position (right side)
-        start_angle = 0
+        # 初期位置（右側）と円軌道の表（位置・速度・重力を1周分）
+        # Initial position (right side) and the circular orbit table (one revolution)
+        orbit_table = kepler_orbits(orbit_radius)
         station.move_to(RIGHT * orbit_radius)
         station_label.next_to(station, UP, buff=0.2)
 
@@ -53,7 +56,7 @@ class OrbitalFreefall(Scene):
 
         # 説明テキスト
         # Explanation text: "The space station is continuously falling"
-        explanation = Text(
+        explanation = cached_text(
             "宇宙ステーションは「落ち続けている」",
             font_size=24,
         )
@@ -65,21 +68,18 @@ class OrbitalFreefall(Scene):
         # Fade out station label
         self.play(FadeOut(station_label))
 
-        # 現在の角度を追跡
-        # Track current angle
-        current_angle = start_angle
+        # 現在の位置（1周のうちの割合）を追跡
+        # Track current position (fraction of one revolution)
+        current = 0.0
 
-        # 複数フレームで「直進 vs 落下 → 円軌道」を示す
-        # Show "straight vs falling → circular orbit" in multiple frames
+        # 複数フレームで「直進 vs 落下 → 円軌道」を示す（4分の1周ごと）
+        # Show "straight vs falling → circular orbit" in multiple frames (every quarter orbit)
         for i in range(4):
-            target_angle = start_angle + i * PI / 2
-            current_angle = self.show_freefall_frame(
-                station, orbit_radius, current_angle, target_angle
-            )
+            current = self.show_freefall_frame(station, orbit_table, current, i / 4)
 
         # 結論
         # Conclusion: "The ground is curved, so it falls forever"
-        conclusion = Text(
+        conclusion = cached_text(
             "地面が曲がっているから、永遠に落ち続ける",
             font_size=24,
             color=GREEN,
@@ -88,40 +88,30 @@ class OrbitalFreefall(Scene):
         self.play(Transform(explanation, conclusion))
         self.wait(2)
 
-    def show_freefall_frame(self, station, orbit_radius, current_angle, target_angle):
+    def show_freefall_frame(self, station, orbit_table, current, target):
         """
-        一つのフレームで直進経路と落下を示す（円弧上を移動）
-        Show straight path and falling in one frame (moving along arc)
+        一つのフレームで直進経路と落下を示す（軌道の表に沿って移動）
+        Show straight path and falling in one frame (moving along the orbit table)
+
+        current, target は1周のうちの割合。速度と重力の向きは表から引く。
+        current and target are fractions of one revolution; the velocity and
+        gravity directions are looked up from the table.
         """
-        # まず目標位置まで円弧上を移動（必要な場合）
-        # First, move along the arc to target position (if needed)
-        angle_diff = target_angle - current_angle
-        if abs(angle_diff) > 0.01:
+        # まず目標位置まで軌道上を移動（必要な場合）
+        # First, move along the orbit to target position (if needed)
+        if target - current > 0.001:
             self.play(
-                Rotate(
-                    station,
-                    angle=angle_diff,
-                    about_point=ORIGIN,
-                    rate_func=linear,
-                ),
+                follow_trajectory([station], orbit_table, current, target),
                 run_time=0.8,
             )
 
-        # 現在位置（target_angleの位置）
-        # Current position (at target_angle)
-        current_pos = np.array([
-            orbit_radius * np.cos(target_angle),
-            orbit_radius * np.sin(target_angle),
-            0,
-        ])
+        # 現在位置・速度・重力（target の位置）
+        # Current position, velocity and gravity (at target)
+        current_pos, velocity, acceleration = (state[0] for state in orbit_table.state_at(target))
 
         # 接線方向（直進方向）
         # Tangent direction (straight-line direction)
-        tangent = np.array([
-            -np.sin(target_angle),
-            np.cos(target_angle),
-            0,
-        ])
+        tangent = velocity / np.linalg.norm(velocity)
 
         # 直進した場合の位置（仮想）
         # Hypothetical position if it went straight
@@ -136,7 +126,7 @@ class OrbitalFreefall(Scene):
             color=RED,
             dash_length=0.1,
         )
-        straight_label = Text("直進経路", font_size=14, color=RED)  # "Straight path"
+        straight_label = cached_text("直進経路", font_size=14, color=RED)  # "Straight path"
         straight_label.next_to(straight_path, tangent * 0.5, buff=0.1)
 
         self.play(
@@ -147,7 +137,7 @@ class OrbitalFreefall(Scene):
 
         # 重力（地球方向への落下）を示す矢印
         # Arrow showing gravity (falling toward Earth)
-        gravity_direction = -current_pos / np.linalg.norm(current_pos)
+        gravity_direction = acceleration / np.linalg.norm(acceleration)
         gravity_arrow = Arrow(
             straight_pos,
             straight_pos + gravity_direction * 1.0,
@@ -155,7 +145,7 @@ class OrbitalFreefall(Scene):
             stroke_width=3,
             max_tip_length_to_length_ratio=0.2,
         )
-        gravity_label = Text("重力で落ちる", font_size=14, color=ORANGE)  # "Falls due to gravity"
+        gravity_label = cached_text("重力で落ちる", font_size=14, color=ORANGE)  # "Falls due to gravity"
         gravity_label.next_to(gravity_arrow, RIGHT, buff=0.1)
 
         self.play(
@@ -165,39 +155,24 @@ class OrbitalFreefall(Scene):
         )
         self.wait(0.3)
 
-        # 次の軌道上の位置（実際の経路）
-        # Next position on orbit (actual path)
-        arc_angle = PI / 8
-        next_angle = target_angle + arc_angle
-
-        # 実際の軌道を示す曲線
-        # Arc showing actual trajectory
-        arc = Arc(
-            radius=orbit_radius,
-            start_angle=target_angle,
-            angle=arc_angle,
-            color=GREEN,
-            stroke_width=4,
-        )
-        actual_label = Text("実際の経路", font_size=14, color=GREEN)  # "Actual path"
-        mid_angle = target_angle + arc_angle / 2
-        actual_label.move_to([
-            (orbit_radius + 0.5) * np.cos(mid_angle),
-            (orbit_radius + 0.5) * np.sin(mid_angle),
-            0,
-        ])
-
-        # 円弧上を移動（Rotateを使用）
-        # Move along the arc (using Rotate)
+        # 次の軌道上の位置（実際の経路、16分の1周先）
+        # Next position on orbit (actual path, 1/16 of a revolution ahead)
+        next_target = target + 1 / 16
+
+        # 実際の軌道を示す曲線（表の点をそのまま使う）
+        # Curve showing actual trajectory (straight from the table points)
+        arc = VMobject(color=GREEN, stroke_width=4)
+        arc.set_points_smoothly([orbit_table.at(a)[0] for a in np.linspace(target, next_target, 12)])
+        actual_label = cached_text("実際の経路", font_size=14, color=GREEN)  # "Actual path"
+        mid_pos = orbit_table.at((target + next_target) / 2)[0]
+        actual_label.move_to(mid_pos * (1 + 0.5 / np.linalg.norm(mid_pos)))
+
+        # 軌道上を移動
+        # Move along the orbit
         self.play(
             Create(arc),
             FadeIn(actual_label),
-            Rotate(
-                station,
-                angle=arc_angle,
-                about_point=ORIGIN,
-                rate_func=linear,
-            ),
+            follow_trajectory([station], orbit_table, target, next_target),
             run_time=1,
         )
         self.wait(0.3)
@@ -214,9 +189,9 @@ class OrbitalFreefall(Scene):
             run_time=0.3,
         )
 
-        # 次のフレームの開始角度を返す
-        # Return starting angle for next frame
-        return next_angle
+        # 次のフレームの開始位置を返す
+        # Return starting position for next frame
+        return next_target
 
 
 class OrbitalFreefallSimple(Scene):
@@ -247,7 +222,7 @@ class OrbitalFreefallSimple(Scene):
 
         # 説明テキスト
         # Explanation text: "Without gravity, it would go straight"
-        text = Text("重力がなければ直進する", font_size=22)
+        text = cached_text("重力がなければ直進する", font_size=22)
         text.to_edge(UP)
         self.play(Write(text))
 
@@ -265,7 +240,7 @@ class OrbitalFreefallSimple(Scene):
         # 重力の矢印
         # Gravity arrow
         # Text: "But gravity pulls it toward Earth"
-        text2 = Text("でも重力で地球に向かって落ちる", font_size=22)
+        text2 = cached_text("でも重力で地球に向かって落ちる", font_size=22)
         text2.to_edge(UP)
         self.play(Transform(text, text2))
 
@@ -281,7 +256,7 @@ class OrbitalFreefallSimple(Scene):
         # 合成
         # Combination
         # Text: "Combined... it becomes a circular orbit!"
-        text3 = Text("合わさると...円軌道になる！", font_size=22, color=GREEN)
+        text3 = cached_text("合わさると...円軌道になる！", font_size=22, color=GREEN)
         text3.to_edge(UP)
         self.play(
             Transform(text, text3),
@@ -289,21 +264,32 @@ class OrbitalFreefallSimple(Scene):
             FadeOut(gravity_arrow),
         )
 
-        # 円軌道を回るアニメーション
-        # Animation of orbiting in circular path
+        # 円軌道を回るアニメーション（速度と重力の矢印も表から毎フレーム）
+        # Animation of orbiting in circular path (velocity and gravity arrows from the table every frame)
+        orbit_table = kepler_orbits(orbit_radius)
+        velocity_arrow = Arrow(ORIGIN, RIGHT, color=RED, stroke_width=3, buff=0)
+        gravity_arrow = Arrow(ORIGIN, RIGHT, color=ORANGE, stroke_width=3, buff=0)
+
+        velocity_pose, gravity_pose = ArrowPose(velocity_arrow), ArrowPose(gravity_arrow)
+
+        def update_arrows(arrows, alpha):
+            position, velocity, acceleration = (state[0] for state in orbit_table.state_at(alpha))
+            velocity_pose.place(position, position + velocity / np.linalg.norm(velocity) * 1.0)
+            gravity_pose.place(position, position + acceleration / np.linalg.norm(acceleration) * 0.8)
+
+        update_arrows(None, 0.0)
+        self.play(GrowArrow(velocity_arrow), GrowArrow(gravity_arrow), run_time=0.5)
         self.play(
-            Rotate(
-                station,
-                angle=2 * PI,
-                about_point=ORIGIN,
-                rate_func=linear,
-            ),
+            follow_trajectory([station], orbit_table),
+            UpdateFromAlphaFunc(VGroup(velocity_arrow, gravity_arrow), update_arrows),
             run_time=4,
+            rate_func=linear,
         )
+        self.play(FadeOut(velocity_arrow), FadeOut(gravity_arrow), run_time=0.3)
 
         # 結論
         # Conclusion: "= Continuously falling"
-        conclusion = Text(
+        conclusion = cached_text(
             "＝「落ち続けている」",
             font_size=26,
             color=YELLOW,
@@ -313,8 +299,55 @@ class OrbitalFreefallSimple(Scene):
         self.wait(2)
 
 
+class OrbitalFreefallManyOrbits(Scene):
+    """
+    多数の衛星版：離心率も周期も違う軌道を同時に回る
+    Many-satellites version: orbits of different eccentricities and periods at once
+    """
+
+    def construct(self):
+        # 地球を作成（中央）
+        # Create Earth (at center)
+        earth = Circle(radius=1.2, color=BLUE, fill_opacity=0.7)
+        earth.set_stroke(color=GREEN, width=3)
+        self.play(GrowFromCenter(earth))
+
+        # 衛星の軌道（近点の距離・離心率・向きをばらばらに、遠点は画面内に収める）
+        # Satellite orbits (scattered pericenters, eccentricities and directions; apocenters stay on screen)
+        count = 36
+        rng = np.random.default_rng(3)
+        pericenter = rng.uniform(1.6, 2.4, count)
+        max_eccentricity = (3.6 - pericenter) / (3.6 + pericenter)
+        eccentricity = rng.uniform(0.0, 1.0, count) * max_eccentricity
+        angle = rng.uniform(0.0, TAU, count)
+        orbits = kepler_orbits(pericenter, eccentricity, angle=angle, revolutions=3, samples=721)
+
+        satellites = [
+            Dot(point, radius=0.06, color=interpolate_color(YELLOW, RED, e / 0.4))
+            for point, e in zip(orbits.positions[0], eccentricity)
+        ]
+        paths = VGroup(
+            *[
+                VMobject(stroke_width=1, stroke_opacity=0.25).set_points_smoothly(orbits.positions[::6, i])
+                for i in range(count)
+            ]
+        )
+
+        text = cached_text("どの衛星も落ち続けている", font_size=22)
+        text_en = cached_text("Every satellite keeps falling", font_size=16, color=GRAY)
+        text_group = VGroup(text, text_en).arrange(DOWN, buff=0.1)
+        text_group.to_edge(UP)
+        self.play(Write(text_group), Create(paths), *[FadeIn(s) for s in satellites], run_time=1.0)
+
+        # 全衛星を表から動かす（フレームごとの物理計算は無い）
+        # Move every satellite from the table (no per-frame physics)
+        self.play(follow_trajectory(satellites, orbits), run_time=9)
+        self.wait(1)
+
+
 if __name__ == "__main__":
     # 使用方法 / Usage
     print("使用方法 / Usage:")
     print("  manim -pql orbital_freefall.py OrbitalFreefall")
     print("  manim -pql orbital_freefall.py OrbitalFreefallSimple")
+    print("  manim -pql orbital_freefall.py OrbitalFreefallManyOrbits")
@@ -15,6 +15,8 @@ yt_script.md L154-158 の解説用
 from manim import *
 import numpy as np
 
+from components import cached_text
+
 
 class ParallelTransportFlat(Scene):
     """
@@ -31,8 +33,8 @@ class ParallelTransportFlat(Scene):
 
     def construct(self):
         # ===== タイトル =====
-        title = Text("平坦な空間での平行移動", font_size=28)
-        title_en = Text("Parallel Transport in Flat Space", font_size=18, color=GRAY)
+        title = cached_text("平坦な空間での平行移動", font_size=28)
+        title_en = cached_text("Parallel Transport in Flat Space", font_size=18, color=GRAY)
         title_group = VGroup(title, title_en).arrange(DOWN, buff=0.1)
         title_group.to_edge(UP, buff=0.3)
 
@@ -125,7 +127,7 @@ class ParallelTransportFlat(Scene):
         vector = create_vector_at(start_pos, DOWN)
 
         # 方位を示すテキスト
-        direction_text = Text("南 / South", font_size=16, color=RED_A)
+        direction_text = cached_text("南 / South", font_size=16, color=RED_A)
         direction_text.next_to(vector, RIGHT, buff=0.3)
 
         self.play(
@@ -136,8 +138,8 @@ class ParallelTransportFlat(Scene):
         self.wait(0.5)
 
         # ===== 「方向を保ったまま移動」のテキスト =====
-        move_text = Text("方向を保ったまま移動", font_size=18, color=WHITE)
-        move_text_en = Text("Move while keeping direction", font_size=12, color=GRAY)
+        move_text = cached_text("方向を保ったまま移動", font_size=18, color=WHITE)
+        move_text_en = cached_text("Move while keeping direction", font_size=12, color=GRAY)
         move_text_group = VGroup(move_text, move_text_en).arrange(DOWN, buff=0.05)
         move_text_group.to_edge(DOWN, buff=0.4)
 
@@ -184,8 +186,8 @@ class ParallelTransportFlat(Scene):
 
         # ===== 結果の強調 =====
         # 「向きは変わらない」を強調
-        result_text = Text("一周しても向きは変わらない！", font_size=22, color=YELLOW)
-        result_text_en = Text("Direction unchanged after one loop!", font_size=14, color=YELLOW_A)
+        result_text = cached_text("一周しても向きは変わらない！", font_size=22, color=YELLOW)
+        result_text_en = cached_text("Direction unchanged after one loop!", font_size=14, color=YELLOW_A)
         result_text_group = VGroup(result_text, result_text_en).arrange(DOWN, buff=0.08)
         result_text_group.to_edge(DOWN, buff=0.4)
 
@@ -207,8 +209,8 @@ class ParallelTransportFlat(Scene):
         self.wait(0.5)
 
         # ===== 「これは当たり前」のメッセージ =====
-        obvious_text = Text("平坦な空間では当たり前", font_size=20, color=WHITE)
-        obvious_text_en = Text("Obvious in flat space", font_size=14, color=GRAY)
+        obvious_text = cached_text("平坦な空間では当たり前", font_size=20, color=WHITE)
+        obvious_text_en = cached_text("Obvious in flat space", font_size=14, color=GRAY)
         obvious_text_group = VGroup(obvious_text, obvious_text_en).arrange(DOWN, buff=0.08)
         obvious_text_group.to_edge(DOWN, buff=0.4)
 
@@ -216,8 +218,8 @@ class ParallelTransportFlat(Scene):
         self.wait(1.0)
 
         # ===== 次への伏線 =====
-        next_text = Text("では、曲がった空間では…？", font_size=22, color=GREEN)
-        next_text_en = Text("But in curved space...?", font_size=14, color=GREEN_A)
+        next_text = cached_text("では、曲がった空間では…？", font_size=22, color=GREEN)
+        next_text_en = cached_text("But in curved space...?", font_size=14, color=GREEN_A)
         next_text_group = VGroup(next_text, next_text_en).arrange(DOWN, buff=0.08)
         next_text_group.to_edge(DOWN, buff=0.4)
 
@@ -233,8 +235,8 @@ class ParallelTransportFlatWithTrace(Scene):
 
     def construct(self):
         # ===== タイトル =====
-        title = Text("平坦な空間での平行移動", font_size=28)
-        title_en = Text("Parallel Transport in Flat Space", font_size=18, color=GRAY)
+        title = cached_text("平坦な空間での平行移動", font_size=28)
+        title_en = cached_text("Parallel Transport in Flat Space", font_size=18, color=GRAY)
         title_group = VGroup(title, title_en).arrange(DOWN, buff=0.1)
         title_group.to_edge(UP, buff=0.3)
 
@@ -299,8 +301,8 @@ class ParallelTransportFlatWithTrace(Scene):
         )
 
         # ===== 説明テキスト =====
-        text = Text("「南」を指したまま歩く", font_size=18, color=WHITE)
-        text_en = Text('Walking while pointing "south"', font_size=12, color=GRAY)
+        text = cached_text("「南」を指したまま歩く", font_size=18, color=WHITE)
+        text_en = cached_text('Walking while pointing "south"', font_size=12, color=GRAY)
         text_group = VGroup(text, text_en).arrange(DOWN, buff=0.05)
         text_group.to_edge(DOWN, buff=0.4)
 
@@ -331,8 +333,8 @@ class ParallelTransportFlatWithTrace(Scene):
         self.wait(0.3)
 
         # ===== 結果 =====
-        result_text = Text("一周しても向きは同じ！", font_size=22, color=YELLOW)
-        result_text_en = Text("Same direction after one loop!", font_size=14, color=YELLOW_A)
+        result_text = cached_text("一周しても向きは同じ！", font_size=22, color=YELLOW)
+        result_text_en = cached_text("Same direction after one loop!", font_size=14, color=YELLOW_A)
         result_text_group = VGroup(result_text, result_text_en).arrange(DOWN, buff=0.08)
         result_text_group.to_edge(DOWN, buff=0.4)
 
@@ -354,8 +356,8 @@ class ParallelTransportFlatWithTrace(Scene):
         self.wait(0.5)
 
         # ===== 次への伏線 =====
-        next_text = Text("では、地球の表面では…？", font_size=22, color=GREEN)
-        next_text_en = Text("But on Earth's surface...?", font_size=14, color=GREEN_A)
+        next_text = cached_text("では、地球の表面では…？", font_size=22, color=GREEN)
+        next_text_en = cached_text("But on Earth's surface...?", font_size=14, color=GREEN_A)
         next_text_group = VGroup(next_text, next_text_en).arrange(DOWN, buff=0.08)
         next_text_group.to_edge(DOWN, buff=0.4)
 
@@ -371,8 +373,8 @@ class ParallelTransportFlatRoom(Scene):
 
     def construct(self):
         # ===== タイトル =====
-        title = Text("部屋の中で「南」を指差しながら歩く", font_size=26)
-        title_en = Text('Walking while pointing "south" in a room', font_size=16, color=GRAY)
+        title = cached_text("部屋の中で「南」を指差しながら歩く", font_size=26)
+        title_en = cached_text('Walking while pointing "south" in a room', font_size=16, color=GRAY)
         title_group = VGroup(title, title_en).arrange(DOWN, buff=0.1)
         title_group.to_edge(UP, buff=0.3)
 
@@ -420,10 +422,10 @@ class ParallelTransportFlatRoom(Scene):
 
         compass = VGroup()
         # Nマーカー
-        n_text = Text("N", font_size=14, color=WHITE)
+        n_text = cached_text("N", font_size=14, color=WHITE)
         n_text.move_to(compass_center + UP * compass_size)
         # Sマーカー
-        s_text = Text("S", font_size=14, color=RED_A)
+        s_text = cached_text("S", font_size=14, color=RED_A)
         s_text.move_to(compass_center + DOWN * compass_size)
         # 矢印（南向き）
         compass_arrow = Arrow(
@@ -484,8 +486,8 @@ class ParallelTransportFlatRoom(Scene):
         self.play(Create(path_lines), run_time=0.6)
 
         # ===== 説明テキスト =====
-        walk_text = Text("ぐるっと一周", font_size=18, color=WHITE)
-        walk_text_en = Text("Walk around", font_size=12, color=GRAY)
+        walk_text = cached_text("ぐるっと一周", font_size=18, color=WHITE)
+        walk_text_en = cached_text("Walk around", font_size=12, color=GRAY)
         walk_text_group = VGroup(walk_text, walk_text_en).arrange(DOWN, buff=0.05)
         walk_text_group.to_edge(DOWN, buff=0.4)
 
@@ -508,8 +510,8 @@ class ParallelTransportFlatRoom(Scene):
         self.wait(0.3)
 
         # ===== 結果 =====
-        result_text = Text("指は南を向いたまま！", font_size=22, color=YELLOW)
-        result_text_en = Text("Finger still points south!", font_size=14, color=YELLOW_A)
+        result_text = cached_text("指は南を向いたまま！", font_size=22, color=YELLOW)
+        result_text_en = cached_text("Finger still points south!", font_size=14, color=YELLOW_A)
         result_text_group = VGroup(result_text, result_text_en).arrange(DOWN, buff=0.08)
         result_text_group.to_edge(DOWN, buff=0.4)
 
@@ -531,8 +533,8 @@ class ParallelTransportFlatRoom(Scene):
         self.wait(0.5)
 
         # ===== 「当たり前」メッセージ =====
-        obvious_text = Text("これは当たり前…", font_size=20, color=WHITE)
-        obvious_text_en = Text("This is obvious...", font_size=14, color=GRAY)
+        obvious_text = cached_text("これは当たり前…", font_size=20, color=WHITE)
+        obvious_text_en = cached_text("This is obvious...", font_size=14, color=GRAY)
         obvious_text_group = VGroup(obvious_text, obvious_text_en).arrange(DOWN, buff=0.08)
         obvious_text_group.to_edge(DOWN, buff=0.4)
 
@@ -540,8 +542,8 @@ class ParallelTransportFlatRoom(Scene):
         self.wait(0.5)
 
         # ===== 次への伏線 =====
-        next_text = Text("では、地球の表面で同じことをすると…？", font_size=20, color=GREEN)
-        next_text_en = Text("But what if we do the same on Earth's surface...?", font_size=12, color=GREEN_A)
+        next_text = cached_text("では、地球の表面で同じことをすると…？", font_size=20, color=GREEN)
+        next_text_en = cached_text("But what if we do the same on Earth's surface...?", font_size=12, color=GREEN_A)
         next_text_group = VGroup(next_text, next_text_en).arrange(DOWN, buff=0.08)
         next_text_group.to_edge(DOWN, buff=0.4)
 
@@ -16,6 +16,9 @@ yt_script.md L160-169 の解説用
 from manim import *
 import numpy as np
 
+from components import ArrowPose, cached_text
+from physics import parallel_transport, spherical_to_cartesian, tangent_frames
+
 
 class ParallelTransportSphere(ThreeDScene):
     """
@@ -36,8 +39,8 @@ class ParallelTransportSphere(ThreeDScene):
 
         # ===== タイトル（2D オーバーレイ） =====
         # 3Dシーンでは固定テキストを追加
-        title = Text("球面上での平行移動", font_size=28)
-        title_en = Text("Parallel Transport on a Sphere", font_size=16, color=GRAY)
+        title = cached_text("球面上での平行移動", font_size=28)
+        title_en = cached_text("Parallel Transport on a Sphere", font_size=16, color=GRAY)
         title_group = VGroup(title, title_en).arrange(DOWN, buff=0.1)
         title_group.to_edge(UP, buff=0.3)
         self.add_fixed_in_frame_mobjects(title_group)
@@ -59,44 +62,30 @@ class ParallelTransportSphere(ThreeDScene):
         self.wait(0.3)
 
         # ===== 北極点マーカー =====
-        north_pole_pos = sphere_radius * UP
+        # 球面座標の北極（theta=0）は +Z 方向
+        north_pole_pos = sphere_radius * OUT
 
         # ===== 経路を定義 =====
         # 経路1: 北極 → 赤道（経度0度の経線に沿って）
         # 経路2: 赤道上を90度東へ（経度0度 → 経度90度）
         # 経路3: 赤道 → 北極（経度90度の経線に沿って）
 
-        # 球面座標での経路点を計算
-        def spherical_to_cartesian(theta, phi, r=sphere_radius):
-            """球面座標 (theta: 天頂角, phi: 方位角) → デカルト座標"""
-            x = r * np.sin(theta) * np.cos(phi)
-            y = r * np.sin(theta) * np.sin(phi)
-            z = r * np.cos(theta)
-            return np.array([x, y, z])
-
-        # 経路の点を生成
+        # 経路の点を生成（各経路とも1回の配列計算）
         # 経路を45度時計回りに回転させて、全体が前面に見えるようにする
+        # Each path is generated with one array call
         num_points = 30
         phi_start = -PI / 2  # -90度（手前左端）
         phi_end = 0          # 0度（手前中央）
+        t = np.linspace(0, 1, num_points)
 
         # 経路1: 北極(theta=0) → 赤道(theta=PI/2)、phi=-45度
-        path1_points = [
-            spherical_to_cartesian(t * PI / 2, phi_start)
-            for t in np.linspace(0, 1, num_points)
-        ]
+        path1_points = spherical_to_cartesian(t * PI / 2, phi_start, sphere_radius)
 
         # 経路2: 赤道上、phi=-45度 → phi=+45度（90度分）
-        path2_points = [
-            spherical_to_cartesian(PI / 2, phi_start + t * PI / 2)
-            for t in np.linspace(0, 1, num_points)
-        ]
+        path2_points = spherical_to_cartesian(PI / 2, phi_start + t * PI / 2, sphere_radius)
 
         # 経路3: 赤道(theta=PI/2) → 北極(theta=0)、phi=+45度
-        path3_points = [
-            spherical_to_cartesian((1 - t) * PI / 2, phi_end)
-            for t in np.linspace(0, 1, num_points)
-        ]
+        path3_points = spherical_to_cartesian((1 - t) * PI / 2, phi_end, sphere_radius)
 
         # 経路を曲線として作成（目立つように太く明るい色）
         def create_path_curve(points, color, opacity=0.5, width=4):
@@ -110,8 +99,8 @@ class ParallelTransportSphere(ThreeDScene):
         preview_path3 = create_path_curve(path3_points, YELLOW, 0.4, 3)
 
         # 経路プレビューを表示
-        path_preview_text = Text("三角形の経路を移動", font_size=16, color=WHITE)
-        path_preview_text_en = Text("Moving along a triangular path", font_size=12, color=GRAY)
+        path_preview_text = cached_text("三角形の経路を移動", font_size=16, color=WHITE)
+        path_preview_text_en = cached_text("Moving along a triangular path", font_size=12, color=GRAY)
         path_preview_group = VGroup(path_preview_text, path_preview_text_en).arrange(DOWN, buff=0.05)
         path_preview_group.to_edge(DOWN, buff=0.4)
         self.add_fixed_in_frame_mobjects(path_preview_group)
@@ -148,9 +137,30 @@ class ParallelTransportSphere(ThreeDScene):
         # 北極点にベクトルを配置
         vector = create_tangent_vector(north_pole_pos, initial_direction)
 
+        # 毎フレームは同じ矢印の点をその場で置き直す（新しい Arrow3D は作らない）
+        # Every frame re-places the same arrow's points in place (no new Arrow3D)
+        vector_pose = ArrowPose(vector, north_pole_pos, north_pole_pos + initial_direction * vector_length)
+
+        def place_vector(position, direction):
+            return vector_pose.place(position, position + direction * vector_length)
+
+        # 三角形の経路全体に沿った平行移動の表を一度だけ作る
+        # 各フレームは表の参照と補間だけ（O(1)）
+        # Build the parallel-transport table for the whole triangle once;
+        # every frame only looks it up and interpolates (O(1))
+        table_samples = np.linspace(0, 1, 120)
+        transport = parallel_transport(
+            [
+                np.column_stack([table_samples * PI / 2, np.full_like(table_samples, phi_start)]),
+                np.column_stack([np.full_like(table_samples, PI / 2), phi_start + table_samples * PI / 2]),
+                np.column_stack([(1 - table_samples) * PI / 2, np.full_like(table_samples, phi_end)]),
+            ],
+            initial_direction,
+        )
+
         # ===== ステップ1: 北極 → 赤道 =====
-        step1_text = Text("①北極から赤道へ", font_size=16, color=RED_A)
-        step1_text_en = Text("Step 1: North Pole to Equator", font_size=12, color=RED_A)
+        step1_text = cached_text("①北極から赤道へ", font_size=16, color=RED_A)
+        step1_text_en = cached_text("Step 1: North Pole to Equator", font_size=12, color=RED_A)
         step1_group = VGroup(step1_text, step1_text_en).arrange(DOWN, buff=0.05)
         step1_group.to_edge(DOWN, buff=0.4)
         self.add_fixed_in_frame_mobjects(step1_group)
@@ -171,25 +181,10 @@ class ParallelTransportSphere(ThreeDScene):
         # 経路1のアニメーション
         def update_vector_path1(mob, alpha):
             """経路1でのベクトル更新（北極→赤道）"""
-            theta = alpha * PI / 2  # 0 → PI/2
-            phi = phi_start  # -45度
-            pos = spherical_to_cartesian(theta, phi)
-
-            # 平行移動: 経線に沿って移動するとき
-            # 初期方向（-90度）を維持しながら、球面の接平面に沿って変化
+            # 平行移動: 初期方向（-90度）は経線の接線方向なので、
             # 赤道に着いたとき、ベクトルは真下（-Z）を向く
-            # 補間: 北極で[-90度方向]、赤道で[-Z方向]
-            t = alpha
-            direction = np.array([
-                (1 - t) * np.cos(phi_vec_initial),
-                (1 - t) * np.sin(phi_vec_initial),
-                -t,
-            ])
-            norm = np.linalg.norm(direction)
-            if norm > 0.01:
-                direction = direction / norm
-
-            mob.become(create_tangent_vector(pos, direction))
+            pos, direction = transport.at_piece(0, alpha)
+            place_vector(sphere_radius * pos, direction)
 
         self.play(
             UpdateFromAlphaFunc(vector, update_vector_path1),
@@ -200,8 +195,8 @@ class ParallelTransportSphere(ThreeDScene):
         self.wait(0.3)
 
         # ===== ステップ2: 赤道上を90度東へ =====
-        step2_text = Text("②赤道に沿って90度", font_size=16, color=GREEN_A)
-        step2_text_en = Text("Step 2: 90° along Equator", font_size=12, color=GREEN_A)
+        step2_text = cached_text("②赤道に沿って90度", font_size=16, color=GREEN_A)
+        step2_text_en = cached_text("Step 2: 90° along Equator", font_size=12, color=GREEN_A)
         step2_group = VGroup(step2_text, step2_text_en).arrange(DOWN, buff=0.05)
         step2_group.to_edge(DOWN, buff=0.4)
         self.add_fixed_in_frame_mobjects(step2_group)
@@ -213,16 +208,9 @@ class ParallelTransportSphere(ThreeDScene):
 
         def update_vector_path2(mob, alpha):
             """経路2でのベクトル更新（赤道上を東へ）"""
-            theta = PI / 2  # 赤道上
-            phi = phi_start + alpha * PI / 2  # -45度 → +45度
-
-            pos = spherical_to_cartesian(theta, phi)
-
-            # 平行移動: 赤道に沿って移動するとき
-            # 赤道上では南向き = 真下（-Z方向）
-            direction = np.array([0, 0, -1])
-
-            mob.become(create_tangent_vector(pos, direction))
+            # 平行移動: 赤道（大円）に沿って移動するとき、南向き（-Z方向）のまま
+            pos, direction = transport.at_piece(1, alpha)
+            place_vector(sphere_radius * pos, direction)
 
         self.play(
             UpdateFromAlphaFunc(vector, update_vector_path2),
@@ -233,8 +221,8 @@ class ParallelTransportSphere(ThreeDScene):
         self.wait(0.3)
 
         # ===== ステップ3: 赤道 → 北極 =====
-        step3_text = Text("③北極へ戻る", font_size=16, color=ORANGE)
-        step3_text_en = Text("Step 3: Return to North Pole", font_size=12, color=ORANGE)
+        step3_text = cached_text("③北極へ戻る", font_size=16, color=ORANGE)
+        step3_text_en = cached_text("Step 3: Return to North Pole", font_size=12, color=ORANGE)
         step3_group = VGroup(step3_text, step3_text_en).arrange(DOWN, buff=0.05)
         step3_group.to_edge(DOWN, buff=0.4)
         self.add_fixed_in_frame_mobjects(step3_group)
@@ -245,43 +233,21 @@ class ParallelTransportSphere(ThreeDScene):
         self.play(FadeIn(step3_group), run_time=0.3)
 
         # 経路3の最終位置を事前に計算（ゴーストベクトルでも使用）
-        final_pos = spherical_to_cartesian(0, phi_end)  # 北極点（theta=0）
+        final_pos = spherical_to_cartesian(0, phi_end, sphere_radius)  # 北極点（theta=0）
         final_normal = final_pos / np.linalg.norm(final_pos)
         final_offset_pos = final_pos + final_normal * 0.05
 
         def update_vector_path3(mob, alpha):
             """経路3でのベクトル更新（赤道→北極）"""
-            theta = (1 - alpha) * PI / 2  # PI/2 → 0
-            phi = phi_end  # 0度
-
-            pos = spherical_to_cartesian(theta, phi)
+            pos, direction = transport.at_piece(2, alpha)
 
             # ベクトルを球面から少し浮かせて、経路より前面に表示
             # 法線方向（球の中心から外向き）にオフセット
-            normal = pos / np.linalg.norm(pos)
-            offset_pos = pos + normal * 0.05  # 0.05だけ浮かせる
-
-            # 平行移動: 経線に沿って北へ戻るとき
-            # 赤道で下向き（-Z）だったベクトルは、
-            # 北極に着いたとき、初期方向から90度ずれた方向を向く
-            # 初期: -90度 → 最終: 0度（X軸正方向）
-
-            # 補間: 赤道で[0,0,-1]、北極で[phi_end方向]
-            t = alpha
-            phi_vec_final = phi_end  # 0度（X軸正方向、90度ずれ）
-            final_dir = np.array([np.cos(phi_vec_final), np.sin(phi_vec_final), 0])
-            direction = np.array([
-                t * final_dir[0],
-                t * final_dir[1],
-                -(1 - t),
-            ])
-            norm = np.linalg.norm(direction)
-            if norm > 0.01:
-                direction = direction / norm
-            else:
-                direction = final_dir
-
-            mob.become(create_tangent_vector(offset_pos, direction))
+            offset_pos = sphere_radius * pos + pos * 0.05  # 0.05だけ浮かせる
+
+            # 平行移動: 赤道で下向き（-Z）だったベクトルは、
+            # 北極に着いたとき、初期方向からホロノミー角（90度）ずれた方向を向く
+            place_vector(offset_pos, direction)
 
         # ベクトルと経路を同時にアニメーション
         self.play(
@@ -311,8 +277,8 @@ class ParallelTransportSphere(ThreeDScene):
         # ===== 結論 =====
         self.play(FadeOut(step3_group), run_time=0.3)
 
-        conclusion_text = Text("曲がった空間では向きが変わる", font_size=20, color=WHITE)
-        conclusion_text_en = Text("Direction changes in curved space", font_size=14, color=GRAY)
+        conclusion_text = cached_text("曲がった空間では向きが変わる", font_size=20, color=WHITE)
+        conclusion_text_en = cached_text("Direction changes in curved space", font_size=14, color=GRAY)
         conclusion_group = VGroup(conclusion_text, conclusion_text_en).arrange(DOWN, buff=0.08)
         conclusion_group.to_edge(DOWN, buff=0.4)
         self.add_fixed_in_frame_mobjects(conclusion_group)
@@ -320,9 +286,10 @@ class ParallelTransportSphere(ThreeDScene):
         self.play(FadeIn(conclusion_group), run_time=0.5)
         self.wait(0.5)
 
-        # 90度ずれたことを強調
-        angle_text = Text("90°回転", font_size=24, color=YELLOW)
-        angle_text_en = Text("90° rotation", font_size=14, color=YELLOW_A)
+        # ホロノミー角（90度）ずれたことを強調
+        holonomy_degrees = round(abs(np.degrees(transport.holonomy())))
+        angle_text = cached_text(f"{holonomy_degrees}°回転", font_size=24, color=YELLOW)
+        angle_text_en = cached_text(f"{holonomy_degrees}° rotation", font_size=14, color=YELLOW_A)
         angle_group = VGroup(angle_text, angle_text_en).arrange(DOWN, buff=0.05)
         angle_group.next_to(conclusion_group, UP, buff=0.3)
         self.add_fixed_in_frame_mobjects(angle_group)
@@ -369,19 +336,11 @@ class ParallelTransportSphereSimple(ThreeDScene):
 
         self.add(sphere, equator)
 
-        # 経路の計算
-        def spherical_to_cartesian(theta, phi, r=sphere_radius):
-            return np.array([
-                r * np.sin(theta) * np.cos(phi),
-                r * np.sin(theta) * np.sin(phi),
-                r * np.cos(theta),
-            ])
-
-        # 経路点
-        n = 20
-        path1 = [spherical_to_cartesian(t * PI / 2, 0) for t in np.linspace(0, 1, n)]
-        path2 = [spherical_to_cartesian(PI / 2, t * PI / 2) for t in np.linspace(0, 1, n)]
-        path3 = [spherical_to_cartesian((1 - t) * PI / 2, PI / 2) for t in np.linspace(0, 1, n)]
+        # 経路点（各経路とも1回の配列計算） / Path points, one array call each
+        t = np.linspace(0, 1, 20)
+        path1 = spherical_to_cartesian(t * PI / 2, 0, sphere_radius)
+        path2 = spherical_to_cartesian(PI / 2, t * PI / 2, sphere_radius)
+        path3 = spherical_to_cartesian((1 - t) * PI / 2, PI / 2, sphere_radius)
 
         # 経路を表示
         for points, color in [(path1, RED), (path2, GREEN), (path3, ORANGE)]:
@@ -391,7 +350,7 @@ class ParallelTransportSphereSimple(ThreeDScene):
 
         # ベクトル
         vector_length = 0.5
-        north_pole = sphere_radius * UP
+        north_pole = spherical_to_cartesian(0, 0, sphere_radius)
 
         vector = Arrow3D(
             start=north_pole,
@@ -412,37 +371,25 @@ class ParallelTransportSphereSimple(ThreeDScene):
                 thickness=0.015,
             )
 
-        # 経路1
-        for i, t in enumerate(np.linspace(0, 1, 15)):
-            theta = t * PI / 2
-            pos = spherical_to_cartesian(theta, 0)
-            direction = np.array([np.cos(theta), 0, -np.sin(theta)])
-            new_vector = make_vector(pos, direction)
-            self.play(Transform(vector, new_vector), run_time=0.15)
-
-        # 経路2
-        for t in np.linspace(0, 1, 15):
-            phi = t * PI / 2
-            pos = spherical_to_cartesian(PI / 2, phi)
-            direction = np.array([0, 0, -1])
-            new_vector = make_vector(pos, direction)
-            self.play(Transform(vector, new_vector), run_time=0.15)
-
-        # 経路3
-        for t in np.linspace(0, 1, 15):
-            theta = (1 - t) * PI / 2
-            pos = spherical_to_cartesian(theta, PI / 2)
-            interp = t
-            direction = np.array([0, interp, -(1 - interp)])
-            if np.linalg.norm(direction) > 0.01:
-                direction = direction / np.linalg.norm(direction)
-            new_vector = make_vector(pos, direction)
-            self.play(Transform(vector, new_vector), run_time=0.15)
+        # 3つの経路とも、平行移動したベクトルは各点で「南」を向く
+        # （経線に沿った移動と赤道に沿った移動のどちらでも）。
+        # 全ステップの位置と向きを配列でまとめて求める。
+        # On all three legs the transported vector points due south at every
+        # step, so positions and directions are computed as arrays up front.
+        steps = np.linspace(0, 1, 15)
+        thetas = np.concatenate([steps * PI / 2, np.full_like(steps, PI / 2), (1 - steps) * PI / 2])
+        phis = np.concatenate([np.zeros_like(steps), steps * PI / 2, np.full_like(steps, PI / 2)])
+        positions = spherical_to_cartesian(thetas, phis, sphere_radius)
+        _, north = tangent_frames(thetas, phis)
+        directions = -north
+
+        for pos, direction in zip(positions, directions):
+            self.play(Transform(vector, make_vector(pos, direction)), run_time=0.15)
 
         self.wait(1)
 
         # 結果表示
-        result = Text("90°ずれた！", font_size=20, color=YELLOW)
+        result = cached_text("90°ずれた！", font_size=20, color=YELLOW)
         result.to_edge(DOWN)
         self.add_fixed_in_frame_mobjects(result)
         self.play(Write(result))
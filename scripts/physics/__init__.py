@@ -0,0 +1,68 @@
+"""
+シーンで使う物理計算（NumPy のみ、manim に依存しない）
+Physics computations used by the scenes (NumPy only, no manim dependency)
+
+各関数は点の配列 (N, d) をまとめて受け取り、1回の NumPy 呼び出しで評価する。
+Every function takes a whole (N, d) array of points and evaluates it in one
+NumPy call.
+"""
+
+from .curvature import Curvature, MetricSpec, two_sphere, warp_metric, weak_field_schwarzschild
+from .deviation import jacobi_fields
+from .geodesics import WarpMetric, geodesic_between, geodesic_fan, integrate_geodesics
+from .infall import StretchTable, infall_table
+from .orbits import kepler_orbits, orbit_period, pericenter_state
+from .parallel_transport import TransportTable, parallel_transport
+from .particles import Trajectory, below, simulate, within
+from .sphere import (
+    geodesic_distance,
+    great_circle,
+    latlon_to_cartesian,
+    normalize,
+    spherical_to_cartesian,
+    tangent_frames,
+)
+from .tidal_field import (
+    gravity,
+    gravity_direction_and_strength,
+    tidal_acceleration,
+    tidal_tensor,
+)
+from .tides import SOLAR_TO_LUNAR, tide_height, tide_weights
+
+__all__ = [
+    "Curvature",
+    "MetricSpec",
+    "two_sphere",
+    "warp_metric",
+    "weak_field_schwarzschild",
+    "jacobi_fields",
+    "WarpMetric",
+    "geodesic_between",
+    "geodesic_fan",
+    "integrate_geodesics",
+    "StretchTable",
+    "infall_table",
+    "kepler_orbits",
+    "orbit_period",
+    "pericenter_state",
+    "TransportTable",
+    "parallel_transport",
+    "Trajectory",
+    "below",
+    "simulate",
+    "within",
+    "geodesic_distance",
+    "great_circle",
+    "latlon_to_cartesian",
+    "normalize",
+    "spherical_to_cartesian",
+    "tangent_frames",
+    "SOLAR_TO_LUNAR",
+    "tide_height",
+    "tide_weights",
+    "gravity",
+    "gravity_direction_and_strength",
+    "tidal_acceleration",
+    "tidal_tensor",
+]
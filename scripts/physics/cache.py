@@ -0,0 +1,64 @@
+"""
+計算結果のディスクキャッシュ
+On-disk cache for computed arrays
+
+積分などの重い計算の結果を、パラメータのハッシュをキーにした .npz として
+media/physics_cache/<name>/ に保存する。再レンダリングでは読み込むだけになる。
+計算方法を変えたら、呼び出し側で params の "version" を上げる。
+
+Heavy results (integrations and the like) are stored as .npz files under
+media/physics_cache/<name>/, keyed by a hash of their parameters, so
+re-renders only load them. Callers bump the "version" entry of params when the
+computation changes.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+CACHE_DIR = Path(__file__).resolve().parents[2] / "media" / "physics_cache"
+
+
+def _jsonable(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"cannot hash {type(value).__name__} in cache params")
+
+
+def cache_path(name: str, params: dict) -> Path:
+    """パラメータに対応するキャッシュファイル / Cache file for a set of parameters"""
+    text = json.dumps(params, sort_keys=True, default=_jsonable)
+    key = hashlib.sha256(text.encode()).hexdigest()[:20]
+    return CACHE_DIR / name / f"{key}.npz"
+
+
+def cached_arrays(name: str, params: dict, compute) -> dict[str, np.ndarray]:
+    """
+    キャッシュがあれば読み込み、無ければ計算して保存する
+    Load the cached arrays, or compute and store them
+
+    Args:
+        name: キャッシュの種類（サブディレクトリ名）
+        params: 結果を決めるパラメータ（JSON にできる値と ndarray）
+        compute: 引数なしで {名前: ndarray} を返す関数
+
+    Returns:
+        {名前: ndarray}
+    """
+    path = cache_path(name, params)
+    if path.exists():
+        with np.load(path) as data:
+            return {key: data[key] for key in data.files}
+    arrays = compute()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # 並列レンダリングで同時に書いても壊れないよう、一時ファイルから置き換える
+    # Write to a temporary file and rename, so concurrent renders never see a partial file
+    temporary = path.with_suffix(f".{os.getpid()}.tmp.npz")
+    np.savez(temporary, **arrays)
+    os.replace(temporary, path)
+    return arrays
@@ -0,0 +1,331 @@
+"""
+2次元の計量の測地線ソルバー
+Geodesic solver for 2D metrics
+
+測地線方程式
+
+    d²x^k/ds² = -Γ^k_ij (dx^i/ds)(dx^j/ds)
+
+を適応刻みの RK45 (scipy.integrate.solve_ivp) で積分する。複数の初期条件は
+1つの連立系にまとめて一度に解くので、100本以上の測地線の扇も1回で求まる。
+クリストッフェル記号は計量の中心差分から作るので、計量は点の配列 (N, 2) から
+(N, 2, 2) を返す関数であれば何でもよい。
+
+Integrates the geodesic equation above with adaptive RK45
+(scipy.integrate.solve_ivp). A batch of initial conditions is stacked into
+one system, so a fan of 100+ geodesics is solved in a single pass. The
+Christoffel symbols come from central differences of the metric, so any
+callable mapping points (N, 2) to metrics (N, 2, 2) works.
+
+WarpMetric は flat_vs_curved_grid.py の warp_point が描く格子を「物差し」とする
+計量（格子の1目盛りが常に同じ長さ）。結果は (well_strength, well_radius) などの
+パラメータをキーにディスクにキャッシュされる。
+
+WarpMetric is the metric in which the grid drawn by warp_point in
+flat_vs_curved_grid.py is the ruler (every grid step has the same length).
+Results are cached on disk, keyed by (well_strength, well_radius) and the
+other parameters.
+"""
+
+import numpy as np
+from scipy.integrate import solve_ivp
+
+from .cache import cached_arrays
+
+# 積分方法を変えたら上げる / Bump when the integration changes
+GEODESIC_VERSION = 1
+
+
+class WarpMetric:
+    """
+    重力井戸の変形 warp_point が誘導する計量
+    Metric induced by the gravity-well warp_point map
+
+    格子座標 u を画面座標 x に写す放射方向の変形
+
+        x = c + u f(|u|),   f(r) = 1 - strength * exp(-(r / radius)^2)
+
+    の下で、格子座標では平坦（格子の目盛りが長さ）とする。画面座標での計量は
+    g(x) = J^-T J^-1（J = dx/du）。strength < 1 なら変形は単調で逆写像がある。
+
+    The grid coordinates u are mapped to screen coordinates x by the radial
+    warp above and are flat (grid steps measure length); on screen the metric
+    is g(x) = J^-T J^-1 with J = dx/du. The warp is monotonic, hence
+    invertible, for strength < 1.
+    """
+
+    def __init__(self, strength: float, radius: float, center=(0.0, 0.0)):
+        if not 0 <= strength < 1:
+            raise ValueError(f"strength must be in [0, 1), got {strength}")
+        self.strength = float(strength)
+        self.radius = float(radius)
+        self.center = np.asarray(center, dtype=float)[:2]
+
+    @property
+    def params(self) -> dict:
+        return {
+            "metric": "warp",
+            "well_strength": self.strength,
+            "well_radius": self.radius,
+            "center": self.center,
+        }
+
+    def _factor(self, r):
+        return 1 - self.strength * np.exp(-((r / self.radius) ** 2))
+
+    def warp(self, u) -> np.ndarray:
+        """格子座標 → 画面座標 (N, 2) / Grid to screen coordinates"""
+        u = np.asarray(u, dtype=float)
+        r = np.linalg.norm(u, axis=-1, keepdims=True)
+        return self.center + u * self._factor(r)
+
+    def unwarp(self, x, iterations: int = 50) -> np.ndarray:
+        """
+        画面座標 → 格子座標 (N, 2)。半径 ρ = r f(r) をニュートン法で解く
+        Screen to grid coordinates, solving ρ = r f(r) by Newton's method
+        """
+        rel = np.asarray(x, dtype=float) - self.center
+        rho = np.linalg.norm(rel, axis=-1)
+        r = rho.copy()
+        for _ in range(iterations):
+            q = (r / self.radius) ** 2
+            decay = self.strength * np.exp(-q)
+            residual = r * (1 - decay) - rho
+            r = r - residual / (1 - decay * (1 - 2 * q))
+            if np.max(np.abs(residual)) < 1e-13:
+                break
+        scale = np.divide(r, rho, out=np.full_like(rho, 1 / (1 - self.strength)), where=rho > 0)
+        return rel * scale[..., np.newaxis]
+
+    def jacobian(self, u) -> np.ndarray:
+        """dx/du (N, 2, 2)"""
+        u = np.asarray(u, dtype=float)
+        r = np.linalg.norm(u, axis=-1)
+        decay = self.strength * np.exp(-((r / self.radius) ** 2))
+        # f'(r) / r は r → 0 でも有限 / f'(r) / r stays finite as r → 0
+        slope = 2 * decay / self.radius**2
+        return (1 - decay)[..., np.newaxis, np.newaxis] * np.eye(2) + slope[
+            ..., np.newaxis, np.newaxis
+        ] * u[..., :, np.newaxis] * u[..., np.newaxis, :]
+
+    def __call__(self, x) -> np.ndarray:
+        """画面座標での計量 g(x) (N, 2, 2) / Metric in screen coordinates"""
+        inverse = np.linalg.inv(self.jacobian(self.unwarp(x)))
+        return np.swapaxes(inverse, -1, -2) @ inverse
+
+
+def christoffel(metric, points, eps: float = 1e-5) -> np.ndarray:
+    """
+    クリストッフェル記号 Γ^k_ij（計量の中心差分から）
+    Christoffel symbols Γ^k_ij from central differences of the metric
+
+    Returns:
+        (N, 2, 2, 2) の配列、添字は [n, k, i, j]
+    """
+    points = np.asarray(points, dtype=float)
+    dim = points.shape[-1]
+    # dg[n, l, i, j] = ∂_l g_ij
+    dg = np.stack(
+        [(metric(points + eps * e) - metric(points - eps * e)) / (2 * eps) for e in np.eye(dim)],
+        axis=1,
+    )
+    inverse = np.linalg.inv(metric(points))
+    # Γ_lij = ½ (∂_i g_lj + ∂_j g_li - ∂_l g_ij)
+    lowered = 0.5 * (np.swapaxes(dg, 1, 2) + np.transpose(dg, (0, 2, 3, 1)) - dg)
+    return np.einsum("nkl,nlij->nkij", inverse, lowered)
+
+
+def unit_speed(metric, points, velocities) -> np.ndarray:
+    """計量で長さ1に正規化した速度 / Velocities normalized to unit length in the metric"""
+    velocities = np.asarray(velocities, dtype=float)
+    norms = np.sqrt(np.einsum("ni,nij,nj->n", velocities, metric(points), velocities))
+    return velocities / norms[:, np.newaxis]
+
+
+def integrate_geodesics(
+    metric, starts, velocities, length: float, samples: int = 100, rtol: float = 1e-8, atol: float = 1e-10
+) -> np.ndarray:
+    """
+    複数の測地線をまとめて積分する
+    Integrate a batch of geodesics together
+
+    初速は長さ1に正規化するので、パラメータは固有長（弧長）になる。
+    Initial velocities are normalized to unit speed, so the parameter is the
+    proper length.
+
+    Args:
+        metric: 点 (N, 2) → 計量 (N, 2, 2) の関数
+        starts: 始点 (N, 2)
+        velocities: 初速の向き (N, 2)
+        length: 積分する固有長
+        samples: 出力の点数（弧長で等間隔）
+
+    Returns:
+        測地線上の点 (N, samples, 2)
+    """
+    starts = np.atleast_2d(np.asarray(starts, dtype=float))[:, :2]
+    velocities = unit_speed(metric, starts, np.atleast_2d(np.asarray(velocities, dtype=float))[:, :2])
+    count = len(starts)
+
+    def rhs(_, state):
+        x, v = state.reshape(2, count, 2)
+        gamma = christoffel(metric, x)
+        a = -np.einsum("nkij,ni,nj->nk", gamma, v, v)
+        return np.concatenate([v.ravel(), a.ravel()])
+
+    steps = np.linspace(0.0, length, samples)
+    solution = solve_ivp(
+        rhs,
+        (0.0, length),
+        np.concatenate([starts.ravel(), velocities.ravel()]),
+        method="RK45",
+        t_eval=steps,
+        rtol=rtol,
+        atol=atol,
+    )
+    if not solution.success:
+        raise RuntimeError(f"geodesic integration failed: {solution.message}")
+    return solution.y[: 2 * count].reshape(count, 2, -1).transpose(0, 2, 1)
+
+
+def proper_length(metric, points) -> float:
+    """折れ線の固有長（中点での計量で近似） / Proper length of a polyline (midpoint rule)"""
+    points = np.asarray(points, dtype=float)[:, :2]
+    steps = np.diff(points, axis=0)
+    midpoints = (points[1:] + points[:-1]) / 2
+    return float(np.sum(np.sqrt(np.einsum("ni,nij,nj->n", steps, metric(midpoints), steps))))
+
+
+def _crossings(paths, end, direction) -> tuple[np.ndarray, np.ndarray]:
+    """
+    各経路が終点を通る法線を横切る位置のずれと、そこまでの割合
+    Signed miss distance where each path crosses the normal line through the end
+
+    Returns:
+        (offsets (N,), fractions (N,))。横切らない経路は nan。
+    """
+    progress = (paths - end) @ direction
+    normal = np.array([-direction[1], direction[0]])
+    offsets = np.full(len(paths), np.nan)
+    fractions = np.full(len(paths), np.nan)
+    for n, along in enumerate(progress):
+        index = np.argmax(along >= 0)
+        if along[index] < 0 or index == 0:
+            continue
+        t = along[index - 1] / (along[index - 1] - along[index])
+        point = paths[n, index - 1] + t * (paths[n, index] - paths[n, index - 1])
+        offsets[n] = (point - end) @ normal
+        fractions[n] = (index - 1 + t) / (paths.shape[1] - 1)
+    return offsets, fractions
+
+
+def shoot(metric, start, end, spread: float = 0.8, fan: int = 33, rounds: int = 4, samples: int = 200):
+    """
+    始点から終点へ届く測地線の初期角度を扇形の射撃で求める
+    Find the initial angle of the geodesic from start to end by fan shooting
+
+    毎回 fan 本の測地線を一度に積分し、終点の左右に外れる隣り合う2本で
+    範囲を狭める。
+    Each round integrates fan geodesics at once and narrows the range to the
+    adjacent pair that misses the end on opposite sides.
+
+    Returns:
+        (angle, length): 初期角度と終点までの固有長
+    """
+    start, end = np.asarray(start, dtype=float)[:2], np.asarray(end, dtype=float)[:2]
+    chord = end - start
+    direction = chord / np.linalg.norm(chord)
+    base = np.arctan2(chord[1], chord[0])
+    reach = 2.0 * proper_length(metric, np.linspace(start, end, 64))
+    low, high = base - spread, base + spread
+    best_angle, best_length = base, reach / 2
+    for _ in range(rounds):
+        angles = np.linspace(low, high, fan)
+        paths = integrate_geodesics(
+            metric,
+            np.repeat(start[np.newaxis], fan, axis=0),
+            np.stack([np.cos(angles), np.sin(angles)], axis=1),
+            reach,
+            samples,
+        )
+        offsets, fractions = _crossings(paths, end, direction)
+        signs = np.sign(offsets)
+        brackets = np.flatnonzero(signs[:-1] * signs[1:] < 0)
+        if len(brackets) == 0:
+            raise RuntimeError("no geodesic from start reaches end within the search fan")
+        # 直線の向きに最も近い区間を採る / Take the bracket closest to the chord direction
+        i = brackets[np.argmin(np.abs((angles[brackets] + angles[brackets + 1]) / 2 - base))]
+        weight = offsets[i] / (offsets[i] - offsets[i + 1])
+        best_angle = angles[i] + weight * (angles[i + 1] - angles[i])
+        best_length = reach * (fractions[i] + weight * (fractions[i + 1] - fractions[i]))
+        low, high = angles[i], angles[i + 1]
+    return best_angle, best_length
+
+
+def _as_points3d(points2d) -> np.ndarray:
+    """manim 用に z = 0 を付ける / Append z = 0 for manim"""
+    return np.concatenate([points2d, np.zeros((*points2d.shape[:-1], 1))], axis=-1)
+
+
+def geodesic_between(metric, start, end, num_points: int = 50) -> np.ndarray:
+    """
+    2点を結ぶ測地線（ディスクキャッシュ付き）
+    Geodesic joining two points (cached on disk)
+
+    Args:
+        metric: WarpMetric など params を持つ計量
+        start, end: 始点・終点（manim の3次元座標でよい）
+        num_points: 出力の点数
+
+    Returns:
+        測地線上の点 (num_points, 3)（z = 0、最後の点は end に一致）
+    """
+    start, end = np.asarray(start, dtype=float)[:2], np.asarray(end, dtype=float)[:2]
+
+    def compute():
+        angle, length = shoot(metric, start, end)
+        path = integrate_geodesics(metric, [start], [[np.cos(angle), np.sin(angle)]], length, num_points)[0]
+        path[-1] = end
+        return {"points": path}
+
+    params = {
+        **metric.params,
+        "version": GEODESIC_VERSION,
+        "kind": "between",
+        "start": start,
+        "end": end,
+        "num_points": num_points,
+    }
+    return _as_points3d(cached_arrays("geodesics", params, compute)["points"])
+
+
+def geodesic_fan(metric, start, angles, length: float, num_points: int = 100) -> np.ndarray:
+    """
+    1点から扇形に出る測地線の束（ディスクキャッシュ付き）
+    Fan of geodesics leaving one point (cached on disk)
+
+    Args:
+        angles: 初速の角度の配列（ラジアン）
+        length: 各測地線の固有長
+
+    Returns:
+        測地線上の点 (len(angles), num_points, 3)
+    """
+    start = np.asarray(start, dtype=float)[:2]
+    angles = np.asarray(angles, dtype=float)
+
+    def compute():
+        starts = np.repeat(start[np.newaxis], len(angles), axis=0)
+        directions = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+        return {"points": integrate_geodesics(metric, starts, directions, length, num_points)}
+
+    params = {
+        **metric.params,
+        "version": GEODESIC_VERSION,
+        "kind": "fan",
+        "start": start,
+        "angles": angles,
+        "length": float(length),
+        "num_points": num_points,
+    }
+    return _as_points3d(cached_arrays("geodesics", params, compute)["points"])
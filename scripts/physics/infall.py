@@ -0,0 +1,135 @@
+"""
+放射落下する物体の潮汐による引き伸ばし
+Tidal stretching of a body in radial infall
+
+静止状態から質量 M に向かってまっすぐ落ちる、内部の力を持たない小さな物体
+（粒子の雲）の変形を表にする。軌道はサイクロイドの式で厳密に
+
+    r = r0 (1 + cos η) / 2,   τ = sqrt(r0³ / 8M) (η + sin η)
+
+と書け、各時刻の潮汐テンソルの固有値 λ（動径方向は引き伸ばし、横方向は圧縮）
+から、大きさの比 ξ をヤコビ方程式 ξ'' = λ ξ（ξ(0) = 1, ξ'(0) = 0）で求める。
+
+ニュートン重力では tidal_tensor を、シュワルツシルト時空では自由落下系での
+リーマンテンソルの成分（λ_r = 2M/r³, λ_t = -M/r³、厳密）を使う。静止からの
+放射落下では、固有時で測った r(τ) も潮汐の固有値も両者で一致することが
+知られているので、表の違いは事象の地平面 r = 2M の有無だけになる。
+
+Tabulates the deformation of a small body without internal forces (a cloud of
+particles) falling straight toward a mass M from rest. The path is the exact
+cycloid above; the size ratios ξ follow from the Jacobi equation ξ'' = λ ξ
+with the eigenvalues λ of the tidal tensor (stretching along the radius,
+compression across it). The Newtonian table uses tidal_tensor; the
+Schwarzschild one uses the exact Riemann components in the freely falling
+frame. For radial infall from rest r(τ) and the eigenvalues coincide in both
+theories, so the tables differ only by the event horizon at r = 2M.
+
+単位は G = c = 1。 / Units with G = c = 1.
+"""
+
+import numpy as np
+
+from .cache import cached_arrays
+from .deviation import fundamental_solutions
+from .tidal_field import tidal_tensor
+
+# 計算方法を変えたら上げる / Bump when the computation changes
+INFALL_VERSION = 1
+
+
+class StretchTable:
+    """
+    落下中の位置と変形の表（固有時で等間隔に参照する）
+    Table of radius and deformation during the fall, looked up evenly in proper time
+
+    Attributes:
+        times: 固有時 (S,)
+        radius: 中心からの距離 (S,)
+        radial: 動径方向の引き伸ばしの比 (S,)
+        transverse: 横方向の圧縮の比 (S,)
+        horizon: 事象の地平面の半径（ニュートン重力では None）
+    """
+
+    def __init__(self, times, radius, radial, transverse, horizon: float | None = None):
+        self.times = times
+        self.radius = radius
+        self.radial = radial
+        self.transverse = transverse
+        self.horizon = horizon
+
+    def at(self, alpha) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        落下時間の割合 alpha（スカラーまたは配列）での (距離, 動径の比, 横の比)
+        (radius, radial ratio, transverse ratio) at fractions alpha of the fall time
+        """
+        time = np.clip(alpha, 0.0, 1.0) * self.times[-1]
+        return (
+            np.interp(time, self.times, self.radius),
+            np.interp(time, self.times, self.radial),
+            np.interp(time, self.times, self.transverse),
+        )
+
+    def alpha_at_radius(self, radius: float) -> float:
+        """距離 radius に着く時間の割合 / Fraction of the fall time at which radius is reached"""
+        # 距離は単調に減るので、反転して補間する / Radius decreases monotonically, so interpolate reversed
+        time = np.interp(radius, self.radius[::-1], self.times[::-1])
+        return float(time / self.times[-1])
+
+
+def _eigenvalues(model: str, radius: np.ndarray, mass: float) -> tuple[np.ndarray, np.ndarray]:
+    if model == "newtonian":
+        points = np.stack([radius, np.zeros_like(radius), np.zeros_like(radius)], axis=1)
+        tensors = tidal_tensor(points, np.zeros(3), mass)
+        return tensors[:, 0, 0], tensors[:, 1, 1]
+    if model == "schwarzschild":
+        return 2 * mass / radius**3, -mass / radius**3
+    raise ValueError(f"unknown model: {model}")
+
+
+def _compute(mass, start_radius, end_radius, model, samples):
+    # 終点までの η を等間隔に取る（終盤ほど時間の刻みが細かくなる）
+    # Even steps in η, which refines the time steps toward the end
+    eta_end = np.arccos(2 * end_radius / start_radius - 1)
+    eta = np.linspace(0.0, eta_end, samples)
+    radius = start_radius * (1 + np.cos(eta)) / 2
+    times = np.sqrt(start_radius**3 / (8 * mass)) * (eta + np.sin(eta))
+
+    radial_eigenvalue, transverse_eigenvalue = _eigenvalues(model, radius, mass)
+    # ξ'' = λ ξ はヤコビ方程式 ξ'' + K ξ = 0 で K = -λ / ξ'' = λ ξ is the Jacobi equation with K = -λ
+    radial, _ = fundamental_solutions(-radial_eigenvalue, times)
+    transverse, _ = fundamental_solutions(-transverse_eigenvalue, times)
+    return {"times": times, "radius": radius, "radial": radial, "transverse": transverse}
+
+
+def infall_table(
+    mass: float, start_radius: float, end_radius: float, model: str = "schwarzschild", samples: int = 400
+) -> StretchTable:
+    """
+    静止から落下する物体の引き伸ばしの表（ディスクにキャッシュ）
+    Stretch table for a body falling from rest (cached on disk)
+
+    Args:
+        mass: 中心の質量 M
+        start_radius: 落下を始める距離
+        end_radius: 表の終わりの距離（0 < end_radius < start_radius）
+        model: "newtonian" または "schwarzschild"
+        samples: 表の行数
+
+    Returns:
+        StretchTable
+    """
+    if not 0 < end_radius < start_radius:
+        raise ValueError("end_radius must lie between 0 and start_radius")
+    params = {
+        "version": INFALL_VERSION,
+        "mass": mass,
+        "start_radius": start_radius,
+        "end_radius": end_radius,
+        "model": model,
+        "samples": samples,
+    }
+    arrays = cached_arrays(
+        "infall", params, lambda: _compute(mass, start_radius, end_radius, model, samples)
+    )
+    horizon = 2 * mass if model == "schwarzschild" else None
+    return StretchTable(arrays["times"], arrays["radius"], arrays["radial"], arrays["transverse"], horizon)
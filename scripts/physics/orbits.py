@@ -0,0 +1,100 @@
+"""
+ケプラー軌道
+Kepler orbits
+
+近点（中心に最も近い点）の距離と離心率から初期条件を作り、particles の
+リープフロッグで積分する。リープフロッグはシンプレクティックなので、
+何周してもエネルギーの誤差は増えず、軌道は閉じたまま保たれる。
+位置・速度・加速度を標本化して保存するので、シーンは速度と重力の矢印も
+表から引ける。衛星は何個でも1回の積分でまとめて計算できる。
+
+Initial conditions come from the pericenter distance and eccentricity, and
+the particles leapfrog integrates them. Leapfrog is symplectic, so the energy
+error does not grow over many revolutions and orbits stay closed. Positions,
+velocities and accelerations are sampled, so scenes can also look up velocity
+and gravity arrows. Any number of satellites share one integration.
+
+単位は G = 1。 / Units with G = 1.
+"""
+
+import numpy as np
+
+from .particles import Trajectory, simulate
+
+
+def orbit_period(semi_major_axis, mass: float = 1.0):
+    """公転周期 2π sqrt(a³ / M) / Orbital period"""
+    return 2 * np.pi * np.sqrt(np.asarray(semi_major_axis, dtype=float) ** 3 / mass)
+
+
+def pericenter_state(pericenter, eccentricity=0.0, mass: float = 1.0, angle=0.0, center=None):
+    """
+    近点での位置と速度（反時計回り）
+    Position and velocity at pericenter (counter-clockwise)
+
+    Args:
+        pericenter: 近点の距離 (N,) またはスカラー
+        eccentricity: 離心率（0 ≤ e < 1）
+        mass: 中心の質量
+        angle: 近点の方向（ラジアン）
+        center: 中心の位置 (3,)（省略時は原点）
+
+    Returns:
+        (位置 (N, 3), 速度 (N, 3))
+    """
+    pericenter, eccentricity, angle = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(pericenter, dtype=float)),
+        np.asarray(eccentricity, dtype=float),
+        np.asarray(angle, dtype=float),
+    )
+    center = np.zeros(3) if center is None else np.asarray(center, dtype=float)
+    outward = np.stack([np.cos(angle), np.sin(angle), np.zeros_like(angle)], axis=1)
+    forward = np.stack([-np.sin(angle), np.cos(angle), np.zeros_like(angle)], axis=1)
+    # 近点での速さ（活力の式から） / Speed at pericenter from the vis-viva equation
+    speed = np.sqrt(mass * (1 + eccentricity) / pericenter)
+    return center + pericenter[:, np.newaxis] * outward, speed[:, np.newaxis] * forward
+
+
+def kepler_orbits(
+    pericenter,
+    eccentricity=0.0,
+    mass: float = 1.0,
+    angle=0.0,
+    center=None,
+    revolutions: float = 1.0,
+    duration: float | None = None,
+    samples: int = 361,
+    substeps: int = 16,
+) -> Trajectory:
+    """
+    衛星の軌道をまとめて積分する
+    Integrate the orbits of many satellites at once
+
+    Args:
+        pericenter, eccentricity, angle: 各衛星の近点の距離・離心率・方向
+        mass: 中心の質量
+        center: 中心の位置 (3,)
+        revolutions: 最初の衛星が回る周回数（duration 省略時）
+        duration: 計算する時間
+        samples: 保存する時刻の数
+        substeps: 標本の間のステップ数
+
+    Returns:
+        位置・速度・加速度を記録した Trajectory
+    """
+    positions, velocities = pericenter_state(pericenter, eccentricity, mass, angle, center)
+    if duration is None:
+        first = np.atleast_1d(np.asarray(pericenter, dtype=float))[0]
+        first_eccentricity = np.atleast_1d(np.asarray(eccentricity, dtype=float))[0]
+        duration = revolutions * float(orbit_period(first / (1 - first_eccentricity), mass))
+    center = np.zeros(3) if center is None else np.asarray(center, dtype=float)
+    return simulate(
+        positions,
+        center,
+        mass,
+        velocities=velocities,
+        duration=duration,
+        samples=samples,
+        substeps=substeps,
+        with_velocities=True,
+    )
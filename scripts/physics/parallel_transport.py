@@ -0,0 +1,135 @@
+"""
+球面上の平行移動
+Parallel transport on the sphere
+
+(theta, phi) の標本点の列で与えた任意の経路に沿って、接ベクトルを平行移動する。
+隣り合う標本点の間は大円の弧とみなす（経線・赤道なら厳密、その他の曲線でも
+標本を細かくすれば収束する）。大円に沿った平行移動では、ベクトルと経路の
+接線のなす角が一定なので、角度が変わるのは標本点で経路が曲がるときだけ:
+
+    α_i = α_0 - Σ_{k<=i} τ_k   （τ_k: 点 k での経路の回転角）
+
+これを np.cumsum で一度に求めて表を作り、フレームごとの参照は添字計算と
+隣接2点の補間だけ（O(1)）で済ませる。閉じた経路ならホロノミー角
+（一周後のずれ、単位球では囲んだ面積に等しい）も表から読める。
+
+Transports a tangent vector along any path given as (theta, phi) samples.
+Consecutive samples are joined by great-circle arcs (exact for meridians and
+the equator, convergent for other curves as the sampling is refined). Along
+a great circle the angle between the vector and the path tangent is
+constant, so it only changes where the path turns at a sample, by the
+turning angle τ. The whole table is built with one cumulative sum; every
+frame then looks up and interpolates two neighbouring entries in O(1). For
+closed paths the holonomy angle (the enclosed area on the unit sphere) is
+read off the table.
+
+座標は単位球、theta は天頂角（北極 = +z）、phi は方位角。
+Coordinates are on the unit sphere; theta is the polar angle (north = +z),
+phi the azimuth.
+"""
+
+import numpy as np
+
+from .sphere import normalize, spherical_to_cartesian
+
+
+def _signed_angle(a, b, normal) -> np.ndarray:
+    """normal 回りに a から b への符号付き角 / Signed angle from a to b about normal"""
+    return np.arctan2(np.einsum("...i,...i", normal, np.cross(a, b)), np.einsum("...i,...i", a, b))
+
+
+class TransportTable:
+    """
+    経路上の位置と平行移動したベクトルの表
+    Table of positions and transported vectors along a path
+
+    Attributes:
+        positions: 経路上の点 (M, 3)（単位球）
+        vectors: 各点での平行移動したベクトル (M, 3)（単位長）
+        piece_bounds: 各区間の (最初, 最後) の添字
+    """
+
+    def __init__(self, positions: np.ndarray, vectors: np.ndarray, piece_bounds: list[tuple[int, int]]):
+        self.positions = positions
+        self.vectors = vectors
+        self.piece_bounds = piece_bounds
+
+    def _lookup(self, first: int, last: int, alpha: float) -> tuple[np.ndarray, np.ndarray]:
+        x = first + np.clip(alpha, 0.0, 1.0) * (last - first)
+        i = min(int(x), last - 1) if last > first else first
+        t = x - i
+        j = min(i + 1, last)
+        position = normalize((1 - t) * self.positions[i] + t * self.positions[j])
+        vector = (1 - t) * self.vectors[i] + t * self.vectors[j]
+        # 補間した点の接平面に射影し直す / Project back onto the tangent plane
+        vector = normalize(vector - np.dot(vector, position) * position)
+        return position, vector
+
+    def at(self, alpha: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        経路全体の割合 alpha での (位置, ベクトル)
+        (position, vector) at fraction alpha of the whole path
+        """
+        return self._lookup(0, len(self.positions) - 1, alpha)
+
+    def at_piece(self, piece: int, alpha: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        区間 piece の中の割合 alpha での (位置, ベクトル)
+        (position, vector) at fraction alpha of one piece
+        """
+        first, last = self.piece_bounds[piece]
+        return self._lookup(first, last, alpha)
+
+    def holonomy(self) -> float:
+        """
+        始点と終点でのベクトルのなす符号付き角（ラジアン、閉じた経路用）
+        Signed angle between the first and last vectors (radians, closed paths)
+
+        始点の法線回りに測る。反時計回りの単純閉曲線なら囲んだ面積に等しい。
+        Measured about the normal at the start; equals the enclosed area for a
+        counter-clockwise simple loop.
+        """
+        return float(_signed_angle(self.vectors[0], self.vectors[-1], self.positions[0]))
+
+
+def parallel_transport(pieces, initial_vector) -> TransportTable:
+    """
+    区間をつないだ経路に沿ってベクトルを平行移動した表を作る
+    Build the parallel-transport table along a piecewise path
+
+    Args:
+        pieces: (theta, phi) の標本の配列 (M_k, 2) のリスト。前の区間の終点と
+                次の区間の始点が同じなら重複は除く。
+        initial_vector: 始点での接ベクトル (3,)（接平面に射影して正規化する）
+
+    Returns:
+        TransportTable
+    """
+    positions, bounds = [], []
+    for piece in pieces:
+        points = spherical_to_cartesian(*np.asarray(piece, dtype=float).T)
+        if positions and np.allclose(points[0], positions[-1]):
+            points = points[1:]
+        first = max(len(positions) - 1, 0)
+        positions.extend(points)
+        bounds.append((first, len(positions) - 1))
+    x = np.array(positions)
+
+    # 各弧の始点・終点での接線 / Tangents at the start and end of every arc
+    dots = np.einsum("ij,ij->i", x[:-1], x[1:])[:, np.newaxis]
+    starts = normalize(x[1:] - dots * x[:-1])
+    ends = normalize(dots * x[1:] - x[:-1])
+
+    # 点での曲がり角と、弧の接線から見たベクトルの角 / Turning angles and the vector's angle per arc
+    turns = _signed_angle(ends[:-1], starts[1:], x[1:-1])
+    v0 = np.asarray(initial_vector, dtype=float)
+    v0 = normalize(v0 - np.dot(v0, x[0]) * x[0])
+    alpha0 = _signed_angle(starts[0], v0, x[0])
+    alphas = alpha0 - np.concatenate([[0.0], np.cumsum(turns)])
+
+    # 各弧の始点でのベクトル、最後の点は最後の弧の終点で / Vector at every arc start, the last one at the final arc end
+    frames = np.concatenate([starts, ends[-1:]])
+    normals = np.cross(x, frames)
+    angles = np.concatenate([alphas, alphas[-1:]])[:, np.newaxis]
+    vectors = np.cos(angles) * frames + np.sin(angles) * normals
+    return TransportTable(x, vectors, bounds)
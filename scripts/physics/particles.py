@@ -0,0 +1,212 @@
+"""
+点質量のまわりの試験粒子のシミュレーション
+Test-particle simulation around point masses
+
+リープフロッグ（kick-drift-kick、速度ベルレ）で全粒子を1ステップずつ
+まとめて進める。1万個以上の粒子でも1ステップは NumPy の数回の呼び出しで済む。
+軌道は等間隔の時刻で標本化した配列 (S, N, d) に保存し、アニメーションは
+alpha（0〜1）で参照する。フレームごとの物理計算は無い。
+
+All particles advance together with leapfrog (kick-drift-kick, velocity
+Verlet); a step is a handful of NumPy calls even for 10,000+ particles.
+Trajectories are stored as arrays (S, N, d) sampled at equal times, and
+animations look them up by alpha (0 to 1); there is no per-frame physics.
+
+単位は G = 1。静止から放した粒子の軌道の形は質量によらない（時間の尺度が
+変わるだけ）ので、アニメーションでは質量 1 のまま終了条件で長さを決めればよい。
+Units with G = 1. Paths of particles released at rest do not depend on the
+mass (only the time scale does), so scenes can keep mass 1 and let a stop
+condition set the duration.
+"""
+
+import numpy as np
+
+from .tidal_field import gravity
+
+
+class Trajectory:
+    """
+    標本化した軌道
+    Sampled trajectories
+
+    Attributes:
+        times: 標本の時刻 (S,)
+        positions: 各時刻の位置 (S, N, d)
+        velocities: 各時刻の速度 (S, N, d)（記録した場合）
+        accelerations: 各時刻の加速度 (S, N, d)（記録した場合）
+    """
+
+    def __init__(
+        self,
+        times: np.ndarray,
+        positions: np.ndarray,
+        velocities: np.ndarray | None = None,
+        accelerations: np.ndarray | None = None,
+    ):
+        self.times = times
+        self.positions = positions
+        self.velocities = velocities
+        self.accelerations = accelerations
+
+    @property
+    def duration(self) -> float:
+        return float(self.times[-1])
+
+    @property
+    def final(self) -> np.ndarray:
+        """最後の位置 (N, d) / Final positions"""
+        return self.positions[-1]
+
+    def _lookup(self, samples: np.ndarray, alpha: float) -> np.ndarray:
+        x = np.clip(alpha, 0.0, 1.0) * (len(self.times) - 1)
+        i = min(int(x), len(self.times) - 2)
+        t = x - i
+        return (1 - t) * samples[i] + t * samples[i + 1]
+
+    def at(self, alpha: float) -> np.ndarray:
+        """
+        時間の割合 alpha での全粒子の位置 (N, d)（隣り合う標本の線形補間）
+        Positions of every particle at fraction alpha of the duration
+        """
+        return self._lookup(self.positions, alpha)
+
+    def state_at(self, alpha: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        時間の割合 alpha での (位置, 速度, 加速度)（with_velocities=True で計算したとき）
+        (positions, velocities, accelerations) at fraction alpha (needs with_velocities=True)
+        """
+        if self.velocities is None or self.accelerations is None:
+            raise ValueError("velocities were not recorded; simulate with with_velocities=True")
+        return (
+            self._lookup(self.positions, alpha),
+            self._lookup(self.velocities, alpha),
+            self._lookup(self.accelerations, alpha),
+        )
+
+
+def _accelerations(positions, centers, masses, active):
+    accelerations = np.zeros_like(positions)
+    if np.any(active):
+        accelerations[active] = gravity(positions[active], centers, masses)
+    return accelerations
+
+
+def _leapfrog(positions, velocities, accelerations, active, dt, centers, masses, stop):
+    """
+    1ステップ進める（止まった粒子は動かさない）
+    Advance one step; stopped particles stay where they are
+    """
+    velocities = velocities + 0.5 * dt * accelerations
+    positions = np.where(active[:, np.newaxis], positions + dt * velocities, positions)
+    if stop is not None:
+        active = active & ~stop(positions)
+    accelerations = _accelerations(positions, centers, masses, active)
+    velocities = np.where(active[:, np.newaxis], velocities + 0.5 * dt * accelerations, 0.0)
+    return positions, velocities, accelerations, active
+
+
+def stop_time(
+    positions, centers, masses=1.0, velocities=None, stop=None, end: str = "all", dt: float = 1e-3, max_steps: int = 10**6
+) -> float:
+    """
+    終了条件を満たすまでの時間
+    Time until the stop condition is met
+
+    Args:
+        stop: 位置 (N, d) → 止まった粒子の真偽 (N,) の関数
+        end: "all" なら全粒子、"any" なら最初の1個が止まった時刻
+    """
+    positions = np.asarray(positions, dtype=float)
+    velocities = np.zeros_like(positions) if velocities is None else np.asarray(velocities, dtype=float)
+    active = ~stop(positions)
+    accelerations = _accelerations(positions, centers, masses, active)
+    done = np.all if end == "all" else np.any
+    for step in range(1, max_steps + 1):
+        positions, velocities, accelerations, active = _leapfrog(
+            positions, velocities, accelerations, active, dt, centers, masses, stop
+        )
+        if done(~active):
+            return step * dt
+    raise RuntimeError(f"stop condition not met within {max_steps} steps")
+
+
+def simulate(
+    positions,
+    centers,
+    masses=1.0,
+    velocities=None,
+    duration: float | None = None,
+    stop=None,
+    end: str = "all",
+    samples: int = 121,
+    substeps: int = 8,
+    dt: float = 1e-3,
+    with_velocities: bool = False,
+) -> Trajectory:
+    """
+    試験粒子の軌道を計算する
+    Compute test-particle trajectories
+
+    Args:
+        positions: 初期位置 (N, d)（manim の座標をそのまま渡せる）
+        centers: 質量の位置 (M, d)、1個なら (d,) でもよい
+        masses: 質量 (M,) またはスカラー
+        velocities: 初速 (N, d)（省略時は静止）
+        duration: 計算する時間。省略時は stop と end で決まる時刻まで
+        stop: 位置 (N, d) → 止まった粒子の真偽 (N,) の関数（着地・衝突など）
+        end: duration 省略時の終わり方（"all": 全粒子が止まる、"any": 最初の1個）
+        samples: 保存する時刻の数
+        substeps: 標本の間のステップ数
+        dt: duration を探すときの刻み
+        with_velocities: 速度と加速度も記録する
+
+    Returns:
+        Trajectory
+    """
+    positions = np.asarray(positions, dtype=float)
+    velocities = np.zeros_like(positions) if velocities is None else np.asarray(velocities, dtype=float)
+    if duration is None:
+        if stop is None:
+            raise ValueError("give either duration or stop")
+        duration = stop_time(positions, centers, masses, velocities, stop, end, dt)
+
+    step = duration / ((samples - 1) * substeps)
+    active = np.ones(len(positions), dtype=bool) if stop is None else ~stop(positions)
+    accelerations = _accelerations(positions, centers, masses, active)
+    recorded = np.empty((samples, *positions.shape))
+    recorded[0] = positions
+    if with_velocities:
+        recorded_velocities = np.empty_like(recorded)
+        recorded_accelerations = np.empty_like(recorded)
+        recorded_velocities[0], recorded_accelerations[0] = velocities, accelerations
+    for sample in range(1, samples):
+        for _ in range(substeps):
+            positions, velocities, accelerations, active = _leapfrog(
+                positions, velocities, accelerations, active, step, centers, masses, stop
+            )
+        recorded[sample] = positions
+        if with_velocities:
+            recorded_velocities[sample], recorded_accelerations[sample] = velocities, accelerations
+    times = np.linspace(0.0, duration, samples)
+    if with_velocities:
+        return Trajectory(times, recorded, recorded_velocities, recorded_accelerations)
+    return Trajectory(times, recorded)
+
+
+def within(center, radius: float):
+    """中心から radius 以内に入ったら止める / Stop once within radius of center"""
+    center = np.asarray(center, dtype=float)
+
+    def stop(positions):
+        return np.linalg.norm(positions - center, axis=-1) <= radius
+
+    return stop
+
+
+def below(height: float, axis: int = 1):
+    """座標 axis が height 以下になったら止める（地面） / Stop at or below a height (the ground)"""
+
+    def stop(positions):
+        return positions[:, axis] <= height
+
+    return stop
@@ -0,0 +1,98 @@
+"""
+球面の幾何（座標変換・大円・距離・接平面の基底）
+Spherical geometry (coordinates, great circles, distances, tangent frames)
+
+どの関数も配列をまとめて受け取り、ブロードキャストして1回の NumPy 呼び出しで
+評価する。数千点の経路も1回の呼び出しで作れる。
+
+Every function takes whole arrays and broadcasts them, so a path with
+thousands of samples is a single NumPy call.
+
+球面座標では theta は天頂角（北極 = +z）、phi は方位角。緯度経度では
+lat は赤道から測る。
+In spherical coordinates theta is the polar angle (north = +z) and phi the
+azimuth; latitude is measured from the equator.
+"""
+
+import numpy as np
+
+
+def normalize(vectors) -> np.ndarray:
+    """最後の軸で単位長にする / Normalize along the last axis"""
+    vectors = np.asarray(vectors, dtype=float)
+    return vectors / np.linalg.norm(vectors, axis=-1, keepdims=True)
+
+
+def spherical_to_cartesian(theta, phi, radius=1.0) -> np.ndarray:
+    """
+    球面座標 (theta, phi) → デカルト座標 (..., 3)
+    Spherical (theta, phi) to Cartesian (..., 3)
+    """
+    theta, phi, radius = np.broadcast_arrays(
+        np.asarray(theta, dtype=float), np.asarray(phi, dtype=float), np.asarray(radius, dtype=float)
+    )
+    sin_theta = np.sin(theta)
+    return np.stack(
+        [radius * sin_theta * np.cos(phi), radius * sin_theta * np.sin(phi), radius * np.cos(theta)], axis=-1
+    )
+
+
+def latlon_to_cartesian(lat, lon, radius=1.0) -> np.ndarray:
+    """
+    緯度経度 (lat, lon) → デカルト座標 (..., 3)
+    Latitude and longitude to Cartesian (..., 3)
+    """
+    return spherical_to_cartesian(np.pi / 2 - np.asarray(lat, dtype=float), lon, radius)
+
+
+def geodesic_distance(p, q, radius=1.0) -> np.ndarray:
+    """
+    球面上の2点の間の大円距離（p, q は中心からの向き、長さは問わない）
+    Great-circle distance between points (only their directions matter)
+
+    小さな角でも精度が落ちないよう atan2(|p×q|, p·q) で求める。
+    Uses atan2(|p×q|, p·q), which stays accurate for small angles.
+    """
+    p, q = normalize(p), normalize(q)
+    angle = np.arctan2(np.linalg.norm(np.cross(p, q), axis=-1), np.einsum("...i,...i", p, q))
+    return radius * angle
+
+
+def great_circle(start, end, t) -> np.ndarray:
+    """
+    start から end への大円上の点（球面線形補間、slerp）
+    Points on the great circle from start to end (spherical linear interpolation)
+
+    Args:
+        start, end: 端点 (3,)（半径は start のものを使う）
+        t: 割合（スカラーまたは配列 (N,)）
+
+    Returns:
+        点 (3,) または (N, 3)
+    """
+    start, end = np.asarray(start, dtype=float), np.asarray(end, dtype=float)
+    radius = np.linalg.norm(start)
+    p, q = start / radius, normalize(end)
+    omega = float(geodesic_distance(p, q))
+    t = np.asarray(t, dtype=float)[..., np.newaxis]
+    if omega < 1e-9:
+        return radius * np.broadcast_to(p, t.shape[:-1] + (3,)).copy()
+    return radius * (np.sin((1 - t) * omega) * p + np.sin(t * omega) * q) / np.sin(omega)
+
+
+def tangent_frames(theta, phi) -> tuple[np.ndarray, np.ndarray]:
+    """
+    球面座標 (theta, phi) の点での接平面の (東, 北) の単位ベクトル
+    Unit (east, north) vectors of the tangent plane at (theta, phi)
+
+    点ではなく角度から作るので、極でも phi の経線に沿った向きに決まる。
+    Built from the angles rather than the point, so at the poles the frame
+    still follows the meridian phi.
+
+    Returns:
+        (east (..., 3), north (..., 3))
+    """
+    theta, phi = np.broadcast_arrays(np.asarray(theta, dtype=float), np.asarray(phi, dtype=float))
+    east = np.stack([-np.sin(phi), np.cos(phi), np.zeros_like(phi)], axis=-1)
+    north = np.stack([-np.cos(theta) * np.cos(phi), -np.cos(theta) * np.sin(phi), np.sin(theta)], axis=-1)
+    return east, north
@@ -0,0 +1,120 @@
+"""
+点質量の重力場と潮汐場
+Gravity and tidal fields of point masses
+
+単位は G = 1。質量 M_k が位置 c_k にあるとき、点 x での重力加速度と
+潮汐テンソル（重力ポテンシャルの2階微分の符号反転）は
+
+    g(x)    = Σ_k M_k (c_k - x) / |c_k - x|^3
+    T_ij(x) = Σ_k M_k (3 r_i r_j - |r|^2 δ_ij) / |r|^5,   r = x - c_k
+
+T は近くの2点の加速度の差を与える: g(x + ξ) - g(x) ≈ T ξ。
+（docs/chapter5.pdf Figure 5.1 参照）
+
+Units with G = 1. For masses M_k at c_k, the gravitational acceleration and
+the tidal tensor (minus the Hessian of the potential) at x are given above;
+T maps a small separation ξ to the difference in acceleration, T ξ.
+
+点は (N, 2) でも (N, 3) でもよい（manim の座標はそのまま渡せる）。
+Points may be (N, 2) or (N, 3); manim coordinates can be passed as they are.
+"""
+
+import numpy as np
+
+
+def _sources(centers, masses) -> tuple[np.ndarray, np.ndarray]:
+    """質量の位置 (M, d) と質量 (M,) に揃える / Normalize to centers (M, d) and masses (M,)"""
+    centers = np.atleast_2d(np.asarray(centers, dtype=float))
+    masses = np.broadcast_to(np.asarray(masses, dtype=float), (len(centers),))
+    return centers, masses
+
+
+def _separations(points, centers) -> tuple[np.ndarray, np.ndarray]:
+    """
+    点から見た各質量への変位 (N, M, d) と距離 (N, M)
+    Displacements from every point to every mass (N, M, d) and distances (N, M)
+    """
+    points = np.asarray(points, dtype=float)
+    offsets = centers[np.newaxis, :, :] - points[:, np.newaxis, :]
+    return offsets, np.linalg.norm(offsets, axis=-1)
+
+
+def gravity(points, centers, masses=1.0) -> np.ndarray:
+    """
+    各点での重力加速度
+    Gravitational acceleration at each point
+
+    Args:
+        points: 点の配列 (N, d)
+        centers: 質量の位置 (M, d)、1個なら (d,) でもよい
+        masses: 質量 (M,) またはスカラー
+
+    Returns:
+        加速度の配列 (N, d)
+    """
+    centers, masses = _sources(centers, masses)
+    offsets, distances = _separations(points, centers)
+    weights = masses / distances**3
+    return np.einsum("nm,nmd->nd", weights, offsets)
+
+
+def gravity_direction_and_strength(points, centers, masses=1.0, reference=None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    各点での重力の方向と相対的な強さ
+    Gravity direction and relative strength at each point
+
+    相対的な強さは基準点での重力の大きさとの比。質量が1個で基準点が原点なら
+    (基準距離 / 距離)^2 になる。
+    The relative strength is the ratio to the magnitude at the reference point;
+    for a single mass and a reference at the origin it is (d_ref / d)^2.
+
+    Args:
+        points: 点の配列 (N, d)
+        centers: 質量の位置 (M, d)、1個なら (d,) でもよい
+        masses: 質量 (M,) またはスカラー
+        reference: 基準点 (d,)（省略時は原点）
+
+    Returns:
+        (directions, strengths)
+        - directions: 正規化された重力の方向 (N, d)
+        - strengths: 相対的な強さ (N,)
+    """
+    points = np.asarray(points, dtype=float)
+    if reference is None:
+        reference = np.zeros(points.shape[-1])
+    field = gravity(points, centers, masses)
+    magnitudes = np.linalg.norm(field, axis=-1)
+    reference_magnitude = np.linalg.norm(gravity(np.atleast_2d(reference), centers, masses)[0])
+    return field / magnitudes[:, np.newaxis], magnitudes / reference_magnitude
+
+
+def tidal_tensor(points, centers, masses=1.0) -> np.ndarray:
+    """
+    各点での潮汐テンソル
+    Tidal tensor at each point
+
+    Returns:
+        対称行列の配列 (N, d, d)。固有値は引き伸ばし（正）と圧縮（負）の強さ。
+        Symmetric matrices (N, d, d); positive eigenvalues stretch, negative
+        ones compress.
+    """
+    centers, masses = _sources(centers, masses)
+    offsets, distances = _separations(points, centers)
+    r = -offsets  # 質量から点へ / from the mass to the point
+    dim = r.shape[-1]
+    outer = 3 * r[..., :, np.newaxis] * r[..., np.newaxis, :]
+    isotropic = (distances**2)[..., np.newaxis, np.newaxis] * np.eye(dim)
+    weights = (masses / distances**5)[..., np.newaxis, np.newaxis]
+    return np.sum(weights * (outer - isotropic), axis=1)
+
+
+def tidal_acceleration(points, reference, centers, masses=1.0) -> np.ndarray:
+    """
+    基準点に対する各点の相対加速度（潮汐力、線形化しない厳密な差）
+    Acceleration of each point relative to the reference (exact tidal force)
+
+    Returns:
+        g(points) - g(reference) の配列 (N, d)
+    """
+    reference_field = gravity(np.atleast_2d(reference), centers, masses)[0]
+    return gravity(points, centers, masses) - reference_field
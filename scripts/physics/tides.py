@@ -0,0 +1,67 @@
+"""
+平衡潮汐（月と太陽）
+Equilibrium tide from the Moon and the Sun
+
+海面が潮汐ポテンシャルの等ポテンシャル面に沿うとしたときの海面の高さ。
+天体の方向から角 ψ 離れた点では、2次のルジャンドル多項式で
+
+    h(ψ) = A P2(cos ψ),   P2(x) = (3x² - 1) / 2
+
+振幅 A は M / d³ に比例し、太陽は月の約 0.46 倍。P2(cos ψ) は
+1/4 + 3/4 cos 2ψ と書けるので、海面全体は cos 2θ, sin 2θ の2つの形と定数の
+重ね合わせになる。天体の位置が変わっても3つの重みを計算し直すだけでよく、
+形そのものは一度作れば使い回せる（大潮・小潮の形もこの重ね合わせ）。
+
+Height of the sea surface when it follows an equipotential of the tidal
+potential. At an angle ψ from the body the degree-2 term gives
+h = A P2(cos ψ), with A proportional to M / d³ (the Sun's is about 0.46 of the
+Moon's). Since P2(cos ψ) = 1/4 + 3/4 cos 2ψ, every surface is a constant plus
+a mix of the cos 2θ and sin 2θ shapes. Moving the bodies only changes three
+weights; the shapes are built once (spring and neap tides are just mixes).
+"""
+
+import numpy as np
+
+# 太陽と月の潮汐の振幅の比 (M_sun / M_moon) (d_moon / d_sun)^3
+# Ratio of the solar to the lunar tidal amplitude
+SOLAR_TO_LUNAR = 0.46
+
+
+def tide_weights(moon_angle, sun_angle=None, lunar_amplitude: float = 1.0, solar_ratio: float = SOLAR_TO_LUNAR):
+    """
+    海面の高さ h = w0 + wc cos 2θ + ws sin 2θ の重み
+    Weights of h = w0 + wc cos 2θ + ws sin 2θ
+
+    Args:
+        moon_angle: 月の方向（ラジアン、配列でもよい）
+        sun_angle: 太陽の方向（省略時は月だけ）
+        lunar_amplitude: 月の潮汐の振幅 A
+        solar_ratio: 太陽の振幅 / 月の振幅
+
+    Returns:
+        (w0, wc, ws)
+    """
+    bodies = [(lunar_amplitude, np.asarray(moon_angle, dtype=float))]
+    if sun_angle is not None:
+        bodies.append((lunar_amplitude * solar_ratio, np.asarray(sun_angle, dtype=float)))
+    w0 = sum(amplitude / 4 for amplitude, _ in bodies)
+    wc = sum(0.75 * amplitude * np.cos(2 * angle) for amplitude, angle in bodies)
+    ws = sum(0.75 * amplitude * np.sin(2 * angle) for amplitude, angle in bodies)
+    return w0, wc, ws
+
+
+def tide_height(theta, moon_angle, sun_angle=None, lunar_amplitude: float = 1.0, solar_ratio: float = SOLAR_TO_LUNAR):
+    """
+    方位角 theta での平衡潮汐の高さ
+    Equilibrium tide height at azimuths theta
+
+    Args:
+        theta: 海面上の点の方位角 (N,)
+        その他は tide_weights と同じ / the rest as in tide_weights
+
+    Returns:
+        高さ (N,)
+    """
+    theta = np.asarray(theta, dtype=float)
+    w0, wc, ws = tide_weights(moon_angle, sun_angle, lunar_amplitude, solar_ratio)
+    return w0 + wc * np.cos(2 * theta) + ws * np.sin(2 * theta)
@@ -0,0 +1,17 @@
+"""
+シーン一括レンダリング用ツール群
+Batch rendering tools for the scenes under scripts/
+
+scripts/*.py に定義された Scene / ThreeDScene のサブクラスを探し出し、
+manim をプロセス内から呼び出してまとめてレンダリングする。
+
+Discovers every Scene / ThreeDScene subclass defined in scripts/*.py and
+renders them by driving manim in-process.
+
+使用方法 / Usage:
+  cd scripts && python -m render batch -q l
+"""
+
+from .registry import SCRIPTS_DIR, SceneEntry, discover_scenes
+
+__all__ = ["SCRIPTS_DIR", "SceneEntry", "discover_scenes"]
@@ -0,0 +1,169 @@
+"""
+レンダリングツールのコマンドライン
+Command line for the rendering tools
+
+使用方法 / Usage:
+  cd scripts
+  python -m render list
+  python -m render batch -q l
+  python -m render batch -q h -j 4 ocean_tides TidalStretchBall
+  python -m render batch --force
+  python -m render batch --shared-prefix converging_balls diverging_balls
+  python -m render sections TidalForceTransition -q h -j 8
+  python -m render watch --final-quality k
+  python -m render farm serve -q k --sections 4 --host 0.0.0.0
+  python -m render farm work coordinator-host:8765
+  python -m render farm serve --local 3 --port 0 converging_balls
+  python -m render farm check
+  python -m render bench --headline
+  python -m render bench --save
+  python -m render profile OceanTidesRotating -q m
+  python -m render stills
+  python -m render stills GravityWellMetric ParallelTransportFlatWithTrace-2.png
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from .batch import DEFAULT_MANIFEST, run_batch
+from .bench import DEFAULT_BASELINE, run_bench
+from .farm import DEFAULT_PORT, check_farm, run_farm, work
+from .profiling import DEFAULT_PROFILE_DIR, run_profile
+from .registry import discover_scenes
+from .sections import render_sections
+from .stills import DEFAULT_SPEC, export_stills
+from .watch import WatchDaemon
+from .worker import QUALITY_FLAGS
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m render", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="シーン一覧 / List scenes")
+    list_parser.add_argument("names", nargs="*", help="モジュール名・クラス名で絞り込み / Filter by module or class")
+
+    batch = commands.add_parser("batch", help="並列一括レンダリング / Parallel batch render")
+    batch.add_argument("names", nargs="*", help="モジュール名・クラス名で絞り込み / Filter by module or class")
+    batch.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="l")
+    batch.add_argument("-j", "--workers", type=int, default=None,
+                       help="ワーカー数（既定: CPU コア数） / Worker count (default: CPU cores)")
+    batch.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST)
+    batch.add_argument("--force", action="store_true",
+                       help="キャッシュを無視して描き直す / Ignore the cache and re-render")
+    batch.add_argument("--shared-prefix", action="store_true",
+                       help="派生シーンの共通の冒頭を一度だけ描く / Draw openings shared by variants once")
+
+    sections = commands.add_parser("sections", help="長いシーンのセクション並列レンダリング / Section-parallel render")
+    sections.add_argument("names", nargs="+", help="シーン名 / Scene names")
+    sections.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="l")
+    sections.add_argument("-j", "--workers", type=int, default=None)
+    sections.add_argument("--all-boundaries", action="store_true",
+                          help="見出しに関係なく全ての play の間で分割可能にする / Allow a split between any two plays")
+
+    watch = commands.add_parser("watch", help="保存のたびにプレビューと本番を描く / Preview and final render on save")
+    watch.add_argument("names", nargs="*", help="監視するシーンの絞り込み / Filter scenes to watch")
+    watch.add_argument("--final-quality", choices=("h", "p", "k"), default="h")
+    watch.add_argument("--interval", type=float, default=0.5, help="監視間隔（秒） / Poll interval (s)")
+    watch.add_argument("--preview-workers", type=int, default=1)
+    watch.add_argument("--final-workers", type=int, default=1)
+
+    farm = commands.add_parser("farm", help="ソケット経由のレンダーファーム / Render farm over sockets")
+    farm_commands = farm.add_subparsers(dest="farm_command", required=True)
+    serve = farm_commands.add_parser("serve", help="コーディネーター / Coordinator")
+    serve.add_argument("names", nargs="*", help="モジュール名・クラス名で絞り込み / Filter by module or class")
+    serve.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="l")
+    serve.add_argument("--sections", type=int, default=1, help="1シーンあたりのセクション数 / Sections per scene")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve.add_argument("--local", type=int, default=0, help="localhost に立てるワーカー数 / Local worker processes")
+    serve.add_argument("--max-attempts", type=int, default=3)
+    worker = farm_commands.add_parser("work", help="ワーカー / Worker")
+    worker.add_argument("address", help="HOST:PORT")
+    worker.add_argument("--name", default=None)
+    check = farm_commands.add_parser("check", help="localhost でプロトコルを確かめる / Check the protocol on localhost")
+    check.add_argument("--workers", type=int, default=2)
+
+    bench = commands.add_parser("bench", help="レンダリングのベンチマーク / Render benchmark")
+    bench.add_argument("names", nargs="*", help="モジュール名・クラス名で絞り込み / Filter by module or class")
+    bench.add_argument("--headline", action="store_true", help="代表ケースだけ / Headline cases only")
+    bench.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    bench.add_argument("--save", action="store_true", help="結果をベースラインに保存 / Save as the baseline")
+    bench.add_argument("--threshold", type=float, default=0.10, help="悪化の閾値 / Regression threshold")
+    bench.add_argument("--repeat", type=int, default=1)
+
+    profile = commands.add_parser("profile", help="フレーム単位のプロファイル / Per-frame profiling trace")
+    profile.add_argument("names", nargs="+", help="モジュール名・クラス名 / Module or class names")
+    profile.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="l")
+    profile.add_argument("--output", type=Path, default=DEFAULT_PROFILE_DIR, help="トレースの出力先 / Trace directory")
+    profile.add_argument("--top", type=int, default=15, help="集計の表示行数 / Summary rows to print")
+
+    stills = commands.add_parser("stills", help="スライド用の静止画を書き出す / Export slide stills")
+    stills.add_argument("names", nargs="*", help="シーン名・画像ファイル名で絞り込み / Filter by scene or image name")
+    stills.add_argument("--spec", type=Path, default=DEFAULT_SPEC)
+    stills.add_argument("-j", "--workers", type=int, default=None)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.command == "list":
+        for entry in discover_scenes(names=args.names):
+            print(f"{entry.key:55s} {entry.base:12s} plays={entry.num_plays:3d} ~{entry.estimated_seconds:5.1f}s")
+        return 0
+
+    if args.command == "batch":
+        results = run_batch(args.names, args.quality, args.workers, args.manifest,
+                            use_cache=not args.force, shared_prefix=args.shared_prefix)
+        return 0 if all(r.ok for r in results) else 1
+
+    if args.command == "sections":
+        ok = True
+        for entry in discover_scenes(names=args.names):
+            result = render_sections(entry, args.quality, args.workers, args.all_boundaries)
+            print(f"{result.key}: {'ok' if result.ok else 'FAILED'} ({result.wall_time:.1f}s) {result.output or ''}")
+            if not result.ok:
+                print(result.error)
+            ok = ok and result.ok
+        return 0 if ok else 1
+
+    if args.command == "watch":
+        WatchDaemon(args.names, args.final_quality, args.interval,
+                    args.preview_workers, args.final_workers).run()
+        return 0
+
+    if args.command == "farm" and args.farm_command == "serve":
+        ok = run_farm(args.names, args.quality, args.sections, args.host, args.port,
+                      args.local, args.max_attempts)
+        return 0 if ok else 1
+
+    if args.command == "farm" and args.farm_command == "work":
+        host, _, port = args.address.rpartition(":")
+        work(host, int(port), args.name)
+        return 0
+
+    if args.command == "farm" and args.farm_command == "check":
+        return 0 if check_farm(args.workers) else 1
+
+    if args.command == "bench":
+        regressions = run_bench(args.names, args.headline, args.baseline, args.save,
+                                args.threshold, args.repeat)
+        return 1 if regressions else 0
+
+    if args.command == "profile":
+        run_profile(args.names, args.quality, args.output, args.top)
+        return 0
+
+    if args.command == "stills":
+        written = export_stills(args.names, args.spec, args.workers)
+        print(f"Wrote {len(written)} stills")
+        return 0
+
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
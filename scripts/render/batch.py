@@ -0,0 +1,162 @@
+"""
+全シーンの並列一括レンダリング
+Parallel batch rendering of every scene
+
+マシンのコア数に合わせたプロセスプールで全シーンをレンダリングし、
+出力パスと所要時間をマニフェスト（JSON）に書き出す。
+長いシーンから先に投入するので、最後に重いシーンが1つだけ残ることが少ない。
+
+Renders every scene in a process pool sized to the machine and writes the
+output paths and wall times to a JSON manifest. The longest scenes are
+submitted first, so a single heavy scene rarely ends up running alone.
+"""
+
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict
+from pathlib import Path
+
+from .cache import SceneCache, scene_key
+from .registry import MEDIA_DIR, SceneEntry, discover_scenes
+from .variants import render_shared
+from .worker import RenderJob, RenderResult, relative_to_repo, render_job
+
+DEFAULT_MANIFEST = MEDIA_DIR / "render_manifest.json"
+
+
+def load_manifest(path: Path) -> dict:
+    """既存のマニフェストを読む（無ければ空） / Read an existing manifest (empty if missing)"""
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def previous_wall_times(manifest: dict, quality: str) -> dict[str, float]:
+    """前回成功したシーンの所要時間 / Wall times of scenes that succeeded last time"""
+    return {
+        s["key"]: s["wall_time"]
+        for s in manifest.get("scenes", [])
+        if s.get("ok") and not s.get("cached") and s.get("quality") == quality
+    }
+
+
+def schedule(entries: list[SceneEntry], wall_times: dict[str, float]) -> list[SceneEntry]:
+    """
+    長いシーンから順に並べる
+    Order scenes longest first
+
+    前回の所要時間があればそれを使い、無いシーンは動画の長さの見積もりに
+    「実時間 / 見積もり」の中央値を掛けて換算する。
+    Uses the previous wall time where known; otherwise the estimated video
+    length is converted with the median wall-time/estimate ratio.
+    """
+    ratios = [
+        wall_times[e.key] / e.estimated_seconds
+        for e in entries
+        if e.key in wall_times and e.estimated_seconds > 0
+    ]
+    ratio = statistics.median(ratios) if ratios else 1.0
+
+    def cost(entry: SceneEntry) -> float:
+        return wall_times.get(entry.key, entry.estimated_seconds * ratio)
+
+    return sorted(entries, key=cost, reverse=True)
+
+
+def make_job(entry: SceneEntry, quality: str, config: dict | None = None) -> RenderJob:
+    return RenderJob(
+        module_path=relative_to_repo(entry.module_path),
+        class_name=entry.class_name,
+        quality=quality,
+        config=dict(config or {}),
+    )
+
+
+def write_manifest(path: Path, quality: str, workers: int, wall_time: float, results) -> None:
+    """マニフェストを書き出す / Write the manifest"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "quality": quality,
+        "workers": workers,
+        "wall_time": wall_time,
+        # 部分動画の一覧は長いので残さない / The partial movie lists are long and not kept
+        "scenes": [
+            {k: v for k, v in asdict(r).items() if k != "segments"} for r in sorted(results, key=lambda r: r.key)
+        ],
+    }
+    path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def run_batch(
+    names=None,
+    quality: str = "l",
+    workers: int | None = None,
+    manifest_path: Path = DEFAULT_MANIFEST,
+    config: dict | None = None,
+    use_cache: bool = True,
+    shared_prefix: bool = False,
+) -> list[RenderResult]:
+    """
+    シーンをまとめてレンダリングする
+    Render scenes in batch
+
+    Args:
+        names: 絞り込み用の名前（省略時は全シーン）
+        quality: 品質フラグ（"l", "m", "h", "p", "k"）
+        workers: ワーカー数（省略時は CPU コア数）
+        manifest_path: マニフェストの出力先
+        config: 全ジョブに適用する manim の追加設定
+        use_cache: False ならキャッシュを無視して全て描き直す
+        shared_prefix: True なら派生シーン間で共通の冒頭を一度だけ描く
+
+    Returns:
+        RenderResult のリスト
+    """
+    entries = discover_scenes(names=names)
+    workers = workers or os.cpu_count() or 1
+    ordered = schedule(entries, previous_wall_times(load_manifest(manifest_path), quality))
+    print(f"Rendering {len(ordered)} scenes with {workers} workers (-q{quality})")
+
+    start = time.perf_counter()
+    results = []
+    cache = SceneCache()
+    keys = {}
+    pending = []
+    for entry in ordered:
+        job = make_job(entry, quality, config)
+        keys[job.key] = scene_key(entry, quality, config)
+        output = cache.lookup(keys[job.key]) if use_cache else None
+        if output is None:
+            pending.append(job)
+        else:
+            results.append(RenderResult(job.key, quality, output, 0.0, ok=True, cached=True))
+    if results:
+        print(f"  {len(results)} scenes unchanged, reusing cached movies")
+
+    def finished(result: RenderResult) -> None:
+        results.append(result)
+        status = "ok" if result.ok else "FAILED"
+        print(f"  [{len(results)}/{len(ordered)}] {result.key}: {status} ({result.wall_time:.1f}s)")
+        if result.ok:
+            cache.store(keys[result.key], result.output)
+        else:
+            print(result.error)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        if shared_prefix and pending:
+            for result in render_shared(pending, pool):
+                finished(result)
+        else:
+            futures = [pool.submit(render_job, job) for job in pending]
+            for future in as_completed(futures):
+                finished(future.result())
+    wall_time = time.perf_counter() - start
+
+    write_manifest(manifest_path, quality, workers, wall_time, results)
+    print(f"Done in {wall_time:.1f}s, manifest: {relative_to_repo(manifest_path)}")
+    return results
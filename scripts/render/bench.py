@@ -0,0 +1,187 @@
+"""
+レンダリングのベンチマーク
+Render benchmark suite
+
+全シーンを固定の低品質設定（-ql、キャッシュ無効）でレンダリングし、
+シーンごとに次を記録する:
+  - 実時間 / 書き出したフレーム数 / フレームレート（frames / 実時間）
+  - ピーク RSS（シーンごとに新しいプロセスで測る）
+  - 画面上のモブジェクト数と点の数（play ごとに数えた最大値）
+
+結果は JSON のベースラインに保存し、後の実行と比べて閾値を超えた
+悪化（実時間・ピーク RSS）を報告する。特に遅い OceanTidesRotating、
+ParallelTransportSphere、GravityWellMetricComparison を代表ケースとして
+先頭に並べる。
+
+Renders every scene at a fixed low-quality preset (-ql, caching disabled) and
+records per scene: wall time, frames written, frames per second, peak RSS
+(each scene in a fresh process) and the largest on-screen mobject and point
+counts seen at any play. Results are saved to a JSON baseline; later runs are
+compared against it and wall-time or peak-RSS regressions beyond a threshold
+are flagged. The slowest scenes are listed first as headline cases.
+"""
+
+import json
+import multiprocessing
+import resource
+import time
+from pathlib import Path
+
+from .registry import MEDIA_DIR, discover_scenes
+from .worker import RenderJob, relative_to_repo, scene_for
+
+DEFAULT_BASELINE = MEDIA_DIR / "benchmarks" / "baseline.json"
+
+# 特に遅い代表ケース / Headline cases (the slowest scenes)
+HEADLINE_SCENES = (
+    "ocean_tides.OceanTidesRotating",
+    "parallel_transport_sphere.ParallelTransportSphere",
+    "flat_vs_curved_grid.GravityWellMetricComparison",
+)
+
+# ベンチマークの固定設定 / Fixed benchmark settings
+BENCH_QUALITY = "l"
+BENCH_CONFIG = {"disable_caching": True}
+
+# 悪化として扱う指標 / Metrics checked for regressions
+REGRESSION_METRICS = ("wall_time", "peak_rss_mb")
+
+
+class BenchProbe:
+    """
+    書き出したフレーム数とモブジェクト数を数える Scene 用ミックスイン
+    Scene mixin counting written frames and on-screen mobjects
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bench = {"frames": 0, "mobjects": 0, "points": 0}
+        renderer = self.renderer
+        add_frame = renderer.add_frame
+
+        def counting_add_frame(frame, num_frames=1):
+            if not renderer.skip_animations:
+                self.bench["frames"] += num_frames
+            return add_frame(frame, num_frames)
+
+        renderer.add_frame = counting_add_frame
+
+    def play(self, *args, **kwargs):
+        super().play(*args, **kwargs)
+        family = [m for top in self.mobjects for m in top.get_family()]
+        points = sum(len(getattr(m, "points", ())) for m in family)
+        self.bench["mobjects"] = max(self.bench["mobjects"], len(family))
+        self.bench["points"] = max(self.bench["points"], points)
+
+
+def bench_scene(job: RenderJob) -> dict:
+    """
+    1シーンを計測する（新しいプロセスで実行すること）
+    Measure one scene (run it in a fresh process)
+
+    計測するのは scene.render() だけで、manim とシーンのモジュールの import は含めない。
+    Only scene.render() is timed; importing manim and the scene module is not.
+    """
+    with scene_for(job, (BenchProbe,)) as scene:
+        start = time.perf_counter()
+        scene.render()
+        wall_time = time.perf_counter() - start
+        counts = scene.bench
+    # Linux の ru_maxrss は KiB / ru_maxrss is in KiB on Linux
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return {
+        "scene": job.key,
+        "wall_time": wall_time,
+        "frames": counts["frames"],
+        "fps": counts["frames"] / wall_time if wall_time > 0 else 0.0,
+        "peak_rss_mb": peak_rss_mb,
+        "mobjects": counts["mobjects"],
+        "points": counts["points"],
+    }
+
+
+def _best_of(job: RenderJob, repeat: int, pool) -> dict:
+    """repeat 回計測して実時間が最短の結果を返す / Measure repeat times and keep the fastest"""
+    runs = [pool.apply(bench_scene, (job,)) for _ in range(repeat)]
+    return min(runs, key=lambda r: r["wall_time"])
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> list[str]:
+    """
+    ベースラインと比べて悪化を列挙する
+    List regressions against the baseline
+
+    Returns:
+        "scene: 指標 前回 -> 今回 (+xx%)" 形式の文字列のリスト
+    """
+    previous = {r["scene"]: r for r in baseline.get("scenes", [])}
+    regressions = []
+    for result in results:
+        before = previous.get(result["scene"])
+        if before is None:
+            continue
+        for metric in REGRESSION_METRICS:
+            old, new = before[metric], result[metric]
+            if old > 0 and (new - old) / old > threshold:
+                regressions.append(
+                    f"{result['scene']}: {metric} {old:.2f} -> {new:.2f} (+{(new - old) / old:.0%})"
+                )
+    return regressions
+
+
+def run_bench(
+    names=None,
+    headline: bool = False,
+    baseline_path: Path = DEFAULT_BASELINE,
+    save: bool = False,
+    threshold: float = 0.10,
+    repeat: int = 1,
+) -> list[str]:
+    """
+    ベンチマークを実行し、ベースラインと比べる
+    Run the benchmark and compare with the baseline
+
+    Args:
+        names: 絞り込み用の名前
+        headline: True なら代表ケースだけを計測する
+        baseline_path: ベースラインの JSON
+        save: True なら今回の結果をベースラインとして保存する
+        threshold: 悪化とみなす増加率（0.10 = 10%）
+        repeat: 1シーンあたりの計測回数（実時間は最短を採る）
+
+    Returns:
+        悪化の一覧（無ければ空）
+    """
+    entries = discover_scenes(names=list(HEADLINE_SCENES) if headline else names)
+    order = {key: i for i, key in enumerate(HEADLINE_SCENES)}
+    entries.sort(key=lambda e: order.get(e.key, len(order)))
+
+    results = []
+    # 1シーンごとに新しいプロセス（ピーク RSS を混ぜない）、計測は直列（時間を干渉させない）
+    # A fresh process per scene (no shared peak RSS), measured serially (no timing interference)
+    with multiprocessing.Pool(processes=1, maxtasksperchild=1) as pool:
+        for entry in entries:
+            job = RenderJob(relative_to_repo(entry.module_path), entry.class_name, BENCH_QUALITY, BENCH_CONFIG)
+            result = _best_of(job, repeat, pool)
+            results.append(result)
+            print(
+                f"{result['scene']:55s} {result['wall_time']:7.2f}s {result['frames']:6d}f "
+                f"{result['fps']:6.1f}fps {result['peak_rss_mb']:7.1f}MB "
+                f"{result['mobjects']:5d}mob {result['points']:8d}pts"
+            )
+
+    baseline_path = Path(baseline_path)
+    regressions = []
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if not regressions:
+            print(f"No regressions beyond {threshold:.0%} against {relative_to_repo(baseline_path)}")
+    if save:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"quality": BENCH_QUALITY, "config": BENCH_CONFIG, "scenes": results}
+        baseline_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        print(f"Saved baseline: {relative_to_repo(baseline_path)}")
+    return regressions
@@ -0,0 +1,251 @@
+"""
+内容アドレス方式のシーン単位レンダーキャッシュ
+Content-addressed per-scene render cache
+
+シーンのキーは次のハッシュで決まる:
+  - シーンクラスのソース（同じファイル内の基底クラスも含む）
+  - クラスから呼ばれるモジュールレベルのヘルパー（再帰的に）
+  - import している scripts/ 内のローカルモジュール
+  - 参照している素材ファイル（scripts/assets/ の画像など）
+  - manim のバージョン・manim.cfg・品質プリセット・追加設定
+
+キーが変わらなければ、前回の動画ファイルをそのまま再利用する。
+
+A scene's key hashes the class source (including local base classes), the
+module-level helpers it calls (recursively), local modules it imports from
+scripts/, referenced asset files, and the manim version, manim.cfg, quality
+preset and config overrides. Unchanged keys reuse the previous movie file.
+"""
+
+import ast
+import hashlib
+import json
+import shutil
+from importlib import metadata
+from pathlib import Path
+
+from .registry import MEDIA_DIR, REPO_ROOT, SCRIPTS_DIR, SceneEntry
+
+CACHE_DIR = MEDIA_DIR / "render_cache"
+ASSETS_DIR = SCRIPTS_DIR / "assets"
+
+# キーの計算方法を変えたら上げる
+# Bump when the way keys are computed changes
+CACHE_VERSION = 1
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _manim_version() -> str:
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _local_module_files(module: str) -> list[Path]:
+    """
+    scripts/ 内のローカルモジュールに対応するファイル
+    Files backing a local module under scripts/
+
+    パッケージの場合は中の .py を全て返す（保守的に）。
+    For a package every .py inside it is returned (conservatively).
+    """
+    top = module.split(".")[0]
+    package = SCRIPTS_DIR / top
+    if package.is_dir() and (package / "__init__.py").exists():
+        return sorted(package.rglob("*.py"))
+    single = SCRIPTS_DIR / f"{top}.py"
+    return [single] if single.exists() else []
+
+
+class ModuleIndex:
+    """
+    1ファイル分のトップレベル定義とローカル import の索引
+    Index of the top-level definitions and local imports of one file
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.source = path.read_text(encoding="utf-8")
+        self.tree = ast.parse(self.source, filename=str(path))
+        self.definitions: dict[str, ast.AST] = {}
+        self.imports: dict[str, list[Path]] = {}
+        for node in self.tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                self.definitions[node.name] = node
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                for target in targets:
+                    for name in ast.walk(target):
+                        if isinstance(name, ast.Name):
+                            self.definitions[name.id] = node
+            elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+                files = _local_module_files(node.module)
+                for alias in node.names:
+                    if files:
+                        self.imports[alias.asname or alias.name] = files
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    files = _local_module_files(alias.name)
+                    if files:
+                        self.imports[(alias.asname or alias.name).split(".")[0]] = files
+
+    def segment(self, node: ast.AST) -> str:
+        return ast.get_source_segment(self.source, node) or ast.dump(node)
+
+
+def _names_used(node: ast.AST) -> set[str]:
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+
+def _string_literals(node: ast.AST) -> set[str]:
+    return {
+        n.value for n in ast.walk(node) if isinstance(n, ast.Constant) and isinstance(n.value, str)
+    }
+
+
+def _referenced_assets(literals: set[str]) -> list[Path]:
+    """
+    文字列リテラルに名前が現れる素材ファイル
+    Asset files whose name appears in a string literal
+    """
+    if not ASSETS_DIR.is_dir():
+        return []
+    assets = []
+    for path in sorted(p for p in ASSETS_DIR.rglob("*") if p.is_file()):
+        relative = path.relative_to(SCRIPTS_DIR).as_posix()
+        if path.name in literals or relative in literals:
+            assets.append(path)
+    return assets
+
+
+def _local_file_closure(files: list[Path]) -> list[Path]:
+    """ローカルモジュールが更に import するローカルモジュールも含める / Follow local imports transitively"""
+    seen: dict[Path, None] = {}
+    pending = list(files)
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen[path] = None
+        for more in ModuleIndex(path).imports.values():
+            pending.extend(more)
+    return sorted(seen)
+
+
+def scene_dependencies(entry: SceneEntry) -> tuple[list[str], list[Path]]:
+    """
+    シーンが依存するソース片とファイルを集める
+    Collect the source fragments and files a scene depends on
+
+    Returns:
+        (ソース片のリスト, 依存ファイルのリスト)
+        - ソース片: クラス本体とそこから辿れるトップレベル定義
+        - 依存ファイル: ローカルモジュールと素材ファイル
+    """
+    index = ModuleIndex(entry.module_path)
+    fragments: dict[str, str] = {}
+    files: list[Path] = []
+    literals: set[str] = set()
+    pending = [entry.class_name]
+    while pending:
+        name = pending.pop()
+        if name in fragments:
+            continue
+        if name in index.imports:
+            fragments[name] = ""
+            files.extend(index.imports[name])
+            continue
+        node = index.definitions.get(name)
+        if node is None:
+            continue
+        fragments[name] = index.segment(node)
+        literals |= _string_literals(node)
+        pending.extend(_names_used(node) - fragments.keys())
+    ordered = [f"{name}\n{fragments[name]}" for name in sorted(fragments)]
+    return ordered, _local_file_closure(files) + _referenced_assets(literals)
+
+
+def _config_files() -> list[Path]:
+    return [p for p in (REPO_ROOT / "manim.cfg", SCRIPTS_DIR / "manim.cfg") if p.exists()]
+
+
+def scene_key(entry: SceneEntry, quality: str, config: dict | None = None) -> str:
+    """
+    シーンのキャッシュキー
+    Cache key of a scene
+
+    Args:
+        entry: 対象のシーン
+        quality: 品質フラグ
+        config: 追加の manim 設定
+
+    Returns:
+        SHA-256 の16進文字列
+    """
+    fragments, files = scene_dependencies(entry)
+    digest = hashlib.sha256()
+    header = {
+        "version": CACHE_VERSION,
+        "scene": entry.key,
+        "manim": _manim_version(),
+        "quality": quality,
+        "config": config or {},
+    }
+    digest.update(json.dumps(header, sort_keys=True, default=str).encode())
+    for fragment in fragments:
+        digest.update(fragment.encode())
+    for path in sorted(set(files) | set(_config_files())):
+        digest.update(str(path.relative_to(REPO_ROOT)).encode())
+        digest.update(_sha256(path.read_bytes()).encode())
+    return digest.hexdigest()
+
+
+class SceneCache:
+    """
+    キーから動画ファイルを引くキャッシュ
+    Cache mapping keys to movie files
+
+    動画は objects/<key><拡張子> にコピーして保持する。manim は出力先を
+    上書きで開くので、ハードリンクではなくコピーにしている。
+    Movies are kept as copies in objects/<key><suffix>. manim reopens its
+    output path for writing, so hard links would be clobbered.
+    """
+
+    def __init__(self, root: Path = CACHE_DIR):
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.index_path = self.root / "index.json"
+        try:
+            self.index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.index = {}
+
+    def lookup(self, key: str) -> str | None:
+        """
+        キーに対応する出力を復元して返す（無ければ None）
+        Restore and return the output for a key (None on a miss)
+        """
+        record = self.index.get(key)
+        if record is None:
+            return None
+        obj = self.objects / record["object"]
+        if not obj.exists():
+            return None
+        output = REPO_ROOT / record["output"]
+        if not output.exists() or output.stat().st_size != obj.stat().st_size:
+            output.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(obj, output)
+        return record["output"]
+
+    def store(self, key: str, output: str) -> None:
+        """レンダリング結果を登録する / Register a rendered output"""
+        source = REPO_ROOT / output
+        self.objects.mkdir(parents=True, exist_ok=True)
+        name = key + source.suffix
+        shutil.copy2(source, self.objects / name)
+        self.index[key] = {"output": output, "object": name}
+        self.index_path.write_text(json.dumps(self.index, indent=2), encoding="utf-8")
@@ -0,0 +1,539 @@
+"""
+複数ワーカーのレンダーファーム（ソケット通信）
+Multi-worker render farm over plain sockets
+
+コーディネーターが scripts/ のシーンレジストリから
+(シーンクラス, セクション, 品質) のジョブを作ってワーカーに配り、
+ワーカーは描き終えた部分動画（play ごとの動画）をストリームで送り返す。
+全ジョブが揃ったシーンは、コーディネーター側で部分動画を連結して仕上げる。
+
+  - 再試行: ワーカーの接続が切れる・応答が途絶えると、貸し出し中の
+    ジョブを待ち行列に戻す（既定で最大3回）。ワーカーは描画中も
+    HEARTBEAT_INTERVAL 秒ごとに生存を知らせるので、止まったワーカーは
+    HEARTBEAT_TIMEOUT 秒で気づかれる。生きていても job_timeout 秒を
+    超えたジョブは取り上げる。
+  - 重複排除: 完了済みジョブの結果は無視し、部分動画は内容で決まる
+    ファイル名（play の累積キー）が既にあれば書き込まない。
+  - 外部のキューサービスは不要。--local N で localhost に N 個の
+    ワーカープロセスを立ててそのまま試せる。`farm check` は manim なしで
+    コーディネーターと2つのワーカーを動かし、再試行と重複排除を確かめる。
+
+The coordinator builds (scene class, section, quality) jobs from the scripts/
+scene registry and hands them out; workers stream the finished partial
+(per-play) movies back. Once every job of a scene is in, the coordinator
+concatenates its partial movies into the final clip.
+
+  - Retry: when a worker disconnects or goes silent, its leased job is put
+    back in the queue (up to 3 attempts by default). Workers send a heartbeat
+    every HEARTBEAT_INTERVAL seconds while rendering, so a dead worker is
+    noticed after HEARTBEAT_TIMEOUT seconds; a job still running past
+    job_timeout is taken back even if the worker is alive.
+  - Dedup: results for finished jobs are ignored, and a partial movie is not
+    written when its content-derived name (the chained play key) exists.
+  - No external queue service: --local N starts N worker processes on
+    localhost for testing, and `farm check` runs a coordinator and two
+    workers without manim to exercise retry and dedup.
+
+メッセージ形式 / Wire format:
+  4バイト（ビッグエンディアン）の長さ + JSON ヘッダ。ヘッダに "size" が
+  あれば、その後に続く生のバイト列がファイルの中身。
+  A 4-byte big-endian length and a JSON header; when the header has "size",
+  that many raw bytes of file content follow.
+"""
+
+import json
+import multiprocessing
+import os
+import socket
+import struct
+import tempfile
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import partial
+from pathlib import Path
+
+from .cache import scene_key
+from .registry import discover_scenes
+from .sections import boundaries_from_markers, marker_lines, plan_sections, probe_scene, section_job
+from .worker import RenderJob, partial_movie_dir, relative_to_repo, render_job, scene_for
+
+DEFAULT_PORT = 8765
+# ワーカーが生存を知らせる間隔と、途絶えたとみなすまでの時間（秒）
+# Worker heartbeat interval and the silence after which it counts as lost (s)
+HEARTBEAT_INTERVAL = 5.0
+HEARTBEAT_TIMEOUT = 30.0
+# 1ジョブの貸し出しの上限（秒、4K のセクションでも収まる長さ）
+# Upper bound on one job lease (s; long enough for a 4K section)
+JOB_TIMEOUT = 3600.0
+CHUNK_SIZE = 1 << 20
+_HEADER = struct.Struct(">I")
+
+
+def send_message(sock: socket.socket, header: dict, path: Path | None = None) -> None:
+    """
+    メッセージを送る（path があればファイルの中身も続けて送る）
+    Send a message (followed by the file content when path is given)
+    """
+    if path is not None:
+        header = {**header, "size": path.stat().st_size}
+    data = json.dumps(header).encode()
+    sock.sendall(_HEADER.pack(len(data)) + data)
+    if path is not None:
+        with open(path, "rb") as f:
+            while chunk := f.read(CHUNK_SIZE):
+                sock.sendall(chunk)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = sock.recv(min(size - len(buffer), CHUNK_SIZE))
+        if not chunk:
+            raise ConnectionError("connection closed")
+        buffer += chunk
+    return bytes(buffer)
+
+
+def recv_message(sock: socket.socket) -> dict:
+    """ヘッダを1つ受け取る / Receive one header"""
+    (length,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    return json.loads(_recv_exact(sock, length))
+
+
+def recv_file(sock: socket.socket, size: int, target: Path | None) -> None:
+    """
+    ファイルの中身を受け取る（target が None なら読み捨てる）
+    Receive file content (discarded when target is None)
+
+    一時ファイルに書いてから名前を変えるので、途中で切れても壊れたファイルは残らない。
+    Written to a temporary file and renamed, so a dropped connection leaves no partial file.
+    """
+    temporary = None
+    if target is not None:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temporary = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.part")
+    remaining = size
+    with open(temporary, "wb") if temporary else open(os.devnull, "wb") as f:
+        while remaining:
+            chunk = sock.recv(min(remaining, CHUNK_SIZE))
+            if not chunk:
+                raise ConnectionError("connection closed")
+            f.write(chunk)
+            remaining -= len(chunk)
+    if temporary is not None:
+        os.replace(temporary, target)
+
+
+@dataclass
+class FarmJob:
+    """
+    ファームのジョブ1件
+    One farm job
+    """
+
+    job_id: str
+    module_path: str
+    class_name: str
+    quality: str
+    scene_key: str
+    first_play: int = 0
+    end_play: int | None = None
+    play_count: int | None = None
+    number: int = 0
+
+    @property
+    def scene_job(self) -> RenderJob:
+        """シーン全体のジョブ（仕上げ用） / Whole-scene job (used for assembly)"""
+        return RenderJob(self.module_path, self.class_name, self.quality)
+
+    def render_job(self) -> RenderJob:
+        """ワーカーが描くジョブ / Job the worker renders"""
+        if self.end_play is None:
+            return RenderJob(self.module_path, self.class_name, self.quality,
+                             {"output_file": f"{self.class_name}_farm"})
+        return section_job(self.scene_job, self.number, self.first_play, self.end_play, self.play_count)
+
+
+def build_jobs(names=None, quality: str = "l", sections: int = 1) -> list[FarmJob]:
+    """
+    レジストリからジョブを作る（sections > 1 なら下見をしてセクションに分ける）
+    Build jobs from the registry (probing and splitting when sections > 1)
+    """
+    entries = discover_scenes(names=names)
+    jobs = []
+    plans = {}
+    if sections > 1:
+        base_jobs = [RenderJob(relative_to_repo(e.module_path), e.class_name, quality) for e in entries]
+        with ProcessPoolExecutor() as pool:
+            for entry, records in zip(entries, pool.map(probe_scene, base_jobs)):
+                boundaries = boundaries_from_markers(records, marker_lines(entry))
+                plans[entry.key] = (plan_sections(records, boundaries, sections), len(records))
+    for entry in entries:
+        key = scene_key(entry, quality)
+        module_path = relative_to_repo(entry.module_path)
+        if entry.key not in plans:
+            jobs.append(FarmJob(f"{entry.key}:all:{quality}", module_path, entry.class_name, quality, key))
+            continue
+        plan, count = plans[entry.key]
+        for number, (first, end) in enumerate(plan):
+            jobs.append(
+                FarmJob(
+                    f"{entry.key}:{first}-{end}:{quality}", module_path, entry.class_name, quality,
+                    key, first_play=first, end_play=end, play_count=count, number=number,
+                )
+            )
+    return jobs
+
+
+class Coordinator:
+    """
+    ジョブを配り、部分動画を受け取るコーディネーター
+    Coordinator that hands out jobs and receives partial movies
+    """
+
+    def __init__(
+        self,
+        jobs: list[FarmJob],
+        max_attempts: int = 3,
+        job_timeout: float = JOB_TIMEOUT,
+        heartbeat_timeout: float = HEARTBEAT_TIMEOUT,
+        segment_dir=None,
+    ):
+        """
+        Args:
+            jobs: ジョブ（job_id が同じものは1つにまとめる）
+            max_attempts: 1ジョブあたりの最大試行回数
+            job_timeout: 1回の貸し出しの上限（秒）
+            heartbeat_timeout: ワーカーからの連絡が途絶えたとみなす時間（秒）
+            segment_dir: ジョブ → 部分動画の置き場所（省略時はシーンの partial_movie_dir）
+        """
+        unique = {job.job_id: job for job in jobs}
+        self.jobs = unique
+        self.pending = deque(unique.values())
+        self.leased: dict[str, str] = {}
+        self.attempts: dict[str, int] = {job_id: 0 for job_id in unique}
+        self.done: dict[str, dict] = {}
+        self.failed: dict[str, str] = {}
+        self.max_attempts = max_attempts
+        self.job_timeout = job_timeout
+        self.heartbeat_timeout = heartbeat_timeout
+        self.segment_dir = segment_dir or (lambda job: partial_movie_dir(job.render_job()))
+        self.condition = threading.Condition()
+
+    @property
+    def finished(self) -> bool:
+        return len(self.done) + len(self.failed) == len(self.jobs)
+
+    def next_job(self, worker: str) -> FarmJob | None:
+        """
+        次のジョブを貸し出す。全て終わっていれば None
+        Lease the next job; None when everything is finished
+
+        待ち行列が空でも貸し出し中のジョブがあれば、それが戻ってくる
+        かもしれないので待つ。
+        With an empty queue but jobs still leased, wait: they may come back.
+        """
+        with self.condition:
+            while not self.pending and not self.finished:
+                self.condition.wait()
+            if not self.pending:
+                return None
+            job = self.pending.popleft()
+            self.leased[job.job_id] = worker
+            self.attempts[job.job_id] += 1
+            return job
+
+    def release(self, job: FarmJob, error: str) -> None:
+        """
+        失敗・ワーカー喪失のジョブを戻す（上限を超えたら失敗扱い）
+        Return a failed or lost job (marked failed past the attempt limit)
+        """
+        with self.condition:
+            self.leased.pop(job.job_id, None)
+            if job.job_id in self.done:
+                pass
+            elif self.attempts[job.job_id] >= self.max_attempts:
+                self.failed[job.job_id] = error
+            else:
+                self.pending.append(job)
+            self.condition.notify_all()
+
+    def complete(self, job: FarmJob, result: dict) -> None:
+        """結果を記録する（完了済みなら無視） / Record a result (ignored if already done)"""
+        with self.condition:
+            self.leased.pop(job.job_id, None)
+            if job.job_id not in self.done:
+                self.done[job.job_id] = result
+                self.failed.pop(job.job_id, None)
+            self.condition.notify_all()
+
+    def handle(self, connection: socket.socket, address) -> None:
+        """1つのワーカーとの接続を処理する（スレッド） / Serve one worker connection (thread)"""
+        connection.settimeout(self.heartbeat_timeout)
+        worker = f"{address[0]}:{address[1]}"
+        job = None
+        try:
+            hello = recv_message(connection)
+            worker = hello.get("worker", worker)
+            print(f"  worker connected: {worker}")
+            while True:
+                job = self.next_job(worker)
+                if job is None:
+                    send_message(connection, {"type": "done"})
+                    return
+                send_message(connection, {"type": "job", **asdict(job)})
+                deadline = time.monotonic() + self.job_timeout
+                while True:
+                    message = recv_message(connection)
+                    if message["type"] == "segment":
+                        target = self.segment_dir(job) / message["name"]
+                        recv_file(connection, message["size"], None if target.exists() else target)
+                    elif message["type"] == "result":
+                        break
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"job ran past {self.job_timeout:.0f}s")
+                if message["ok"]:
+                    self.complete(job, message)
+                    print(f"  {job.job_id}: ok ({worker}, {message['wall_time']:.1f}s)")
+                else:
+                    print(f"  {job.job_id}: FAILED on {worker}\n{message['error']}")
+                    self.release(job, message["error"])
+                job = None
+        except (OSError, ConnectionError, ValueError) as error:
+            print(f"  worker lost: {worker} ({error})")
+            if job is not None:
+                self.release(job, f"worker {worker} lost: {error}")
+        finally:
+            connection.close()
+
+    def serve(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT, ready=None) -> None:
+        """
+        全ジョブが終わるまで接続を受け付ける
+        Accept connections until every job is finished
+
+        Args:
+            ready: 待ち受けを始めたら実際のポート番号を渡して呼ぶ関数（省略可）
+        """
+        with socket.create_server((host, port)) as server:
+            server.settimeout(0.5)
+            if ready is not None:
+                ready(server.getsockname()[1])
+            while True:
+                with self.condition:
+                    if self.finished:
+                        break
+                try:
+                    connection, address = server.accept()
+                except socket.timeout:
+                    continue
+                threading.Thread(target=self.handle, args=(connection, address), daemon=True).start()
+
+
+def run_job(message: dict) -> tuple[dict, list[Path]]:
+    """
+    ワーカー側でジョブを1つ描き、結果と部分動画の一覧を返す
+    Render one job on the worker; return the result and its partial movies
+    """
+    fields = {k: v for k, v in message.items() if k in FarmJob.__dataclass_fields__}
+    job = FarmJob(**fields)
+    name = f"{Path(job.module_path).stem}.{job.class_name}"
+    start = time.perf_counter()
+    try:
+        entry = next(iter(discover_scenes(names=[name])), None)
+        if entry is None:
+            return {"ok": False, "wall_time": 0.0, "error": f"scene {name} not found in this worker's tree"}, []
+        if scene_key(entry, job.quality) != job.scene_key:
+            return {"ok": False, "wall_time": 0.0, "error": "scene source differs from the coordinator's"}, []
+        with scene_for(job.render_job()) as scene:
+            scene.render()
+            writer = scene.renderer.file_writer
+            segments = [Path(p) for p in writer.partial_movie_files if p is not None]
+            output = Path(writer.movie_file_path)
+    except Exception:
+        return {"ok": False, "wall_time": time.perf_counter() - start, "error": traceback.format_exc()}, []
+    output.unlink(missing_ok=True)
+    return {"ok": True, "wall_time": time.perf_counter() - start, "error": None}, segments
+
+
+@contextmanager
+def heartbeat(send, interval: float = HEARTBEAT_INTERVAL):
+    """
+    with ブロックの間、interval 秒ごとに生存を知らせる
+    Send a heartbeat every interval seconds while the block runs
+    """
+    stop = threading.Event()
+
+    def beat():
+        while not stop.wait(interval):
+            try:
+                send({"type": "heartbeat"})
+            except OSError:
+                return
+
+    thread = threading.Thread(target=beat, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def work(host: str, port: int, name: str | None = None, runner=run_job) -> None:
+    """
+    コーディネーターに接続してジョブを処理し続ける
+    Connect to the coordinator and keep processing jobs
+
+    Args:
+        runner: メッセージ → (結果, 部分動画のパス) の関数（既定は run_job）
+    """
+    name = name or f"{socket.gethostname()}:{os.getpid()}"
+    lock = threading.Lock()
+
+    def send(header: dict, path: Path | None = None) -> None:
+        # 生存の知らせがファイルの途中に割り込まないようにする / Keep heartbeats out of file bodies
+        with lock:
+            send_message(sock, header, path)
+
+    with socket.create_connection((host, port)) as sock:
+        send({"type": "hello", "worker": name})
+        while True:
+            message = recv_message(sock)
+            if message["type"] == "done":
+                return
+            with heartbeat(send):
+                result, segments = runner(message)
+                for path in segments:
+                    send({"type": "segment", "name": path.name}, path)
+            send({"type": "result", "job_id": message["job_id"], **result})
+
+
+def _check_runner(workdir: Path, message: dict) -> tuple[dict, list[Path]]:
+    """
+    farm check 用の偽のジョブ（manim を使わない）
+    Fake job for farm check (no manim)
+
+    部分動画の名前は3つのジョブごとに重なる（重複排除の確認用）。
+    "check:lost" は最初の試行でワーカーごと落ちる（再試行の確認用）。
+    Segment names repeat every three jobs (for dedup); "check:lost" kills its
+    worker on the first attempt (for retry).
+    """
+    if message["job_id"] == "check:lost":
+        marker = workdir / "lost.marker"
+        if not marker.exists():
+            marker.touch()
+            os._exit(1)
+    time.sleep(0.1)
+    segment = workdir / message["job_id"].replace(":", "_") / f"segment{message['number'] % 3}.mp4"
+    segment.parent.mkdir(exist_ok=True)
+    segment.write_bytes(message["job_id"].encode())
+    return {"ok": True, "wall_time": 0.1, "error": None}, [segment]
+
+
+def check_farm(workers: int = 2) -> bool:
+    """
+    localhost でコーディネーターとワーカーを動かしてプロトコルを確かめる
+    Run a coordinator and workers on localhost and check the protocol
+
+    偽のジョブ（manim 不要）で、全ジョブの完了、ワーカー喪失時の再試行、
+    同じ job_id と同じ部分動画の重複排除を確かめる。
+    With fake jobs (no manim needed) checks that every job finishes, that a
+    lost worker's job is retried, and that duplicate job ids and segments are
+    deduplicated.
+
+    Returns:
+        全て確かめられれば True
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir, received = Path(tmp) / "work", Path(tmp) / "received"
+        workdir.mkdir()
+        jobs = [FarmJob(f"check:{i}", "check.py", "Check", "l", "check", number=i) for i in range(6)]
+        jobs += [jobs[0], FarmJob("check:lost", "check.py", "Check", "l", "check", number=6)]
+        coordinator = Coordinator(jobs, heartbeat_timeout=5.0, segment_dir=lambda job: received)
+        processes = []
+
+        def ready(port: int) -> None:
+            for i in range(workers):
+                process = multiprocessing.Process(
+                    target=work, args=("127.0.0.1", port, f"check-{i}", partial(_check_runner, workdir)), daemon=True
+                )
+                process.start()
+                processes.append(process)
+
+        coordinator.serve("127.0.0.1", 0, ready)
+        for process in processes:
+            process.join(timeout=10)
+
+        checks = {
+            "7 unique jobs": len(coordinator.jobs) == 7,
+            "all jobs done": len(coordinator.done) == 7 and not coordinator.failed,
+            "lost job retried": coordinator.attempts["check:lost"] == 2,
+            "segments deduplicated": sorted(p.name for p in received.iterdir())
+            == ["segment0.mp4", "segment1.mp4", "segment2.mp4"],
+        }
+    for label, ok in checks.items():
+        print(f"  {'ok    ' if ok else 'FAILED'} {label}")
+    return all(checks.values())
+
+
+def run_farm(
+    names=None,
+    quality: str = "l",
+    sections: int = 1,
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    local_workers: int = 0,
+    max_attempts: int = 3,
+) -> bool:
+    """
+    コーディネーターを動かし、終わったシーンを仕上げる
+    Run the coordinator and assemble the finished scenes
+
+    Args:
+        names: 絞り込み用の名前
+        quality: 品質フラグ
+        sections: 1シーンあたりのセクション数（1 なら分割しない）
+        host, port: 待ち受けアドレス（port=0 なら空きポート）
+        local_workers: localhost に立てるワーカープロセスの数
+        max_attempts: 1ジョブあたりの最大試行回数
+
+    Returns:
+        全シーンが仕上がれば True
+    """
+    jobs = build_jobs(names, quality, sections)
+    coordinator = Coordinator(jobs, max_attempts=max_attempts)
+    print(f"Farm: {len(coordinator.jobs)} jobs (-q{quality})")
+
+    processes = []
+
+    def ready(actual_port: int) -> None:
+        print(f"  listening on {host}:{actual_port}")
+        for i in range(local_workers):
+            process = multiprocessing.Process(target=work, args=(host, actual_port, f"local-{i}"), daemon=True)
+            process.start()
+            processes.append(process)
+
+    coordinator.serve(host, port, ready)
+    for process in processes:
+        process.join()
+
+    for job_id, error in coordinator.failed.items():
+        print(f"  {job_id}: gave up\n{error}")
+    failed = {coordinator.jobs[job_id].scene_job.key for job_id in coordinator.failed}
+    finished = {}
+    for job in coordinator.jobs.values():
+        if job.scene_job.key not in failed:
+            finished[job.scene_job.key] = job.scene_job
+    with ProcessPoolExecutor() as pool:
+        for result in pool.map(render_job, finished.values()):
+            status = "ok" if result.ok else "FAILED"
+            print(f"  assembled {result.key}: {status} {result.output or ''}")
+            if not result.ok:
+                print(result.error)
+                failed.add(result.key)
+    return not failed
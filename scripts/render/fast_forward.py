@@ -0,0 +1,55 @@
+"""
+早送り用の Scene ミックスイン
+Scene mixin for fast-forwarding
+
+全ての play をスキップし、スキップ中はラスタライズも一切行わない。
+manim の skip_animations だけでは、play ごとに静止モブジェクトの背景や
+wait のフレームが描かれてしまうので、それも止める。
+
+Skips every play and performs no rasterization at all while skipping.
+manim's skip_animations alone still draws the static-mobject background and
+the frozen frame of each wait, so those are suppressed as well.
+"""
+
+
+class FastForward:
+    """
+    construct() を描画なしで最後まで進めるミックスイン
+    Mixin that runs construct() to the end without drawing
+
+    フレームが必要なときは self.rasterize() で明示的に描く。
+    Call self.rasterize() to draw a frame explicitly when one is needed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs["skip_animations"] = True
+        super().__init__(*args, **kwargs)
+        renderer = self.renderer
+        update_frame = renderer.update_frame
+        save_static_frame_data = renderer.save_static_frame_data
+
+        def skipping_update_frame(scene, *frame_args, **frame_kwargs):
+            if renderer.skip_animations:
+                return None
+            return update_frame(scene, *frame_args, **frame_kwargs)
+
+        def skipping_save_static_frame_data(scene, static_mobjects):
+            if renderer.skip_animations:
+                renderer.static_image = None
+                return None
+            return save_static_frame_data(scene, static_mobjects)
+
+        renderer.update_frame = skipping_update_frame
+        renderer.save_static_frame_data = skipping_save_static_frame_data
+        self._update_frame = update_frame
+
+    def rasterize(self):
+        """
+        現在のシーンの状態を1フレーム描いて PIL の画像で返す
+        Draw the current scene state once and return it as a PIL image
+        """
+        static_image = self.renderer.static_image
+        self.renderer.static_image = None
+        self._update_frame(self, ignore_skipping=True)
+        self.renderer.static_image = static_image
+        return self.renderer.camera.get_image()
@@ -0,0 +1,96 @@
+"""
+play() 単位の累積キャッシュ
+Cumulative per-play() cache
+
+manim は play() ごとに部分動画（partial movie file）を書き出し、その play の
+アニメーションと画面上のモブジェクトのハッシュで再利用する。ここではその
+キーを「最初の play からの累積ハッシュ」に置き換える:
+
+    key_i = sha256(key_{i-1} + hash(play_i))
+
+こうすると、後半のフェーズだけを直した場合は編集箇所より前の play の
+キーが一切変わらず、前半の部分動画はそのまま再利用される。最終動画は
+manim が部分動画を再エンコードせずに連結して作る。
+
+manim writes one partial movie file per play() and reuses it by hashing that
+play's animations and on-screen mobjects. This module replaces that key with
+a hash chained from the first play of the scene, so editing a later phase
+leaves every earlier key untouched; the cached earlier segments are spliced
+back in by manim's stream-copy concatenation without re-encoding.
+"""
+
+import hashlib
+
+# 部分動画をシーンあたりこの数まで残す（manim の既定 100 では長いシーンで溢れる）
+# Keep this many partial movies per scene (manim's default of 100 overflows on long scenes)
+MAX_FILES_CACHED = 1000
+
+PLAY_CACHE_CONFIG = {
+    "disable_caching": False,
+    "max_files_cached": MAX_FILES_CACHED,
+}
+
+_installed = False
+
+
+def _chained_hash(scene, camera, animations, mobjects, _original=None):
+    """
+    累積キーを持つシーンならそれを返し、持たなければ manim 本来のハッシュを返す
+    Return the chained key for scenes that have one, else manim's own hash
+    """
+    key = getattr(scene, "_chained_play_key", None)
+    if key is not None:
+        return key
+    return _original(scene, camera, animations, mobjects)
+
+
+def install() -> None:
+    """
+    CairoRenderer が使うハッシュ関数を累積キー対応版に差し替える（冪等）
+    Swap the hash function used by CairoRenderer for the chained one (idempotent)
+    """
+    global _installed
+    if _installed:
+        return
+    from manim.renderer import cairo_renderer
+    from manim.utils import hashing
+
+    original = hashing.get_hash_from_play_call
+
+    def patched(scene, camera, animations, mobjects):
+        return _chained_hash(scene, camera, animations, mobjects, _original=original)
+
+    hashing.get_hash_from_play_call = patched
+    if hasattr(cairo_renderer, "get_hash_from_play_call"):
+        cairo_renderer.get_hash_from_play_call = patched
+    _installed = True
+
+
+class ChainedPlayCache:
+    """
+    play() のキャッシュキーを累積ハッシュにする Scene 用ミックスイン
+    Scene mixin that makes play() cache keys cumulative
+
+    スキップ中（範囲指定レンダリングでの早送りなど）の play でも鎖は
+    途切れないように、キーは compile_animation_data の直後に毎回計算する。
+    The key is computed right after compile_animation_data for every play,
+    including skipped ones, so the chain never breaks during fast-forwards.
+    """
+
+    _chained_play_key = None
+
+    def compile_animation_data(self, *animations, **play_kwargs):
+        from manim.utils.hashing import get_hash_from_play_call
+
+        result = super().compile_animation_data(*animations, **play_kwargs)
+        # 種はシーン名を含まない（部分動画のディレクトリが既にシーンごとに分かれている）。
+        # そのため同じ冒頭を持つ派生シーン同士ではキーが一致する。
+        # The seed omits the scene name (partial movies already live in a
+        # per-scene directory), so variants with the same opening share keys.
+        previous = self._chained_play_key or ""
+        # 自分自身を返さないよう、キーを外してから manim のハッシュを取る
+        # Clear the key first so the manim hash below is not short-circuited
+        self._chained_play_key = None
+        play_hash = get_hash_from_play_call(self, self.camera, self.animations, self.mobjects)
+        self._chained_play_key = hashlib.sha256(f"{previous}:{play_hash}".encode()).hexdigest()[:40]
+        return result
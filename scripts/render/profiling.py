@@ -0,0 +1,237 @@
+"""
+フレーム単位のプロファイリング（任意で有効化）
+Opt-in per-frame profiling
+
+遅いシーンの時間は、フレームごとに呼ばれる Python のコールバック
+（OceanTidesRotating の update_ocean / update_moon、ParallelTransportSphere の
+update_vector_path1/2/3、FlatVsCurvedGrid の create_meridian_updater など）に
+費やされている。ここでは次の区間をそれぞれ計測する:
+
+  - play    : play() 1回分
+  - updater : アップデータ1回の呼び出し（add_updater と UpdateFromFunc /
+              UpdateFromAlphaFunc の両方）
+  - frame   : 1フレーム分（update = アニメーションとアップデータの適用、
+              rasterize = Cairo での描画、encode = 動画への書き出し）
+
+結果は Chrome trace 形式の JSON に書き出す。chrome://tracing や
+https://ui.perfetto.dev で開ける。encode は ffmpeg へフレームを渡す時間で、
+ffmpeg 側の圧縮が追いつかない場合もここに現れる。
+
+The slow scenes spend their time in per-frame Python callbacks. This module
+times, separately, each play() segment, each updater call (add_updater as well
+as UpdateFromFunc / UpdateFromAlphaFunc) and, per frame, the update
+(animations and updaters), rasterize (Cairo) and encode (writing the frame to
+the movie) steps. The data is written as Chrome trace JSON for
+chrome://tracing or https://ui.perfetto.dev. Encode is the time spent handing
+the frame to ffmpeg, which includes back-pressure when ffmpeg falls behind.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+from .registry import MEDIA_DIR, discover_scenes
+from .worker import RenderJob, relative_to_repo, scene_for
+
+DEFAULT_PROFILE_DIR = MEDIA_DIR / "profiles"
+
+# 全フレームを実際に描くためキャッシュは切る / Caching off so every frame is really drawn
+PROFILE_CONFIG = {"disable_caching": True}
+
+
+def updater_name(function) -> str:
+    """
+    トレースに載せるアップデータの名前（<locals> を除いた修飾名）
+    Updater name for the trace (qualified name without <locals>)
+    """
+    name = getattr(function, "__qualname__", None) or getattr(function, "__name__", repr(function))
+    return name.replace(".<locals>", "")
+
+
+class Tracer:
+    """
+    Chrome trace の完了イベント（ph = "X"）を集める
+    Collects Chrome trace complete events (ph = "X")
+    """
+
+    def __init__(self):
+        self.events: list[dict] = []
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+
+    @contextmanager
+    def span(self, name: str, category: str, **args):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self.origin) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": self.pid,
+                "tid": threading.get_ident(),
+            }
+            if args:
+                event["args"] = args
+            self.events.append(event)
+
+    def wrap(self, function, name: str, category: str):
+        """呼び出しごとに区間を記録する関数を返す / Return a function that records a span per call"""
+
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            with self.span(name, category):
+                return function(*args, **kwargs)
+
+        return timed
+
+    def summary(self) -> list[tuple[str, str, int, float, float]]:
+        """
+        区間名ごとの集計（合計時間の降順）
+        Totals per span name, longest total first
+
+        Returns:
+            (category, name, calls, total_ms, mean_ms) のリスト
+        """
+        totals = defaultdict(lambda: [0, 0.0])
+        for event in self.events:
+            # play は番号ごとに名前が違うので1行にまとめる / Fold the numbered play spans into one row
+            name = "play" if event["cat"] == "play" else event["name"]
+            row = totals[(event["cat"], name)]
+            row[0] += 1
+            row[1] += event["dur"] / 1000
+        rows = [(cat, name, calls, total, total / calls) for (cat, name), (calls, total) in totals.items()]
+        return sorted(rows, key=lambda r: r[3], reverse=True)
+
+    def write(self, path: Path, process_name: str) -> None:
+        """Chrome trace の JSON を書き出す / Write the Chrome trace JSON"""
+        metadata = {"name": "process_name", "ph": "M", "pid": self.pid, "args": {"name": process_name}}
+        data = {"traceEvents": [metadata, *self.events], "displayTimeUnit": "ms"}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+
+@contextmanager
+def instrument_updaters(tracer: Tracer):
+    """
+    with ブロックの間、アップデータの呼び出しを計測する
+    Time every updater call while the block is active
+
+    Mobject.add_updater で登録される関数を計測版に包み、UpdateFromFunc /
+    UpdateFromAlphaFunc の interpolate_mobject も包む。ブロックを抜けると元に戻す。
+    Functions registered through Mobject.add_updater are wrapped, as is
+    interpolate_mobject of UpdateFromFunc / UpdateFromAlphaFunc. Everything is
+    restored when the block exits.
+    """
+    from manim import Mobject, UpdateFromAlphaFunc, UpdateFromFunc
+
+    original_add = Mobject.add_updater
+    original_remove = Mobject.remove_updater
+    originals = {cls: cls.__dict__["interpolate_mobject"] for cls in (UpdateFromFunc, UpdateFromAlphaFunc)}
+
+    def add_updater(mob, update_function, *args, **kwargs):
+        timed = tracer.wrap(update_function, updater_name(update_function), "updater")
+        return original_add(mob, timed, *args, **kwargs)
+
+    def remove_updater(mob, update_function):
+        # 包んだ関数は元の関数を __wrapped__ に持つ / Wrapped functions keep the original in __wrapped__
+        for updater in list(mob.updaters):
+            if getattr(updater, "__wrapped__", None) is update_function:
+                mob.updaters.remove(updater)
+        return original_remove(mob, update_function)
+
+    def timed_interpolate(original):
+        def interpolate_mobject(animation, alpha):
+            with tracer.span(updater_name(animation.update_function), "updater"):
+                return original(animation, alpha)
+
+        return interpolate_mobject
+
+    Mobject.add_updater = add_updater
+    Mobject.remove_updater = remove_updater
+    for cls, original in originals.items():
+        cls.interpolate_mobject = timed_interpolate(original)
+    try:
+        yield
+    finally:
+        Mobject.add_updater = original_add
+        Mobject.remove_updater = original_remove
+        for cls, original in originals.items():
+            cls.interpolate_mobject = original
+
+
+class FrameProfiler:
+    """
+    play() とフレームの各工程を計測する Scene 用ミックスイン
+    Scene mixin timing play() segments and the steps of every frame
+
+    tracer はクラス属性で渡す（profiler_mixin を使う）。
+    The tracer is given as a class attribute (see profiler_mixin).
+    """
+
+    tracer: Tracer = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        tracer = self.tracer
+        renderer = self.renderer
+        renderer.render = tracer.wrap(renderer.render, "frame", "frame")
+        renderer.update_frame = tracer.wrap(renderer.update_frame, "rasterize", "frame")
+        writer = renderer.file_writer
+        writer.write_frame = tracer.wrap(writer.write_frame, "encode", "frame")
+        self._profiled_plays = 0
+
+    def play(self, *args, **kwargs):
+        self._profiled_plays += 1
+        animations = [type(a).__name__ for a in args]
+        with self.tracer.span(f"play {self._profiled_plays}", "play", animations=animations):
+            return super().play(*args, **kwargs)
+
+    def update_to_time(self, t):
+        with self.tracer.span("update", "frame"):
+            return super().update_to_time(t)
+
+
+def profiler_mixin(tracer: Tracer) -> type:
+    """tracer を持った FrameProfiler を作る / Build a FrameProfiler bound to a tracer"""
+    return type("FrameProfiler", (FrameProfiler,), {"tracer": tracer})
+
+
+def profile_scene(job: RenderJob, output_dir: Path = DEFAULT_PROFILE_DIR) -> tuple[Path, Tracer]:
+    """
+    1シーンを計測しながらレンダリングし、トレースを書き出す
+    Render one scene under the profiler and write its trace
+
+    Returns:
+        (トレースのパス, Tracer)
+    """
+    tracer = Tracer()
+    with instrument_updaters(tracer), scene_for(job, (profiler_mixin(tracer),)) as scene:
+        with tracer.span(job.key, "scene"):
+            scene.render()
+    path = Path(output_dir) / f"{job.class_name}_q{job.quality}.trace.json"
+    tracer.write(path, job.key)
+    return path, tracer
+
+
+def run_profile(names, quality: str = "l", output_dir: Path = DEFAULT_PROFILE_DIR, top: int = 15) -> None:
+    """
+    指定したシーンを順に計測し、集計を表示する
+    Profile the given scenes one by one and print a summary
+    """
+    for entry in discover_scenes(names=names):
+        job = RenderJob(relative_to_repo(entry.module_path), entry.class_name, quality, PROFILE_CONFIG)
+        path, tracer = profile_scene(job, output_dir)
+        print(f"{entry.key}: {relative_to_repo(path)}")
+        print(f"  {'category':9s} {'name':60s} {'calls':>7s} {'total ms':>10s} {'mean ms':>9s}")
+        for category, name, calls, total, mean in tracer.summary()[:top]:
+            print(f"  {category:9s} {name[:60]:60s} {calls:7d} {total:10.1f} {mean:9.3f}")
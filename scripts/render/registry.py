@@ -0,0 +1,142 @@
+"""
+シーンレジストリ
+Scene registry
+
+scripts/*.py を AST で解析し、Scene 系クラスの一覧を作る。
+manim を import せずに済むので、一覧の作成は一瞬で終わる。
+
+Parses scripts/*.py with the ast module and lists the Scene classes.
+No manim import is needed, so building the registry is instant.
+"""
+
+import ast
+from dataclasses import dataclass
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+REPO_ROOT = SCRIPTS_DIR.parent
+MEDIA_DIR = REPO_ROOT / "media"
+
+# manim の Scene 基底クラス
+# manim's Scene base classes
+SCENE_BASES = {"Scene", "ThreeDScene", "MovingCameraScene", "ZoomedScene"}
+
+
+@dataclass(frozen=True)
+class SceneEntry:
+    """
+    レンダリング対象の1シーン
+    A single renderable scene
+    """
+
+    module_path: Path
+    class_name: str
+    base: str
+    lineno: int
+    end_lineno: int
+    num_plays: int
+    estimated_seconds: float
+
+    @property
+    def module_name(self) -> str:
+        return self.module_path.stem
+
+    @property
+    def key(self) -> str:
+        """マニフェスト等で使う一意な名前 / Unique name used in manifests"""
+        return f"{self.module_name}.{self.class_name}"
+
+
+def _literal_number(node, default: float) -> float:
+    """数値リテラルならその値、そうでなければ既定値 / Value of a numeric literal, else default"""
+    try:
+        value = ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError):
+        return default
+    return float(value) if isinstance(value, (int, float)) else default
+
+
+def _estimate_duration(class_node: ast.ClassDef) -> tuple[int, float]:
+    """
+    self.play / self.wait の呼び出しから動画の長さを大まかに見積もる
+    Roughly estimate the video length from self.play / self.wait calls
+
+    Returns:
+        (play/wait の呼び出し数, 見積もった秒数)
+    """
+    num_plays = 0
+    seconds = 0.0
+    for node in ast.walk(class_node):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)):
+            continue
+        target = node.func.value
+        if not (isinstance(target, ast.Name) and target.id == "self"):
+            continue
+        keywords = {kw.arg: kw.value for kw in node.keywords}
+        if node.func.attr == "play":
+            num_plays += 1
+            run_time = keywords.get("run_time")
+            seconds += _literal_number(run_time, 1.0) if run_time is not None else 1.0
+        elif node.func.attr == "wait":
+            num_plays += 1
+            duration = node.args[0] if node.args else keywords.get("duration")
+            seconds += _literal_number(duration, 1.0) if duration is not None else 1.0
+    return num_plays, seconds
+
+
+def scan_module(module_path: Path) -> list[SceneEntry]:
+    """
+    1つのスクリプトから Scene 系クラスを探す
+    Find the Scene classes defined in one script
+
+    同じファイル内の Scene サブクラスを継承したクラスも対象にする。
+    Classes deriving from another Scene subclass in the same file are included.
+    """
+    tree = ast.parse(module_path.read_text(encoding="utf-8"), filename=str(module_path))
+    scene_bases = {name: name for name in SCENE_BASES}
+    entries = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        base_names = [b.id for b in node.bases if isinstance(b, ast.Name)]
+        base_names += [b.attr for b in node.bases if isinstance(b, ast.Attribute)]
+        root = next((scene_bases[b] for b in base_names if b in scene_bases), None)
+        if root is None:
+            continue
+        scene_bases[node.name] = root
+        num_plays, seconds = _estimate_duration(node)
+        entries.append(
+            SceneEntry(
+                module_path=module_path,
+                class_name=node.name,
+                base=root,
+                lineno=node.lineno,
+                end_lineno=node.end_lineno,
+                num_plays=num_plays,
+                estimated_seconds=seconds,
+            )
+        )
+    return entries
+
+
+def discover_scenes(scripts_dir: Path = SCRIPTS_DIR, names=None) -> list[SceneEntry]:
+    """
+    scripts/*.py の全シーンを列挙する
+    List every scene in scripts/*.py
+
+    Args:
+        scripts_dir: 探索するディレクトリ
+        names: 絞り込み用の名前（モジュール名、クラス名、または "module.Class"）
+
+    Returns:
+        ファイル名・定義順に並んだ SceneEntry のリスト
+    """
+    entries = []
+    for module_path in sorted(scripts_dir.glob("*.py")):
+        entries.extend(scan_module(module_path))
+    if names:
+        wanted = set(names)
+        entries = [
+            e for e in entries if {e.module_name, e.class_name, e.key} & wanted
+        ]
+    return entries
@@ -0,0 +1,243 @@
+"""
+長いシーンのセクション並列レンダリング
+Section-parallel rendering of long scenes
+
+1. 下見（probe）: シーンを早送りで最後まで実行し、各 play の長さと
+   construct() 内の行番号を記録する。ラスタライズはしない。
+2. 分割: construct() 内の "===== ... =====" / "--- ... ---" のフェーズ見出し、
+   および self.next_section() をセクション境界の候補とし、各ワーカーの
+   受け持ち時間がほぼ均等になる境界を選ぶ。
+3. 並列レンダリング: 各セクションを別プロセスで描く。セクション開始までの
+   play は manim の from_animation_number で早送りするので、途中のシーンの
+   状態は再構築されるだけで描画はされない。
+4. 結合: 各セクションの部分動画をシーン本来の partial_movie_dir にリンクし
+   （output_file を変えると manim は部分動画を別のディレクトリに書く）、
+   全体をもう一度レンダリングする。全ての play が play() 単位の
+   キャッシュにヒットするので、manim は部分動画を再エンコードせずに連結する。
+
+1. Probe: fast-forward through the scene once, recording each play's length
+   and its line in construct(); nothing is rasterized.
+2. Split: phase markers ("===== ... =====" / "--- ... ---") and
+   self.next_section() calls in construct() are candidate boundaries; the ones
+   that best balance the per-worker duration are chosen.
+3. Render: each section runs in its own process. Plays before the section are
+   fast-forwarded with manim's from_animation_number, which rebuilds the scene
+   state at the boundary without drawing it.
+4. Assemble: each section's partial movies are linked into the scene's own
+   partial_movie_dir (manim writes them elsewhere when output_file is set),
+   then the full scene is rendered once more. Every play hits the per-play
+   cache, so manim concatenates the partial movies by stream copy.
+"""
+
+import ast
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from .fast_forward import FastForward
+from .registry import REPO_ROOT, SceneEntry
+from .worker import RenderJob, RenderResult, link_partial_movies, relative_to_repo, render_job, scene_for
+
+# フェーズ見出しのコメント（例: "# ===== タイトル =====", "# --- Phase 2: ... ---"）
+# Phase marker comments (e.g. "# ===== Title =====", "# --- Phase 2: ... ---")
+MARKER_PATTERN = re.compile(r"^\s*#\s*(?:={3,}|-{3,})\s*(.*?)\s*(?:={3,}|-{3,})\s*$")
+
+
+@dataclass
+class PlayRecord:
+    """
+    下見で記録した1回分の play
+    One play recorded during the probe
+    """
+
+    index: int
+    line: int
+    duration: float
+    key: str | None = None
+
+
+class PlayProbe(FastForward):
+    """
+    全ての play をスキップしつつ記録する Scene 用ミックスイン
+    Scene mixin that skips every play while recording it
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.play_records: list[PlayRecord] = []
+
+    def _construct_line(self) -> int:
+        """
+        construct() 内で play を呼んだ行（ヘルパーメソッド経由でも construct の行）
+        Line in construct() that led to this play (even through helper methods)
+        """
+        frame = sys._getframe(1)
+        line = -1
+        while frame is not None:
+            if frame.f_code.co_name == "construct" and frame.f_locals.get("self") is self:
+                line = frame.f_lineno
+            frame = frame.f_back
+        return line
+
+    def play(self, *args, **kwargs):
+        line = self._construct_line()
+        start = self.renderer.time
+        super().play(*args, **kwargs)
+        self.play_records.append(
+            PlayRecord(
+                index=len(self.play_records),
+                line=line,
+                duration=self.renderer.time - start,
+                key=getattr(self, "_chained_play_key", None),
+            )
+        )
+
+
+def probe_scene(job: RenderJob) -> list[PlayRecord]:
+    """
+    シーンを早送りで実行して play の一覧を得る
+    Fast-forward through a scene and list its plays
+    """
+    probe_job = RenderJob(job.module_path, job.class_name, job.quality, {**job.config, "dry_run": True})
+    with scene_for(probe_job, (PlayProbe,)) as scene:
+        scene.render()
+        return scene.play_records
+
+
+def marker_lines(entry: SceneEntry) -> list[int]:
+    """
+    construct() 内のフェーズ見出しと self.next_section() の行番号
+    Line numbers of phase markers and self.next_section() calls in construct()
+    """
+    source = entry.module_path.read_text(encoding="utf-8")
+    tree = ast.parse(source)
+    class_node = next(
+        n for n in tree.body if isinstance(n, ast.ClassDef) and n.name == entry.class_name
+    )
+    construct = next(
+        (n for n in class_node.body if isinstance(n, ast.FunctionDef) and n.name == "construct"),
+        None,
+    )
+    if construct is None:
+        return []
+    lines = source.splitlines()
+    markers = [
+        number
+        for number in range(construct.lineno, construct.end_lineno + 1)
+        if MARKER_PATTERN.match(lines[number - 1])
+    ]
+    for node in ast.walk(construct):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "next_section"
+        ):
+            markers.append(node.lineno)
+    return sorted(markers)
+
+
+def boundaries_from_markers(records: list[PlayRecord], markers: list[int]) -> list[int]:
+    """
+    見出しの行番号を「その見出しの後の最初の play の番号」に変換する
+    Convert marker lines into the index of the first play after each marker
+    """
+    boundaries = set()
+    for marker in markers:
+        index = next((r.index for r in records if r.line > marker), None)
+        if index is not None:
+            boundaries.add(index)
+    return sorted(boundaries)
+
+
+def plan_sections(records: list[PlayRecord], boundaries: list[int], workers: int) -> list[tuple[int, int]]:
+    """
+    ワーカーごとの受け持ち時間が均等に近くなるように境界を選ぶ
+    Choose boundaries so each worker gets a similar share of the duration
+
+    Returns:
+        (開始 play 番号, 終了 play 番号（含まない）) のリスト
+    """
+    count = len(records)
+    cuts = sorted(b for b in set(boundaries) if 0 < b < count)
+    if workers <= 1 or not cuts:
+        return [(0, count)]
+    starts = [0.0]
+    for record in records:
+        starts.append(starts[-1] + record.duration)
+    total = starts[-1]
+    chosen = {
+        min(cuts, key=lambda c: abs(starts[c] - total * k / workers)) for k in range(1, workers)
+    }
+    edges = [0, *sorted(chosen), count]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def section_job(job: RenderJob, number: int, start: int, end: int, count: int) -> RenderJob:
+    """
+    1セクション分のジョブ（play 番号の範囲を指定）
+    Job for one section (restricted to a range of play numbers)
+    """
+    config = {**job.config, "output_file": f"{job.class_name}_section{number:02d}"}
+    if start > 0:
+        config["from_animation_number"] = start
+    if end < count:
+        config["upto_animation_number"] = end - 1
+    return RenderJob(job.module_path, job.class_name, job.quality, config)
+
+
+def render_sections(
+    entry: SceneEntry,
+    quality: str = "l",
+    workers: int | None = None,
+    all_boundaries: bool = False,
+) -> RenderResult:
+    """
+    1つのシーンをセクションに分けて並列レンダリングする
+    Render one scene split into sections in parallel
+
+    Args:
+        entry: 対象のシーン
+        quality: 品質フラグ
+        workers: ワーカー数（省略時は CPU コア数）
+        all_boundaries: True なら見出しに関係なく全ての play の間を境界候補にする
+
+    Returns:
+        結合後の動画の RenderResult
+    """
+    workers = workers or os.cpu_count() or 1
+    job = RenderJob(relative_to_repo(entry.module_path), entry.class_name, quality)
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        records = pool.submit(probe_scene, job).result()
+        if all_boundaries:
+            boundaries = [r.index for r in records]
+        else:
+            boundaries = boundaries_from_markers(records, marker_lines(entry))
+        plan = plan_sections(records, boundaries, workers)
+        print(f"{entry.key}: {len(records)} plays in {len(plan)} sections")
+        for number, (first, end) in enumerate(plan):
+            seconds = sum(r.duration for r in records[first:end])
+            print(f"  section {number:02d}: plays {first}-{end - 1} ({seconds:.1f}s of video)")
+
+        jobs = [section_job(job, n, s, e, len(records)) for n, (s, e) in enumerate(plan)]
+        for section, result in zip(jobs, pool.map(render_job, jobs)):
+            if result.ok:
+                # 区間ごとの動画は結合には使わない（部分動画を結合のパスから見える所に置けば十分）
+                # The per-section movies are not used; only their partial movies, placed where
+                # the assembly pass looks for them, matter
+                (REPO_ROOT / result.output).unlink(missing_ok=True)
+                link_partial_movies(result.segments, job)
+            else:
+                print(f"  warning: {section.config['output_file']} failed, assembly will render it")
+                print(result.error)
+
+        result = pool.submit(render_job, job).result()
+    result.report_reuse()
+
+    result.wall_time = time.perf_counter() - start
+    return result
+
@@ -0,0 +1,186 @@
+"""
+スライド用の静止画書き出し
+Still-frame export for the slides
+
+slides-jp/index.html が使うシーンの PNG を、動画を作らずに直接書き出す。
+各画像は slide_stills.json で (シーン, 時刻 または play 番号) に対応付ける。
+construct() を描画なしで早送りし、指定された瞬間だけをスライド用の
+解像度でラスタライズする。シーンごとに別プロセスで並列に処理する。
+
+Writes the scene PNGs used by slides-jp/index.html directly, without making
+the movie. slide_stills.json maps each image to a (scene, time or play index)
+pair. construct() is fast-forwarded without drawing and only the requested
+instants are rasterized at slide resolution, one process per scene.
+
+注意 / Note:
+  早送り中の updater は play ごとに1回しか呼ばれないので、TracedPath の
+  ような軌跡は途中の曲線が直線で近似される。
+  While fast-forwarding, updaters run once per play, so traces such as
+  TracedPath are approximated by straight segments.
+"""
+
+import json
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .fast_forward import FastForward
+from .registry import REPO_ROOT, discover_scenes
+from .worker import RenderJob, relative_to_repo, scene_for
+
+DEFAULT_SPEC = Path(__file__).resolve().parent / "slide_stills.json"
+
+
+@dataclass
+class StillTarget:
+    """
+    書き出す静止画1枚
+    One still to export
+
+    play も time も無ければシーンの最後のフレーム。
+    With neither play nor time, the last frame of the scene is used.
+    """
+
+    image: str
+    play: int | None = None
+    time: float | None = None
+    crop: tuple[float, float, float, float] | None = None  # (左, 上, 右, 下) の割合 / fractions
+
+
+class StillCapture(FastForward):
+    """
+    指定の瞬間だけラスタライズする Scene 用ミックスイン
+    Scene mixin that rasterizes only the requested instants
+    """
+
+    still_targets: list[StillTarget] = []
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.still_pending = list(self.still_targets)
+        self.still_written: list[str] = []
+        self._still_start = 0.0
+
+    def _capture(self, target: StillTarget) -> None:
+        image = self.rasterize()
+        if target.crop is not None:
+            left, top, right, bottom = target.crop
+            width, height = image.size
+            image = image.crop((int(left * width), int(top * height), int(right * width), int(bottom * height)))
+        path = REPO_ROOT / target.image
+        path.parent.mkdir(parents=True, exist_ok=True)
+        image.save(path)
+        self.still_pending.remove(target)
+        self.still_written.append(relative_to_repo(path))
+
+    def update_to_time(self, t):
+        # 早送り中は play ごとに t = run_time で1回だけ呼ばれる。
+        # この play の途中にある時刻指定はここで止めて描く。
+        # While skipping this runs once per play with t = run_time;
+        # instants that fall inside this play are drawn here.
+        start = self._still_start
+        due = sorted(
+            (s for s in self.still_pending if s.time is not None and start <= s.time < start + t),
+            key=lambda s: s.time,
+        )
+        for target in due:
+            super().update_to_time(target.time - start)
+            self._capture(target)
+        super().update_to_time(t)
+
+    def play(self, *args, **kwargs):
+        from manim.utils.exceptions import EndSceneEarlyException
+
+        self._still_start = self.renderer.time
+        super().play(*args, **kwargs)
+        index = self.renderer.num_plays - 1
+        for target in list(self.still_pending):
+            # 静止した wait の途中の時刻指定も、ここで（同じ絵なので）描く
+            # Instants inside a frozen wait are drawn here (the picture is the same)
+            if target.play == index or (target.time is not None and target.time <= self.renderer.time):
+                self._capture(target)
+        if not self.still_pending:
+            raise EndSceneEarlyException()
+
+    def tear_down(self):
+        for target in list(self.still_pending):
+            self._capture(target)
+        super().tear_down()
+
+
+def capture_stills(job: RenderJob, targets: list[StillTarget]) -> list[str]:
+    """
+    1つのシーンから静止画をまとめて書き出す（ワーカープロセスで実行）
+    Export all stills of one scene (runs in a worker process)
+
+    Returns:
+        書き出したファイルのパス（リポジトリからの相対パス）
+    """
+    capture = type("StillCapture", (StillCapture,), {"still_targets": targets})
+    with scene_for(job, (capture,)) as scene:
+        scene.render()
+        return scene.still_written
+
+
+def load_spec(path: Path = DEFAULT_SPEC) -> dict:
+    """
+    静止画の対応表を読み込む
+    Load the still-frame mapping
+    """
+    spec = json.loads(Path(path).read_text(encoding="utf-8"))
+    output_dir = Path(spec.get("output_dir", "slides-jp/assets/images"))
+    grouped = defaultdict(list)
+    for item in spec["stills"]:
+        crop = item.get("crop")
+        grouped[item["scene"]].append(
+            StillTarget(
+                image=str(output_dir / item["image"]),
+                play=item.get("play"),
+                time=item.get("time"),
+                crop=tuple(crop) if crop else None,
+            )
+        )
+    return {"resolution": tuple(spec.get("resolution", (1920, 1080))), "scenes": dict(grouped)}
+
+
+def export_stills(names=None, spec_path: Path = DEFAULT_SPEC, workers: int | None = None) -> list[str]:
+    """
+    スライド用の静止画を並列に書き出す
+    Export the slide stills in parallel
+
+    Args:
+        names: 絞り込み用の名前（シーン名・モジュール名・画像ファイル名）
+        spec_path: 対応表の JSON
+        workers: ワーカー数（省略時は CPU コア数）
+
+    Returns:
+        書き出したファイルのパスのリスト
+    """
+    spec = load_spec(spec_path)
+    width, height = spec["resolution"]
+    entries = {e.key: e for e in discover_scenes()}
+    config = {"dry_run": True, "pixel_width": width, "pixel_height": height}
+
+    tasks = []
+    for key, targets in spec["scenes"].items():
+        entry = entries[key]
+        if names:
+            wanted = set(names)
+            if not {entry.module_name, entry.class_name, key} & wanted:
+                targets = [t for t in targets if Path(t.image).name in wanted]
+            if not targets:
+                continue
+        job = RenderJob(relative_to_repo(entry.module_path), entry.class_name, "h", config)
+        tasks.append((job, targets))
+
+    written = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        futures = [pool.submit(capture_stills, job, targets) for job, targets in tasks]
+        for (job, _), future in zip(tasks, futures):
+            paths = future.result()
+            for path in paths:
+                print(f"  {job.key} -> {path}")
+            written.extend(paths)
+    return written
@@ -0,0 +1,134 @@
+"""
+派生シーン（Simple / WithLabels / WithArrows など）の共通冒頭の共有
+Shared-prefix rendering for scene variants (Simple / WithLabels / WithArrows, ...)
+
+ConvergingBalls と ConvergingBallsWithLabels のような派生シーンは、同じ地球・
+ボール・座標軸を作って同じ冒頭を再生することが多い。play() 単位の累積キーは
+シーン名を含まないので、冒頭が同じなら派生シーン間でキーの列の先頭が一致する。
+
+1. 下見: 各シーンを早送りして play ごとの累積キーを得る。
+2. 担当決め: 先に並んだシーンと共通する最長の冒頭 p_i は、そのシーンでは描かない。
+   各シーンは play p_i 以降だけを from_animation_number で描く（全て並列）。
+   冒頭までのシーンの状態は早送りで再構築される。
+3. 共有: 枝の部分動画（output_file で別のディレクトリに書かれる）を各シーンの
+   partial_movie_dir にリンクし、冒頭の部分動画を描いたシーンのディレクトリから
+   ハードリンクする。
+4. 結合: 各シーンを通常どおりレンダリングする。全 play がキャッシュに
+   ヒットするので、部分動画の連結だけで終わる。
+
+Variants such as ConvergingBalls and ConvergingBallsWithLabels usually build
+the same Earth, balls and axes and play the same opening. The chained per-play
+keys omit the scene name, so identical openings give identical key prefixes.
+
+1. Probe every scene (fast-forward) to get its chained per-play keys.
+2. A scene does not draw the longest prefix p_i it shares with an earlier
+   scene; it renders only plays p_i onwards via from_animation_number, all
+   scenes in parallel. The state at p_i is rebuilt by fast-forwarding.
+3. Branch partial movies (written to another directory because output_file
+   is set) are linked into each scene's partial_movie_dir, then the prefix
+   partial movies are hard-linked from the scene that drew them.
+4. Every scene is rendered normally; all plays hit the cache, so this is
+   just the stream-copy concatenation.
+"""
+
+import time
+
+from .registry import REPO_ROOT
+from .sections import probe_scene
+from .worker import RenderJob, RenderResult, link_partial_movies, partial_movie_dir, render_job
+
+
+def common_prefix(a: list[str], b: list[str]) -> int:
+    """2つのキー列の共通する先頭の長さ / Length of the common head of two key lists"""
+    length = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        length += 1
+    return length
+
+
+def branch_points(key_lists: list[list[str]]) -> list[int]:
+    """
+    各シーンが自分で描き始める play 番号
+    Play index from which each scene draws on its own
+
+    先に並んだシーンと共通する最長の冒頭の長さ。冒頭の play は木構造
+    （トライ）の節点なので、ある節点を先のシーンが描くならその祖先も全て
+    描かれている。よって各シーンの担当は常に末尾の連続した区間になる。
+    The longest head shared with any earlier scene. Plays form a trie, so if an
+    earlier scene draws a node it also draws every ancestor; each scene's own
+    share is therefore always a contiguous tail.
+    """
+    points = []
+    for i, keys in enumerate(key_lists):
+        points.append(max((common_prefix(keys, other) for other in key_lists[:i]), default=0))
+    return points
+
+
+def share_prefix(jobs: list[RenderJob], key_lists: list[list[str]], points: list[int]) -> int:
+    """
+    冒頭の部分動画を、描いたシーンから各シーンのディレクトリへリンクする
+    Link prefix partial movies from the scene that drew them into each scene
+
+    Returns:
+        リンクしたファイル数
+    """
+    dirs = [partial_movie_dir(job) for job in jobs]
+    linked = 0
+    for job, keys, point, target_dir in zip(jobs, key_lists, points, dirs):
+        sources = []
+        for key in keys[:point]:
+            candidates = (d / f"{key}.mp4" for d in dirs if d != target_dir)
+            source = next((c for c in candidates if c.exists()), None)
+            if source is not None:
+                sources.append(source)
+        linked += link_partial_movies(sources, job)
+    return linked
+
+
+def render_shared(jobs: list[RenderJob], pool) -> list[RenderResult]:
+    """
+    共通の冒頭を一度だけ描いて、複数のシーンをレンダリングする
+    Render several scenes, drawing each shared opening only once
+
+    Args:
+        jobs: レンダリングするジョブ（先に並んだものが冒頭を描く）
+        pool: ProcessPoolExecutor
+
+    Returns:
+        各ジョブの RenderResult（wall_time は全工程込み）
+    """
+    start = time.perf_counter()
+    records = list(pool.map(probe_scene, jobs))
+    key_lists = [[r.key for r in rec] for rec in records]
+    points = branch_points(key_lists)
+    saved = sum(points)
+    total = sum(len(keys) for keys in key_lists)
+    print(f"  shared openings: {saved} of {total} plays are drawn by another variant")
+
+    branches, owners = [], []
+    for job, keys, point in zip(jobs, key_lists, points):
+        if point >= len(keys):
+            continue
+        config = {**job.config, "output_file": f"{job.class_name}_branch"}
+        if point > 0:
+            config["from_animation_number"] = point
+        branches.append(RenderJob(job.module_path, job.class_name, job.quality, config))
+        owners.append(job)
+    for owner, result in zip(owners, pool.map(render_job, branches)):
+        if result.ok:
+            (REPO_ROOT / result.output).unlink(missing_ok=True)
+            link_partial_movies(result.segments, owner)
+        else:
+            print(f"  warning: branch of {result.key} failed, assembly will render it")
+            print(result.error)
+
+    share_prefix(jobs, key_lists, points)
+    results = list(pool.map(render_job, jobs))
+    for result in results:
+        result.report_reuse()
+    elapsed = time.perf_counter() - start
+    for result in results:
+        result.wall_time = elapsed
+    return results
@@ -0,0 +1,250 @@
+"""
+ウォッチモードのレンダリングデーモン
+Watch-mode render daemon
+
+scripts/ 以下の .py と素材ファイルを監視し、保存のたびに変更のあった
+シーンクラスだけを検出する（シーン単位のキャッシュキーを比較）。
+
+  - プレビュー: 変更されたクラスを、manim を import 済みの常駐ワーカーで
+    すぐに -ql でレンダリングする。インタプリタ起動と import の待ちがない。
+  - 本番: プレビューが成功したら -qh / -qk のレンダリングを、nice 値を
+    上げた別プロセスでバックグラウンドに積む。
+  - 取り消し: 同じシーンがまた変更されたら、古い本番ジョブは待ち行列から
+    外し、実行中ならプロセスごと止める。
+
+Watches the .py files and assets under scripts/ and, on every save, detects
+which scene classes changed by comparing per-scene cache keys.
+
+  - Preview: changed classes are rendered at -ql right away by a resident
+    worker that has already imported manim, so there is no interpreter or
+    import start-up.
+  - Final: once the preview succeeds, a -qh / -qk render is queued in a
+    background process with a raised nice value.
+  - Cancel: when the same scene changes again, its stale final job is dropped
+    from the queue, or its process is terminated if already running.
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from .batch import make_job
+from .cache import ASSETS_DIR, SceneCache, scene_key
+from .registry import SCRIPTS_DIR, SceneEntry, discover_scenes
+from .worker import RenderJob, RenderResult, render_job
+
+# バックグラウンドの本番レンダリングの nice 値の増分
+# Nice increment for background final renders
+FINAL_NICENESS = 10
+
+
+def _warm_up() -> None:
+    """プレビュー用ワーカーで manim を先に import しておく / Import manim up front in preview workers"""
+    import manim  # noqa: F401
+
+
+def _evict_local_modules() -> list[str]:
+    """
+    scripts/ 以下のモジュール（components, physics など）を sys.modules から外す
+    Drop modules under scripts/ (components, physics, ...) from sys.modules
+
+    常駐ワーカーはシーンのファイルしか読み直さないので、これをしないと
+    編集した部品の古いコードでプレビューしてしまう。レンダリングツール自身
+    （scripts/render/）は残す。
+    The resident worker only re-executes the scene file; without this a
+    preview would run the old code of an edited helper. The render tooling
+    itself (scripts/render/) is kept.
+    """
+    scripts_dir, render_dir = SCRIPTS_DIR.resolve(), (SCRIPTS_DIR / "render").resolve()
+    evicted = []
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path is None:
+            continue
+        path = Path(path).resolve()
+        if path.is_relative_to(scripts_dir) and not path.is_relative_to(render_dir):
+            del sys.modules[name]
+            evicted.append(name)
+    return evicted
+
+
+def _preview_render(job: RenderJob) -> RenderResult:
+    """ローカルのモジュールを読み直してからプレビューを描く / Preview render with local modules reloaded"""
+    _evict_local_modules()
+    return render_job(job)
+
+
+def _final_render(job: RenderJob, connection) -> None:
+    """バックグラウンドの本番レンダリング（子プロセス） / Background final render (child process)"""
+    os.nice(FINAL_NICENESS)
+    connection.send(render_job(job))
+    connection.close()
+
+
+def watched_files() -> dict:
+    """
+    監視対象のファイルと更新時刻
+    Watched files and their modification times
+
+    レンダリングツール自身（scripts/render/）は対象外。
+    The rendering tools themselves (scripts/render/) are excluded.
+    """
+    render_dir = SCRIPTS_DIR / "render"
+    files = [p for p in SCRIPTS_DIR.rglob("*.py") if render_dir not in p.parents]
+    if ASSETS_DIR.is_dir():
+        files += [p for p in ASSETS_DIR.rglob("*") if p.is_file()]
+    snapshot = {}
+    for path in files:
+        try:
+            snapshot[path] = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            continue
+    return snapshot
+
+
+@dataclass
+class FinalRender:
+    """
+    バックグラウンドの本番レンダリング1件
+    One background final render
+    """
+
+    job: RenderJob
+    scene_key: str
+    process: multiprocessing.Process | None = None
+    connection: object = None
+
+
+class WatchDaemon:
+    """
+    ファイルを監視してプレビューと本番レンダリングを回すデーモン
+    Daemon that watches files and drives preview and final renders
+    """
+
+    def __init__(
+        self,
+        names=None,
+        final_quality: str = "h",
+        interval: float = 0.5,
+        preview_workers: int = 1,
+        final_workers: int = 1,
+    ):
+        self.names = names
+        self.final_quality = final_quality
+        self.interval = interval
+        self.preview_workers = preview_workers
+        self.final_workers = final_workers
+        self.cache = SceneCache()
+        self.entries: dict[str, SceneEntry] = {}
+        self.keys: dict[str, str] = {}
+        self.previews = {}  # scene -> (future, key)
+        self.queued: dict[str, FinalRender] = {}
+        self.running: dict[str, FinalRender] = {}
+
+    def scan(self) -> list[SceneEntry]:
+        """
+        キーが変わったシーンを返し、記録を更新する
+        Return scenes whose key changed and update the record
+        """
+        entries = {e.key: e for e in discover_scenes(names=self.names)}
+        keys = {name: scene_key(entry, "l") for name, entry in entries.items()}
+        changed = [entries[name] for name, key in keys.items() if self.keys.get(name) != key]
+        self.entries, self.keys = entries, keys
+        return changed
+
+    def cancel_stale(self, name: str) -> None:
+        """古くなった本番ジョブを取り消す / Cancel a stale final job"""
+        if self.queued.pop(name, None) is not None:
+            print(f"  dropped queued final render of {name}")
+        final = self.running.pop(name, None)
+        if final is not None:
+            final.process.terminate()
+            final.process.join()
+            print(f"  cancelled running final render of {name}")
+
+    def submit_preview(self, pool, entry: SceneEntry) -> None:
+        job = make_job(entry, "l")
+        self.previews[entry.key] = (pool.submit(_preview_render, job), self.keys[entry.key])
+        print(f"  preview: {entry.key}")
+
+    def collect_previews(self) -> None:
+        """終わったプレビューを回収し、成功したものの本番を積む / Collect previews and queue finals"""
+        for name, (future, key) in list(self.previews.items()):
+            if not future.done():
+                continue
+            del self.previews[name]
+            result: RenderResult = future.result()
+            if key != self.keys.get(name):
+                continue  # 実行中にまた変更された / changed again while rendering
+            if not result.ok:
+                print(f"  preview FAILED: {name}\n{result.error}")
+                continue
+            self.cache.store(key, result.output)
+            print(f"  preview ready: {result.output} ({result.wall_time:.1f}s)")
+            entry = self.entries[name]
+            final_key = scene_key(entry, self.final_quality)
+            if self.cache.lookup(final_key) is None:
+                self.queued[name] = FinalRender(make_job(entry, self.final_quality), final_key)
+
+    def reap_finals(self) -> None:
+        """終わった本番レンダリングを回収する / Collect finished final renders"""
+        for name, final in list(self.running.items()):
+            # 結果を先に受け取る（子はパイプへの送信が終わるまで終了できない）
+            # Receive first (the child cannot exit until its send completes)
+            if final.connection.poll():
+                result: RenderResult = final.connection.recv()
+            elif final.process.is_alive():
+                continue
+            else:
+                result = None
+            final.process.join()
+            del self.running[name]
+            if result is None:
+                print(f"  final render of {name} exited without a result")
+                continue
+            if result.ok:
+                self.cache.store(final.scene_key, result.output)
+                print(f"  final ready: {result.output} ({result.wall_time:.1f}s)")
+            else:
+                print(f"  final FAILED: {name}\n{result.error}")
+
+    def start_finals(self) -> None:
+        """空きがあれば待ち行列の本番レンダリングを始める / Start queued finals when slots are free"""
+        while self.queued and len(self.running) < self.final_workers:
+            name = next(iter(self.queued))
+            final = self.queued.pop(name)
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            final.process = multiprocessing.Process(target=_final_render, args=(final.job, sender), daemon=True)
+            final.connection = receiver
+            final.process.start()
+            sender.close()
+            self.running[name] = final
+            print(f"  final (-q{self.final_quality}) started in background: {name}")
+
+    def run(self) -> None:
+        """Ctrl-C で止めるまで監視を続ける / Watch until interrupted with Ctrl-C"""
+        snapshot = watched_files()
+        self.scan()
+        print(f"Watching {len(snapshot)} files, {len(self.entries)} scenes (Ctrl-C to stop)")
+        with ProcessPoolExecutor(max_workers=self.preview_workers, initializer=_warm_up) as pool:
+            try:
+                while True:
+                    current = watched_files()
+                    if current != snapshot:
+                        snapshot = current
+                        for entry in self.scan():
+                            self.cancel_stale(entry.key)
+                            self.submit_preview(pool, entry)
+                    self.collect_previews()
+                    self.reap_finals()
+                    self.start_finals()
+                    time.sleep(self.interval)
+            except KeyboardInterrupt:
+                print("Stopping")
+            finally:
+                for name in list(self.running):
+                    self.cancel_stale(name)
@@ -0,0 +1,265 @@
+"""
+1シーンをプロセス内でレンダリングするワーカー
+Worker that renders a single scene in-process
+
+`manim -pql scripts/<file>.py <Class>` と同じ結果を、コマンドを起動せずに得る。
+プロセスプールの各ワーカーから呼ばれる。
+
+Produces the same result as `manim -pql scripts/<file>.py <Class>` without
+spawning the CLI. Called from each worker of the process pool.
+"""
+
+import importlib.util
+import os
+import shutil
+import sys
+import time
+import traceback
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from . import play_cache
+from .registry import MEDIA_DIR, REPO_ROOT
+
+# 品質フラグ（-ql / -qm / -qh / -qp / -qk の文字）
+# Quality flags (the letter of -ql / -qm / -qh / -qp / -qk)
+QUALITY_FLAGS = ("l", "m", "h", "p", "k")
+
+
+@dataclass
+class RenderJob:
+    """
+    レンダリング要求
+    A render request
+    """
+
+    module_path: str  # リポジトリからの相対パス / Path relative to the repo
+    class_name: str
+    quality: str = "l"
+    config: dict = field(default_factory=dict)
+
+    @property
+    def path(self) -> Path:
+        """スクリプトの絶対パス / Absolute path of the script"""
+        return REPO_ROOT / self.module_path
+
+    @property
+    def key(self) -> str:
+        return f"{self.path.stem}.{self.class_name}"
+
+
+@dataclass
+class RenderResult:
+    """
+    レンダリング結果
+    Result of a render
+    """
+
+    key: str
+    quality: str
+    output: str | None
+    wall_time: float
+    ok: bool
+    error: str | None = None
+    cached: bool = False
+    segments: list[str] = field(default_factory=list)  # 部分動画の絶対パス / Absolute paths of the partial movies
+    reused: int = 0  # キャッシュから再利用した部分動画の数 / Partial movies reused from the cache
+
+    def report_reuse(self) -> None:
+        """
+        結合のパスで全ての play がキャッシュにヒットしたかを表示する
+        Report whether every play hit the cache during an assembly pass
+        """
+        if not self.ok:
+            return
+        drawn = len(self.segments) - self.reused
+        if drawn:
+            print(f"  warning: {self.key}: assembly re-rendered {drawn} of {len(self.segments)} plays")
+        else:
+            print(f"  {self.key}: all {len(self.segments)} plays reused from the cache")
+
+
+def load_scene_module(module_path: Path):
+    """
+    シーンのスクリプトを新しいモジュールとして読み込む
+    Load a scene script as a fresh module
+
+    manim の CLI と同じく scripts/ を sys.path に追加するので、
+    スクリプト側は兄弟モジュールをそのまま import できる。
+    Like the manim CLI, scripts/ is put on sys.path so the scripts can
+    import sibling modules directly.
+    """
+    module_path = Path(module_path).resolve()
+    if str(module_path.parent) not in sys.path:
+        sys.path.insert(0, str(module_path.parent))
+    spec = importlib.util.spec_from_file_location(module_path.stem, module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_path.stem] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def quality_config(quality: str) -> dict:
+    """
+    品質フラグを manim の設定値に変換する
+    Translate a quality flag into manim config values
+    """
+    from manim.constants import QUALITIES
+
+    for preset in QUALITIES.values():
+        if preset["flag"] == quality:
+            return {
+                "pixel_height": preset["pixel_height"],
+                "pixel_width": preset["pixel_width"],
+                "frame_rate": preset["frame_rate"],
+            }
+    raise ValueError(f"Unknown quality flag: {quality!r} (expected one of {QUALITY_FLAGS})")
+
+
+def job_config(job: RenderJob) -> dict:
+    """
+    ジョブに対応する manim の一時設定
+    Temporary manim config for a job
+    """
+    return {
+        **quality_config(job.quality),
+        "input_file": str(job.path),
+        "media_dir": str(MEDIA_DIR),
+        "preview": False,
+        "write_to_movie": True,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+        **play_cache.PLAY_CACHE_CONFIG,
+        **job.config,
+    }
+
+
+def partial_movie_dir(job: RenderJob) -> Path:
+    """
+    ジョブの部分動画（play ごとの動画）が置かれるディレクトリ
+    Directory holding the partial (per-play) movies of a job
+
+    manim の既定の partial_movie_dir と同じ場所を、manim の設定に触れずに求める。
+    Same location as manim's default partial_movie_dir, computed without
+    touching manim's config.
+    """
+    quality = quality_config(job.quality)
+    quality_dir = f"{quality['pixel_height']}p{quality['frame_rate']}"
+    return MEDIA_DIR / "videos" / job.path.stem / quality_dir / "partial_movie_files" / job.class_name
+
+
+def link_partial_movies(segments, job: RenderJob) -> int:
+    """
+    部分動画をジョブ本来の partial_movie_dir にハードリンクする（できなければコピー）
+    Hard-link partial movies into the job's own partial_movie_dir (copy if linking fails)
+
+    manim は output_file を指定すると部分動画のディレクトリ名も output_file に
+    するので、output_file を変えたレンダリング（区間ごとなど）の部分動画は
+    そのままでは結合のパスから見えない。
+    manim names the partial movie directory after output_file when it is set,
+    so segments of renders with their own output_file (per section, say) are
+    invisible to the assembly pass until they are linked here.
+
+    Returns:
+        新しく置いたファイル数
+    """
+    target_dir = partial_movie_dir(job)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    placed = 0
+    for source in map(Path, segments):
+        target = target_dir / source.name
+        if target.exists() or source.parent == target_dir:
+            continue
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+        placed += 1
+    return placed
+
+
+def relative_to_repo(path) -> str:
+    """リポジトリからの相対パス（外なら絶対パス） / Path relative to the repo (absolute if outside)"""
+    path = Path(path).resolve()
+    try:
+        return str(path.relative_to(REPO_ROOT))
+    except ValueError:
+        return str(path)
+
+
+def with_mixins(scene_cls, mixins=()):
+    """
+    シーンクラスにミックスインを被せた派生クラスを作る
+    Derive a scene class with mixins layered on top
+
+    クラス名は元のままなので、出力ファイル名も変わらない。
+    The class name is kept, so output file names stay the same.
+    """
+    if not mixins:
+        return scene_cls
+    namespace = {"__module__": scene_cls.__module__, "__doc__": scene_cls.__doc__}
+    return type(scene_cls.__name__, (*mixins, scene_cls), namespace)
+
+
+@contextmanager
+def scene_for(job: RenderJob, mixins=(), **scene_kwargs):
+    """
+    ジョブの設定を適用した状態でシーンのインスタンスを作る
+    Instantiate the scene of a job with the job's config applied
+
+    with ブロックを抜けるまで manim の設定はジョブのものになっている。
+    manim's config stays set to the job's values until the block exits.
+    """
+    from manim import tempconfig
+
+    config = job_config(job)
+    if not config["disable_caching"]:
+        play_cache.install()
+        mixins = (play_cache.ChainedPlayCache, *mixins)
+    with tempconfig(config):
+        module = load_scene_module(job.path)
+        scene_cls = with_mixins(getattr(module, job.class_name), mixins)
+        yield scene_cls(**scene_kwargs)
+
+
+def render_job(job: RenderJob, mixins=()) -> RenderResult:
+    """
+    ジョブを1つレンダリングする
+    Render one job
+
+    Args:
+        job: レンダリング要求
+        mixins: シーンクラスに被せるミックスイン（フック用、省略可）
+
+    Returns:
+        RenderResult（失敗しても例外は投げず ok=False で返す）
+    """
+    start = time.perf_counter()
+    started = time.time()
+    try:
+        with scene_for(job, mixins) as scene:
+            scene.render()
+            writer = scene.renderer.file_writer
+            output = relative_to_repo(writer.movie_file_path)
+            segments = [str(Path(p).resolve()) for p in writer.partial_movie_files if p is not None]
+        # 開始前からあった部分動画はキャッシュのヒット / Segments older than the render were cache hits
+        reused = sum(1 for p in segments if Path(p).exists() and Path(p).stat().st_mtime < started)
+    except Exception:
+        return RenderResult(
+            key=job.key,
+            quality=job.quality,
+            output=None,
+            wall_time=time.perf_counter() - start,
+            ok=False,
+            error=traceback.format_exc(),
+        )
+    return RenderResult(
+        key=job.key,
+        quality=job.quality,
+        output=output,
+        wall_time=time.perf_counter() - start,
+        ok=True,
+        segments=segments,
+        reused=reused,
+    )
@@ -15,6 +15,8 @@ yt_script.md L133-140 の解説用
 
 from manim import *
 
+from components import cached_text
+
 
 class RiemannCurvatureIntro(Scene):
     """
@@ -27,8 +29,8 @@ class RiemannCurvatureIntro(Scene):
 
     def construct(self):
         # ===== タイトル =====
-        title = Text("リーマン曲率", font_size=40)
-        title_en = Text("Riemann Curvature", font_size=24, color=GRAY)
+        title = cached_text("リーマン曲率", font_size=40)
+        title_en = cached_text("Riemann Curvature", font_size=24, color=GRAY)
         title_group = VGroup(title, title_en).arrange(DOWN, buff=0.15)
         title_group.to_edge(UP, buff=0.8)
 
@@ -55,8 +57,8 @@ class RiemannCurvatureIntro(Scene):
         formula.move_to(ORIGIN)
 
         # ===== 補足テキスト =====
-        note = Text("19世紀にリーマンが考案", font_size=20, color=GRAY_B)
-        note_en = Text("Developed by Riemann in the 19th century", font_size=14, color=GRAY)
+        note = cached_text("19世紀にリーマンが考案", font_size=20, color=GRAY_B)
+        note_en = cached_text("Developed by Riemann in the 19th century", font_size=14, color=GRAY)
         note_group = VGroup(note, note_en).arrange(DOWN, buff=0.05)
         note_group.next_to(formula, DOWN, buff=0.8)
 
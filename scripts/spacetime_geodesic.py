@@ -15,6 +15,9 @@ L126「測地線」、L130「測地線偏差」への伏線
 from manim import *
 import numpy as np
 
+from components import cached_text
+from physics import great_circle, latlon_to_cartesian
+
 
 class SpacetimeGeodesicConvergence(Scene):
     """
@@ -24,8 +27,8 @@ class SpacetimeGeodesicConvergence(Scene):
 
     def construct(self):
         # ===== タイトル =====
-        title = Text("時空図で見る「まっすぐ」", font_size=28)
-        title_en = Text('"Straight" in Spacetime Diagram', font_size=18, color=GRAY)
+        title = cached_text("時空図で見る「まっすぐ」", font_size=28)
+        title_en = cached_text('"Straight" in Spacetime Diagram', font_size=18, color=GRAY)
         title_group = VGroup(title, title_en).arrange(DOWN, buff=0.1)
         title_group.to_edge(UP, buff=0.3)
 
@@ -44,8 +47,8 @@ class SpacetimeGeodesicConvergence(Scene):
             stroke_width=2,
             max_tip_length_to_length_ratio=0.05,
         )
-        time_label = Text("時間", font_size=16, color=WHITE)
-        time_label_en = Text("Time", font_size=12, color=GRAY)
+        time_label = cached_text("時間", font_size=16, color=WHITE)
+        time_label_en = cached_text("Time", font_size=12, color=GRAY)
         time_label_group = VGroup(time_label, time_label_en).arrange(DOWN, buff=0.05)
         time_label_group.next_to(time_axis.get_end(), RIGHT, buff=0.1)
 
@@ -57,8 +60,8 @@ class SpacetimeGeodesicConvergence(Scene):
             stroke_width=2,
             max_tip_length_to_length_ratio=0.05,
         )
-        space_label = Text("空間", font_size=16, color=WHITE)
-        space_label_en = Text("Space", font_size=12, color=GRAY)
+        space_label = cached_text("空間", font_size=16, color=WHITE)
+        space_label_en = cached_text("Space", font_size=12, color=GRAY)
         space_label_group = VGroup(space_label, space_label_en).arrange(DOWN, buff=0.05)
         space_label_group.next_to(space_axis.get_end(), DOWN, buff=0.1)
 
@@ -111,13 +114,13 @@ class SpacetimeGeodesicConvergence(Scene):
         )
 
         # ===== 「まっすぐ」であることを示すラベル =====
-        straight_label1 = Text("まっすぐ", font_size=14, color=RED_A)
-        straight_label1_en = Text("Straight", font_size=10, color=RED_A)
+        straight_label1 = cached_text("まっすぐ", font_size=14, color=RED_A)
+        straight_label1_en = cached_text("Straight", font_size=10, color=RED_A)
         straight_group1 = VGroup(straight_label1, straight_label1_en).arrange(DOWN, buff=0.02)
         straight_group1.next_to(worldline1.point_from_proportion(0.3), LEFT, buff=0.15)
 
-        straight_label2 = Text("まっすぐ", font_size=14, color=BLUE_A)
-        straight_label2_en = Text("Straight", font_size=10, color=BLUE_A)
+        straight_label2 = cached_text("まっすぐ", font_size=14, color=BLUE_A)
+        straight_label2_en = cached_text("Straight", font_size=10, color=BLUE_A)
         straight_group2 = VGroup(straight_label2, straight_label2_en).arrange(DOWN, buff=0.02)
         straight_group2.next_to(worldline2.point_from_proportion(0.3), RIGHT, buff=0.15)
 
@@ -132,8 +135,8 @@ class SpacetimeGeodesicConvergence(Scene):
         ball2.move_to(worldline2_path(0))
 
         # 初期状態の説明
-        initial_text = Text("2つの物体が離れた位置からスタート", font_size=18)
-        initial_text_en = Text("Two objects start at separate positions", font_size=14, color=GRAY)
+        initial_text = cached_text("2つの物体が離れた位置からスタート", font_size=18)
+        initial_text_en = cached_text("Two objects start at separate positions", font_size=14, color=GRAY)
         initial_group = VGroup(initial_text, initial_text_en).arrange(DOWN, buff=0.05)
         initial_group.to_edge(DOWN, buff=0.4)
 
@@ -147,8 +150,8 @@ class SpacetimeGeodesicConvergence(Scene):
 
         # ===== 世界線を描きながらボールが移動 =====
         # 「まっすぐ進んでいる」ことを強調
-        moving_text = Text("どちらも「まっすぐ」進んでいる", font_size=18, color=YELLOW)
-        moving_text_en = Text('Both are moving "straight"', font_size=14, color=YELLOW_A)
+        moving_text = cached_text("どちらも「まっすぐ」進んでいる", font_size=18, color=YELLOW)
+        moving_text_en = cached_text('Both are moving "straight"', font_size=14, color=YELLOW_A)
         moving_group = VGroup(moving_text, moving_text_en).arrange(DOWN, buff=0.05)
         moving_group.to_edge(DOWN, buff=0.4)
 
@@ -184,7 +187,7 @@ class SpacetimeGeodesicConvergence(Scene):
             max_tip_length_to_length_ratio=0.1,
             buff=0,
         )
-        initial_sep_label = Text("広い", font_size=14, color=GREEN_C)
+        initial_sep_label = cached_text("広い", font_size=14, color=GREEN_C)
         initial_sep_label.next_to(initial_sep_line, DOWN, buff=0.1)
 
         # 最終間隔（上部）
@@ -196,7 +199,7 @@ class SpacetimeGeodesicConvergence(Scene):
             max_tip_length_to_length_ratio=0.15,
             buff=0,
         )
-        final_sep_label = Text("狭い！", font_size=14, color=ORANGE)
+        final_sep_label = cached_text("狭い！", font_size=14, color=ORANGE)
         final_sep_label.next_to(final_sep_line, UP, buff=0.1)
 
         self.play(
@@ -209,8 +212,8 @@ class SpacetimeGeodesicConvergence(Scene):
         self.wait(0.5)
 
         # ===== パラドックスの提示 =====
-        paradox_text = Text("「まっすぐ」なのに間隔が縮む？", font_size=22, color=YELLOW)
-        paradox_text_en = Text('"Straight" yet the gap shrinks?', font_size=16, color=YELLOW_A)
+        paradox_text = cached_text("「まっすぐ」なのに間隔が縮む？", font_size=22, color=YELLOW)
+        paradox_text_en = cached_text('"Straight" yet the gap shrinks?', font_size=16, color=YELLOW_A)
         paradox_group = VGroup(paradox_text, paradox_text_en).arrange(DOWN, buff=0.08)
         paradox_group.to_edge(DOWN, buff=0.4)
 
@@ -218,8 +221,8 @@ class SpacetimeGeodesicConvergence(Scene):
         self.wait(1.0)
 
         # ===== 結論への伏線 =====
-        conclusion_text = Text("これが「時空の曲がり」の証拠", font_size=22, color=WHITE)
-        conclusion_text_en = Text("This is evidence of curved spacetime", font_size=16, color=GRAY)
+        conclusion_text = cached_text("これが「時空の曲がり」の証拠", font_size=22, color=WHITE)
+        conclusion_text_en = cached_text("This is evidence of curved spacetime", font_size=16, color=GRAY)
         conclusion_group = VGroup(conclusion_text, conclusion_text_en).arrange(DOWN, buff=0.08)
         conclusion_group.to_edge(DOWN, buff=0.4)
 
@@ -240,9 +243,9 @@ class SpacetimeGeodesicSimple(Scene):
         time_axis = Arrow(origin, origin + UP * 4, color=WHITE, stroke_width=2)
         space_axis = Arrow(origin + LEFT * 3, origin + RIGHT * 3, color=WHITE, stroke_width=2)
 
-        time_label = Text("時間 / Time", font_size=14, color=GRAY)
+        time_label = cached_text("時間 / Time", font_size=14, color=GRAY)
         time_label.next_to(time_axis.get_end(), RIGHT, buff=0.1)
-        space_label = Text("空間 / Space", font_size=14, color=GRAY)
+        space_label = cached_text("空間 / Space", font_size=14, color=GRAY)
         space_label.next_to(space_axis.get_end(), DOWN, buff=0.1)
 
         self.add(time_axis, space_axis, time_label, space_label)
@@ -287,15 +290,15 @@ class SpacetimeGeodesicSimple(Scene):
         )
 
         # ラベル
-        label1 = Text("まっすぐ", font_size=12, color=RED_A)
+        label1 = cached_text("まっすぐ", font_size=12, color=RED_A)
         label1.next_to(line1.get_center(), LEFT, buff=0.1)
-        label2 = Text("まっすぐ", font_size=12, color=BLUE_A)
+        label2 = cached_text("まっすぐ", font_size=12, color=BLUE_A)
         label2.next_to(line2.get_center(), RIGHT, buff=0.1)
 
         self.play(Write(label1), Write(label2), run_time=0.4)
 
         # 結論
-        conclusion = Text("「まっすぐ」なのに交わる", font_size=20, color=YELLOW)
+        conclusion = cached_text("「まっすぐ」なのに交わる", font_size=20, color=YELLOW)
         conclusion.to_edge(DOWN, buff=0.5)
         self.play(Write(conclusion))
         self.wait(1.5)
@@ -309,8 +312,8 @@ class SpacetimeGeodesicWithGeodesicLabel(Scene):
 
     def construct(self):
         # ===== タイトル =====
-        title = Text("時空図と測地線", font_size=28)
-        title_en = Text("Spacetime Diagram & Geodesics", font_size=18, color=GRAY)
+        title = cached_text("時空図と測地線", font_size=28)
+        title_en = cached_text("Spacetime Diagram & Geodesics", font_size=18, color=GRAY)
         title_group = VGroup(title, title_en).arrange(DOWN, buff=0.1)
         title_group.to_edge(UP, buff=0.3)
 
@@ -335,9 +338,9 @@ class SpacetimeGeodesicWithGeodesicLabel(Scene):
             max_tip_length_to_length_ratio=0.05,
         )
 
-        time_label = Text("時間 / Time", font_size=14, color=GRAY)
+        time_label = cached_text("時間 / Time", font_size=14, color=GRAY)
         time_label.next_to(time_axis.get_end(), RIGHT, buff=0.1)
-        space_label = Text("空間 / Space", font_size=14, color=GRAY)
+        space_label = cached_text("空間 / Space", font_size=14, color=GRAY)
         space_label.next_to(space_axis.get_end(), DOWN, buff=0.1)
 
         self.play(
@@ -389,8 +392,8 @@ class SpacetimeGeodesicWithGeodesicLabel(Scene):
         self.play(FadeIn(ball1, scale=0.5), FadeIn(ball2, scale=0.5), run_time=0.4)
 
         # 説明テキスト
-        explain1 = Text("自由落下する物体の軌道を", font_size=18)
-        explain1_en = Text("The path of a free-falling object", font_size=14, color=GRAY)
+        explain1 = cached_text("自由落下する物体の軌道を", font_size=18)
+        explain1_en = cached_text("The path of a free-falling object", font_size=14, color=GRAY)
         explain_group1 = VGroup(explain1, explain1_en).arrange(DOWN, buff=0.05)
         explain_group1.to_edge(DOWN, buff=0.4)
 
@@ -408,21 +411,21 @@ class SpacetimeGeodesicWithGeodesicLabel(Scene):
         )
 
         # 「測地線」という言葉を導入
-        explain2 = Text("「測地線」と呼びます", font_size=18, color=YELLOW)
-        explain2_en = Text('is called a "Geodesic"', font_size=14, color=YELLOW_A)
+        explain2 = cached_text("「測地線」と呼びます", font_size=18, color=YELLOW)
+        explain2_en = cached_text('is called a "Geodesic"', font_size=14, color=YELLOW_A)
         explain_group2 = VGroup(explain2, explain2_en).arrange(DOWN, buff=0.05)
         explain_group2.to_edge(DOWN, buff=0.4)
 
         self.play(Transform(explain_group1, explain_group2))
 
         # 測地線ラベル
-        geodesic_label1 = Text("測地線", font_size=14, color=RED_A)
-        geodesic_label1_en = Text("Geodesic", font_size=10, color=RED_A)
+        geodesic_label1 = cached_text("測地線", font_size=14, color=RED_A)
+        geodesic_label1_en = cached_text("Geodesic", font_size=10, color=RED_A)
         geodesic_group1 = VGroup(geodesic_label1, geodesic_label1_en).arrange(DOWN, buff=0.02)
         geodesic_group1.next_to(geodesic1.point_from_proportion(0.5), LEFT, buff=0.15)
 
-        geodesic_label2 = Text("測地線", font_size=14, color=BLUE_A)
-        geodesic_label2_en = Text("Geodesic", font_size=10, color=BLUE_A)
+        geodesic_label2 = cached_text("測地線", font_size=14, color=BLUE_A)
+        geodesic_label2_en = cached_text("Geodesic", font_size=10, color=BLUE_A)
         geodesic_group2 = VGroup(geodesic_label2, geodesic_label2_en).arrange(DOWN, buff=0.02)
         geodesic_group2.next_to(geodesic2.point_from_proportion(0.5), RIGHT, buff=0.15)
 
@@ -441,8 +444,8 @@ class SpacetimeGeodesicWithGeodesicLabel(Scene):
         convergence_arrow.move_to((geodesic1_path(0.85) + geodesic2_path(0.85)) / 2)
         convergence_arrow.scale(0.6)
 
-        convergence_label = Text("収束", font_size=14, color=ORANGE)
-        convergence_label_en = Text("Converging", font_size=10, color=ORANGE)
+        convergence_label = cached_text("収束", font_size=14, color=ORANGE)
+        convergence_label_en = cached_text("Converging", font_size=10, color=ORANGE)
         convergence_group = VGroup(convergence_label, convergence_label_en).arrange(DOWN, buff=0.02)
         convergence_group.next_to(convergence_arrow, UP, buff=0.1)
 
@@ -454,8 +457,8 @@ class SpacetimeGeodesicWithGeodesicLabel(Scene):
         self.wait(0.5)
 
         # 結論
-        conclusion = Text("2本の測地線の間隔が変化する", font_size=20, color=WHITE)
-        conclusion_en = Text("The separation between geodesics changes", font_size=14, color=GRAY)
+        conclusion = cached_text("2本の測地線の間隔が変化する", font_size=20, color=WHITE)
+        conclusion_en = cached_text("The separation between geodesics changes", font_size=14, color=GRAY)
         conclusion_group = VGroup(conclusion, conclusion_en).arrange(DOWN, buff=0.08)
         conclusion_group.to_edge(DOWN, buff=0.4)
 
@@ -463,8 +466,8 @@ class SpacetimeGeodesicWithGeodesicLabel(Scene):
         self.wait(0.5)
 
         # 測地線偏差への伏線
-        final = Text("→ これを「測地線偏差」と呼ぶ", font_size=20, color=YELLOW)
-        final_en = Text('→ This is called "Geodesic Deviation"', font_size=14, color=YELLOW_A)
+        final = cached_text("→ これを「測地線偏差」と呼ぶ", font_size=20, color=YELLOW)
+        final_en = cached_text('→ This is called "Geodesic Deviation"', font_size=14, color=YELLOW_A)
         final_group = VGroup(final, final_en).arrange(DOWN, buff=0.08)
         final_group.to_edge(DOWN, buff=0.4)
 
@@ -480,8 +483,8 @@ class SpacetimeGeodesicComparison(Scene):
 
     def construct(self):
         # ===== タイトル =====
-        title = Text("平坦な時空 vs 曲がった時空", font_size=26)
-        title_en = Text("Flat Spacetime vs Curved Spacetime", font_size=16, color=GRAY)
+        title = cached_text("平坦な時空 vs 曲がった時空", font_size=26)
+        title_en = cached_text("Flat Spacetime vs Curved Spacetime", font_size=16, color=GRAY)
         title_group = VGroup(title, title_en).arrange(DOWN, buff=0.1)
         title_group.to_edge(UP, buff=0.3)
 
@@ -522,7 +525,7 @@ class SpacetimeGeodesicComparison(Scene):
             stroke_width=3,
         )
 
-        flat_label = Text("平坦 / Flat", font_size=16, color=YELLOW)
+        flat_label = cached_text("平坦 / Flat", font_size=16, color=YELLOW)
         flat_label.next_to(left_center + UP * 1.2, UP, buff=0.1)
 
         # ===== 右側：曲がった時空 =====
@@ -559,7 +562,7 @@ class SpacetimeGeodesicComparison(Scene):
             stroke_width=3,
         )
 
-        curved_label = Text("曲がった / Curved", font_size=16, color=GREEN)
+        curved_label = cached_text("曲がった / Curved", font_size=16, color=GREEN)
         curved_label.next_to(right_center + UP * 1.2, UP, buff=0.1)
 
         # 区切り線
@@ -623,13 +626,13 @@ class SpacetimeGeodesicComparison(Scene):
         )
 
         # 結果ラベル
-        result_flat = Text("平行のまま", font_size=14, color=YELLOW)
-        result_flat_en = Text("Stay parallel", font_size=10, color=YELLOW_A)
+        result_flat = cached_text("平行のまま", font_size=14, color=YELLOW)
+        result_flat_en = cached_text("Stay parallel", font_size=10, color=YELLOW_A)
         result_flat_group = VGroup(result_flat, result_flat_en).arrange(DOWN, buff=0.02)
         result_flat_group.next_to(flat_line1.get_end(), RIGHT, buff=0.3)
 
-        result_curved = Text("収束！", font_size=14, color=GREEN)
-        result_curved_en = Text("Converge!", font_size=10, color=GREEN_A)
+        result_curved = cached_text("収束！", font_size=14, color=GREEN)
+        result_curved_en = cached_text("Converge!", font_size=10, color=GREEN_A)
         result_curved_group = VGroup(result_curved, result_curved_en).arrange(DOWN, buff=0.02)
         result_curved_group.next_to(
             (curved_line1.get_end() + curved_line2.get_end()) / 2,
@@ -645,8 +648,8 @@ class SpacetimeGeodesicComparison(Scene):
         self.wait(0.5)
 
         # 結論
-        conclusion = Text("時空の曲がりが測地線を収束させる", font_size=20, color=WHITE)
-        conclusion_en = Text("Spacetime curvature makes geodesics converge", font_size=14, color=GRAY)
+        conclusion = cached_text("時空の曲がりが測地線を収束させる", font_size=20, color=WHITE)
+        conclusion_en = cached_text("Spacetime curvature makes geodesics converge", font_size=14, color=GRAY)
         conclusion_group = VGroup(conclusion, conclusion_en).arrange(DOWN, buff=0.08)
         conclusion_group.to_edge(DOWN, buff=0.4)
 
@@ -668,8 +671,8 @@ class GeodesicShortestPath3D(ThreeDScene):
         self.set_camera_orientation(phi=70 * DEGREES, theta=-45 * DEGREES)
 
         # ===== タイトル（固定テキスト）=====
-        title = Text("測地線 = 最短経路", font_size=32)
-        title_en = Text("Geodesic = Shortest Path", font_size=20, color=GRAY)
+        title = cached_text("測地線 = 最短経路", font_size=32)
+        title_en = cached_text("Geodesic = Shortest Path", font_size=20, color=GRAY)
         title_group = VGroup(title, title_en).arrange(DOWN, buff=0.1)
         title_group.to_corner(UL, buff=0.3)
         self.add_fixed_in_frame_mobjects(title_group)
@@ -706,22 +709,15 @@ class GeodesicShortestPath3D(ThreeDScene):
         lat_A, lon_A = 40 * DEGREES, -70 * DEGREES
         lat_B, lon_B = -30 * DEGREES, 10 * DEGREES
 
-        def spherical_to_cartesian(lat, lon, r=sphere_radius):
-            return np.array([
-                r * np.cos(lat) * np.cos(lon),
-                r * np.cos(lat) * np.sin(lon),
-                r * np.sin(lat),
-            ])
-
-        point_A = spherical_to_cartesian(lat_A, lon_A)
-        point_B = spherical_to_cartesian(lat_B, lon_B)
+        point_A = latlon_to_cartesian(lat_A, lon_A, sphere_radius)
+        point_B = latlon_to_cartesian(lat_B, lon_B, sphere_radius)
 
         dot_A = Sphere(radius=0.12, color=RED_C).move_to(point_A)
         dot_B = Sphere(radius=0.12, color=GREEN_C).move_to(point_B)
 
         # ラベルをフレームに固定して左下に配置
-        label_info = Text("A → B への経路を比較", font_size=16, color=WHITE)
-        label_info_en = Text("Comparing paths from A to B", font_size=12, color=GRAY)
+        label_info = cached_text("A → B への経路を比較", font_size=16, color=WHITE)
+        label_info_en = cached_text("Comparing paths from A to B", font_size=12, color=GRAY)
         label_group = VGroup(label_info, label_info_en).arrange(DOWN, buff=0.05)
         label_group.to_corner(DL, buff=0.3)
         self.add_fixed_in_frame_mobjects(label_group)
@@ -734,16 +730,18 @@ class GeodesicShortestPath3D(ThreeDScene):
         )
         self.wait(0.3)
 
+        # 両方の経路は同じ割合の標本から配列でまとめて作る
+        # Both paths are sampled as whole arrays over the same fractions
+        path_samples = np.linspace(0, 1, 101)
+
         # ===== 緯度線に沿った経路（非最短）=====
-        latitude_path = ParametricFunction(
-            lambda t: spherical_to_cartesian(lat_A, lon_A + t * (lon_B - lon_A)),
-            t_range=[0, 1],
-            color=YELLOW,
-            stroke_width=4,
+        latitude_path = VMobject(color=YELLOW, stroke_width=4)
+        latitude_path.set_points_smoothly(
+            latlon_to_cartesian(lat_A, lon_A + path_samples * (lon_B - lon_A), sphere_radius)
         )
 
-        not_shortest_label = Text("緯度線に沿った経路", font_size=18, color=YELLOW)
-        not_shortest_label_en = Text("Path along latitude", font_size=12, color=YELLOW_A)
+        not_shortest_label = cached_text("緯度線に沿った経路", font_size=18, color=YELLOW)
+        not_shortest_label_en = cached_text("Path along latitude", font_size=12, color=YELLOW_A)
         not_shortest_group = VGroup(not_shortest_label, not_shortest_label_en).arrange(DOWN, buff=0.05)
         not_shortest_group.to_corner(UR, buff=0.3)
         self.add_fixed_in_frame_mobjects(not_shortest_group)
@@ -756,26 +754,13 @@ class GeodesicShortestPath3D(ThreeDScene):
         self.wait(0.5)
 
         # ===== 大圏コース（測地線・最短経路）=====
-        def great_circle_path(t, p1, p2):
-            """2点間の大圏に沿った補間（球面線形補間）"""
-            omega = np.arccos(np.clip(np.dot(p1, p2) / (np.linalg.norm(p1) * np.linalg.norm(p2)), -1, 1))
-            if omega < 1e-6:
-                return p1
-            return (np.sin((1 - t) * omega) * p1 + np.sin(t * omega) * p2) / np.sin(omega)
-
-        p1_norm = point_A / np.linalg.norm(point_A)
-        p2_norm = point_B / np.linalg.norm(point_B)
-
-        great_circle = ParametricFunction(
-            lambda t: sphere_radius * great_circle_path(t, p1_norm, p2_norm),
-            t_range=[0, 1],
-            color=ORANGE,
-            stroke_width=5,
-        )
+        # 球面線形補間（slerp）で全標本を一度に求める / Slerp all samples at once
+        great_circle_curve = VMobject(color=ORANGE, stroke_width=5)
+        great_circle_curve.set_points_smoothly(great_circle(point_A, point_B, path_samples))
 
         # ラベル更新
-        shortest_label = Text("大圏コース（測地線）", font_size=18, color=ORANGE)
-        shortest_label_en = Text("Great circle (Geodesic)", font_size=12, color=ORANGE)
+        shortest_label = cached_text("大圏コース（測地線）", font_size=18, color=ORANGE)
+        shortest_label_en = cached_text("Great circle (Geodesic)", font_size=12, color=ORANGE)
         shortest_group = VGroup(shortest_label, shortest_label_en).arrange(DOWN, buff=0.05)
         shortest_group.to_corner(UR, buff=0.3)
         self.add_fixed_in_frame_mobjects(shortest_group)
@@ -786,7 +771,7 @@ class GeodesicShortestPath3D(ThreeDScene):
             run_time=0.4,
         )
         self.play(
-            Create(great_circle),
+            Create(great_circle_curve),
             FadeIn(shortest_group),
             run_time=1.5,
         )
@@ -796,8 +781,8 @@ class GeodesicShortestPath3D(ThreeDScene):
         self.wait(0.3)
 
         # ===== 説明テキスト =====
-        explain1 = Text("北に膨らんで見えるけど...", font_size=20, color=WHITE)
-        explain1_en = Text("Looks curved northward, but...", font_size=14, color=GRAY)
+        explain1 = cached_text("北に膨らんで見えるけど...", font_size=20, color=WHITE)
+        explain1_en = cached_text("Looks curved northward, but...", font_size=14, color=GRAY)
         explain_group1 = VGroup(explain1, explain1_en).arrange(DOWN, buff=0.05)
         explain_group1.to_edge(DOWN, buff=0.4)
         self.add_fixed_in_frame_mobjects(explain_group1)
@@ -805,8 +790,8 @@ class GeodesicShortestPath3D(ThreeDScene):
         self.play(Write(explain_group1), run_time=0.6)
         self.wait(0.8)
 
-        explain2 = Text("これが最短経路！", font_size=24, color=ORANGE)
-        explain2_en = Text("This IS the shortest path!", font_size=16, color=ORANGE)
+        explain2 = cached_text("これが最短経路！", font_size=24, color=ORANGE)
+        explain2_en = cached_text("This IS the shortest path!", font_size=16, color=ORANGE)
         explain_group2 = VGroup(explain2, explain2_en).arrange(DOWN, buff=0.05)
         explain_group2.to_edge(DOWN, buff=0.4)
         self.add_fixed_in_frame_mobjects(explain_group2)
@@ -819,8 +804,8 @@ class GeodesicShortestPath3D(ThreeDScene):
         self.wait(0.8)
 
         # ===== 結論 =====
-        conclusion = Text("曲がった空間での「まっすぐ」= 測地線", font_size=22, color=WHITE)
-        conclusion_en = Text('"Straight" in curved space = Geodesic', font_size=14, color=GRAY)
+        conclusion = cached_text("曲がった空間での「まっすぐ」= 測地線", font_size=22, color=WHITE)
+        conclusion_en = cached_text('"Straight" in curved space = Geodesic', font_size=14, color=GRAY)
         conclusion_group = VGroup(conclusion, conclusion_en).arrange(DOWN, buff=0.08)
         conclusion_group.to_edge(DOWN, buff=0.4)
         self.add_fixed_in_frame_mobjects(conclusion_group)
@@ -6,6 +6,10 @@
 """
 
 from manim import *
+import numpy as np
+
+from components import InfallBody, cached_text
+from physics import infall_table, tidal_tensor
 
 
 class Spaghettification(Scene):
@@ -13,8 +17,8 @@ class Spaghettification(Scene):
 
     def construct(self):
         # タイトル
-        title = Text("スパゲッティ化", font_size=48)
-        subtitle = Text("Spaghettification", font_size=24, color=GRAY)
+        title = cached_text("スパゲッティ化", font_size=48)
+        subtitle = cached_text("Spaghettification", font_size=24, color=GRAY)
         subtitle.next_to(title, DOWN, buff=0.3)
         title_group = VGroup(title, subtitle)
         title_group.to_edge(UP)
@@ -32,7 +36,7 @@ class Spaghettification(Scene):
             color=ORANGE,
             fill_opacity=0.3,
         )
-        bh_label = Text("ブラックホール", font_size=20)
+        bh_label = cached_text("ブラックホール", font_size=20)
         bh_group = VGroup(black_hole, accretion_disk)
         bh_group.move_to(RIGHT * 4)
         bh_label.next_to(bh_group, DOWN)
@@ -45,14 +49,17 @@ class Spaghettification(Scene):
         self.wait(0.5)
 
         # 人型を作成（楕円体として表現）
+        # 足をブラックホールに向けて横たえる（頭から足が落下の向き＝動径方向）
         person = self.create_person()
+        person.rotate(PI / 2)
         person.move_to(LEFT * 4)
+        toward_hole = normalize(bh_group.get_center() - person.get_center())
 
         self.play(FadeIn(person))
         self.wait(0.5)
 
         # 潮汐力の説明テキスト
-        tidal_text = Text(
+        tidal_text = cached_text(
             "頭と足で重力の強さが違う",
             font_size=24,
         )
@@ -61,7 +68,7 @@ class Spaghettification(Scene):
         self.wait(1)
 
         # 潮汐力を示す矢印を追加
-        arrows, labels = self.create_tidal_arrows(person)
+        arrows, labels = self.create_tidal_arrows(person, toward_hole)
         self.play(
             *[GrowArrow(arrow) for arrow in arrows],
             *[FadeIn(label) for label in labels],
@@ -69,7 +76,7 @@ class Spaghettification(Scene):
         self.wait(1)
 
         # 説明を更新
-        stretch_text = Text(
+        stretch_text = cached_text(
             "→ 体が引き伸ばされる！",
             font_size=24,
         )
@@ -79,8 +86,15 @@ class Spaghettification(Scene):
 
         # スパゲッティ化アニメーション
         # 人がブラックホールに近づきながら引き伸ばされる
+        # （事象の地平面の半径 2M が円の半径になる質量で、落下中の潮汐の表を使う。
+        #   頭から足の向きが動径方向なので、体は落下の向きに伸びて横に縮む）
+        bh_center = bh_group.get_center()
+        start_radius = float(np.linalg.norm(person.get_center() - bh_center))
+        stretch = infall_table(mass=black_hole.radius / 2, start_radius=start_radius, end_radius=2.0)
+        falling = InfallBody(person, stretch, bh_center)
+
         self.play(
-            person.animate.move_to(RIGHT * 0.5).stretch(3, 1).stretch(0.3, 0),
+            falling.fall(to_radius=3.5),
             *[FadeOut(arrow) for arrow in arrows],
             *[FadeOut(label) for label in labels],
             run_time=3,
@@ -89,7 +103,7 @@ class Spaghettification(Scene):
 
         # さらに引き伸ばし
         self.play(
-            person.animate.move_to(RIGHT * 2).stretch(2, 1).stretch(0.5, 0),
+            falling.fall(to_radius=2.0),
             run_time=2,
         )
         self.wait(0.5)
@@ -102,7 +116,7 @@ class Spaghettification(Scene):
         self.wait(0.5)
 
         # 結論テキスト
-        conclusion = Text(
+        conclusion = cached_text(
             "これが「スパゲッティ化」です",
             font_size=28,
             color=YELLOW,
@@ -131,29 +145,29 @@ class Spaghettification(Scene):
         person = VGroup(head, body, left_arm, right_arm, left_leg, right_leg)
         return person
 
-    def create_tidal_arrows(self, person: VGroup) -> tuple[list, list]:
-        """潮汐力を示す矢印を作成"""
-        # 頭を上に引っ張る力（ブラックホールから遠ざかる方向）
-        head_pos = person.get_top()
+    def create_tidal_arrows(self, person: VGroup, toward_hole: np.ndarray) -> tuple[list, list]:
+        """潮汐力を示す矢印を作成（toward_hole: ブラックホールへの単位ベクトル）"""
+        # 頭を引っ張る力（ブラックホールから遠ざかる方向）
+        head_pos = person.get_edge_center(-toward_hole)
         head_arrow = Arrow(
             head_pos,
-            head_pos + UP * 0.8,
+            head_pos - toward_hole * 0.8,
             color=RED,
             stroke_width=4,
         )
-        head_label = Text("弱い重力", font_size=16, color=RED)
+        head_label = cached_text("弱い重力", font_size=16, color=RED)
         head_label.next_to(head_arrow, UP, buff=0.1)
 
-        # 足を下に引っ張る力（ブラックホールに近い＝強い重力）
-        foot_pos = person.get_bottom()
+        # 足を引っ張る力（ブラックホールに近い＝強い重力）
+        foot_pos = person.get_edge_center(toward_hole)
         foot_arrow = Arrow(
             foot_pos,
-            foot_pos + DOWN * 0.8,
+            foot_pos + toward_hole * 0.8,
             color=RED,
             stroke_width=4,
         )
-        foot_label = Text("強い重力", font_size=16, color=RED)
-        foot_label.next_to(foot_arrow, DOWN, buff=0.1)
+        foot_label = cached_text("強い重力", font_size=16, color=RED)
+        foot_label.next_to(foot_arrow, UP, buff=0.1)
 
         arrows = [head_arrow, foot_arrow]
         labels = [head_label, foot_label]
@@ -192,14 +206,20 @@ class SpaghettificationBall(Scene):
         self.wait(0.3)
 
         # 説明テキスト
-        text = Text("ボールがブラックホールに近づくと...", font_size=24)
+        text = cached_text("ボールがブラックホールに近づくと...", font_size=24)
         text.to_edge(UP)
         self.play(Write(text))
         self.wait(0.5)
 
+        # 落下中の引き伸ばしの表（事象の地平面 2M = 1.0 まで）
+        bh_center = bh_group.get_center()
+        start_radius = float(np.linalg.norm(ball.get_center() - bh_center))
+        stretch = infall_table(mass=0.5, start_radius=start_radius, end_radius=1.0)
+        falling = InfallBody(ball, stretch, bh_center)
+
         # フェーズ1: ボールが近づき始める（少し引き伸ばし開始）
         self.play(
-            ball.animate.move_to(LEFT * 2).stretch(1.3, 0).stretch(0.85, 1),
+            falling.fall(to_radius=6.5),
             run_time=1.5,
         )
 
@@ -217,7 +237,7 @@ class SpaghettificationBall(Scene):
             stroke_width=3,
         )
 
-        text2 = Text("潮汐力で引き伸ばされる", font_size=24)
+        text2 = cached_text("潮汐力で引き伸ばされる", font_size=24)
         text2.to_edge(UP)
         self.play(
             Transform(text, text2),
@@ -228,7 +248,7 @@ class SpaghettificationBall(Scene):
 
         # フェーズ2: さらに近づいて引き伸ばされる
         self.play(
-            ball.animate.move_to(RIGHT * 0.5).stretch(2.0, 0).stretch(0.5, 1),
+            falling.fall(to_radius=4.0),
             arrow_towards.animate.move_to(RIGHT * 2),
             arrow_away.animate.move_to(LEFT * 0.5),
             run_time=2,
@@ -239,10 +259,10 @@ class SpaghettificationBall(Scene):
         self.play(FadeOut(arrow_towards), FadeOut(arrow_away))
 
         # フェーズ3: スパゲッティ状に引き伸ばされる
-        text3 = Text("スパゲッティのように！", font_size=24, color=YELLOW)
+        text3 = cached_text("スパゲッティのように！", font_size=24, color=YELLOW)
         text3.to_edge(UP)
         self.play(
-            ball.animate.move_to(RIGHT * 2.5).stretch(3.0, 0).stretch(0.3, 1),
+            falling.fall(to_radius=2.0),
             Transform(text, text3),
             run_time=2,
         )
@@ -251,9 +271,8 @@ class SpaghettificationBall(Scene):
         # フェーズ4: 事象の地平面に到達して吸い込まれる
         # ブラックホール中心は RIGHT * 4.5、半径1.0 なので事象の地平面は RIGHT * 3.5
         self.play(
-            ball.animate.move_to(RIGHT * 3.5).stretch(1.5, 0).stretch(0.5, 1),
+            falling.fall(to_radius=1.0),
             run_time=1.5,
-            rate_func=rate_functions.ease_in_cubic,
         )
 
         # 事象の地平面で消える
@@ -264,7 +283,7 @@ class SpaghettificationBall(Scene):
         )
 
         # 結論
-        conclusion = Text("これがスパゲッティ化", font_size=28, color=GREEN)
+        conclusion = cached_text("これがスパゲッティ化", font_size=28, color=GREEN)
         conclusion.to_edge(UP)
         self.play(Transform(text, conclusion))
         self.wait(2)
@@ -275,7 +294,7 @@ class SpaghettificationEarth(Scene):
 
     def construct(self):
         # タイトル
-        title = Text("地球でも同じことが起きている！", font_size=36)
+        title = cached_text("地球でも同じことが起きている！", font_size=36)
         title.to_edge(UP)
         self.play(Write(title))
         self.wait(0.5)
@@ -283,7 +302,7 @@ class SpaghettificationEarth(Scene):
         # 地球
         earth = Circle(radius=2, color=BLUE, fill_opacity=0.6)
         earth.set_stroke(color=GREEN, width=3)
-        earth_label = Text("地球", font_size=20)
+        earth_label = cached_text("地球", font_size=20)
         earth_label.next_to(earth, DOWN)
         earth.move_to(DOWN * 2)
         earth_label.next_to(earth, DOWN)
@@ -298,8 +317,8 @@ class SpaghettificationEarth(Scene):
         self.wait(0.5)
 
         # 重力の差を示す
-        head_text = Text("頭: 地球から少し遠い", font_size=18, color=YELLOW)
-        foot_text = Text("足: 地球に近い", font_size=18, color=ORANGE)
+        head_text = cached_text("頭: 地球から少し遠い", font_size=18, color=YELLOW)
+        foot_text = cached_text("足: 地球に近い", font_size=18, color=ORANGE)
         head_text.next_to(person, RIGHT, buff=0.5).shift(UP * 0.3)
         foot_text.next_to(person, RIGHT, buff=0.5).shift(DOWN * 0.3)
 
@@ -322,8 +341,16 @@ class SpaghettificationEarth(Scene):
             max_tip_length_to_length_ratio=0.3,
         )
 
-        effect_text = Text(
-            "効果はとても小さい（目に見えない）",
+        # 身長 1.7 m の人の頭と足の重力の差（SI 単位、GM = 3.986e14 m³/s²）
+        earth_gm = 3.986e14
+        earth_radius_m = 6.371e6
+        height_m = 1.7
+        radial_tidal = tidal_tensor([[earth_radius_m, 0.0, 0.0]], np.zeros(3), earth_gm)[0, 0, 0]
+        # 有効数字2桁の a×10ⁿ 表記（例: 5.2×10⁻⁶） / Two significant digits as a×10ⁿ
+        mantissa, exponent = f"{radial_tidal * height_m:.1e}".split("e")
+        exponent = str(int(exponent)).translate(str.maketrans("-0123456789", "⁻⁰¹²³⁴⁵⁶⁷⁸⁹"))
+        effect_text = cached_text(
+            f"効果はとても小さい（頭と足の差: 約 {mantissa}×10{exponent} m/s²）",
             font_size=20,
             color=GRAY,
         )
@@ -337,7 +364,7 @@ class SpaghettificationEarth(Scene):
         self.wait(1)
 
         # 結論
-        conclusion = Text(
+        conclusion = cached_text(
             "でも原理はブラックホールと同じ！",
             font_size=24,
             color=GREEN,
@@ -12,7 +12,9 @@ yt_script.md L107-110 の解説用
 """
 
 from manim import *
-import numpy as np
+
+from components import cached_text, follow_trajectory
+from physics import gravity_direction_and_strength, simulate, within
 
 
 class TidalComparison(Scene):
@@ -27,8 +29,8 @@ class TidalComparison(Scene):
 
         # ===== タイトル =====
         # ===== Title =====
-        title = Text("潮汐力：横並び vs 縦並び", font_size=28)
-        title_en = Text("Tidal Force: Horizontal vs Vertical", font_size=18, color=GRAY)
+        title = cached_text("潮汐力：横並び vs 縦並び", font_size=28)
+        title_en = cached_text("Tidal Force: Horizontal vs Vertical", font_size=18, color=GRAY)
         title_group = VGroup(title, title_en).arrange(DOWN, buff=0.1)
         title_group.to_edge(UP, buff=0.3)
 
@@ -48,7 +50,7 @@ class TidalComparison(Scene):
         center_dot_left = Dot(left_center, radius=0.06, color=WHITE)
 
         # ラベル（左）
-        label_left = Text("横並び / Horizontal", font_size=16, color=YELLOW)
+        label_left = cached_text("横並び / Horizontal", font_size=16, color=YELLOW)
         label_left.next_to(earth_left, DOWN, buff=0.2)
 
         # ===== 右側：縦並びのボール（発散） =====
@@ -64,7 +66,7 @@ class TidalComparison(Scene):
         center_dot_right = Dot(right_center, radius=0.06, color=WHITE)
 
         # ラベル（右）
-        label_right = Text("縦並び / Vertical", font_size=16, color=GREEN)
+        label_right = cached_text("縦並び / Vertical", font_size=16, color=GREEN)
         label_right.next_to(earth_right, DOWN, buff=0.2)
 
         # 中央の区切り線
@@ -187,32 +189,37 @@ class TidalComparison(Scene):
         fall_duration = 2.5
 
         # 左側：ボールが中心で衝突
-        h_final = left_center
+        h_fall = simulate(
+            [ball_h_left.get_center(), ball_h_right.get_center()],
+            left_center,
+            stop=within(left_center, ball_radius),
+        )
 
-        # 右側：下のボールがより速く落ちる
-        v_lower_final = right_center + UP * 0.3
-        v_upper_final = right_center + UP * 1.4
+        # 右側：下のボールがより速く落ちる（下のボールが中心の近くに着くまで）
+        v_fall = simulate(
+            [ball_v_lower.get_center(), ball_v_upper.get_center()],
+            right_center,
+            stop=within(right_center, 0.3),
+            end="any",
+        )
 
         # 説明テキスト
         # Explanation text
-        converge_text = Text("近づく→", font_size=18, color=YELLOW)
+        converge_text = cached_text("近づく→", font_size=18, color=YELLOW)
         converge_text.next_to(ball_h_left, LEFT, buff=0.3)
 
-        diverge_text = Text("←離れる", font_size=18, color=GREEN)
+        diverge_text = cached_text("←離れる", font_size=18, color=GREEN)
         diverge_text.next_to(ball_v_upper, RIGHT, buff=0.3)
 
         self.play(
             # 左側：収束
-            ball_h_left.animate.move_to(h_final),
-            ball_h_right.animate.move_to(h_final),
+            follow_trajectory([ball_h_left, ball_h_right], h_fall),
             # 右側：発散
-            ball_v_lower.animate.move_to(v_lower_final),
-            ball_v_upper.animate.move_to(v_upper_final),
+            follow_trajectory([ball_v_lower, ball_v_upper], v_fall),
             # テキスト
             FadeIn(converge_text),
             FadeIn(diverge_text),
             run_time=fall_duration,
-            rate_func=rate_functions.ease_in_quad,
         )
 
         # 左側：衝突エフェクト
@@ -228,10 +235,10 @@ class TidalComparison(Scene):
 
         # ===== 結論 =====
         # ===== Conclusion =====
-        conclusion_left = Text("衝突！", font_size=20, color=YELLOW)
+        conclusion_left = cached_text("衝突！", font_size=20, color=YELLOW)
         conclusion_left.next_to(earth_left, UP, buff=0.1)
 
-        conclusion_right = Text("離れた！", font_size=20, color=GREEN)
+        conclusion_right = cached_text("離れた！", font_size=20, color=GREEN)
         conclusion_right.next_to(earth_right, UP, buff=0.1)
 
         self.play(
@@ -244,12 +251,12 @@ class TidalComparison(Scene):
 
         # 最終メッセージ
         # Final message
-        final_text = Text(
+        final_text = cached_text(
             "これが「潮汐力」の正体！",
             font_size=24,
             color=WHITE,
         )
-        final_text_en = Text(
+        final_text_en = cached_text(
             "This is the true nature of tidal force!",
             font_size=16,
             color=GRAY,
@@ -285,9 +292,9 @@ class TidalComparisonSimple(Scene):
         center_dot_right = Dot(right_center, radius=0.05, color=WHITE)
 
         # タイトルラベル
-        label_left = Text("横 / Horizontal", font_size=14, color=YELLOW)
+        label_left = cached_text("横 / Horizontal", font_size=14, color=YELLOW)
         label_left.next_to(earth_left, DOWN, buff=0.15)
-        label_right = Text("縦 / Vertical", font_size=14, color=GREEN)
+        label_right = cached_text("縦 / Vertical", font_size=14, color=GREEN)
         label_right.next_to(earth_right, DOWN, buff=0.15)
 
         self.add(earth_left, earth_right, center_dot_left, center_dot_right)
@@ -328,13 +335,16 @@ class TidalComparisonSimple(Scene):
         self.wait(0.5)
 
         # 落下アニメーション
+        h_fall = simulate(
+            [ball_h1.get_center(), ball_h2.get_center()], left_center, stop=within(left_center, ball_radius)
+        )
+        v_fall = simulate(
+            [ball_v1.get_center(), ball_v2.get_center()], right_center, stop=within(right_center, 0.3), end="any"
+        )
         self.play(
-            ball_h1.animate.move_to(left_center),
-            ball_h2.animate.move_to(left_center),
-            ball_v1.animate.move_to(right_center + UP * 0.3),
-            ball_v2.animate.move_to(right_center + UP * 1.3),
+            follow_trajectory([ball_h1, ball_h2], h_fall),
+            follow_trajectory([ball_v1, ball_v2], v_fall),
             run_time=2.0,
-            rate_func=rate_functions.ease_in_quad,
         )
 
         # 衝突フラッシュ（左側のみ）
@@ -355,8 +365,8 @@ class TidalComparisonWithArrows(Scene):
 
     def construct(self):
         # タイトル
-        title = Text("潮汐力の仕組み", font_size=28)
-        title_en = Text("How Tidal Forces Work", font_size=18, color=GRAY)
+        title = cached_text("潮汐力の仕組み", font_size=28)
+        title_en = cached_text("How Tidal Forces Work", font_size=18, color=GRAY)
         title_group = VGroup(title, title_en).arrange(DOWN, buff=0.1)
         title_group.to_edge(UP, buff=0.3)
 
@@ -380,9 +390,9 @@ class TidalComparisonWithArrows(Scene):
         center_dot_right = Dot(right_center, radius=0.06, color=WHITE)
 
         # ラベル
-        label_left = Text("横並び", font_size=16, color=YELLOW)
+        label_left = cached_text("横並び", font_size=16, color=YELLOW)
         label_left.next_to(earth_left, DOWN, buff=0.2)
-        label_right = Text("縦並び", font_size=16, color=GREEN)
+        label_right = cached_text("縦並び", font_size=16, color=GREEN)
         label_right.next_to(earth_right, DOWN, buff=0.2)
 
         # 区切り線
@@ -443,8 +453,7 @@ class TidalComparisonWithArrows(Scene):
         # ===== Show gravity arrows =====
 
         # 左側：中心に向かう矢印
-        left_dir1 = (left_center - left_ball_pos) / np.linalg.norm(left_center - left_ball_pos)
-        left_dir2 = (left_center - right_ball_pos) / np.linalg.norm(left_center - right_ball_pos)
+        (left_dir1, left_dir2), _ = gravity_direction_and_strength([left_ball_pos, right_ball_pos], left_center)
 
         arrow_h1 = Arrow(
             left_ball_pos,
@@ -478,13 +487,13 @@ class TidalComparisonWithArrows(Scene):
         )
 
         # 左側説明
-        explain_left = Text("斜めに引かれる", font_size=14, color=ORANGE)
+        explain_left = cached_text("斜めに引かれる", font_size=14, color=ORANGE)
         explain_left.next_to(arrow_h1, LEFT, buff=0.1)
 
         # 右側説明
-        explain_right1 = Text("強い", font_size=12, color=ORANGE)
+        explain_right1 = cached_text("強い", font_size=12, color=ORANGE)
         explain_right1.next_to(arrow_v1, LEFT, buff=0.1)
-        explain_right2 = Text("弱い", font_size=12, color=ORANGE)
+        explain_right2 = cached_text("弱い", font_size=12, color=ORANGE)
         explain_right2.next_to(arrow_v2, LEFT, buff=0.1)
 
         self.play(
@@ -512,20 +521,20 @@ class TidalComparisonWithArrows(Scene):
         # 落下アニメーション
         fall_duration = 2.5
 
-        result_left = Text("→ 近づく", font_size=16, color=YELLOW)
+        result_left = cached_text("→ 近づく", font_size=16, color=YELLOW)
         result_left.next_to(earth_left, UP, buff=0.1)
-        result_right = Text("→ 離れる", font_size=16, color=GREEN)
+        result_right = cached_text("→ 離れる", font_size=16, color=GREEN)
         result_right.next_to(earth_right, UP, buff=0.1)
 
+        h_fall = simulate([left_ball_pos, right_ball_pos], left_center, stop=within(left_center, ball_radius))
+        v_fall = simulate([lower_ball_pos, upper_ball_pos], right_center, stop=within(right_center, 0.3), end="any")
+
         self.play(
-            ball_h1.animate.move_to(left_center),
-            ball_h2.animate.move_to(left_center),
-            ball_v1.animate.move_to(right_center + UP * 0.3),
-            ball_v2.animate.move_to(right_center + UP * 1.3),
+            follow_trajectory([ball_h1, ball_h2], h_fall),
+            follow_trajectory([ball_v1, ball_v2], v_fall),
             FadeIn(result_left),
             FadeIn(result_right),
             run_time=fall_duration,
-            rate_func=rate_functions.ease_in_quad,
         )
 
         # 衝突エフェクト
@@ -536,8 +545,8 @@ class TidalComparisonWithArrows(Scene):
         self.remove(flash)
 
         # 最終メッセージ
-        final = Text("潮汐力 = 時空の曲がり", font_size=24, color=WHITE)
-        final_en = Text("Tidal Force = Curvature of Spacetime", font_size=16, color=GRAY)
+        final = cached_text("潮汐力 = 時空の曲がり", font_size=24, color=WHITE)
+        final_en = cached_text("Tidal Force = Curvature of Spacetime", font_size=16, color=GRAY)
         final_group = VGroup(final, final_en).arrange(DOWN, buff=0.1)
         final_group.to_edge(DOWN, buff=0.3)
 
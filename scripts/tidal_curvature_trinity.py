@@ -10,6 +10,8 @@ yt_script.md L144-147 の解説用
 
 from manim import *
 
+from components import cached_text
+
 
 class TidalCurvatureTrinity(Scene):
     """
@@ -35,8 +37,8 @@ class TidalCurvatureTrinity(Scene):
 
         # ===== 1. 潮汐力（上） =====
         tidal_icon = self._create_wave_icon().scale(0.5)
-        tidal_label = Text("潮汐力", font_size=32, color=TIDAL_COLOR)
-        tidal_label_en = Text("Tidal Force", font_size=18, color=GRAY)
+        tidal_label = cached_text("潮汐力", font_size=32, color=TIDAL_COLOR)
+        tidal_label_en = cached_text("Tidal Force", font_size=18, color=GRAY)
         tidal_group = VGroup(
             tidal_icon,
             VGroup(tidal_label, tidal_label_en).arrange(DOWN, buff=0.05),
@@ -45,8 +47,8 @@ class TidalCurvatureTrinity(Scene):
 
         # ===== 2. 測地線偏差（左下） =====
         geodesic_icon = self._create_geodesic_icon().scale(0.5)
-        geodesic_label = Text("測地線偏差", font_size=32, color=GEODESIC_COLOR)
-        geodesic_label_en = Text("Geodesic Deviation", font_size=18, color=GRAY)
+        geodesic_label = cached_text("測地線偏差", font_size=32, color=GEODESIC_COLOR)
+        geodesic_label_en = cached_text("Geodesic Deviation", font_size=18, color=GRAY)
         geodesic_group = VGroup(
             geodesic_icon,
             VGroup(geodesic_label, geodesic_label_en).arrange(DOWN, buff=0.05),
@@ -55,8 +57,8 @@ class TidalCurvatureTrinity(Scene):
 
         # ===== 3. リーマン曲率（右下） =====
         riemann_icon = self._create_curved_surface_icon().scale(0.5)
-        riemann_label = Text("リーマン曲率", font_size=32, color=RIEMANN_COLOR)
-        riemann_label_en = Text("Riemann Curvature", font_size=18, color=GRAY)
+        riemann_label = cached_text("リーマン曲率", font_size=32, color=RIEMANN_COLOR)
+        riemann_label_en = cached_text("Riemann Curvature", font_size=18, color=GRAY)
         riemann_group = VGroup(
             riemann_icon,
             VGroup(riemann_label, riemann_label_en).arrange(DOWN, buff=0.05),
@@ -88,12 +90,12 @@ class TidalCurvatureTrinity(Scene):
         equiv_symbol.move_to(center_pos)
 
         # ===== 6. 結論テキスト =====
-        conclusion = Text(
+        conclusion = cached_text(
             "同じ概念の異なる現れ",
             font_size=28,
             color=UNITY_COLOR,
         )
-        conclusion_en = Text(
+        conclusion_en = cached_text(
             "Different manifestations of the same concept",
             font_size=16,
             color=GRAY,
@@ -11,6 +11,8 @@ tidal force is the gravity effect that cannot be eliminated even in free fall.
 
 from manim import *
 
+from components import cached_text
+
 
 class TidalForceDefinition(Scene):
     """
@@ -21,8 +23,8 @@ class TidalForceDefinition(Scene):
     def construct(self):
         # パート1：等価原理の復習
         # Part 1: Recap of equivalence principle
-        equiv_title = Text("等価原理", font_size=32, color=BLUE)
-        equiv_title_en = Text("Equivalence Principle", font_size=24, color=BLUE_A)
+        equiv_title = cached_text("等価原理", font_size=32, color=BLUE)
+        equiv_title_en = cached_text("Equivalence Principle", font_size=24, color=BLUE_A)
         equiv_group = VGroup(equiv_title, equiv_title_en).arrange(DOWN, buff=0.1)
         equiv_group.to_edge(UP)
 
@@ -31,8 +33,8 @@ class TidalForceDefinition(Scene):
 
         # 等価原理の内容
         # Content of equivalence principle
-        equiv_text = Text("重力 ≈ 加速度", font_size=36)
-        equiv_text_en = Text("Gravity ≈ Acceleration", font_size=24, color=GRAY)
+        equiv_text = cached_text("重力 ≈ 加速度", font_size=36)
+        equiv_text_en = cached_text("Gravity ≈ Acceleration", font_size=24, color=GRAY)
         equiv_content = VGroup(equiv_text, equiv_text_en).arrange(DOWN, buff=0.1)
 
         self.play(Write(equiv_content))
@@ -40,8 +42,8 @@ class TidalForceDefinition(Scene):
 
         # 「自由落下で消せる」
         # "Can be eliminated by free fall"
-        can_eliminate = Text("→ 自由落下で「消せる」", font_size=28, color=GREEN)
-        can_eliminate_en = Text(
+        can_eliminate = cached_text("→ 自由落下で「消せる」", font_size=28, color=GREEN)
+        can_eliminate_en = cached_text(
             "→ Can be 'eliminated' by free fall", font_size=20, color=GREEN_A
         )
         can_eliminate_group = VGroup(can_eliminate, can_eliminate_en).arrange(
@@ -54,8 +56,8 @@ class TidalForceDefinition(Scene):
 
         # パート2：「でも...」+ エレベーターの簡略版
         # Part 2: "But..." + simplified elevator animation
-        but_text = Text("でも...", font_size=40, color=YELLOW)
-        but_text_en = Text("But...", font_size=28, color=YELLOW_A)
+        but_text = cached_text("でも...", font_size=40, color=YELLOW)
+        but_text_en = cached_text("But...", font_size=28, color=YELLOW_A)
         but_group = VGroup(but_text, but_text_en).arrange(DOWN, buff=0.1)
 
         self.play(
@@ -148,10 +150,10 @@ class TidalForceDefinition(Scene):
         )
 
         # ラベル表示
-        converge_label = Text("近づく", font_size=14, color=RED_C)
+        converge_label = cached_text("近づく", font_size=14, color=RED_C)
         converge_label.next_to(elevator_left, DOWN, buff=0.15)
 
-        diverge_label = Text("離れる", font_size=14, color=BLUE_C)
+        diverge_label = cached_text("離れる", font_size=14, color=BLUE_C)
         diverge_label.next_to(elevator_right, DOWN, buff=0.15)
 
         self.play(
@@ -161,10 +163,10 @@ class TidalForceDefinition(Scene):
         self.wait(0.5)
 
         # テキスト
-        problem_text = Text(
+        problem_text = cached_text(
             "自由落下中でも、ボールは動いている", font_size=24, color=ORANGE
         )
-        problem_text_en = Text(
+        problem_text_en = cached_text(
             "Even in free fall, the balls are moving", font_size=16, color=ORANGE
         )
         problem_group = VGroup(problem_text, problem_text_en).arrange(DOWN, buff=0.1)
@@ -195,8 +197,8 @@ class TidalForceDefinition(Scene):
 
         # 大きなタイトル
         # Big title
-        tidal_title = Text("潮汐力", font_size=48, color=YELLOW)
-        tidal_title_en = Text("Tidal Force", font_size=36, color=YELLOW_A)
+        tidal_title = cached_text("潮汐力", font_size=48, color=YELLOW)
+        tidal_title_en = cached_text("Tidal Force", font_size=36, color=YELLOW_A)
         tidal_group = VGroup(tidal_title, tidal_title_en).arrange(DOWN, buff=0.15)
 
         self.play(Write(tidal_group))
@@ -210,22 +212,22 @@ class TidalForceDefinition(Scene):
 
         # 定義1：重力の勾配
         # Definition 1: Gravity gradient
-        def1 = Text("重力が場所によって違う", font_size=28)
-        def1_en = Text("Gravity varies by location", font_size=20, color=GRAY)
+        def1 = cached_text("重力が場所によって違う", font_size=28)
+        def1_en = cached_text("Gravity varies by location", font_size=20, color=GRAY)
         def1_group = VGroup(def1, def1_en).arrange(DOWN, buff=0.1)
 
         self.play(Write(def1_group))
         self.wait(0.8)
 
         # 矢印
-        arrow = Text("↓", font_size=36, color=YELLOW)
+        arrow = cached_text("↓", font_size=36, color=YELLOW)
         arrow.next_to(def1_group, DOWN, buff=0.3)
         self.play(Write(arrow))
 
         # 定義2：消せない効果
         # Definition 2: Cannot be eliminated
-        def2 = Text("自由落下しても消すことができない", font_size=28, color=RED)
-        def2_en = Text(
+        def2 = cached_text("自由落下しても消すことができない", font_size=28, color=RED)
+        def2_en = cached_text(
             "Cannot be eliminated even in free fall", font_size=20, color=RED_A
         )
         def2_group = VGroup(def2, def2_en).arrange(DOWN, buff=0.1)
@@ -243,8 +245,8 @@ class TidalForceDefinition(Scene):
 
         # パート4：結論
         # Part 4: Conclusion
-        conclusion = Text("消せない重力効果", font_size=36, color=YELLOW)
-        conclusion_en = Text("The Inescapable Gravity", font_size=26, color=YELLOW_A)
+        conclusion = cached_text("消せない重力効果", font_size=36, color=YELLOW)
+        conclusion_en = cached_text("The Inescapable Gravity", font_size=26, color=YELLOW_A)
         conclusion_group = VGroup(conclusion, conclusion_en).arrange(DOWN, buff=0.1)
         conclusion_group.to_edge(DOWN, buff=0.6)
 
@@ -261,15 +263,15 @@ class TidalForceDefinitionSimple(Scene):
     def construct(self):
         # 等号形式で表示
         # Display in equation format
-        tidal = Text("潮汐力", font_size=42, color=YELLOW)
-        equals = Text("＝", font_size=42)
-        definition = Text("消せない重力効果", font_size=42, color=RED)
+        tidal = cached_text("潮汐力", font_size=42, color=YELLOW)
+        equals = cached_text("＝", font_size=42)
+        definition = cached_text("消せない重力効果", font_size=42, color=RED)
 
         equation = VGroup(tidal, equals, definition).arrange(RIGHT, buff=0.3)
 
-        tidal_en = Text("Tidal Force", font_size=28, color=YELLOW_A)
-        equals_en = Text("=", font_size=28)
-        definition_en = Text("Inescapable Gravity", font_size=28, color=RED_A)
+        tidal_en = cached_text("Tidal Force", font_size=28, color=YELLOW_A)
+        equals_en = cached_text("=", font_size=28)
+        definition_en = cached_text("Inescapable Gravity", font_size=28, color=RED_A)
 
         equation_en = VGroup(tidal_en, equals_en, definition_en).arrange(RIGHT, buff=0.2)
         equation_en.next_to(equation, DOWN, buff=0.3)
@@ -292,8 +294,8 @@ class TidalForceDefinitionSimple(Scene):
         self.wait(0.5)
 
         # 補足テキスト
-        note = Text("自由落下しても消すことができない", font_size=24, color=GRAY)
-        note_en = Text(
+        note = cached_text("自由落下しても消すことができない", font_size=24, color=GRAY)
+        note_en = cached_text(
             "Cannot be eliminated even in free fall", font_size=18, color=GRAY
         )
         note_group = VGroup(note, note_en).arrange(DOWN, buff=0.1)
@@ -311,8 +313,8 @@ class TidalForceDefinitionVisual(Scene):
 
     def construct(self):
         # タイトル
-        title = Text("潮汐力の効果", font_size=28)
-        title_en = Text("Effect of Tidal Force", font_size=20, color=GRAY)
+        title = cached_text("潮汐力の効果", font_size=28)
+        title_en = cached_text("Effect of Tidal Force", font_size=20, color=GRAY)
         title_group = VGroup(title, title_en).arrange(DOWN, buff=0.1)
         title_group.to_edge(UP)
 
@@ -327,8 +329,8 @@ class TidalForceDefinitionVisual(Scene):
         self.wait(0.5)
 
         # 「重力が均一なら...」
-        uniform_text = Text("均一な重力場では...", font_size=22)
-        uniform_text_en = Text("In uniform gravity...", font_size=16, color=GRAY)
+        uniform_text = cached_text("均一な重力場では...", font_size=22)
+        uniform_text_en = cached_text("In uniform gravity...", font_size=16, color=GRAY)
         uniform_group = VGroup(uniform_text, uniform_text_en).arrange(DOWN, buff=0.1)
         uniform_group.to_edge(DOWN, buff=1.0)
 
@@ -336,8 +338,8 @@ class TidalForceDefinitionVisual(Scene):
         self.wait(0.5)
 
         # 球のまま落下（形は変わらない）
-        no_change = Text("形は変わらない", font_size=20, color=GREEN)
-        no_change_en = Text("Shape unchanged", font_size=14, color=GREEN_A)
+        no_change = cached_text("形は変わらない", font_size=20, color=GREEN)
+        no_change_en = cached_text("Shape unchanged", font_size=14, color=GREEN_A)
         no_change_group = VGroup(no_change, no_change_en).arrange(DOWN, buff=0.05)
         no_change_group.next_to(original_ball, RIGHT, buff=0.5)
 
@@ -347,8 +349,8 @@ class TidalForceDefinitionVisual(Scene):
         # テキストを更新
         self.play(FadeOut(no_change_group))
 
-        nonuniform_text = Text("不均一な重力場では...", font_size=22, color=ORANGE)
-        nonuniform_text_en = Text("In non-uniform gravity...", font_size=16, color=ORANGE)
+        nonuniform_text = cached_text("不均一な重力場では...", font_size=22, color=ORANGE)
+        nonuniform_text_en = cached_text("In non-uniform gravity...", font_size=16, color=ORANGE)
         nonuniform_group = VGroup(nonuniform_text, nonuniform_text_en).arrange(
             DOWN, buff=0.1
         )
@@ -399,8 +401,8 @@ class TidalForceDefinitionVisual(Scene):
         self.wait(0.5)
 
         # 「縦に伸び、横に縮む」
-        deform_text = Text("縦に伸び、横に縮む", font_size=22, color=YELLOW)
-        deform_text_en = Text(
+        deform_text = cached_text("縦に伸び、横に縮む", font_size=22, color=YELLOW)
+        deform_text_en = cached_text(
             "Stretched vertically, compressed horizontally", font_size=14, color=YELLOW_A
         )
         deform_group = VGroup(deform_text, deform_text_en).arrange(DOWN, buff=0.05)
@@ -410,8 +412,8 @@ class TidalForceDefinitionVisual(Scene):
         self.wait(1)
 
         # 結論
-        conclusion = Text("これが潮汐力", font_size=32, color=YELLOW)
-        conclusion_en = Text("This is Tidal Force", font_size=24, color=YELLOW_A)
+        conclusion = cached_text("これが潮汐力", font_size=32, color=YELLOW)
+        conclusion_en = cached_text("This is Tidal Force", font_size=24, color=YELLOW_A)
         conclusion_group = VGroup(conclusion, conclusion_en).arrange(DOWN, buff=0.1)
         conclusion_group.to_edge(DOWN, buff=0.5)
 
@@ -14,6 +14,8 @@ Despite apparent weightlessness, the balls seem to move on their own - this is t
 
 from manim import *
 
+from components import cached_text
+
 
 class TidalForceElevatorHorizontal(Scene):
     """
@@ -56,8 +58,8 @@ class TidalForceElevatorHorizontal(Scene):
             )
             fall_arrows.add(arrow)
 
-        fall_label = Text("自由落下中", font_size=18, color=YELLOW)
-        fall_label_en = Text("Free Falling", font_size=14, color=YELLOW_A)
+        fall_label = cached_text("自由落下中", font_size=18, color=YELLOW)
+        fall_label_en = cached_text("Free Falling", font_size=14, color=YELLOW_A)
         fall_label_group = VGroup(fall_label, fall_label_en).arrange(DOWN, buff=0.05)
         fall_label_group.to_edge(UP).shift(DOWN * 0.3)
 
@@ -96,8 +98,8 @@ class TidalForceElevatorHorizontal(Scene):
 
         # 「浮いている」ことを示すテキスト
         # Text indicating floating
-        floating_text = Text("ボールは浮いている（無重力）", font_size=22)
-        floating_text_en = Text("Balls are floating (zero-G)", font_size=16, color=GRAY)
+        floating_text = cached_text("ボールは浮いている（無重力）", font_size=22)
+        floating_text_en = cached_text("Balls are floating (zero-G)", font_size=16, color=GRAY)
         floating_group = VGroup(floating_text, floating_text_en).arrange(DOWN, buff=0.1)
         floating_group.to_edge(DOWN).shift(UP * 0.3)
 
@@ -106,8 +108,8 @@ class TidalForceElevatorHorizontal(Scene):
 
         # テキストを更新
         # Update text
-        approaching_text = Text("でも...少しずつ近づいていく", font_size=22, color=YELLOW)
-        approaching_text_en = Text(
+        approaching_text = cached_text("でも...少しずつ近づいていく", font_size=22, color=YELLOW)
+        approaching_text_en = cached_text(
             "But...they slowly move closer", font_size=16, color=YELLOW_A
         )
         approaching_group = VGroup(approaching_text, approaching_text_en).arrange(
@@ -130,8 +132,8 @@ class TidalForceElevatorHorizontal(Scene):
 
         # 結論テキスト
         # Conclusion text
-        conclusion = Text("無重力なのに動く？", font_size=28, color=YELLOW)
-        conclusion_en = Text("Moving in Zero-G?", font_size=20, color=YELLOW_A)
+        conclusion = cached_text("無重力なのに動く？", font_size=28, color=YELLOW)
+        conclusion_en = cached_text("Moving in Zero-G?", font_size=20, color=YELLOW_A)
         conclusion_group = VGroup(conclusion, conclusion_en).arrange(DOWN, buff=0.1)
         conclusion_group.to_edge(DOWN).shift(UP * 0.3)
 
@@ -180,8 +182,8 @@ class TidalForceElevatorVertical(Scene):
             )
             fall_arrows.add(arrow)
 
-        fall_label = Text("自由落下中", font_size=18, color=YELLOW)
-        fall_label_en = Text("Free Falling", font_size=14, color=YELLOW_A)
+        fall_label = cached_text("自由落下中", font_size=18, color=YELLOW)
+        fall_label_en = cached_text("Free Falling", font_size=14, color=YELLOW_A)
         fall_label_group = VGroup(fall_label, fall_label_en).arrange(DOWN, buff=0.05)
         fall_label_group.to_edge(UP).shift(DOWN * 0.3)
 
@@ -220,8 +222,8 @@ class TidalForceElevatorVertical(Scene):
 
         # 「浮いている」ことを示すテキスト
         # Text indicating floating
-        floating_text = Text("ボールは浮いている（無重力）", font_size=22)
-        floating_text_en = Text("Balls are floating (zero-G)", font_size=16, color=GRAY)
+        floating_text = cached_text("ボールは浮いている（無重力）", font_size=22)
+        floating_text_en = cached_text("Balls are floating (zero-G)", font_size=16, color=GRAY)
         floating_group = VGroup(floating_text, floating_text_en).arrange(DOWN, buff=0.1)
         floating_group.to_edge(DOWN).shift(UP * 0.3)
 
@@ -230,8 +232,8 @@ class TidalForceElevatorVertical(Scene):
 
         # テキストを更新
         # Update text
-        separating_text = Text("でも...少しずつ離れていく", font_size=22, color=GREEN)
-        separating_text_en = Text(
+        separating_text = cached_text("でも...少しずつ離れていく", font_size=22, color=GREEN)
+        separating_text_en = cached_text(
             "But...they slowly move apart", font_size=16, color=GREEN_A
         )
         separating_group = VGroup(separating_text, separating_text_en).arrange(
@@ -255,8 +257,8 @@ class TidalForceElevatorVertical(Scene):
 
         # 結論テキスト
         # Conclusion text
-        conclusion = Text("無重力なのに動く？", font_size=28, color=GREEN)
-        conclusion_en = Text("Moving in Zero-G?", font_size=20, color=GREEN_A)
+        conclusion = cached_text("無重力なのに動く？", font_size=28, color=GREEN)
+        conclusion_en = cached_text("Moving in Zero-G?", font_size=20, color=GREEN_A)
         conclusion_group = VGroup(conclusion, conclusion_en).arrange(DOWN, buff=0.1)
         conclusion_group.to_edge(DOWN).shift(UP * 0.3)
 
@@ -314,8 +316,8 @@ class TidalForceElevatorSideBySide(Scene):
             )
             fall_arrows.add(arrow)
 
-        fall_label = Text("自由落下中", font_size=18, color=YELLOW)
-        fall_label_en = Text("Free Falling", font_size=14, color=YELLOW_A)
+        fall_label = cached_text("自由落下中", font_size=18, color=YELLOW)
+        fall_label_en = cached_text("Free Falling", font_size=14, color=YELLOW_A)
         fall_label_group = VGroup(fall_label, fall_label_en).arrange(DOWN, buff=0.05)
         fall_label_group.to_edge(UP).shift(DOWN * 0.2)
 
@@ -369,8 +371,8 @@ class TidalForceElevatorSideBySide(Scene):
 
         # テキスト表示
         # Display text
-        text = Text("無重力で浮いているはずなのに...", font_size=22)
-        text_en = Text(
+        text = cached_text("無重力で浮いているはずなのに...", font_size=22)
+        text_en = cached_text(
             "They should be floating in zero-G, but...", font_size=16, color=GRAY
         )
         text_group = VGroup(text, text_en).arrange(DOWN, buff=0.1)
@@ -401,13 +403,13 @@ class TidalForceElevatorSideBySide(Scene):
 
         # 結果を示すラベル
         # Labels showing results
-        converge_label = Text("近づく", font_size=18, color=RED_C)
-        converge_label_en = Text("Converge", font_size=14, color=RED_A)
+        converge_label = cached_text("近づく", font_size=18, color=RED_C)
+        converge_label_en = cached_text("Converge", font_size=14, color=RED_A)
         converge_group = VGroup(converge_label, converge_label_en).arrange(DOWN, buff=0.05)
         converge_group.next_to(elevator_left, UP, buff=0.2)
 
-        diverge_label = Text("離れる", font_size=18, color=BLUE_C)
-        diverge_label_en = Text("Diverge", font_size=14, color=BLUE_A)
+        diverge_label = cached_text("離れる", font_size=18, color=BLUE_C)
+        diverge_label_en = cached_text("Diverge", font_size=14, color=BLUE_A)
         diverge_group = VGroup(diverge_label, diverge_label_en).arrange(DOWN, buff=0.05)
         diverge_group.next_to(elevator_right, UP, buff=0.2)
 
@@ -419,8 +421,8 @@ class TidalForceElevatorSideBySide(Scene):
 
         # 最終メッセージ
         # Final message
-        final_text = Text("無重力なのに動く？", font_size=28, color=YELLOW)
-        final_text_en = Text("Moving in Zero-G?", font_size=20, color=YELLOW_A)
+        final_text = cached_text("無重力なのに動く？", font_size=28, color=YELLOW)
+        final_text_en = cached_text("Moving in Zero-G?", font_size=20, color=YELLOW_A)
         final_group = VGroup(final_text, final_text_en).arrange(DOWN, buff=0.1)
         final_group.to_edge(DOWN).shift(UP * 0.3)
 
@@ -19,25 +19,7 @@ Visualized by the elevator deforming due to tidal forces.
 
 from manim import *
 
-
-def create_text_with_backplate(
-    text_content, font_size, text_color, bg_color="#000000", bg_opacity=0.7, padding=0.15
-):
-    """
-    バックプレート付きテキストを作成するヘルパー関数
-    Helper function to create text with a background plate
-    """
-    text = Text(text_content, font_size=font_size, color=text_color)
-    backplate = Rectangle(
-        width=text.width + padding * 2,
-        height=text.height + padding * 2,
-        color=bg_color,
-        fill_color=bg_color,
-        fill_opacity=bg_opacity,
-        stroke_width=0,
-    )
-    backplate.move_to(text.get_center())
-    return VGroup(backplate, text)
+from components import backplate_label, backplate_labels, cached_text
 
 
 class TidalForceTransition(Scene):
@@ -74,7 +56,7 @@ class TidalForceTransition(Scene):
 
         # 自由落下中のラベル
         # Free fall label
-        freefall_label = create_text_with_backplate(
+        freefall_label = backplate_label(
             "自由落下中 / In Free Fall",
             font_size=22,
             text_color=BLUE_B,
@@ -91,7 +73,7 @@ class TidalForceTransition(Scene):
             stroke_width=4,
             max_tip_length_to_length_ratio=0.25,
         )
-        motion_label = Text("↓ 落下中", font_size=16, color=GRAY)
+        motion_label = cached_text("↓ 落下中", font_size=16, color=GRAY)
         motion_label.next_to(motion_arrow, RIGHT, buff=0.1)
 
         # 表示
@@ -111,7 +93,7 @@ class TidalForceTransition(Scene):
 
         # 無重力状態のテキスト
         # Weightless state text
-        weightless_text = create_text_with_backplate(
+        weightless_text = backplate_label(
             "重力が「消えた」？\nDid gravity 'disappear'?",
             font_size=26,
             text_color=GREEN,
@@ -127,7 +109,7 @@ class TidalForceTransition(Scene):
 
         # 疑問マークを表示
         # Show question mark
-        question = Text("？", font_size=100, color=YELLOW)
+        question = cached_text("？", font_size=100, color=YELLOW)
         question.move_to(RIGHT * 3.0 + DOWN * 0.5)
 
         self.play(FadeIn(question, scale=1.3), run_time=0.5)
@@ -135,7 +117,7 @@ class TidalForceTransition(Scene):
 
         # 「実は...」のテキスト
         # "Actually..." text
-        actually_text = create_text_with_backplate(
+        actually_text = backplate_label(
             "実は... / Actually...",
             font_size=28,
             text_color=ORANGE,
@@ -163,7 +145,7 @@ class TidalForceTransition(Scene):
 
         # 潮汐力の説明テキスト
         # Tidal force explanation text
-        tidal_explain = create_text_with_backplate(
+        tidal_explain = backplate_label(
             "消せない重力効果\nUncancellable gravity effect",
             font_size=24,
             text_color=WHITE,
@@ -228,36 +210,18 @@ class TidalForceTransition(Scene):
 
         # 矢印のラベル（tidal_stretch_body.pyと同じスタイル）
         # Arrow labels (same style as tidal_stretch_body.py)
-        gravity_label_top = create_text_with_backplate(
-            "g（弱）/ g (weak)",
-            font_size=18,
-            text_color=RED,
+        gravity_label_top, gravity_label_bottom, stretch_effect_label, compress_label = backplate_labels(
+            [
+                ("g（弱）/ g (weak)", 18, RED),
+                ("g（強）/ g (strong)", 18, RED),
+                ("→ 縦に引き伸ばされる\n→ Stretched vertically", 20, RED),
+                ("横に圧縮\nHorizontal squeeze", 20, BLUE),
+            ],
             bg_opacity=0.85,
         )
         gravity_label_top.next_to(gravity_top, LEFT, buff=0.15)
-
-        gravity_label_bottom = create_text_with_backplate(
-            "g（強）/ g (strong)",
-            font_size=18,
-            text_color=RED,
-            bg_opacity=0.85,
-        )
         gravity_label_bottom.next_to(gravity_bottom, LEFT, buff=0.15)
-
-        stretch_effect_label = create_text_with_backplate(
-            "→ 縦に引き伸ばされる\n→ Stretched vertically",
-            font_size=20,
-            text_color=RED,
-            bg_opacity=0.85,
-        )
         stretch_effect_label.move_to(RIGHT * 3.0 + UP * 0.8)
-
-        compress_label = create_text_with_backplate(
-            "横に圧縮\nHorizontal squeeze",
-            font_size=20,
-            text_color=BLUE,
-            bg_opacity=0.85,
-        )
         compress_label.move_to(RIGHT * 3.0 + DOWN * 0.5)
 
         # 縦方向の矢印を表示
@@ -325,18 +289,18 @@ class TidalForceTransition(Scene):
 
         # メインテロップ（画面中央右）
         # Main telop (center-right of screen)
-        telop_main = Text(
+        telop_main = cached_text(
             "潮汐力",
             font_size=48,
             color=YELLOW,
             weight=BOLD,
         )
-        telop_sub = Text(
+        telop_sub = cached_text(
             "消せない本物の重力",
             font_size=32,
             color=YELLOW,
         )
-        telop_en = Text(
+        telop_en = cached_text(
             "Tidal Force: The Real Gravity You Can't Cancel",
             font_size=20,
             color=YELLOW_C,
@@ -407,7 +371,7 @@ class TidalForceTransition(Scene):
 
         # 次のセクションへの導入テキスト
         # Introduction text to next section
-        next_section = create_text_with_backplate(
+        next_section = backplate_label(
             "では、潮汐力を詳しく見ていきましょう\nLet's examine tidal forces in detail",
             font_size=28,
             text_color=WHITE,
@@ -478,7 +442,7 @@ class TidalForceTransitionShort(Scene):
         self.play(FadeIn(elevator), FadeIn(person), run_time=0.5)
 
         # 疑問テキスト
-        question_text = create_text_with_backplate(
+        question_text = backplate_label(
             "重力が消えた？\nGravity disappeared?",
             font_size=26,
             text_color=GREEN,
@@ -541,7 +505,7 @@ class TidalForceTransitionShort(Scene):
         )
 
         # テロップ
-        telop = create_text_with_backplate(
+        telop = backplate_label(
             "潮汐力: 消せない本物の重力\nTidal Force: The Real Gravity You Can't Cancel",
             font_size=26,
             text_color=YELLOW,
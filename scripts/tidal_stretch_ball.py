@@ -13,57 +13,8 @@ Ball being stretched by tidal forces
 from manim import *
 import numpy as np
 
-
-def create_text_with_backplate(
-    text_content, font_size, text_color, bg_color="#000000", bg_opacity=0.7, padding=0.15
-):
-    """
-    バックプレート付きテキストを作成するヘルパー関数
-    Helper function to create text with a background plate
-    """
-    text = Text(text_content, font_size=font_size, color=text_color)
-    backplate = Rectangle(
-        width=text.width + padding * 2,
-        height=text.height + padding * 2,
-        color=bg_color,
-        fill_color=bg_color,
-        fill_opacity=bg_opacity,
-        stroke_width=0,
-    )
-    backplate.move_to(text.get_center())
-    return VGroup(backplate, text)
-
-
-def calculate_gravity_direction_and_strength(point_pos, earth_center_pos):
-    """
-    各点での重力の方向と相対的な強さを計算する
-    Calculate gravity direction and relative strength at each point
-
-    重力は中心力なので、各点から地球中心に向かうベクトルになる。
-    強さは距離の2乗に反比例する。
-    （docs/chapter5.pdf Figure 5.1 右図参照）
-
-    Args:
-        point_pos: ボール表面上の点の位置 [x, y]
-        earth_center_pos: 地球中心の位置 [x, y]
-
-    Returns:
-        (direction_x, direction_y, relative_strength)
-        - direction: 正規化された重力方向ベクトル
-        - relative_strength: 相対的な重力の強さ（基準点との比）
-    """
-    # 地球中心への方向ベクトル
-    to_earth = np.array(earth_center_pos) - np.array(point_pos)
-    distance = np.linalg.norm(to_earth)
-
-    # 正規化
-    direction = to_earth / distance
-
-    # 相対的な強さ（距離の2乗に反比例、基準距離で正規化）
-    base_distance = abs(earth_center_pos[1])  # 地球中心までの基準距離
-    relative_strength = (base_distance / distance) ** 2
-
-    return direction[0], direction[1], relative_strength
+from components import backplate_label, backplate_labels
+from physics import gravity_direction_and_strength
 
 
 class TidalStretchBall(Scene):
@@ -103,7 +54,7 @@ class TidalStretchBall(Scene):
 
         # 地球のラベル（バックプレート付き）
         # Earth label (with backplate)
-        earth_label = create_text_with_backplate(
+        earth_label = backplate_label(
             "↓ 地球 / Earth ↓", font_size=22, text_color="#3498db"
         )
         earth_label.move_to(DOWN * 3.3)
@@ -139,38 +90,32 @@ class TidalStretchBall(Scene):
         # 8 directions (degrees): up, upper-right, right, lower-right, down, lower-left, left, upper-left
         angles = [90, 45, 0, 315, 270, 225, 180, 135]
 
-        arrows = []
-
-        for angle in angles:
-            # ボール表面上の位置を計算
-            # Calculate position on ball surface
-            angle_rad = np.radians(angle)
-            # ボール中心から見た外向き方向
-            outward_dir = np.array([np.cos(angle_rad), np.sin(angle_rad), 0])
-            surface_pos = ball_center + ball_radius * outward_dir
-
-            # 重力の方向と強さを計算（地球中心に向かう）
-            # Calculate gravity direction and strength (toward Earth's center)
-            gx, gy, strength = calculate_gravity_direction_and_strength(
-                surface_pos[:2], earth_center[:2]
-            )
-            gravity_dir = np.array([gx, gy, 0])
-
-            # 矢印の長さは重力の強さに比例（視覚的に誇張、ただし常に正の値を保証）
-            # Arrow length proportional to gravity strength (visually exaggerated, always positive)
-            length_factor = max(0.4, 1.0 + (strength - 1.0) * 3)
-            arrow_length = base_arrow_length * length_factor
-
-            # 矢印の開始点：ボール表面から外側にギャップを取る
-            # Arrow start: gap outward from ball surface
-            start_pos = surface_pos + arrow_start_gap * outward_dir
-            # 矢印の終了点：開始点から地球中心方向へ
-            # Arrow end: from start toward Earth's center
-            end_pos = start_pos + arrow_length * gravity_dir
-
-            # 色は黄色で統一（重力ベクトルを表す）
-            # Unified yellow color (representing gravity vectors)
-            arrow = Arrow(
+        # ボール表面上の位置を計算（ボール中心から見た外向き方向）
+        # Calculate positions on ball surface (outward from ball center)
+        angles_rad = np.radians(angles)
+        outward_dirs = np.stack([np.cos(angles_rad), np.sin(angles_rad), np.zeros_like(angles_rad)], axis=1)
+        surface_points = ball_center + ball_radius * outward_dirs
+
+        # 重力の方向と強さを全点まとめて計算（地球中心に向かう）
+        # Calculate gravity direction and strength for all points at once (toward Earth's center)
+        gravity_dirs, strengths = gravity_direction_and_strength(surface_points, earth_center)
+
+        # 矢印の長さは重力の強さに比例（視覚的に誇張、ただし常に正の値を保証）
+        # Arrow length proportional to gravity strength (visually exaggerated, always positive)
+        length_factors = np.maximum(0.4, 1.0 + (strengths - 1.0) * 3)
+        arrow_lengths = base_arrow_length * length_factors
+
+        # 矢印の開始点：ボール表面から外側にギャップを取る
+        # Arrow start: gap outward from ball surface
+        start_points = surface_points + arrow_start_gap * outward_dirs
+        # 矢印の終了点：開始点から地球中心方向へ
+        # Arrow end: from start toward Earth's center
+        end_points = start_points + arrow_lengths[:, np.newaxis] * gravity_dirs
+
+        # 色は黄色で統一（重力ベクトルを表す）
+        # Unified yellow color (representing gravity vectors)
+        arrows = [
+            Arrow(
                 start=start_pos,
                 end=end_pos,
                 color=YELLOW,
@@ -178,58 +123,35 @@ class TidalStretchBall(Scene):
                 max_tip_length_to_length_ratio=0.3,
                 buff=0,
             )
-            arrows.append(arrow)
+            for start_pos, end_pos in zip(start_points, end_points)
+        ]
 
         # 説明テキスト
         # Explanation text
-        explanation_jp = create_text_with_backplate(
-            "重力は地球の中心を向く",
-            font_size=24,
-            text_color=WHITE,
+        explanation_jp, explanation_en = backplate_labels(
+            [
+                ("重力は地球の中心を向く", 24, WHITE),
+                ("Gravity points to Earth's center", 18, GRAY_B),
+            ],
             bg_opacity=0.85,
         )
         explanation_jp.move_to(RIGHT * 4.0 + UP * 2.5)
-
-        explanation_en = create_text_with_backplate(
-            "Gravity points to Earth's center",
-            font_size=18,
-            text_color=GRAY_B,
-            bg_opacity=0.85,
-        )
         explanation_en.next_to(explanation_jp, DOWN, buff=0.2)
 
         # 凡例：重力の強さの違い
         # Legend: Gravity strength difference
-        legend_strong = create_text_with_backplate(
-            "下側: 地球に近い → 重力強い",
-            font_size=18,
-            text_color=ORANGE,
+        legend_strong, legend_strong_en, legend_weak, legend_weak_en = backplate_labels(
+            [
+                ("下側: 地球に近い → 重力強い", 18, ORANGE),
+                ("Bottom: Closer → Stronger gravity", 16, GRAY_B),
+                ("上側: 地球から遠い → 重力弱い", 18, YELLOW),
+                ("Top: Farther → Weaker gravity", 16, GRAY_B),
+            ],
             bg_opacity=0.8,
         )
         legend_strong.move_to(RIGHT * 4.0 + UP * 1.0)
-
-        legend_strong_en = create_text_with_backplate(
-            "Bottom: Closer → Stronger gravity",
-            font_size=16,
-            text_color=GRAY_B,
-            bg_opacity=0.8,
-        )
         legend_strong_en.next_to(legend_strong, DOWN, buff=0.15)
-
-        legend_weak = create_text_with_backplate(
-            "上側: 地球から遠い → 重力弱い",
-            font_size=18,
-            text_color=YELLOW,
-            bg_opacity=0.8,
-        )
         legend_weak.next_to(legend_strong_en, DOWN, buff=0.3)
-
-        legend_weak_en = create_text_with_backplate(
-            "Top: Farther → Weaker gravity",
-            font_size=16,
-            text_color=GRAY_B,
-            bg_opacity=0.8,
-        )
         legend_weak_en.next_to(legend_weak, DOWN, buff=0.15)
 
         # 全ての矢印を一度に表示
@@ -257,20 +179,14 @@ class TidalStretchBall(Scene):
         # --- フェーズ3: ボールを楕円に変形 ---
         # --- Phase 3: Deform ball into ellipse ---
 
-        deform_label = create_text_with_backplate(
-            "重力の差でボールが変形",
-            font_size=20,
-            text_color=WHITE,
+        deform_label, deform_label_en = backplate_labels(
+            [
+                ("重力の差でボールが変形", 20, WHITE),
+                ("Ball deforms due to gravity difference", 16, GRAY_B),
+            ],
             bg_opacity=0.85,
         )
         deform_label.move_to(RIGHT * 4.0 + DOWN * 1.2)
-
-        deform_label_en = create_text_with_backplate(
-            "Ball deforms due to gravity difference",
-            font_size=16,
-            text_color=GRAY_B,
-            bg_opacity=0.85,
-        )
         deform_label_en.next_to(deform_label, DOWN, buff=0.15)
 
         self.play(FadeIn(deform_label), FadeIn(deform_label_en), run_time=0.4)
@@ -284,37 +200,27 @@ class TidalStretchBall(Scene):
         # Move arrows along with deformation (always pointing to Earth's center)
         def create_arrow_animations():
             """矢印の移動アニメーションを生成"""
-            anims = []
-            for i, angle in enumerate(angles):
-                angle_rad = np.radians(angle)
-                # 変形後の位置を計算
-                # Calculate position after deformation
-                # 楕円上の点: (a*cosθ, b*sinθ) where a=compress, b=stretch
-                new_surface_x = ball_center[0] + ball_radius * compress_factor * np.cos(angle_rad)
-                new_surface_y = ball_center[1] + ball_radius * stretch_factor * np.sin(angle_rad)
-                new_surface_pos = np.array([new_surface_x, new_surface_y, 0])
-
-                # 楕円の外向き方向（近似的に元の角度方向）
-                outward_dir = np.array([np.cos(angle_rad), np.sin(angle_rad), 0])
-
-                # 重力方向を再計算（地球中心に向かう）
-                gx, gy, strength = calculate_gravity_direction_and_strength(
-                    new_surface_pos[:2], earth_center[:2]
-                )
-                gravity_dir = np.array([gx, gy, 0])
-
-                # 矢印の長さも更新（常に正の値を保証）
-                length_factor = max(0.4, 1.0 + (strength - 1.0) * 3)
-                new_arrow_length = base_arrow_length * length_factor
-
-                # 開始点：表面から外側にギャップ
-                new_start = new_surface_pos + arrow_start_gap * outward_dir
-                # 終了点：地球中心方向へ
-                new_end = new_start + new_arrow_length * gravity_dir
-
-                # 矢印を新しい位置に移動
-                anims.append(arrows[i].animate.put_start_and_end_on(new_start, new_end))
-            return anims
+            # 変形後の位置を計算
+            # Calculate positions after deformation
+            # 楕円上の点: (a*cosθ, b*sinθ) where a=compress, b=stretch
+            new_surface_points = ball_center + ball_radius * outward_dirs * [compress_factor, stretch_factor, 0]
+
+            # 重力方向を再計算（地球中心に向かう）
+            new_gravity_dirs, new_strengths = gravity_direction_and_strength(new_surface_points, earth_center)
+
+            # 矢印の長さも更新（常に正の値を保証）
+            new_arrow_lengths = base_arrow_length * np.maximum(0.4, 1.0 + (new_strengths - 1.0) * 3)
+
+            # 開始点：表面から外側にギャップ（楕円の外向き方向は近似的に元の角度方向）
+            new_starts = new_surface_points + arrow_start_gap * outward_dirs
+            # 終了点：地球中心方向へ
+            new_ends = new_starts + new_arrow_lengths[:, np.newaxis] * new_gravity_dirs
+
+            # 矢印を新しい位置に移動
+            return [
+                arrow.animate.put_start_and_end_on(new_start, new_end)
+                for arrow, new_start, new_end in zip(arrows, new_starts, new_ends)
+            ]
 
         self.play(
             ball.animate.stretch(stretch_factor, dim=1).stretch(compress_factor, dim=0),
@@ -328,20 +234,14 @@ class TidalStretchBall(Scene):
         # --- フェーズ4: 潮汐力ラベルを強調 ---
         # --- Phase 4: Emphasize tidal force label ---
 
-        tidal_label = create_text_with_backplate(
-            "これが「潮汐力」",
-            font_size=28,
-            text_color=YELLOW,
+        tidal_label, tidal_label_en = backplate_labels(
+            [
+                ("これが「潮汐力」", 28, YELLOW),
+                ("This is the \"Tidal Force\"", 22, YELLOW),
+            ],
             bg_opacity=0.9,
         )
         tidal_label.move_to(RIGHT * 4.0 + DOWN * 2.5)
-
-        tidal_label_en = create_text_with_backplate(
-            "This is the \"Tidal Force\"",
-            font_size=22,
-            text_color=YELLOW,
-            bg_opacity=0.9,
-        )
         tidal_label_en.next_to(tidal_label, DOWN, buff=0.15)
 
         self.play(FadeIn(tidal_label), FadeIn(tidal_label_en), run_time=0.6)
@@ -403,28 +303,23 @@ class TidalStretchBallSimple(Scene):
         arrow_start_gap = 0.15
         angles = [90, 45, 0, 315, 270, 225, 180, 135]
 
-        arrows = []
-        for angle in angles:
-            angle_rad = np.radians(angle)
-            outward_dir = np.array([np.cos(angle_rad), np.sin(angle_rad), 0])
-            surface_pos = ball_center + ball_radius * outward_dir
+        angles_rad = np.radians(angles)
+        outward_dirs = np.stack([np.cos(angles_rad), np.sin(angles_rad), np.zeros_like(angles_rad)], axis=1)
+        surface_points = ball_center + ball_radius * outward_dirs
 
-            # 重力方向と強さを計算
-            gx, gy, strength = calculate_gravity_direction_and_strength(
-                surface_pos[:2], earth_center[:2]
-            )
-            gravity_dir = np.array([gx, gy, 0])
+        # 重力方向と強さを全点まとめて計算
+        gravity_dirs, strengths = gravity_direction_and_strength(surface_points, earth_center)
 
-            # 矢印の長さは重力の強さに比例（常に正の値を保証）
-            length_factor = max(0.4, 1.0 + (strength - 1.0) * 3)
-            arrow_length = base_arrow_length * length_factor
+        # 矢印の長さは重力の強さに比例（常に正の値を保証）
+        arrow_lengths = base_arrow_length * np.maximum(0.4, 1.0 + (strengths - 1.0) * 3)
 
-            # 開始点：表面から外側にギャップ
-            start_pos = surface_pos + arrow_start_gap * outward_dir
-            # 終了点：地球中心方向へ
-            end_pos = start_pos + arrow_length * gravity_dir
+        # 開始点：表面から外側にギャップ
+        start_points = surface_points + arrow_start_gap * outward_dirs
+        # 終了点：地球中心方向へ
+        end_points = start_points + arrow_lengths[:, np.newaxis] * gravity_dirs
 
-            arrow = Arrow(
+        arrows = [
+            Arrow(
                 start=start_pos,
                 end=end_pos,
                 color=YELLOW,
@@ -432,7 +327,8 @@ class TidalStretchBallSimple(Scene):
                 max_tip_length_to_length_ratio=0.3,
                 buff=0,
             )
-            arrows.append(arrow)
+            for start_pos, end_pos in zip(start_points, end_points)
+        ]
 
         self.play(*[GrowArrow(a) for a in arrows], run_time=0.6)
         self.wait(0.4)
@@ -442,29 +338,19 @@ class TidalStretchBallSimple(Scene):
         compress_factor = 0.82
 
         def create_arrow_animations():
-            anims = []
-            for i, angle in enumerate(angles):
-                angle_rad = np.radians(angle)
-                new_x = ball_center[0] + ball_radius * compress_factor * np.cos(angle_rad)
-                new_y = ball_center[1] + ball_radius * stretch_factor * np.sin(angle_rad)
-                new_surface_pos = np.array([new_x, new_y, 0])
-
-                # 外向き方向
-                outward_dir = np.array([np.cos(angle_rad), np.sin(angle_rad), 0])
-
-                # 重力方向を再計算
-                gx, gy, strength = calculate_gravity_direction_and_strength(
-                    new_surface_pos[:2], earth_center[:2]
-                )
-                gravity_dir = np.array([gx, gy, 0])
-
-                length_factor = max(0.4, 1.0 + (strength - 1.0) * 3)
-                new_arrow_length = base_arrow_length * length_factor
-
-                new_start = new_surface_pos + arrow_start_gap * outward_dir
-                new_end = new_start + new_arrow_length * gravity_dir
-                anims.append(arrows[i].animate.put_start_and_end_on(new_start, new_end))
-            return anims
+            new_surface_points = ball_center + ball_radius * outward_dirs * [compress_factor, stretch_factor, 0]
+
+            # 重力方向を再計算
+            new_gravity_dirs, new_strengths = gravity_direction_and_strength(new_surface_points, earth_center)
+            new_arrow_lengths = base_arrow_length * np.maximum(0.4, 1.0 + (new_strengths - 1.0) * 3)
+
+            # 外向き方向にギャップを取って開始
+            new_starts = new_surface_points + arrow_start_gap * outward_dirs
+            new_ends = new_starts + new_arrow_lengths[:, np.newaxis] * new_gravity_dirs
+            return [
+                arrow.animate.put_start_and_end_on(new_start, new_end)
+                for arrow, new_start, new_end in zip(arrows, new_starts, new_ends)
+            ]
 
         self.play(
             ball.animate.stretch(stretch_factor, dim=1).stretch(compress_factor, dim=0),
@@ -474,7 +360,7 @@ class TidalStretchBallSimple(Scene):
         )
 
         # ラベル
-        tidal_label = create_text_with_backplate(
+        tidal_label = backplate_label(
             "潮汐力 / Tidal Force",
             font_size=32,
             text_color=YELLOW,
@@ -15,27 +15,7 @@ Body being stretched by tidal forces
 from manim import *
 import os
 
-
-def create_text_with_backplate(text_content, font_size, text_color, bg_color="#000000", bg_opacity=0.7, padding=0.15):
-    """
-    バックプレート付きテキストを作成するヘルパー関数
-    Helper function to create text with a background plate
-    """
-    text = Text(text_content, font_size=font_size, color=text_color)
-    # バックプレート（背景矩形）を作成
-    # Create background rectangle
-    backplate = Rectangle(
-        width=text.width + padding * 2,
-        height=text.height + padding * 2,
-        color=bg_color,
-        fill_color=bg_color,
-        fill_opacity=bg_opacity,
-        stroke_width=0,
-    )
-    backplate.move_to(text.get_center())
-    # グループ化して返す
-    # Group and return
-    return VGroup(backplate, text)
+from components import backplate_label, backplate_labels
 
 
 class TidalStretchBody(Scene):
@@ -72,7 +52,7 @@ class TidalStretchBody(Scene):
 
         # 地球のラベル（バックプレート付き）
         # Earth label (with backplate)
-        earth_label = create_text_with_backplate(
+        earth_label = backplate_label(
             "↓ 地球 / Earth ↓", font_size=22, text_color="#3498db"
         )
         earth_label.move_to(DOWN * 3.6)
@@ -123,32 +103,25 @@ class TidalStretchBody(Scene):
 
         # 重力ラベル（バックプレート付き）
         # Gravity labels (with backplate)
-        gravity_head_label = create_text_with_backplate(
-            "g（弱）/ g (weak)", font_size=18, text_color=YELLOW
+        gravity_head_label, gravity_feet_label = backplate_labels(
+            [
+                ("g（弱）/ g (weak)", 18, YELLOW),
+                ("g（強）/ g (strong)", 18, ORANGE),
+            ],
         )
         gravity_head_label.next_to(gravity_head, LEFT, buff=0.15)
-
-        gravity_feet_label = create_text_with_backplate(
-            "g（強）/ g (strong)", font_size=18, text_color=ORANGE
-        )
         gravity_feet_label.next_to(gravity_feet, LEFT, buff=0.1)
 
         # 説明テキスト（バックプレート付き）
         # Explanation text (with backplate)
-        explanation_text = create_text_with_backplate(
-            "頭と足では\n地球からの距離が違う\n→ 重力の強さが違う",
-            font_size=24,
-            text_color=WHITE,
+        explanation_text, explanation_text_en = backplate_labels(
+            [
+                ("頭と足では\n地球からの距離が違う\n→ 重力の強さが違う", 24, WHITE),
+                ("Head and feet are at\ndifferent distances from Earth\n→ Different gravity strength", 20, GRAY_B),
+            ],
             bg_opacity=0.8,
         )
         explanation_text.move_to(RIGHT * 3.0 + UP * 2.0)
-
-        explanation_text_en = create_text_with_backplate(
-            "Head and feet are at\ndifferent distances from Earth\n→ Different gravity strength",
-            font_size=20,
-            text_color=GRAY_B,
-            bg_opacity=0.8,
-        )
         explanation_text_en.next_to(explanation_text, DOWN, buff=0.3)
 
         self.play(
@@ -229,28 +202,16 @@ class TidalStretchBody(Scene):
 
         # 潮汐力の説明（バックプレート付き）
         # Tidal force explanation (with backplate)
-        tidal_explanation = create_text_with_backplate(
-            "潮汐力の効果",
-            font_size=28,
-            text_color=WHITE,
+        tidal_explanation, stretch_label, compress_label = backplate_labels(
+            [
+                ("潮汐力の効果", 28, WHITE),
+                ("重力の差 → 引き伸ばし\nGravity difference → Stretching", 22, RED),
+                ("地球中心へ引かれ圧縮\nPulled toward Earth's center", 22, BLUE),
+            ],
             bg_opacity=0.85,
         )
         tidal_explanation.move_to(RIGHT * 3.0 + UP * 2.5)
-
-        stretch_label = create_text_with_backplate(
-            "重力の差 → 引き伸ばし\nGravity difference → Stretching",
-            font_size=22,
-            text_color=RED,
-            bg_opacity=0.85,
-        )
         stretch_label.move_to(RIGHT * 3.0 + UP * 1.0)
-
-        compress_label = create_text_with_backplate(
-            "地球中心へ引かれ圧縮\nPulled toward Earth's center",
-            font_size=22,
-            text_color=BLUE,
-            bg_opacity=0.85,
-        )
         compress_label.move_to(RIGHT * 3.0 + DOWN * 0.5)
 
         # 縦方向の矢印を表示
@@ -296,7 +257,7 @@ class TidalStretchBody(Scene):
 
         # 注釈（効果は目に見えないほど小さい）
         # Note (effect is too small to see)
-        note_text = create_text_with_backplate(
+        note_text = backplate_label(
             "※実際の効果は目に見えないほど小さい\n* The actual effect is imperceptibly small",
             font_size=16,
             text_color=GRAY,
@@ -306,7 +267,7 @@ class TidalStretchBody(Scene):
 
         # 潮汐力のラベル
         # Tidal force label
-        tidal_label = create_text_with_backplate(
+        tidal_label = backplate_label(
             "これが「潮汐力」\nThis is the \"Tidal Force\"",
             font_size=28,
             text_color=YELLOW,
@@ -434,7 +395,7 @@ class TidalStretchBodySimple(Scene):
         )
 
         # 潮汐力ラベル（バックプレート付き）
-        tidal_text = create_text_with_backplate(
+        tidal_text = backplate_label(
             "潮汐力 / Tidal Force",
             font_size=32,
             text_color=YELLOW,
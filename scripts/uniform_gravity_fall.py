@@ -10,6 +10,8 @@
 
 from manim import *
 
+from components import cached_text
+
 
 class UniformGravityFall(Scene):
     """一様重力場でのボール落下アニメーション"""
@@ -115,7 +117,7 @@ class UniformGravityFallWithLabel(Scene):
 
     def construct(self):
         # タイトル
-        title = Text("平坦な空間（一様な重力場）", font_size=32)
+        title = cached_text("平坦な空間（一様な重力場）", font_size=32)
         title.to_edge(UP)
 
         # 地面を作成
@@ -168,7 +170,7 @@ class UniformGravityFallWithLabel(Scene):
             buff=0,
             max_tip_length_to_length_ratio=0.1,
         )
-        distance_label = Text("一定", font_size=20, color=YELLOW)
+        distance_label = cached_text("一定", font_size=20, color=YELLOW)
         distance_label.next_to(distance_line, DOWN, buff=0.1)
 
         # シーンの構築
@@ -227,7 +229,7 @@ class UniformGravityFallWithLabel(Scene):
         )
 
         # 結果テキスト
-        result_text = Text(
+        result_text = cached_text(
             "平行に落ちて、同時に着地",
             font_size=28,
             color=GREEN,